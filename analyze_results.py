@@ -0,0 +1,67 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Executable for analyzing the saved results with ResultsAnalytics: the fastest build orders with an early TEMPLE, the
+fastest opening prefixes, and the effect of each order type at each step
+
+"""
+import os
+import time
+
+from libraries.ColumnarResults import convert_results_directory
+from libraries.ResultsAnalytics import ResultsAnalytics
+
+# Directory with the results csv files, converted to the columnar format first if COLUMNAR_RESULTS_DIRECTORY is missing
+RESULTS_DIRECTORY = "results"
+COLUMNAR_RESULTS_DIRECTORY = "results/columnar"
+# The results to analyze, None for every resource trigger or number of bases
+RESOURCE_TRIGGER_VALUE = 3000
+NUMBER_OF_BASES = 2
+# Only the build orders with a TEMPLE by this step, starting at 1, for the fastest build orders
+MAX_TEMPLE_STEP = 4
+# Number of fastest build orders and prefixes to print
+NUMBER_OF_RESULTS = 10
+# Number of steps in the opening prefixes, and the fewest build orders a prefix needs to be printed
+PREFIX_LENGTH = 3
+PREFIX_MIN_SAMPLES = 20
+
+
+def main():
+    if not os.path.isdir(COLUMNAR_RESULTS_DIRECTORY):
+        print(f"Converting {RESULTS_DIRECTORY} to the columnar format...")
+        convert_results_directory(RESULTS_DIRECTORY, COLUMNAR_RESULTS_DIRECTORY)
+
+    start_time = time.perf_counter()
+    analytics = ResultsAnalytics.from_columnar_directory(COLUMNAR_RESULTS_DIRECTORY)
+    print(f"Loaded {len(analytics)} results in {time.perf_counter() - start_time:.3f} seconds")
+
+    start_time = time.perf_counter()
+    mask = analytics.get_mask(resource_trigger=RESOURCE_TRIGGER_VALUE, number_of_bases=NUMBER_OF_BASES)
+    temple_steps = analytics.get_first_step("TEMPLE")
+    best = analytics.get_best(mask & (temple_steps > 0) & (temple_steps <= MAX_TEMPLE_STEP), NUMBER_OF_RESULTS)
+    print(f"\nFastest build orders with a TEMPLE by step {MAX_TEMPLE_STEP} "
+          f"({time.perf_counter() - start_time:.3f} seconds):")
+    for final_time, build_order_string, source_name in best:
+        print(f"    {final_time} seconds, orders: {build_order_string} ({source_name})")
+
+    start_time = time.perf_counter()
+    prefix_statistics = analytics.get_prefix_statistics(PREFIX_LENGTH, mask & (temple_steps > 0),
+                                                        min_samples=PREFIX_MIN_SAMPLES)
+    print(f"\nFastest {PREFIX_LENGTH} step prefixes with a TEMPLE ({time.perf_counter() - start_time:.3f} seconds):")
+    for prefix_string, count, minimum, mean, median, quantile_90 in prefix_statistics[:NUMBER_OF_RESULTS]:
+        print(f"    {prefix_string}: {count} build orders, min {minimum}, mean {mean:.1f}, median {median}, "
+              f"90% {quantile_90}")
+
+    start_time = time.perf_counter()
+    effects, counts, labels = analytics.get_position_effects(mask & (temple_steps > 0), by_order_type=True)
+    print(f"\nMean final time difference of each order type at each step "
+          f"({time.perf_counter() - start_time:.3f} seconds):")
+    print("    step " + "".join(f"{label:>10}" for label in labels))
+    for step, step_effects in enumerate(effects):
+        if counts[step].sum():
+            print(f"    {step + 1:>4} " + "".join(f"{effect:>10.1f}" for effect in step_effects))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Executable for converting the results csv files to the columnar format of ColumnarResults, which NumPy can memory map
+for analysis instead of parsing the csv files
+
+"""
+from libraries.ColumnarResults import ColumnarResults, convert_results_directory, read_results_csv
+
+# Directory with the results csv files. The csv files in its legacy_runs directory are converted too
+RESULTS_DIRECTORY = "results"
+# Directory the columnar results are written to, one directory per csv file
+COLUMNAR_RESULTS_DIRECTORY = "results/columnar"
+# Read every converted file back and check it matches its csv file. Slower, but the csv files can be trusted to be
+# replaceable by the columnar files afterwards
+VERIFY_CONVERSION = True
+
+
+def main():
+    converted = convert_results_directory(RESULTS_DIRECTORY, COLUMNAR_RESULTS_DIRECTORY)
+    for csv_path, columnar_directory, number_of_results in converted:
+        print(f"{csv_path}: {number_of_results} results saved to {columnar_directory}")
+
+        if VERIFY_CONVERSION:
+            columnar_results = ColumnarResults(columnar_directory)
+            for csv_result, columnar_result in zip(read_results_csv(csv_path), columnar_results.read_results(),
+                                                   strict=True):
+                if csv_result != columnar_result:
+                    raise ValueError(f"{columnar_directory} does not match {csv_path}: {csv_result}")
+
+    print(f"Converted {len(converted)} results csv files")
+
+
+if __name__ == "__main__":
+    main()
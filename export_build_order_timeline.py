@@ -0,0 +1,68 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Executable for checking a build order against the game. Simulates one build order string from the results csv files
+and saves the money, income, supply pads and tech level of every in game second, and the in game second of every build
+order approval, skip and completion, for plotting supply curves
+
+"""
+import os
+
+from libraries.BuildOrderEncoding import decode_build_order, text_to_packed
+from libraries.SimulationTimeline import TIMELINE_EVENTS_FILE
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+# The build order to simulate, in the same format as the results csv files
+BUILD_ORDER_STRING = "U_BASE 2, SUPPLY 1, SUPPLY 1, SUPPLY 2, SUPPLY 1, SUPPLY 2, SUPPLY 2, TEMPLE 1, U_SPLY 1, "
+# Number of bases, the first one starts as a KEEP and the rest are empty
+NUMBER_OF_BASES = 2
+# Pause timer of the bases after the first, the same as SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS in run_build_combinations.
+# Set it to what the run that found the build order used, so the timeline matches its final time
+SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS = 120
+# If the pause timer only starts once a temple is built, the same as IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER in
+# run_build_combinations
+IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER = True
+# Starting money
+STARTING_RESOURCES = 800
+# The simulation stops once this much money is reached
+RESOURCE_TRIGGER_VALUE = 3000
+# Maximum in game seconds to simulate, the same as run_build_combinations
+SIMULATION_TIME_SECONDS = 1000
+# Directory the timeline is saved to: timeline.csv, the events csv file and one .npy file per column
+TIMELINE_OUTPUT_DIRECTORY = "results/timelines"
+# Also save each column as a NumPy .npy file
+SAVE_NPY = True
+
+
+def main():
+    sim_wrapper = SimulatorWrapper(starting_money=STARTING_RESOURCES, fine_debug=False, event_driven=True)
+    sim_wrapper.add_bases(NUMBER_OF_BASES, pause_timer=SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS,
+                          temple_needed_to_clear_second_base=IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER)
+    build_orders = decode_build_order(text_to_packed(BUILD_ORDER_STRING), sim_wrapper.base_list)
+
+    final_sim_time, timeline = sim_wrapper.run_simulation(build_order=build_orders,
+                                                          resource_trigger=RESOURCE_TRIGGER_VALUE,
+                                                          simulation_time_seconds=SIMULATION_TIME_SECONDS,
+                                                          record_timeline=True)
+    if final_sim_time is None:
+        print(f"Did not reach {RESOURCE_TRIGGER_VALUE} resources in {SIMULATION_TIME_SECONDS} seconds")
+    else:
+        print(f"Reached {RESOURCE_TRIGGER_VALUE} resources in {final_sim_time} seconds")
+
+    for second, event, base_number, slot, detail in timeline.events:
+        slot_text = f" slot {slot}" if slot is not None else ""
+        detail_text = f" {detail.name}" if detail is not None else ""
+        print(f"    {second:>5} s  {event.name:<20} base {base_number}{slot_text}{detail_text}")
+
+    os.makedirs(TIMELINE_OUTPUT_DIRECTORY, exist_ok=True)
+    timeline.save_csv(os.path.join(TIMELINE_OUTPUT_DIRECTORY, "timeline.csv"))
+    if SAVE_NPY:
+        timeline.save_npy(TIMELINE_OUTPUT_DIRECTORY)
+    else:
+        timeline.save_events_csv(os.path.join(TIMELINE_OUTPUT_DIRECTORY, TIMELINE_EVENTS_FILE))
+    print(f"Saved {len(timeline)} seconds and {len(timeline.events)} events to {TIMELINE_OUTPUT_DIRECTORY}")
+
+
+if __name__ == "__main__":
+    main()
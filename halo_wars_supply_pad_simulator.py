@@ -10,9 +10,10 @@ Sandbox testing.
 
 """
 from libraries.ResourceManager import ResourceManager
-from libraries.BaseClass import Base
+from libraries.BaseClass import make_base
 from libraries.BaseConstants import *
-from libraries.RuntimeBuildingBlocks import RuntimeBuildingBlocks
+from libraries.RuntimeBuildingBlocks import make_runtime_building_blocks
+from libraries.TraceRecorder import TraceRecorder
 
 
 debug_mode = True
@@ -20,16 +21,18 @@ debug_mode = True
 # Instantiate all the needed objects and class packs
 resource_manager = ResourceManager()
 resource_manager.add_money(800)
-first_base = Base(resource_manager=resource_manager,
-                  upgrade_level=BaseLevel.KEEP,
-                  print_mode=debug_mode,
-                  base_number=1)
-second_base = Base(resource_manager=resource_manager,
-                   upgrade_level=BaseLevel.EMPTY,
-                   print_mode=debug_mode,
-                   base_number=2,
-                   pause_timer=30,
-                   temple_needed_to_clear_second_base=True)
+# The debug messages are printed as they are recorded
+trace_recorder = TraceRecorder(resource_manager=resource_manager, print_events=True) if debug_mode else None
+first_base = make_base(resource_manager=resource_manager,
+                       upgrade_level=BaseLevel.KEEP,
+                       trace_recorder=trace_recorder,
+                       base_number=1)
+second_base = make_base(resource_manager=resource_manager,
+                        upgrade_level=BaseLevel.EMPTY,
+                        trace_recorder=trace_recorder,
+                        base_number=2,
+                        pause_timer=30,
+                        temple_needed_to_clear_second_base=True)
 
 
 # Overall build order test
@@ -92,12 +95,13 @@ build_orders_4 = [
     [Orders.BUILD_SUPPLY_PAD, first_base, SlotNumbers.build_slot_3],
 ]
 
-# Bare bones simulation run.
-base_list = [first_base, second_base]
-runtime_building_blocks = RuntimeBuildingBlocks(resource_manager=resource_manager, print_mode=debug_mode)
-final_sim_time = runtime_building_blocks.run_simulation(build_orders=build_orders,
-                                                        resource_amount=3000,
-                                                        simulation_time_max=2000,
-                                                        base_list=base_list)
-
-
+# Bare bones simulation run. Only when run directly, so the build orders above can be imported, for example by the
+# benchmarks
+if __name__ == "__main__":
+    base_list = [first_base, second_base]
+    runtime_building_blocks = make_runtime_building_blocks(resource_manager=resource_manager,
+                                                           trace_recorder=trace_recorder)
+    final_sim_time = runtime_building_blocks.run_simulation(build_orders=build_orders,
+                                                            resource_amount=3000,
+                                                            simulation_time_max=2000,
+                                                            base_list=base_list)
@@ -0,0 +1,265 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Simulated annealing local search that improves a build order one small change at a time, only simulating the part of
+the build order that changed.
+
+"""
+import math
+import random
+
+from libraries.BaseConstants import Orders
+from libraries.BuildOrderEncoding import decode_build_order, packed_to_text
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+# Orders that the insert and delete moves add or remove
+INSERT_DELETE_ORDERS = [Orders.BUILD_SUPPLY_PAD, Orders.UPGRADE_SUPPLY_PAD]
+
+# Furthest the temple can be moved by one move
+MAX_TEMPLE_MOVE = 3
+
+# Number of times a move is tried again when it does not change the build order
+MOVE_ATTEMPTS = 10
+
+
+class SimulationCheckpoints:
+    """
+    The simulation of one build order, with a checkpoint before each of its orders, so a build order that starts the
+    same can continue from the checkpoint where it starts to be different.
+
+    Args:
+        packed_build_order (bytes): The packed build order that was simulated
+        checkpoints (list): [SimulatorWrapper, game tick, orders that were not SKIPPED] at the start of the game tick
+            each order was first tried on. There is one more checkpoint than orders, for after the last order. If the
+            simulation ended before an order was tried, there are no checkpoints from that order on
+        orders_tried (int): Number of orders that were tried before the simulation ended
+        approved_orders (bytes): The orders that were tried and not SKIPPED
+        final_time (int): The final time, None if the simulation timed out
+
+    """
+    def __init__(self, packed_build_order: bytes, checkpoints: list, orders_tried: int, approved_orders: bytes,
+                 final_time):
+        self.packed_build_order = packed_build_order
+        self.checkpoints = checkpoints
+        self.orders_tried = orders_tried
+        self.approved_orders = approved_orders
+        self.final_time = final_time
+        # Orders that were never tried are in the build order string as they are
+        self.build_order_string = packed_to_text(approved_orders + packed_build_order[orders_tried:])
+
+
+class SimulatedAnnealingOptimizer:
+    """
+    The SimulatedAnnealingOptimizer improves a build order with simulated annealing. Each iteration makes one move on
+    the current build order: swap two orders next to each other, move the temple earlier or later, insert or delete a
+    supply pad or supply pad upgrade, or change the base of an order. The move is repaired with
+    GenerateOrdersBuildingBlocks.repair_build_order, so it is always a build order the random generator could have made.
+
+    Faster build orders are always accepted, and slower ones are accepted with a chance that gets smaller as the
+    temperature cools from the starting temperature to the final temperature, so the search can get out of local
+    minimums early on and settles on the best build orders at the end.
+
+    A move only changes the build order from some order k on, so the simulation of the current build order is kept with
+    a checkpoint before each order, and the new build order is simulated from a copy of checkpoint k with
+    RuntimeBuildingBlocks.run_next_order. Each move only costs the orders that changed and the time after them.
+
+    Args:
+        starting_money (int): The amount of money to start with
+        number_of_bases (int): Number of bases, the first starts as a KEEP and the others are empty
+        resource_trigger (int): The amount of resources to reach the exit scenario
+        simulation_time_seconds (int): Maximum time for each simulation
+        number_of_iterations (int): Number of moves to try
+        starting_temperature (float): Temperature at the start, in seconds of final time
+        final_temperature (float): Temperature at the end, in seconds of final time
+        require_temple (bool): If build orders without a temple count as timed out
+        pause_timer (int): Pause timer of every base after the first, see Base
+        temple_needed_to_clear_second_base (bool): If the pause timer of the bases after the first only counts down
+            once there is a tech level, see Base
+        random_generator (random.Random): The random number generator, defaults to the random module itself
+        progress_callback (callable): Called with a progress message for every new best build order, for example
+            print. None for no progress messages
+
+    """
+    def __init__(self, starting_money: int, number_of_bases: int, resource_trigger: int, simulation_time_seconds: int,
+                 number_of_iterations=5000, starting_temperature=10.0, final_temperature=0.1, require_temple=True,
+                 pause_timer=0, temple_needed_to_clear_second_base=False, random_generator=None,
+                 progress_callback=None):
+        self.starting_money = starting_money
+        self.number_of_bases = number_of_bases
+        self.resource_trigger = resource_trigger
+        self.simulation_time_seconds = simulation_time_seconds
+        self.number_of_iterations = number_of_iterations
+        self.starting_temperature = starting_temperature
+        self.final_temperature = final_temperature
+        self.require_temple = require_temple
+        self.pause_timer = pause_timer
+        self.temple_needed_to_clear_second_base = temple_needed_to_clear_second_base
+        self.random_generator = random if random_generator is None else random_generator
+        self.progress_callback = progress_callback
+
+        # Packed build order to [final time, build order string], for every build order simulated
+        self.results = {}
+        self.best_time = None
+        self.best_build_order = None
+        # Number of orders simulated, against the sum of the build order lengths if every move started from second 0
+        self.orders_simulated = 0
+
+    def run(self, starting_build_order=None) -> list:
+        """
+        Run the simulated annealing.
+
+        :param starting_build_order: bytes: The packed build order to start from, for example the fastest one from
+            read_best_build_orders. It is repaired first. A random build order is used if None
+        :return: list: [packed build order, final time, build order string] for every build order simulated, in the
+            order they were simulated
+        """
+        if starting_build_order is None:
+            starting_build_order = GenerateOrdersBuildingBlocks(random_generator=self.random_generator) \
+                .generate_random_packed_build_order(self.number_of_bases)
+        starting_build_order = GenerateOrdersBuildingBlocks.repair_build_order(
+            GenerateOrdersBuildingBlocks.get_build_order_genes(starting_build_order), self.number_of_bases)
+
+        sim_wrapper = SimulatorWrapper(starting_money=self.starting_money, fine_debug=False, event_driven=True)
+        sim_wrapper.add_bases(self.number_of_bases, pause_timer=self.pause_timer,
+                              temple_needed_to_clear_second_base=self.temple_needed_to_clear_second_base)
+        current = self.simulate(starting_build_order, SimulationCheckpoints(b"", [[sim_wrapper, 0, b""]], 0, b"", None))
+        current_fitness = self.get_fitness(current)
+
+        # Geometric cooling from the starting temperature to the final temperature
+        cooling_rate = (self.final_temperature / self.starting_temperature) ** (1 / max(self.number_of_iterations, 1))
+        temperature = self.starting_temperature
+        for _ in range(self.number_of_iterations):
+            neighbour_build_order = self.get_neighbour(current.packed_build_order)
+            if neighbour_build_order is not None:
+                neighbour = self.simulate(neighbour_build_order, current)
+                neighbour_fitness = self.get_fitness(neighbour)
+                if neighbour_fitness <= current_fitness or (
+                        neighbour_fitness != math.inf and
+                        self.random_generator.random() < math.exp((current_fitness - neighbour_fitness) / temperature)):
+                    current = neighbour
+                    current_fitness = neighbour_fitness
+            temperature *= cooling_rate
+
+        return [[packed_build_order, final_time, build_order_string]
+                for packed_build_order, (final_time, build_order_string) in self.results.items()]
+
+    def get_fitness(self, simulation: SimulationCheckpoints) -> float:
+        """
+        Fitness of a simulated build order, lower is better.
+
+        :param simulation: SimulationCheckpoints: The simulated build order
+        :return: float: The final time, math.inf if it timed out or needs a temple it does not have
+        """
+        if simulation.final_time is None or (self.require_temple and "TEMPLE" not in simulation.build_order_string):
+            return math.inf
+        return simulation.final_time
+
+    def simulate(self, packed_build_order: bytes, parent: SimulationCheckpoints) -> SimulationCheckpoints:
+        """
+        Simulate a build order, continuing from the last checkpoint of the parent simulation that the build order still
+        starts the same as.
+
+        :param packed_build_order: bytes: The packed build order to simulate
+        :param parent: SimulationCheckpoints: A simulated build order with its checkpoints
+        :return: SimulationCheckpoints: The simulation of the build order with its checkpoints
+        """
+        # The first order that is different, the checkpoint before it is the last one that can be used
+        k = 0
+        for packed_order, parent_packed_order in zip(packed_build_order, parent.packed_build_order):
+            if packed_order != parent_packed_order:
+                break
+            k += 1
+        checkpoints = parent.checkpoints[:k + 1]
+
+        if k >= len(parent.checkpoints):
+            # The parent simulation ended before order k was tried, so the orders from there on never happen
+            simulation = SimulationCheckpoints(packed_build_order, checkpoints, parent.orders_tried,
+                                               parent.approved_orders, parent.final_time)
+        else:
+            sim_wrapper, simulation_time, approved_orders = checkpoints[-1]
+            sim_wrapper = sim_wrapper.copy()
+            final_time = None
+            reached = False
+            j = k
+            while j < len(packed_build_order):
+                build_orders = decode_build_order(packed_build_order[j:j + 1], sim_wrapper.base_list)
+                _, simulation_time, reached = sim_wrapper.runtime_building_blocks.run_next_order(
+                    build_orders=build_orders, i=0, simulation_time=simulation_time,
+                    resource_amount=self.resource_trigger, simulation_time_max=self.simulation_time_seconds,
+                    base_list=sim_wrapper.base_list)
+                self.orders_simulated += 1
+                if build_orders[0][0] != "SKIPPED":
+                    approved_orders += packed_build_order[j:j + 1]
+                j += 1
+                if reached or simulation_time >= self.simulation_time_seconds:
+                    break
+                checkpoints.append([sim_wrapper.copy(), simulation_time, approved_orders])
+
+            if not reached and simulation_time < self.simulation_time_seconds:
+                # Every order is done, run until the resource trigger is reached
+                _, simulation_time, reached = sim_wrapper.runtime_building_blocks.run_next_order(
+                    build_orders=[], i=0, simulation_time=simulation_time, resource_amount=self.resource_trigger,
+                    simulation_time_max=self.simulation_time_seconds, base_list=sim_wrapper.base_list)
+            if reached:
+                final_time = simulation_time
+            simulation = SimulationCheckpoints(packed_build_order, checkpoints, j, approved_orders, final_time)
+
+        if packed_build_order not in self.results:
+            self.results[packed_build_order] = [simulation.final_time, simulation.build_order_string]
+            fitness = self.get_fitness(simulation)
+            if fitness != math.inf and (self.best_time is None or fitness < self.best_time):
+                self.best_time = fitness
+                self.best_build_order = packed_build_order
+                if self.progress_callback is not None:
+                    self.progress_callback(f"New best: {fitness} seconds, orders: {simulation.build_order_string}")
+        return simulation
+
+    def get_neighbour(self, packed_build_order: bytes):
+        """
+        Make a random move on a build order. Moves that do not change the build order after it is repaired are tried
+        again a few times.
+
+        :param packed_build_order: bytes: The packed build order
+        :return: bytes: The packed neighbour build order, None if no move changed the build order
+        """
+        for _ in range(MOVE_ATTEMPTS):
+            genes = GenerateOrdersBuildingBlocks.get_build_order_genes(packed_build_order)
+            move = self.random_generator.randint(0, 4)
+            if move == 0 and len(genes) > 1:
+                # Swap two orders next to each other
+                j = self.random_generator.randrange(len(genes) - 1)
+                genes[j], genes[j + 1] = genes[j + 1], genes[j]
+            elif move == 1:
+                # Move the temple earlier or later, or add one if there is none
+                temple_indexes = [j for j, gene in enumerate(genes) if gene[0] == Orders.BUILD_TEMPLE]
+                if not temple_indexes:
+                    genes.insert(self.random_generator.randint(0, len(genes)),
+                                 (Orders.BUILD_TEMPLE, self.random_generator.randint(1, self.number_of_bases)))
+                    temple_indexes = [j for j, gene in enumerate(genes) if gene[0] == Orders.BUILD_TEMPLE]
+                temple_gene = genes.pop(temple_indexes[0])
+                distance = self.random_generator.randint(1, MAX_TEMPLE_MOVE)
+                if self.random_generator.random() < 0.5:
+                    distance = -distance
+                genes.insert(min(max(temple_indexes[0] + distance, 0), len(genes)), temple_gene)
+            elif move == 2:
+                # Insert a supply pad or supply pad upgrade
+                genes.insert(self.random_generator.randint(0, len(genes)),
+                             (self.random_generator.choice(INSERT_DELETE_ORDERS),
+                              self.random_generator.randint(1, self.number_of_bases)))
+            elif move == 3:
+                # Delete a supply pad or supply pad upgrade
+                indexes = [j for j, gene in enumerate(genes) if gene[0] in INSERT_DELETE_ORDERS]
+                if not indexes:
+                    continue
+                del genes[self.random_generator.choice(indexes)]
+            elif genes:
+                # Change the base of an order
+                j = self.random_generator.randrange(len(genes))
+                genes[j] = (genes[j][0], self.random_generator.randint(1, self.number_of_bases))
+
+            neighbour_build_order = GenerateOrdersBuildingBlocks.repair_build_order(genes, self.number_of_bases)
+            if neighbour_build_order != packed_build_order:
+                return neighbour_build_order
+        return None
@@ -5,9 +5,32 @@ March 19th, 2024
 Base class used to contain build slots, check build conditions, upgrades, and more.
 
 """
-from libraries.BuildSlotClasses import BuildSlot, EmptySLot, SupplyPad, Temple
+import math
+
+from libraries.BuildSlotClasses import _SLOT_BUILDING, _SLOT_BUILT, _SLOT_IDLE, _SLOT_UPGRADED, _SLOT_UPGRADING, \
+    EmptySLot, SupplyPad, Temple, TracedSupplyPad, TracedTemple
 from libraries.ResourceManager import ResourceManager
 from libraries.BaseConstants import *
+from libraries.TraceRecorder import TraceEvent, get_print_mode_recorder
+
+# The base states and slot types as module names, the same as the build slot states in BuildSlotClasses
+_BASE_IDLE = BaseState.IDLE
+_BASE_UPGRADING = BaseState.UPGRADING
+_BASE_PAUSED = BaseState.PAUSED
+_EMPTY_SLOT_TYPE = BuildSlotType.EMTPY
+_SUPPLY_PAD_SLOT_TYPE = BuildSlotType.SUPPLY_PAD
+_HEAVY_SUPPLY_PAD_SLOT_TYPE = BuildSlotType.HEAVY_SUPPLY_PAD
+
+# The empty build slots every base starts with. Empty slots are never changed, so all the bases share them
+_EMPTY_BUILD_SLOTS = {
+    1: EmptySLot(build_slot="build_slot_1", upgrade_level_needed=BaseLevel.OUTPOST),
+    2: EmptySLot(build_slot="build_slot_2", upgrade_level_needed=BaseLevel.OUTPOST),
+    3: EmptySLot(build_slot="build_slot_3", upgrade_level_needed=BaseLevel.OUTPOST),
+    4: EmptySLot(build_slot="build_slot_4", upgrade_level_needed=BaseLevel.KEEP),
+    5: EmptySLot(build_slot="build_slot_5", upgrade_level_needed=BaseLevel.KEEP),
+    6: EmptySLot(build_slot="build_slot_6", upgrade_level_needed=BaseLevel.CITADEL),
+    7: EmptySLot(build_slot="build_slot_7", upgrade_level_needed=BaseLevel.CITADEL),
+}
 
 
 class Base:
@@ -23,34 +46,35 @@ class Base:
         :param base_number: int: The identifying base number. Mostly used for debugging purposes.
         :param pause_timer: int: Used to pause the building of a base. Typically done in the beginning of a simulation
                                     to mimic the amount of time it takes to clear a base.
-        :param print_mode: bool: Debugging purposes, will enable the print messages.
+        :param trace_recorder: TraceRecorder: Debugging purposes, the recorder TracedBase records the events of the
+                                                base and its build slots in. A Base itself never records anything, use
+                                                make_base to get a TracedBase when there is a recorder.
 
     """
+    __slots__ = ("base_upgrade_level", "build_timer", "base_status", "base_number", "resource_manager", "build_slots",
+                 "build_queue", "trace_recorder", "pause_timer", "temple_needed_to_clear_second_base")
+
+    # The build slot classes made by build_supply_pad and build_temple
+    _SUPPLY_PAD_CLASS = SupplyPad
+    _TEMPLE_CLASS = Temple
+
     def __init__(self, resource_manager: ResourceManager, upgrade_level=BaseLevel.EMPTY, base_number=0, pause_timer=0,
                  temple_needed_to_clear_second_base=False,
-                 print_mode=True):
+                 trace_recorder=None):
         self.base_upgrade_level = upgrade_level
         self.build_timer = 0
-        self.base_status = BaseState.IDLE
+        self.base_status = _BASE_IDLE
         self.base_number = base_number
 
         self.resource_manager = resource_manager
-        self.build_slots = {
-            1: EmptySLot(build_slot="build_slot_1", upgrade_level_needed=BaseLevel.OUTPOST),
-            2: EmptySLot(build_slot="build_slot_2", upgrade_level_needed=BaseLevel.OUTPOST),
-            3: EmptySLot(build_slot="build_slot_3", upgrade_level_needed=BaseLevel.OUTPOST),
-            4: EmptySLot(build_slot="build_slot_4", upgrade_level_needed=BaseLevel.KEEP),
-            5: EmptySLot(build_slot="build_slot_5", upgrade_level_needed=BaseLevel.KEEP),
-            6: EmptySLot(build_slot="build_slot_6", upgrade_level_needed=BaseLevel.CITADEL),
-            7: EmptySLot(build_slot="build_slot_7", upgrade_level_needed=BaseLevel.CITADEL),
-        }
+        self.build_slots = dict(_EMPTY_BUILD_SLOTS)
 
         self.build_queue = []
-        self.print_mode = print_mode
+        self.trace_recorder = trace_recorder
         # If there is a pause timer, put the base into the paused state
         self.pause_timer = pause_timer
         if self.pause_timer > 0:
-            self.base_status = BaseState.PAUSED
+            self.base_status = _BASE_PAUSED
 
         # This flag determines if building a temple is needed to un-pause the pause countdown timer
         # The thought process is if the pause is tied to the player using their prophet to clear a base themselves,
@@ -59,7 +83,7 @@ class Base:
         self.temple_needed_to_clear_second_base = temple_needed_to_clear_second_base
 
     def _default_build_slot_check(self, build_slot_name: int, tech_requirement: int, resource_requirement: int,
-                                  building_to_build: BuildSlot) -> BuildResult:
+                                  building_class: type) -> BuildResult:
         """
         Method that can do some basic checks before making a build slot, things like resource and tech requirements as
         well as checking if a slot has already been built.
@@ -69,42 +93,37 @@ class Base:
         :param build_slot_name: str: The name of the corresponding build slot to build on
         :param tech_requirement: int: The tech level needed for the building to be built
         :param resource_requirement: int: the amount of resources needed in order to build the building
+        :param building_class: type: The BuildSlot class of the building, only made once the build is approved
         :return: BuildResult: The build result from attempting to build the building
 
         """
         # Check if the build slot exists, if not return error
         if build_slot_name not in self.build_slots:
-            if self.print_mode:
-                print(f"Desired build slot does not exist")
             return BuildResult.BASE_NOT_UPGRADED_ENOUGH
 
         # Ensure the build slot is empty
-        if self.build_slots[build_slot_name].build_type != BuildSlotType.EMTPY:
-            if self.print_mode:
-                print(f"Build slot {build_slot_name} is not empty for new building")
+        if self.build_slots[build_slot_name].build_type is not _EMPTY_SLOT_TYPE:
             return BuildResult.ALREADY_BUILT
 
         # Ensure the base upgrade level is high enough for the slot that wants to be built, otherwise exit
         if self.base_upgrade_level.value < self.build_slots.get(build_slot_name).upgrade_level_needed.value:
-            if self.print_mode:
-                print(f"Base is not upgraded enough to build there")
             return BuildResult.BASE_NOT_UPGRADED_ENOUGH
 
         # Ensure the proper tech level is ready
         if tech_requirement > self.resource_manager.current_tech_level:
-            if self.print_mode:
-                print(f"Tech level for desired building is not high enough")
             return BuildResult.NOT_ENOUGH_TECH
 
         # Ensure the correct amount of money is available and subtract it
         if self.resource_manager.subtract_money(resource_requirement):
+            building_to_build = building_class(resource_manager=self.resource_manager,
+                                               build_slot=build_slot_name,
+                                               base_number=self.base_number,
+                                               trace_recorder=self.trace_recorder)
             self.build_slots[build_slot_name] = building_to_build
-            self.build_slots[build_slot_name].build()
-            self.build_queue.append(self.build_slots[build_slot_name])
+            building_to_build.build()
+            self.build_queue.append(building_to_build)
             return BuildResult.APPROVED
         else:
-            if self.print_mode:
-                print(f"Not enough resources to build: {build_slot_name}")
             return BuildResult.NOT_ENOUGH_RESOURCES
 
     def build_supply_pad(self, build_slot_name: int) -> BuildResult:
@@ -119,12 +138,8 @@ class Base:
         build_result = self._default_build_slot_check(build_slot_name=build_slot_name,
                                                       tech_requirement=0,
                                                       resource_requirement=SUPPLY_PAD_COST,
-                                                      building_to_build=SupplyPad(resource_manager=self.resource_manager,
-                                                                                  build_slot=build_slot_name,
-                                                                                  print_mode=self.print_mode))
+                                                      building_class=self._SUPPLY_PAD_CLASS)
 
-        if self.print_mode:
-            print(f"Supply pad build {build_result}: {build_slot_name}")
         return build_result
 
     def build_temple(self, build_slot_name: int) -> BuildResult:
@@ -139,18 +154,12 @@ class Base:
         """
         # Check if temple has already been built, if it has, return with an ALREADY_BUILT status
         if self.resource_manager.current_temple_count > 0:
-            if self.print_mode:
-                print(f"Temple already built {build_slot_name}")
             return BuildResult.ALREADY_BUILT
 
         build_result = self._default_build_slot_check(build_slot_name=build_slot_name,
                                                       tech_requirement=0,
                                                       resource_requirement=TEMPLE_COST,
-                                                      building_to_build=Temple(resource_manager=self.resource_manager,
-                                                                               build_slot=build_slot_name,
-                                                                               print_mode=self.print_mode))
-        if self.print_mode:
-            print(f"Temple Build {build_result}: {build_slot_name}")
+                                                      building_class=self._TEMPLE_CLASS)
         return build_result
 
     def upgrade_supply_pad(self, build_slot_name: int) -> BuildResult:
@@ -164,50 +173,32 @@ class Base:
         """
         # Check if the build slot exists, if not return error
         if build_slot_name not in self.build_slots:
-            if self.print_mode:
-                print(f"Desired build slot does not exist")
             return BuildResult.BASE_NOT_UPGRADED_ENOUGH
 
         # Ensure the build slot is a supply pad
-        if self.build_slots[build_slot_name].build_type != BuildSlotType.SUPPLY_PAD:
-            if self.print_mode:
-                print(f"Not a Supply Pad: {build_slot_name}")
+        if self.build_slots[build_slot_name].build_type is not _SUPPLY_PAD_SLOT_TYPE:
             return BuildResult.NOT_A_SUPPLY_PAD
 
         # Ensure supply pad is BUILT and not being built or any other stages
-        if self.build_slots[build_slot_name].status == BuildSlotState.UPGRADED:
-            if self.print_mode:
-                print(f"Supply Pad already upgraded: {build_slot_name}")
+        if self.build_slots[build_slot_name].status is _SLOT_UPGRADED:
             return BuildResult.SUPPLY_PAD_ALREADY_UPGRADED
-        elif self.build_slots[build_slot_name].status == BuildSlotState.BUILDING:
-            if self.print_mode:
-                print(f"Supply Pad building in progress: {build_slot_name}")
+        elif self.build_slots[build_slot_name].status is _SLOT_BUILDING:
             return BuildResult.BUILD_IN_PROGRESS
-        elif self.build_slots[build_slot_name].status == BuildSlotState.UPGRADING:
-            if self.print_mode:
-                print(f"Supply Pad already upgrading: {build_slot_name}")
+        elif self.build_slots[build_slot_name].status is _SLOT_UPGRADING:
             return BuildResult.SUPPLY_PAD_ALREADY_UPGRADED
-        elif self.build_slots[build_slot_name].status != BuildSlotState.BUILT:
-            if self.print_mode:
-                print(f"Supply pad not built: {build_slot_name}")
+        elif self.build_slots[build_slot_name].status is not _SLOT_BUILT:
             return BuildResult.BUILDING_NOT_BUILT
 
         # Check the tech level
         if self.resource_manager.current_tech_level < 1:
-            if self.print_mode:
-                print(f"Not high enough tech to upgrade supply pad: {build_slot_name}")
             return BuildResult.NOT_ENOUGH_TECH
 
         # Check the money situation and approve if good!
         if self.resource_manager.subtract_money(SUPPLY_PAD_UPGRADE_COST):
             self.build_slots[build_slot_name].upgrade()
             self.build_queue.append(self.build_slots[build_slot_name])
-            if self.print_mode:
-                print(f"Supply Pad upgrade APPROVED: {build_slot_name}")
             return BuildResult.APPROVED
         else:
-            if self.print_mode:
-                print(f"Not enough money to upgrade supply pad: {build_slot_name}")
             return BuildResult.NOT_ENOUGH_RESOURCES
 
     def _base_upgrade_helper(self, upgrade_cost: int, upgrade_timer: int) -> BuildResult:
@@ -222,14 +213,10 @@ class Base:
         """
         # check if there is enough money, if so, approve
         if self.resource_manager.subtract_money(upgrade_cost):
-            if self.print_mode:
-                print(f"Building {BaseLevel(self.base_upgrade_level.value + 1)}")
-            self.base_status = BaseState.UPGRADING
+            self.base_status = _BASE_UPGRADING
             self.build_timer = upgrade_timer
             return BuildResult.APPROVED
         else:
-            if self.print_mode:
-                print(f"Not enough resources for {BaseLevel(self.base_upgrade_level.value + 1)}")
             return BuildResult.NOT_ENOUGH_RESOURCES
 
     def upgrade_base(self) -> BuildResult:
@@ -240,21 +227,15 @@ class Base:
 
         """
         # If the base state is paused, return that
-        if self.base_status == BaseState.PAUSED:
-            if self.print_mode:
-                print(f"Base {self.base_number} is currently PAUSED")
+        if self.base_status is _BASE_PAUSED:
             return BuildResult.PAUSED
 
         # Ensure the base is in an IDLE state, otherwise cant upgrade
-        if self.base_status != BaseState.IDLE:
-            if self.print_mode:
-                print(f"Base {self.base_number} state is not idle, currently {self.base_status}")
+        if self.base_status is not _BASE_IDLE:
             return BuildResult.BUILDING_BUSY
 
         # Check if base is a CITIDALE, in which case already max level, skip
         if self.base_upgrade_level == BaseLevel.CITADEL:
-            if self.print_mode:
-                print("already max level")
             return BuildResult.ALREADY_BUILT
 
         # Perform the checks for each base upgrade level
@@ -268,8 +249,6 @@ class Base:
             return self._base_upgrade_helper(upgrade_cost=CITADEL_UPGRADE_COST,
                                              upgrade_timer=CITADEL_UPGRADE_TIME_SECONDS)
         else:
-            if self.print_mode:
-                print("Invalid Base level")
             return BuildResult.ERROR
 
     def update(self):
@@ -278,21 +257,22 @@ class Base:
 
         """
         # If the base is IDLE, then not paused or upgrading, so start updating slots
-        if self.base_status == BaseState.IDLE:
+        if self.base_status is _BASE_IDLE:
             # Check the build queue. If it is not 0, then start updating.
             if len(self.build_queue) > 0:
                 # If the state is IDLE, then it hasnt been started, set state to BUILDING
-                if self.build_queue[0].status == BuildSlotState.IDLE:
-                    self.build_queue[0].status = BuildSlotState.BUILDING
+                if self.build_queue[0].status is _SLOT_IDLE:
+                    self.build_queue[0].status = _SLOT_BUILDING
                 # If the state is no longer building, and not IDLE, then must be DONE or UPGRADED, so can remove.
-                elif self.build_queue[0].status is not BuildSlotState.BUILDING:
+                elif self.build_queue[0].status is not _SLOT_BUILDING:
                     self.build_queue.pop(0)
-            # Update each build slot
-            for slot_name in self.build_slots:
-                self.build_slots[slot_name].update()
+            # Update each build slot. Only building or upgrading slots change in update
+            for slot in self.build_slots.values():
+                if slot.status is _SLOT_BUILDING or slot.status is _SLOT_UPGRADING:
+                    slot.update()
 
         # Check the build timer. If > 0 then base is building/upgrading. and increment.
-        elif self.base_status == BaseState.UPGRADING:
+        elif self.base_status is _BASE_UPGRADING:
             if self.build_timer > 0:
                 self.build_timer = self.build_timer - 1
             else:
@@ -301,14 +281,12 @@ class Base:
                 if current_index < len(BaseLevel) - 1:
                     next_level_index = current_index + 1
                     self.base_upgrade_level = BaseLevel(next_level_index)
-                self.base_status = BaseState.IDLE
-                if self.print_mode:
-                    print(f"BASE UPGRADED: IS NOW {self.base_upgrade_level}, {self.base_status}")
+                self.base_status = _BASE_IDLE
                 self.build_timer = 0
 
         # Check the pause timer. The pause timer is used for things like simulating clearing a base, where the base
         # is not immediately available build
-        elif self.base_status == BaseState.PAUSED:
+        elif self.base_status is _BASE_PAUSED:
             # if a temple is required, then check if there is a tech level, which notes a temple has been built, which
             # means a prophet is out and the base clearing countdown can continue
             if self.temple_needed_to_clear_second_base:
@@ -320,11 +298,57 @@ class Base:
             if self.pause_timer > 0:
                 self.pause_timer -= 1
             else:
-                self.base_status = BaseState.IDLE
-                if self.print_mode:
-                    print(f"BASE is no longer paused: IS NOW {self.base_status}")
+                self.base_status = _BASE_IDLE
                 self.pause_timer = 0
 
+    def get_quiet_ticks(self) -> float:
+        """
+        Get how many of the next update calls will only count timers down. A quiet update does not change the base
+        state, level, build queue or any build slot state, so the event driven simulation can skip over them.
+
+        :return: float: Number of quiet update calls, math.inf if nothing on the base will change on its own
+        """
+        if self.base_status is _BASE_IDLE:
+            # Starting or removing the first item in the build queue is not quiet
+            if len(self.build_queue) > 0 and self.build_queue[0].status is not _SLOT_BUILDING:
+                return 0
+            quiet_ticks = math.inf
+            for slot in self.build_slots.values():
+                # Only building or upgrading slots change on their own
+                if slot.status is _SLOT_BUILDING or slot.status is _SLOT_UPGRADING:
+                    quiet_ticks = min(quiet_ticks, slot.get_quiet_ticks())
+            return quiet_ticks
+
+        elif self.base_status is _BASE_UPGRADING:
+            return max(self.build_timer, 0)
+
+        elif self.base_status is _BASE_PAUSED:
+            # The pause timer does not count down until there is a tech level, if needed
+            if self.temple_needed_to_clear_second_base and self.resource_manager.current_tech_level <= 0:
+                return math.inf
+            return max(self.pause_timer, 0)
+
+        return 0
+
+    def skip_ticks(self, ticks: int):
+        """
+        Apply several quiet update calls at once. Only valid if ticks is not larger than the value returned by
+        get_quiet_ticks.
+
+        :param ticks: int: The number of update calls to skip
+        """
+        if self.base_status is _BASE_IDLE:
+            for slot in self.build_slots.values():
+                slot.skip_ticks(ticks)
+
+        elif self.base_status is _BASE_UPGRADING:
+            self.build_timer = self.build_timer - ticks
+
+        elif self.base_status is _BASE_PAUSED:
+            if self.temple_needed_to_clear_second_base and self.resource_manager.current_tech_level <= 0:
+                return
+            self.pause_timer = self.pause_timer - ticks
+
     def print_base(self):
         """
         Print base info and build slots on the base. Can be used to print other information about the base as well.
@@ -350,9 +374,9 @@ class Base:
         """
         # Check if there's an available build slot
         if build_slot_name in self.build_slots:
-            if self.build_slots[build_slot_name].build_type == BuildSlotType.SUPPLY_PAD:
-                if (self.build_slots[build_slot_name].status == BuildSlotState.BUILT or
-                        self.build_slots[build_slot_name].status == BuildSlotState.UPGRADED):
+            if self.build_slots[build_slot_name].build_type is _SUPPLY_PAD_SLOT_TYPE:
+                if (self.build_slots[build_slot_name].status is _SLOT_BUILT or
+                        self.build_slots[build_slot_name].status is _SLOT_UPGRADED):
                     return True
                 else:
                     return False
@@ -365,7 +389,7 @@ class Base:
         :return: bool: True if supply pad is upgraded, false if not
         """
         if build_slot_name in self.build_slots:
-            if self.build_slots[build_slot_name].build_type == BuildSlotType.HEAVY_SUPPLY_PAD:
+            if self.build_slots[build_slot_name].build_type is _HEAVY_SUPPLY_PAD_SLOT_TYPE:
                 return True
             else:
                 return False
@@ -382,6 +406,187 @@ class Base:
             return KEEP_UPGRADE_COST
         elif self.base_upgrade_level == BaseLevel.KEEP:
             return CITADEL_UPGRADE_COST
+        return None
+
+
+class TracedBase(Base):
+    """
+    Base that records the events of its methods, and of the build slots it builds, in the trace recorder, so the Base
+    itself never checks for a recorder. The events are worked out from the results of the Base methods. Made by
+    make_base when there is a recorder.
+
+    """
+    __slots__ = ()
+
+    _SUPPLY_PAD_CLASS = TracedSupplyPad
+    _TEMPLE_CLASS = TracedTemple
+
+    # The events for the results of upgrade_supply_pad, besides SUPPLY_PAD_ALREADY_UPGRADED
+    _UPGRADE_SUPPLY_PAD_EVENTS = {
+        BuildResult.BASE_NOT_UPGRADED_ENOUGH: TraceEvent.SLOT_DOES_NOT_EXIST,
+        BuildResult.NOT_A_SUPPLY_PAD: TraceEvent.NOT_A_SUPPLY_PAD,
+        BuildResult.BUILD_IN_PROGRESS: TraceEvent.SUPPLY_PAD_BUILD_IN_PROGRESS,
+        BuildResult.BUILDING_NOT_BUILT: TraceEvent.SUPPLY_PAD_NOT_BUILT,
+        BuildResult.NOT_ENOUGH_TECH: TraceEvent.SUPPLY_PAD_UPGRADE_NOT_ENOUGH_TECH,
+        BuildResult.APPROVED: TraceEvent.SUPPLY_PAD_UPGRADE_APPROVED,
+        BuildResult.NOT_ENOUGH_RESOURCES: TraceEvent.SUPPLY_PAD_UPGRADE_NOT_ENOUGH_RESOURCES,
+    }
+
+    # The events for the results of _default_build_slot_check that were not approved, besides BASE_NOT_UPGRADED_ENOUGH
+    _BUILD_SLOT_CHECK_EVENTS = {
+        BuildResult.ALREADY_BUILT: TraceEvent.SLOT_NOT_EMPTY,
+        BuildResult.NOT_ENOUGH_TECH: TraceEvent.BUILDING_NOT_ENOUGH_TECH,
+        BuildResult.NOT_ENOUGH_RESOURCES: TraceEvent.BUILDING_NOT_ENOUGH_RESOURCES,
+    }
+
+    def _default_build_slot_check(self, build_slot_name: int, tech_requirement: int, resource_requirement: int,
+                                  building_class: type) -> BuildResult:
+        """
+        Run the build slot checks and record why the build was not approved.
+
+        :param build_slot_name: str: The name of the corresponding build slot to build on
+        :param tech_requirement: int: The tech level needed for the building to be built
+        :param resource_requirement: int: the amount of resources needed in order to build the building
+        :param building_class: type: The BuildSlot class of the building, only made once the build is approved
+        :return: BuildResult: The build result from attempting to build the building
+
+        """
+        slot_exists = build_slot_name in self.build_slots
+        build_result = super()._default_build_slot_check(build_slot_name, tech_requirement, resource_requirement,
+                                                         building_class)
+        if build_result is BuildResult.BASE_NOT_UPGRADED_ENOUGH:
+            event = TraceEvent.BASE_NOT_UPGRADED_ENOUGH if slot_exists else TraceEvent.SLOT_DOES_NOT_EXIST
+            self.trace_recorder.record(event, self.base_number, build_slot_name)
+        elif build_result is not BuildResult.APPROVED:
+            self.trace_recorder.record(self._BUILD_SLOT_CHECK_EVENTS[build_result], self.base_number, build_slot_name)
+        return build_result
+
+    def build_supply_pad(self, build_slot_name: int) -> BuildResult:
+        """
+        Build a supply pad and record the result.
+
+        :param build_slot_name: str: The slot location on the base to build
+        :return: BuildResult: The result from the build attempt in the BuildResult class
+
+        """
+        build_result = super().build_supply_pad(build_slot_name)
+        self.trace_recorder.record(TraceEvent.SUPPLY_PAD_BUILD_RESULT, self.base_number, build_slot_name, build_result)
+        return build_result
+
+    def build_temple(self, build_slot_name: int) -> BuildResult:
+        """
+        Build a temple and record the result, or that a temple was already built.
+
+        :param build_slot_name: str: The slot location on the base to build
+        :return: BuildResult: The result from the build attempt in the BuildResult class
+
+        """
+        temple_built = self.resource_manager.current_temple_count > 0
+        build_result = super().build_temple(build_slot_name)
+        if temple_built:
+            self.trace_recorder.record(TraceEvent.TEMPLE_ALREADY_BUILT, self.base_number, build_slot_name)
         else:
-            if self.print_mode:
-                print("not an option for get_next_build_cost")
+            self.trace_recorder.record(TraceEvent.TEMPLE_BUILD_RESULT, self.base_number, build_slot_name, build_result)
+        return build_result
+
+    def upgrade_supply_pad(self, build_slot_name: int) -> BuildResult:
+        """
+        Upgrade the supply pad and record the result.
+
+        :param build_slot_name: str: The slot that wishes to get upgraded
+        :return: BuildResult: The final result from the attempted build/upgrade
+
+        """
+        build_result = super().upgrade_supply_pad(build_slot_name)
+        if build_result is BuildResult.SUPPLY_PAD_ALREADY_UPGRADED:
+            if self.build_slots[build_slot_name].status is _SLOT_UPGRADED:
+                event = TraceEvent.SUPPLY_PAD_ALREADY_UPGRADED
+            else:
+                event = TraceEvent.SUPPLY_PAD_ALREADY_UPGRADING
+        else:
+            event = self._UPGRADE_SUPPLY_PAD_EVENTS[build_result]
+        self.trace_recorder.record(event, self.base_number, build_slot_name)
+        return build_result
+
+    def _base_upgrade_helper(self, upgrade_cost: int, upgrade_timer: int) -> BuildResult:
+        """
+        Start the base upgrade and record if it started.
+
+        :param upgrade_cost: int: The cost for the build/upgrade
+        :param upgrade_timer: int: How long the build/upgrade should take
+        :return: BuildResult: The result from the attempted build
+
+        """
+        build_result = super()._base_upgrade_helper(upgrade_cost, upgrade_timer)
+        if build_result is BuildResult.APPROVED:
+            event = TraceEvent.BASE_UPGRADE_STARTED
+        else:
+            event = TraceEvent.BASE_UPGRADE_NOT_ENOUGH_RESOURCES
+        self.trace_recorder.record(event, self.base_number, detail=BaseLevel(self.base_upgrade_level.value + 1))
+        return build_result
+
+    def upgrade_base(self) -> BuildResult:
+        """
+        Upgrade the base and record why it could not be upgraded.
+
+        :return: BuildResult: The final result from the attempted Base build/upgrade
+
+        """
+        base_status = self.base_status
+        build_result = super().upgrade_base()
+        if build_result is BuildResult.PAUSED:
+            self.trace_recorder.record(TraceEvent.BASE_PAUSED, self.base_number)
+        elif build_result is BuildResult.BUILDING_BUSY:
+            self.trace_recorder.record(TraceEvent.BASE_BUSY, self.base_number, detail=base_status)
+        elif build_result is BuildResult.ALREADY_BUILT:
+            self.trace_recorder.record(TraceEvent.BASE_MAX_LEVEL, self.base_number)
+        elif build_result is BuildResult.ERROR:
+            self.trace_recorder.record(TraceEvent.INVALID_BASE_LEVEL, self.base_number)
+        return build_result
+
+    def update(self):
+        """
+        Update the base and record when it is upgraded or unpaused.
+
+        """
+        base_status = self.base_status
+        super().update()
+        if base_status is not self.base_status:
+            if base_status is _BASE_UPGRADING:
+                self.trace_recorder.record(TraceEvent.BASE_UPGRADED, self.base_number,
+                                           detail=(self.base_upgrade_level, self.base_status))
+            elif base_status is _BASE_PAUSED:
+                self.trace_recorder.record(TraceEvent.BASE_UNPAUSED, self.base_number, detail=self.base_status)
+
+    def get_next_build_cost(self) -> int:
+        """
+        Get the next build cost for the base and record if there is none.
+
+        :return: int: the cost of the next base build
+        """
+        next_build_cost = super().get_next_build_cost()
+        if next_build_cost is None:
+            self.trace_recorder.record(TraceEvent.NO_NEXT_BUILD_COST, self.base_number)
+        return next_build_cost
+
+
+def make_base(resource_manager: ResourceManager, upgrade_level=BaseLevel.EMPTY, base_number=0, pause_timer=0,
+              temple_needed_to_clear_second_base=False, trace_recorder=None, print_mode=None) -> Base:
+    """
+    Make a Base, or a TracedBase when there is a trace recorder.
+
+    :param resource_manager: ResourceManager: The ResourceManager class which contains all tech and resource collection
+    :param upgrade_level: BaseLevel: The starting base level
+    :param base_number: int: The identifying base number
+    :param pause_timer: int: Starting pause timer of the base, 0 for no pause
+    :param temple_needed_to_clear_second_base: bool: If a temple is needed for the pause timer to count down
+    :param trace_recorder: TraceRecorder: Records the events of the base and its build slots, None to not record
+        anything
+    :param print_mode: bool: Deprecated, True is the same as a TraceRecorder with print_events on
+    :return: Base: The new base
+    """
+    trace_recorder = get_print_mode_recorder(resource_manager, trace_recorder, print_mode)
+    base_class = Base if trace_recorder is None else TracedBase
+    return base_class(resource_manager=resource_manager, upgrade_level=upgrade_level, base_number=base_number,
+                      pause_timer=pause_timer, temple_needed_to_clear_second_base=temple_needed_to_clear_second_base,
+                      trace_recorder=trace_recorder)
@@ -90,6 +90,14 @@ class BuildResult(Enum):
     ERROR = 11
 
 
+# How a simulation run ended: the resource amount was reached, the maximum simulation time ran out, or the run was
+# stopped since it could no longer reach the resource amount before the cutoff time
+class SimulationOutcome(Enum):
+    REACHED = 0
+    TIMED_OUT = 1
+    ABORTED = 2
+
+
 # The build orders that can happen
 class Orders(Enum):
     BUILD_SUPPLY_PAD = 1
@@ -0,0 +1,452 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Batch simulator that runs many build orders at the same time, using NumPy arrays for the simulation state.
+
+"""
+import numpy as np
+
+from libraries.ResourceManager import ResourceManager
+from libraries.SimulatorWrapper import SimulatorWrapper
+from libraries.BaseConstants import *
+
+
+# Half seconds are used for the build slot timers, so the 17.5 second supply pad upgrade can be an integer
+HALF_SECONDS_PER_SECOND = 2
+
+# Maximum number of items a base build queue can ever hold. Every build slot can be built once and upgraded once.
+BUILD_QUEUE_SIZE = 2 * len(SlotNumbers)
+
+# The kind of building object on a build slot. Needed since a Temple has a build type of EMPTY
+SLOT_KIND_EMPTY = 0
+SLOT_KIND_SUPPLY_PAD = 1
+SLOT_KIND_TEMPLE = 2
+
+# Build order result codes used inside the batch
+_WAITING = BuildOrderResults.WAITING.value
+_APPROVED = BuildOrderResults.APPROVED.value
+_SKIPPED = BuildOrderResults.SKIPPED.value
+
+# Integer codes for the enums used in the state arrays
+_IDLE = BuildSlotState.IDLE.value
+_BUILDING = BuildSlotState.BUILDING.value
+_BUILT = BuildSlotState.BUILT.value
+_UPGRADING = BuildSlotState.UPGRADING.value
+_UPGRADED = BuildSlotState.UPGRADED.value
+_BASE_IDLE = BaseState.IDLE.value
+_BASE_UPGRADING = BaseState.UPGRADING.value
+_BASE_PAUSED = BaseState.PAUSED.value
+
+# Base level needed for each build slot, index 0 is unused so slot numbers can be used directly
+_SLOT_LEVEL_NEEDED = np.array([0,
+                               BaseLevel.OUTPOST.value, BaseLevel.OUTPOST.value, BaseLevel.OUTPOST.value,
+                               BaseLevel.KEEP.value, BaseLevel.KEEP.value,
+                               BaseLevel.CITADEL.value, BaseLevel.CITADEL.value])
+
+# Base build/upgrade cost and time, indexed by the current base level
+_BASE_UPGRADE_COST = np.array([BASE_BUILD_COST, KEEP_UPGRADE_COST, CITADEL_UPGRADE_COST, 0])
+_BASE_UPGRADE_TIME = np.array([BASE_BUILD_TIME_SECONDS, KEEP_UPGRADE_TIME_SECONDS, CITADEL_UPGRADE_TIME_SECONDS, 0])
+
+
+class EncodedBuildOrders:
+    """
+    A batch of build orders encoded as integer arrays. Build orders shorter than the longest one are padded with 0.
+
+    Args:
+        order_types (np.ndarray): (N, L) array of Orders values, 0 for no order
+        order_bases (np.ndarray): (N, L) array of base indexes into the BatchSimulator base list
+        order_slots (np.ndarray): (N, L) array of slot numbers, 0 for orders without a slot
+        lengths (np.ndarray): (N,) array with the number of orders in each build order
+
+    """
+    def __init__(self, order_types: np.ndarray, order_bases: np.ndarray, order_slots: np.ndarray,
+                 lengths: np.ndarray):
+        self.order_types = order_types
+        self.order_bases = order_bases
+        self.order_slots = order_slots
+        self.lengths = lengths
+
+    def __len__(self):
+        return len(self.lengths)
+
+
+class BatchSimulator:
+    """
+    The BatchSimulator runs N build orders for the same scenario at once. Instead of a ResourceManager, Base and
+    BuildSlot objects per build order, all the state lives in arrays with one row per build order, and every in game
+    second all rows are stepped together with vectorized NumPy operations.
+
+    The rules are the same as RuntimeBuildingBlocks.run_simulation, build_verifier and _get_order_result, including
+    only one build order being tried per second, and which orders are SKIPPED or WAITING, so the results are the same
+    as running every build order through its own SimulatorWrapper.
+
+    Bases are added the same way as with the SimulatorWrapper, and the build orders can reference any Base objects with
+    the same base numbers.
+
+    Args:
+        starting_money (int): The starting money for every build order
+        base_levels (list): The starting BaseLevel of each base
+        base_numbers (list): The base number of each base, used to match build orders to bases
+        pause_timers (list): The pause timer of each base
+        temple_needed_list (list): If a temple is needed to clear each base
+
+    """
+    def __init__(self, starting_money: int):
+        self.starting_money = starting_money
+        self.base_levels = []
+        self.base_numbers = []
+        self.pause_timers = []
+        self.temple_needed_list = []
+
+    def add_base(self, upgrade_level: BaseLevel, base_number: int, pause_timer=0,
+                 temple_needed_to_clear_second_base=False):
+        """
+        Method to add a base to every simulation in the batch. Same as SimulatorWrapper.add_base.
+
+        :param upgrade_level: BaseLevel: Starting level of the base
+        :param base_number: int: Base identification number
+        :param pause_timer: int: Starting pause timer of the base
+        :param temple_needed_to_clear_second_base: bool: If a temple is needed for the pause timer to count down
+        """
+        self.base_levels.append(upgrade_level)
+        self.base_numbers.append(base_number)
+        self.pause_timers.append(pause_timer)
+        self.temple_needed_list.append(temple_needed_to_clear_second_base)
+
+    # The starting bases of a scenario, the same as SimulatorWrapper.add_bases
+    add_bases = SimulatorWrapper.add_bases
+
+    def encode_build_orders(self, build_orders: list[list]) -> EncodedBuildOrders:
+        """
+        Convert a list of build orders in the normal list format to integer arrays. The bases are matched by base
+        number, so the build orders can use any Base objects.
+
+        :param build_orders: list[list]: List of build orders in list format
+        :return: EncodedBuildOrders: The encoded build orders
+        """
+        base_index = {base_number: index for index, base_number in enumerate(self.base_numbers)}
+        longest = max((len(build_order) for build_order in build_orders), default=0)
+        # One extra column of 0 so the order pointer can always be used as an index
+        order_types = np.zeros((len(build_orders), longest + 1), dtype=np.int8)
+        order_bases = np.zeros((len(build_orders), longest + 1), dtype=np.int8)
+        order_slots = np.zeros((len(build_orders), longest + 1), dtype=np.int8)
+        lengths = np.zeros(len(build_orders), dtype=np.int64)
+
+        for n, build_order in enumerate(build_orders):
+            lengths[n] = len(build_order)
+            for i, order in enumerate(build_order):
+                order_types[n, i] = order[0].value
+                order_bases[n, i] = base_index[order[1].base_number]
+                order_slots[n, i] = 0 if order[2] is None else order[2].value
+
+        return EncodedBuildOrders(order_types=order_types, order_bases=order_bases, order_slots=order_slots,
+                                  lengths=lengths)
+
+    def run_simulation(self, build_orders: list[list], resource_trigger: int,
+                       simulation_time_seconds: int) -> list:
+        """
+        Run every build order in the list. Same as calling SimulatorWrapper.run_simulation for each build order, and
+        like it, orders that were skipped are overwritten with "SKIPPED" in the build order lists.
+
+        :param build_orders: list[list]: List of build orders in list format
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param simulation_time_seconds: int: Maximum time for the simulation to reach
+        :return: list: The final number of seconds for each build order, None if the simulation timed out
+        """
+        final_times, skipped = self.run_encoded(self.encode_build_orders(build_orders),
+                                                resource_trigger=resource_trigger,
+                                                simulation_time_seconds=simulation_time_seconds)
+        for n, i in zip(*np.nonzero(skipped)):
+            build_orders[n][i][0] = "SKIPPED"
+        return [None if final_time < 0 else int(final_time) for final_time in final_times]
+
+    def run_encoded(self, encoded: EncodedBuildOrders, resource_trigger: int,
+                    simulation_time_seconds: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Main simulation loop for the encoded build orders. Every loop is one in game second for all build orders that
+        have not reached the resource trigger yet. Finished build orders are removed from the working arrays so the
+        later seconds only work on the build orders that are still running.
+
+        :param encoded: EncodedBuildOrders: The encoded build orders to run
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param simulation_time_seconds: int: Maximum time for the simulation to reach
+        :return: tuple[np.ndarray, np.ndarray]: The final times (-1 for a timeout) and the (N, L) mask of skipped orders
+        """
+        number_of_orders = len(encoded)
+        number_of_bases = len(self.base_numbers)
+        final_times = np.full(number_of_orders, -1, dtype=np.int64)
+        skipped = np.zeros(encoded.order_types.shape, dtype=bool)
+        if number_of_orders == 0:
+            return final_times, skipped[:, :-1]
+
+        income_table = self.get_income_table(len(SlotNumbers) * number_of_bases)
+        temple_needed = np.array(self.temple_needed_list, dtype=bool)
+        state = _BatchState(simulator=self, number_of_orders=number_of_orders, encoded=encoded)
+
+        simulation_time = 0
+        while simulation_time < simulation_time_seconds and len(state.rows) > 0:
+            self._verify_build_orders(state, skipped, temple_needed)
+            for base_index in range(number_of_bases):
+                self._update_base(state, base_index, temple_needed[base_index])
+            state.money += income_table[state.lite, state.heavy]
+
+            # Check the exit condition and drop the finished rows
+            finished = state.money >= resource_trigger
+            if finished.any():
+                final_times[state.rows[finished]] = simulation_time
+                state.keep(~finished)
+
+            simulation_time = simulation_time + 1
+
+        return final_times, skipped[:, :-1]
+
+    @staticmethod
+    def get_income_table(max_supply_pads: int) -> np.ndarray:
+        """
+        Money added per second for every number of lite (row) and heavy (column) supply pads.
+
+        :param max_supply_pads: int: The largest number of supply pads of one type
+        :return: np.ndarray: The income table
+        """
+        income_table = np.zeros((max_supply_pads + 1, max_supply_pads + 1), dtype=np.int64)
+        for lite in range(max_supply_pads + 1):
+            for heavy in range(max_supply_pads + 1):
+                income_table[lite, heavy] = ResourceManager.get_income(lite, heavy)
+        return income_table
+
+    @staticmethod
+    def _verify_build_orders(state, skipped: np.ndarray, temple_needed: np.ndarray):
+        """
+        Vectorized version of RuntimeBuildingBlocks.build_verifier. Tries the current build order of every row,
+        applies the approved builds, and moves the order pointer on approved and skipped orders.
+
+        :param state: _BatchState: The state of the rows still running
+        :param skipped: np.ndarray: The (N, L) mask of skipped orders, updated in place
+        :param temple_needed: np.ndarray: If each base needs a temple to clear its pause timer
+        """
+        rows = np.arange(len(state.rows))
+        order = state.order_types[state.order_index, rows]
+        base = state.order_bases[state.order_index, rows].astype(np.int64)
+        slot = state.order_slots[state.order_index, rows].astype(np.int64)
+        result = np.full(len(rows), _WAITING, dtype=np.int8)
+        # Rows without any build orders left do nothing
+        result[order == 0] = -1
+
+        money = state.money
+        base_status = state.base_status[base, rows]
+        base_level = state.base_level[base, rows]
+        slot_type = state.slot_type[base, slot, rows]
+        slot_status = state.slot_status[base, slot, rows]
+        # Not enough resources is only a wait if there is a supply pad to make more resources
+        money_result = np.where(state.pad_flag, _WAITING, _SKIPPED)
+
+        # Build a supply pad or temple, same checks as Base._default_build_slot_check
+        is_build = (order == Orders.BUILD_SUPPLY_PAD.value) | (order == Orders.BUILD_TEMPLE.value)
+        cost = np.where(order == Orders.BUILD_TEMPLE.value, TEMPLE_COST, SUPPLY_PAD_COST)
+        build_result = np.where(money >= cost, _APPROVED, money_result)
+        build_result = np.where(base_level < _SLOT_LEVEL_NEEDED[slot],
+                                np.where(base_status == _BASE_UPGRADING, _WAITING, _SKIPPED), build_result)
+        slot_free = slot_type == BuildSlotType.EMTPY.value
+        if np.any((order == Orders.BUILD_SUPPLY_PAD.value) & slot_free &
+                  (state.slot_kind[base, slot, rows] == SLOT_KIND_TEMPLE)):
+            raise ValueError("Build order builds a supply pad on top of a Temple, which is not supported by the batch "
+                             "kernel, use SimulatorWrapper")
+        build_result = np.where(slot_free, build_result, _SKIPPED)
+        build_result = np.where((order == Orders.BUILD_TEMPLE.value) & (state.temple_count > 0), _SKIPPED,
+                                build_result)
+        result = np.where(is_build, build_result, result)
+
+        # Upgrade the base, same checks as Base.upgrade_base
+        is_base = order == Orders.UPGRADE_BASE.value
+        base_cost = _BASE_UPGRADE_COST[base_level]
+        base_result = np.where(money >= base_cost, _APPROVED, money_result)
+        base_result = np.where(base_level == BaseLevel.CITADEL.value, _SKIPPED, base_result)
+        base_result = np.where(base_status == _BASE_UPGRADING, _WAITING, base_result)
+        paused_result = np.where(temple_needed[base] & (state.temple_count > 0), _WAITING, _SKIPPED)
+        base_result = np.where(base_status == _BASE_PAUSED, paused_result, base_result)
+        result = np.where(is_base, base_result, result)
+
+        # Upgrade a supply pad, same checks as Base.upgrade_supply_pad
+        is_upgrade = order == Orders.UPGRADE_SUPPLY_PAD.value
+        upgrade_result = np.where(money >= SUPPLY_PAD_UPGRADE_COST, _APPROVED, money_result)
+        upgrade_result = np.where(state.tech_level < 1, np.where(state.temple_count == 1, _WAITING, _SKIPPED),
+                                  upgrade_result)
+        upgrade_result = np.where(slot_status == _BUILT, upgrade_result, _SKIPPED)
+        upgrade_result = np.where(slot_status == _BUILDING, _WAITING, upgrade_result)
+        upgrade_result = np.where(slot_type == BuildSlotType.SUPPLY_PAD.value, upgrade_result, _SKIPPED)
+        result = np.where(is_upgrade, upgrade_result, result)
+
+        approved = result == _APPROVED
+
+        # Apply the approved supply pad and temple builds
+        built = approved & is_build
+        if built.any():
+            r, b, s = rows[built], base[built], slot[built]
+            is_temple = order[built] == Orders.BUILD_TEMPLE.value
+            state.money[built] -= cost[built]
+            state.slot_kind[b, s, r] = np.where(is_temple, SLOT_KIND_TEMPLE, SLOT_KIND_SUPPLY_PAD)
+            state.slot_type[b, s, r] = np.where(is_temple, BuildSlotType.EMTPY.value, BuildSlotType.SUPPLY_PAD.value)
+            state.slot_status[b, s, r] = _IDLE
+            state.slot_timer[b, s, r] = np.where(is_temple, TEMPLE_BUILD_TIME_SECONDS,
+                                                 SUPPLY_PAD_BUILD_TIME_SECONDS) * HALF_SECONDS_PER_SECOND
+            state.temple_count[r[is_temple]] += 1
+            state.pad_flag[r[~is_temple]] = True
+            state.enqueue(r, b, s)
+
+        # Apply the approved base upgrades
+        upgraded_base = approved & is_base
+        if upgraded_base.any():
+            r, b = rows[upgraded_base], base[upgraded_base]
+            state.money[upgraded_base] -= base_cost[upgraded_base]
+            state.base_status[b, r] = _BASE_UPGRADING
+            state.base_timer[b, r] = _BASE_UPGRADE_TIME[base_level[upgraded_base]]
+
+        # Apply the approved supply pad upgrades
+        upgraded_pad = approved & is_upgrade
+        if upgraded_pad.any():
+            r, b, s = rows[upgraded_pad], base[upgraded_pad], slot[upgraded_pad]
+            state.money[upgraded_pad] -= SUPPLY_PAD_UPGRADE_COST
+            state.slot_status[b, s, r] = _UPGRADING
+            state.slot_timer[b, s, r] = int(SUPPLY_PAD_UPGRADE_TIME_SECONDS * HALF_SECONDS_PER_SECOND)
+            state.enqueue(r, b, s)
+
+        # Move on to the next order for approved and skipped orders
+        was_skipped = result == _SKIPPED
+        if was_skipped.any():
+            skipped[state.rows[was_skipped], state.order_index[was_skipped]] = True
+        state.order_index[approved | was_skipped] += 1
+
+    @staticmethod
+    def _update_base(state, base_index: int, temple_needed: bool):
+        """
+        Vectorized version of Base.update and the build slot update methods, for one base of every row.
+
+        :param state: _BatchState: The state of the rows still running
+        :param base_index: int: The index of the base to update
+        :param temple_needed: bool: If the base needs a temple to clear its pause timer
+        """
+        base_status = state.base_status[base_index]
+
+        # IDLE bases start or remove the first item in the build queue, then update every build slot
+        idle = base_status == _BASE_IDLE
+        queued = idle & (state.queue_length[base_index] > 0)
+        if queued.any():
+            r = np.flatnonzero(queued)
+            front = state.queue[base_index, state.queue_head[base_index, r], r]
+            front_status = state.slot_status[base_index, front, r]
+            start = front_status == _IDLE
+            state.slot_status[base_index, front[start], r[start]] = _BUILDING
+            done = ~start & (front_status != _BUILDING)
+            state.queue_head[base_index, r[done]] += 1
+            state.queue_length[base_index, r[done]] -= 1
+
+        slot_status = state.slot_status[base_index]
+        slot_timer = state.slot_timer[base_index]
+        active = ((slot_status == _BUILDING) | (slot_status == _UPGRADING)) & idle
+        counting = active & (slot_timer > 0)
+        slot_timer -= counting * HALF_SECONDS_PER_SECOND
+        complete = active & ~counting
+        if complete.any():
+            slot_kind = state.slot_kind[base_index]
+            new_pad = complete & (slot_status == _BUILDING) & (slot_kind == SLOT_KIND_SUPPLY_PAD)
+            new_heavy = complete & (slot_status == _UPGRADING)
+            new_temple = complete & (slot_kind == SLOT_KIND_TEMPLE)
+            state.lite += new_pad.sum(axis=0) - new_heavy.sum(axis=0)
+            state.heavy += new_heavy.sum(axis=0)
+            state.tech_level += new_temple.sum(axis=0)
+            slot_status[complete] = _BUILT
+            slot_status[new_heavy] = _UPGRADED
+            state.slot_type[base_index][new_heavy] = BuildSlotType.HEAVY_SUPPLY_PAD.value
+            slot_timer[complete] = 0
+
+        # UPGRADING bases count down, then go up a level
+        upgrading = base_status == _BASE_UPGRADING
+        if upgrading.any():
+            base_timer = state.base_timer[base_index]
+            counting = upgrading & (base_timer > 0)
+            base_timer -= counting
+            upgraded = upgrading & ~counting
+            base_level = state.base_level[base_index]
+            base_level[upgraded] = np.minimum(base_level[upgraded] + 1, BaseLevel.CITADEL.value)
+            base_status[upgraded] = _BASE_IDLE
+            base_timer[upgraded] = 0
+
+        # PAUSED bases count down, if they do not need to wait on a temple
+        paused = base_status == _BASE_PAUSED
+        if temple_needed:
+            paused = paused & (state.tech_level > 0)
+        if paused.any():
+            pause_timer = state.pause_timer[base_index]
+            counting = paused & (pause_timer > 0)
+            pause_timer -= counting
+            unpaused = paused & ~counting
+            base_status[unpaused] = _BASE_IDLE
+            pause_timer[unpaused] = 0
+
+
+class _BatchState:
+    """
+    Arrays holding the simulation state of the rows that are still running. The last axis of every array is the row,
+    so the state of one base or build slot for all rows is stored together, and rows is the original build order index
+    for each row.
+
+    """
+    def __init__(self, simulator: BatchSimulator, number_of_orders: int, encoded: EncodedBuildOrders):
+        number_of_bases = len(simulator.base_numbers)
+        number_of_slots = len(SlotNumbers) + 1
+
+        self.rows = np.arange(number_of_orders)
+        self.order_types = np.ascontiguousarray(encoded.order_types.T)
+        self.order_bases = np.ascontiguousarray(encoded.order_bases.T)
+        self.order_slots = np.ascontiguousarray(encoded.order_slots.T)
+        self.order_index = np.zeros(number_of_orders, dtype=np.int64)
+
+        # Resource manager state
+        self.money = np.full(number_of_orders, simulator.starting_money, dtype=np.int64)
+        self.lite = np.zeros(number_of_orders, dtype=np.int64)
+        self.heavy = np.zeros(number_of_orders, dtype=np.int64)
+        self.tech_level = np.zeros(number_of_orders, dtype=np.int64)
+        self.temple_count = np.zeros(number_of_orders, dtype=np.int64)
+        self.pad_flag = np.zeros(number_of_orders, dtype=bool)
+
+        # Base state
+        base_levels = np.array([level.value for level in simulator.base_levels], dtype=np.int64)
+        pause_timers = np.array(simulator.pause_timers, dtype=np.int64)
+        self.base_level = np.repeat(base_levels[:, None], number_of_orders, axis=1)
+        self.base_status = np.repeat(np.where(pause_timers > 0, _BASE_PAUSED, _BASE_IDLE)[:, None], number_of_orders,
+                                     axis=1)
+        self.base_timer = np.zeros((number_of_bases, number_of_orders), dtype=np.int64)
+        self.pause_timer = np.repeat(pause_timers[:, None], number_of_orders, axis=1)
+
+        # Build slot state, slot 0 is unused so the slot numbers can be used directly
+        self.slot_kind = np.zeros((number_of_bases, number_of_slots, number_of_orders), dtype=np.int8)
+        self.slot_type = np.zeros((number_of_bases, number_of_slots, number_of_orders), dtype=np.int8)
+        self.slot_status = np.zeros((number_of_bases, number_of_slots, number_of_orders), dtype=np.int8)
+        self.slot_timer = np.zeros((number_of_bases, number_of_slots, number_of_orders), dtype=np.int64)
+
+        # Build queue of slot numbers for each base
+        self.queue = np.zeros((number_of_bases, BUILD_QUEUE_SIZE, number_of_orders), dtype=np.int64)
+        self.queue_head = np.zeros((number_of_bases, number_of_orders), dtype=np.int64)
+        self.queue_length = np.zeros((number_of_bases, number_of_orders), dtype=np.int64)
+
+    def enqueue(self, rows: np.ndarray, bases: np.ndarray, slots: np.ndarray):
+        """
+        Add build slots to the back of the build queues.
+
+        :param rows: np.ndarray: The rows to add to
+        :param bases: np.ndarray: The base index for each row
+        :param slots: np.ndarray: The slot number to add for each row
+        """
+        self.queue[bases, self.queue_head[bases, rows] + self.queue_length[bases, rows], rows] = slots
+        self.queue_length[bases, rows] += 1
+
+    def keep(self, mask: np.ndarray):
+        """
+        Only keep the rows in the mask, used to drop the rows that have finished.
+
+        :param mask: np.ndarray: Boolean mask of the rows to keep
+        """
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray):
+                setattr(self, name, value[..., mask])
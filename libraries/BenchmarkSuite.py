@@ -0,0 +1,417 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Benchmark suite for the simulator and build order generator, on fixed seeded build orders, that also checks the final
+times do not change.
+
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import random
+import time
+import tracemalloc
+
+from libraries.BaseClass import Base
+from libraries.BaseConstants import BaseLevel, SlotNumbers
+from libraries.BuildOrderEncoding import decode_build_order, encode_build_order
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.ResourceManager import ResourceManager
+from libraries.RuntimeBuildingBlocks import RuntimeBuildingBlocks
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+# Settings of the build order corpora, every number of bases with every resource trigger
+CORPUS_NUMBERS_OF_BASES = [1, 2, 3]
+CORPUS_RESOURCE_TRIGGERS = [3000, 3300, 6800]
+
+# Settings the handcrafted build orders of halo_wars_supply_pad_simulator are run with, the same as that file
+HANDCRAFTED_RESOURCE_TRIGGER = 3000
+HANDCRAFTED_SIMULATION_TIME_SECONDS = 2000
+HANDCRAFTED_PAUSE_TIMER = 30
+
+
+def get_checksum(values: list) -> str:
+    """
+    Stable checksum of a list of values, such as the final times of a corpus, to check they have not changed.
+
+    :param values: list: The values, each is converted to text
+    :return: str: The checksum as hex text
+    """
+    return hashlib.blake2b(",".join(str(value) for value in values).encode(), digest_size=8).hexdigest()
+
+
+def load_baseline(baseline_path: str) -> dict:
+    """
+    Load saved benchmark results and the settings they were run with.
+
+    :param baseline_path: str: The path of the baseline json file
+    :return: dict: {"settings": BenchmarkSuite.get_settings, "results": BenchmarkSuite.run}, empty if there is no
+        baseline file. A baseline saved without its settings has empty settings
+    """
+    if not os.path.exists(baseline_path):
+        return {}
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    if "results" not in baseline:
+        return {"settings": {}, "results": baseline}
+    return baseline
+
+
+def save_baseline(results: dict, baseline_path: str, settings: dict):
+    """
+    Save benchmark results as the baseline for later runs, with the settings they were run with, since the checksums
+    depend on them.
+
+    :param results: dict: The benchmark results from BenchmarkSuite.run
+    :param baseline_path: str: The path of the baseline json file
+    :param settings: dict: The settings of the run from BenchmarkSuite.get_settings
+    """
+    directory = os.path.dirname(baseline_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(baseline_path, 'w') as baseline_file:
+        json.dump({"settings": settings, "results": results}, baseline_file, indent=4)
+
+
+def get_changed_settings(settings: dict, baseline: dict) -> list:
+    """
+    Get the settings that are different from the ones the baseline was run with. The checksums of two runs can only be
+    compared when there are none.
+
+    :param settings: dict: The settings of the run from BenchmarkSuite.get_settings
+    :param baseline: dict: The baseline from load_baseline
+    :return: list: A message for each changed setting, empty if there are none
+    """
+    baseline_settings = baseline.get("settings", {})
+    return [f"{name} is {value}, the baseline was run with {baseline_settings.get(name)}"
+            for name, value in settings.items() if baseline_settings.get(name) != value]
+
+
+def compare_to_baseline(results: dict, baseline: dict, regression_threshold: float, compare_checksums=True) -> list:
+    """
+    Compare benchmark results to a baseline. A benchmark is flagged if its checksum changed, so its final times or
+    generated build orders are different, or if its rate is more than regression_threshold slower.
+
+    :param results: dict: The benchmark results from BenchmarkSuite.run
+    :param baseline: dict: The baseline from load_baseline
+    :param regression_threshold: float: The fraction slower a rate can be before it is flagged, for example 0.1
+    :param compare_checksums: bool: Flag changed checksums, False when the settings are different from the baseline's,
+        see get_changed_settings
+    :return: list: A message for each flagged benchmark, empty if there are none
+    """
+    messages = []
+    baseline_results = baseline.get("results", {})
+    for name, result in results.items():
+        if name not in baseline_results:
+            continue
+        baseline_result = baseline_results[name]
+        if compare_checksums and result["checksum"] != baseline_result["checksum"]:
+            messages.append(f"{name}: results changed, checksum {result['checksum']} was "
+                            f"{baseline_result['checksum']}")
+        if result["rate"] < baseline_result["rate"] * (1 - regression_threshold):
+            messages.append(f"{name}: {result['rate']:.1f} {result['unit']} is "
+                            f"{1 - result['rate'] / baseline_result['rate']:.1%} slower than the baseline "
+                            f"{baseline_result['rate']:.1f} {baseline_result['unit']}")
+    return messages
+
+
+class BenchmarkSuite:
+    """
+    The BenchmarkSuite times the simulator and the build order generator on fixed build orders, so runs can be compared
+    before and after a change:
+        - generate: GenerateOrdersBuildingBlocks.generate_random_build_orders, in generated orders per second
+        - generate_legal: the same with legal_move_generation, which uses generate_legal_build_orders
+        - simulate: RuntimeBuildingBlocks.run_simulation and run_simulation_event_driven on a seeded corpus of
+          corpus_size build orders for each number of bases and resource trigger, and on the handcrafted build orders of
+          halo_wars_supply_pad_simulator, in simulations per second and simulated game ticks per second
+        - simulate_compiled: the compiled kernel of CompiledSimulator on the same corpora, with one call per corpus,
+          only if Numba is installed
+        - base_update and resource_manager_update: Base.update and ResourceManager.update, in calls per second
+
+    Each benchmark is timed repeats times and the fastest is kept, then run once more with tracemalloc for its peak
+    memory, since tracemalloc slows the timed runs down. Each benchmark also has a checksum of its final times or
+    generated build orders, so the suite doubles as a check that a speed up did not change the results. The tick, event
+    driven and compiled simulations of a corpus always have the same checksum. verify_compiled_kernel checks the kernel
+    of CompiledSimulator against RuntimeBuildingBlocks.run_simulation on the corpora, with or without Numba.
+
+    Args:
+        corpus_size (int): Number of build orders in each corpus, and the number of generated build orders
+        seed (int): The seed for the build order corpora
+        repeats (int): Number of timed runs of each benchmark
+        update_calls (int): Number of calls for the update benchmarks
+
+    """
+    def __init__(self, corpus_size=50, seed=2024, repeats=3, update_calls=20000):
+        self.corpus_size = corpus_size
+        self.seed = seed
+        self.repeats = repeats
+        self.update_calls = update_calls
+
+    def get_settings(self) -> dict:
+        """
+        Get the settings the checksums depend on, to save with a baseline.
+
+        :return: dict: The corpus_size, seed and update_calls of the suite
+        """
+        return {"corpus_size": self.corpus_size, "seed": self.seed, "update_calls": self.update_calls}
+
+    def run(self, print_mode=True) -> dict:
+        """
+        Run every benchmark.
+
+        :param print_mode: bool: Print each result as it is measured
+        :return: dict: Benchmark name to {"rate", "unit", "ticks_per_second", "peak_memory_kib", "checksum"}
+        """
+        results = {}
+        for number_of_bases in CORPUS_NUMBERS_OF_BASES:
+            results[f"generate_{number_of_bases}b"] = self._measure(
+                "generated orders/s", lambda: self._run_generation(number_of_bases))
+            results[f"generate_legal_{number_of_bases}b"] = self._measure(
+                "generated orders/s", lambda: self._run_generation(number_of_bases, legal_move_generation=True))
+
+        for number_of_bases in CORPUS_NUMBERS_OF_BASES:
+            # One corpus per number of bases, seeded so every run simulates the same build orders
+            corpus = self._get_corpus(number_of_bases)
+            for resource_trigger in CORPUS_RESOURCE_TRIGGERS:
+                for event_driven in [False, True]:
+                    name = f"simulate_{'event' if event_driven else 'tick'}_{number_of_bases}b_{resource_trigger}r"
+                    results[name] = self._measure("simulations/s", lambda: self._run_corpus(
+                        corpus, number_of_bases, resource_trigger, event_driven))
+                if self._is_compiled_kernel_available():
+                    name = f"simulate_compiled_{number_of_bases}b_{resource_trigger}r"
+                    results[name] = self._measure("simulations/s", lambda: self._run_compiled_corpus(
+                        corpus, number_of_bases, resource_trigger))
+
+        for event_driven in [False, True]:
+            name = f"simulate_{'event' if event_driven else 'tick'}_handcrafted"
+            results[name] = self._measure("simulations/s", lambda: self._run_handcrafted(event_driven))
+
+        results["base_update"] = self._measure("calls/s", self._run_base_update)
+        results["resource_manager_update"] = self._measure("calls/s", self._run_resource_manager_update)
+
+        if print_mode:
+            for name, result in results.items():
+                ticks_text = f", {result['ticks_per_second']:.0f} ticks/s" if result["ticks_per_second"] else ""
+                print(f"{name}: {result['rate']:.1f} {result['unit']}{ticks_text}, "
+                      f"peak memory {result['peak_memory_kib']:.1f} KiB, checksum {result['checksum']}")
+        return results
+
+    def verify_compiled_kernel(self) -> list:
+        """
+        Check the kernel of CompiledSimulator against RuntimeBuildingBlocks.run_simulation on every corpus and resource
+        trigger. Without Numba the kernel is checked as Python code.
+
+        :return: list: A message for each build order the kernel got a different result for, empty if there are none
+        """
+        # NumPy is only needed for the compiled kernel
+        from libraries.CompiledSimulator import CompiledSimulator
+
+        messages = []
+        for number_of_bases in CORPUS_NUMBERS_OF_BASES:
+            corpus = self._get_corpus(number_of_bases)
+            compiled_simulator = CompiledSimulator(starting_money=800)
+            compiled_simulator.add_bases(number_of_bases)
+            for resource_trigger in CORPUS_RESOURCE_TRIGGERS:
+                messages.extend(f"{number_of_bases}b_{resource_trigger}r: {message}" for message in
+                                compiled_simulator.verify(corpus, resource_trigger=resource_trigger,
+                                                          simulation_time_seconds=1000))
+        return messages
+
+    def _get_corpus(self, number_of_bases: int) -> list[bytes]:
+        """
+        Generate the seeded build order corpus for a number of bases.
+
+        :param number_of_bases: int: Number of bases to generate the build orders for
+        :return: list[bytes]: corpus_size packed build orders, the same every run
+        """
+        generator = GenerateOrdersBuildingBlocks(random_generator=random.Random(self.seed + number_of_bases))
+        return [generator.generate_random_packed_build_order(number_of_bases) for _ in range(self.corpus_size)]
+
+    @staticmethod
+    def _is_compiled_kernel_available() -> bool:
+        """
+        Check if Numba is installed, without importing NumPy when it is not needed.
+
+        :return: bool: True if the compiled kernel can be benchmarked
+        """
+        return importlib.util.find_spec("numba") is not None
+
+    def _measure(self, unit: str, benchmark) -> dict:
+        """
+        Time a benchmark, then measure its peak memory.
+
+        :param unit: str: The unit of the rate, what the count of the benchmark is per second
+        :param benchmark: function: Runs the benchmark once, returning [count, simulated ticks, checksum values]
+        :return: dict: The benchmark result
+        """
+        best_seconds = None
+        for _ in range(self.repeats):
+            start_time = time.perf_counter()
+            count, ticks, checksum_values = benchmark()
+            seconds = time.perf_counter() - start_time
+            if best_seconds is None or seconds < best_seconds:
+                best_seconds = seconds
+
+        tracemalloc.start()
+        benchmark()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return {"rate": count / best_seconds,
+                "unit": unit,
+                "ticks_per_second": ticks / best_seconds,
+                "peak_memory_kib": peak_memory / 1024,
+                "checksum": get_checksum(checksum_values)}
+
+    def _run_generation(self, number_of_bases: int, legal_move_generation=False) -> list:
+        """
+        Generate corpus_size seeded build orders.
+
+        :param number_of_bases: int: Number of bases to generate the build orders for
+        :param legal_move_generation: bool: Generate them with generate_legal_build_orders
+        :return: list: [number of generated orders, 0, packed build orders]
+        """
+        generator = GenerateOrdersBuildingBlocks(random_generator=random.Random(self.seed),
+                                                 legal_move_generation=legal_move_generation)
+        # The bases are only used for generating the build orders, they are never simulated
+        sim_wrapper = SimulatorWrapper(starting_money=0, fine_debug=False)
+        sim_wrapper.add_bases(number_of_bases)
+        build_orders = [encode_build_order(generator.generate_random_build_orders(sim_wrapper.base_list))
+                        for _ in range(self.corpus_size)]
+        return [sum(len(build_order) for build_order in build_orders), 0, [build_order.hex()
+                                                                          for build_order in build_orders]]
+
+    @staticmethod
+    def _run_corpus(corpus: list[bytes], number_of_bases: int, resource_trigger: int, event_driven: bool) -> list:
+        """
+        Simulate every build order of a corpus, each with its own SimulatorWrapper, the same way run_build_combinations
+        does.
+
+        :param corpus: list[bytes]: The packed build orders
+        :param number_of_bases: int: Number of bases, the first starts as a KEEP and the others are empty
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param event_driven: bool: Use the event driven simulation instead of one tick at a time
+        :return: list: [number of simulations, simulated ticks, final times]
+        """
+        # Same defaults as run_build_combinations
+        simulation_time_seconds = 1000
+        final_times = []
+        ticks = 0
+        for packed_build_order in corpus:
+            sim_wrapper = SimulatorWrapper(starting_money=800, fine_debug=False, event_driven=event_driven)
+            sim_wrapper.add_bases(number_of_bases)
+            final_time = sim_wrapper.run_simulation(build_order=decode_build_order(packed_build_order,
+                                                                                   sim_wrapper.base_list),
+                                                    resource_trigger=resource_trigger,
+                                                    simulation_time_seconds=simulation_time_seconds)
+            final_times.append(final_time)
+            ticks += simulation_time_seconds if final_time is None else final_time
+        return [len(corpus), ticks, final_times]
+
+    @staticmethod
+    def _run_compiled_corpus(corpus: list[bytes], number_of_bases: int, resource_trigger: int) -> list:
+        """
+        Simulate every build order of a corpus with one call of the compiled kernel.
+
+        :param corpus: list[bytes]: The packed build orders
+        :param number_of_bases: int: Number of bases, the first starts as a KEEP and the others are empty
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :return: list: [number of simulations, simulated ticks, final times]
+        """
+        from libraries.CompiledSimulator import CompiledSimulator
+
+        # Same defaults as _run_corpus
+        simulation_time_seconds = 1000
+        compiled_simulator = CompiledSimulator(starting_money=800)
+        compiled_simulator.add_bases(number_of_bases)
+        final_times = [final_time for final_time, _ in compiled_simulator.run_packed(
+            corpus, resource_trigger=resource_trigger, simulation_time_seconds=simulation_time_seconds)]
+        ticks = sum(simulation_time_seconds if final_time is None else final_time for final_time in final_times)
+        return [len(corpus), ticks, final_times]
+
+    @staticmethod
+    def _run_handcrafted(event_driven: bool) -> list:
+        """
+        Simulate the handcrafted build orders of halo_wars_supply_pad_simulator, with the same bases that file uses: a
+        KEEP, and an empty second base that is paused until a temple is built and HANDCRAFTED_PAUSE_TIMER seconds after.
+
+        :param event_driven: bool: Use the event driven simulation instead of one tick at a time
+        :return: list: [number of simulations, simulated ticks, final times]
+        """
+        # Imported here since the file makes its bases when it is imported
+        import halo_wars_supply_pad_simulator
+
+        packed_build_orders = [encode_build_order(build_order) for build_order in [
+            halo_wars_supply_pad_simulator.build_orders, halo_wars_supply_pad_simulator.build_orders_2,
+            halo_wars_supply_pad_simulator.build_orders_3, halo_wars_supply_pad_simulator.build_orders_4]]
+
+        final_times = []
+        ticks = 0
+        for packed_build_order in packed_build_orders:
+            resource_manager = ResourceManager()
+            resource_manager.add_money(800)
+            base_list = [Base(resource_manager=resource_manager, upgrade_level=BaseLevel.KEEP, base_number=1),
+                         Base(resource_manager=resource_manager, upgrade_level=BaseLevel.EMPTY, base_number=2,
+                              pause_timer=HANDCRAFTED_PAUSE_TIMER,
+                              temple_needed_to_clear_second_base=True)]
+            runtime_building_blocks = RuntimeBuildingBlocks(resource_manager=resource_manager)
+            if event_driven:
+                run_simulation = runtime_building_blocks.run_simulation_event_driven
+            else:
+                run_simulation = runtime_building_blocks.run_simulation
+            final_time = run_simulation(build_orders=decode_build_order(packed_build_order, base_list),
+                                        resource_amount=HANDCRAFTED_RESOURCE_TRIGGER,
+                                        simulation_time_max=HANDCRAFTED_SIMULATION_TIME_SECONDS,
+                                        base_list=base_list,
+                                        fine_debug=False)
+            final_times.append(final_time)
+            ticks += HANDCRAFTED_SIMULATION_TIME_SECONDS if final_time is None else final_time
+        return [len(packed_build_orders), ticks, final_times]
+
+    def _run_base_update(self) -> list:
+        """
+        Call Base.update on a base that builds a supply pad and a temple, upgrades to a CITADEL, and then builds and
+        upgrades supply pads on every slot, making a new base each time the last one runs out of work.
+
+        :return: list: [number of calls, 0, the money left after each base]
+        """
+        money_left = []
+        calls = 0
+        while calls < self.update_calls:
+            resource_manager = ResourceManager()
+            resource_manager.add_money(100000)
+            base = Base(resource_manager=resource_manager, upgrade_level=BaseLevel.KEEP, base_number=1)
+            base.build_supply_pad(SlotNumbers.build_slot_1.value)
+            base.build_temple(SlotNumbers.build_slot_2.value)
+            for _ in range(200):
+                base.update()
+            base.upgrade_base()
+            for _ in range(200):
+                base.update()
+            for slot in range(SlotNumbers.build_slot_3.value, SlotNumbers.build_slot_7.value + 1):
+                base.build_supply_pad(slot)
+            for slot in [SlotNumbers.build_slot_1.value] + list(range(SlotNumbers.build_slot_3.value,
+                                                                     SlotNumbers.build_slot_7.value + 1)):
+                base.upgrade_supply_pad(slot)
+            for _ in range(600):
+                base.update()
+            calls += 1000
+            money_left.append(resource_manager.current_money)
+        return [calls, 0, money_left]
+
+    def _run_resource_manager_update(self) -> list:
+        """
+        Call ResourceManager.update with a few lite and heavy supply pads.
+
+        :return: list: [number of calls, 0, the money at the end]
+        """
+        resource_manager = ResourceManager()
+        for _ in range(4):
+            resource_manager.add_lite_supply_pad()
+        for _ in range(2):
+            resource_manager.add_heavy_supply_pad()
+        for _ in range(self.update_calls):
+            resource_manager.update()
+        return [self.update_calls, 0, [resource_manager.current_money]]
@@ -0,0 +1,184 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Compact, immutable encoding for build orders, and conversions to and from the list and text formats.
+
+"""
+import hashlib
+
+from libraries.BaseClass import Base
+from libraries.BaseConstants import Orders, SlotNumbers
+
+
+# A packed build order is a bytes object with one byte per order:
+#   bits 7-6: the order, Orders value - 1
+#   bits 5-3: the base number (0 to 7)
+#   bits 2-0: the slot number (1 to 7), 0 for orders without a slot
+ORDER_SHIFT = 6
+BASE_SHIFT = 3
+BASE_MASK = 0b111
+SLOT_MASK = 0b111
+
+# The bases are numbered from 1, so with 3 bits for the base number a packed build order can have at most 7 bases
+MAX_NUMBER_OF_BASES = BASE_MASK
+
+# Placeholder for an order that is always SKIPPED, used in canonical build orders. An UPGRADE_BASE order never has a
+# slot, so no real order packs to this byte. It is decoded to a "SKIPPED" order and is left out of the text
+SKIPPED_ORDER = ((Orders.UPGRADE_BASE.value - 1) << ORDER_SHIFT) | SLOT_MASK
+
+# Short names used by GenerateOrdersBuildingBlocks.build_order_print
+ORDER_NAMES = {
+    Orders.BUILD_SUPPLY_PAD: "SUPPLY",
+    Orders.UPGRADE_SUPPLY_PAD: "U_SPLY",
+    Orders.BUILD_TEMPLE: "TEMPLE",
+    Orders.UPGRADE_BASE: "U_BASE",
+}
+ORDERS_BY_NAME = {name: order for order, name in ORDER_NAMES.items()}
+
+# Number of bytes in a build order fingerprint
+FINGERPRINT_SIZE = 8
+
+
+def pack_order(order: Orders, base_number: int, slot: int) -> int:
+    """
+    Pack a single order into its byte value.
+
+    :param order: Orders: The order
+    :param base_number: int: The base number the order is for, 0 to 7
+    :param slot: int: The slot number, 0 or None for orders without a slot
+    :return: int: The packed byte value
+    :raises: ValueError: If the base number or slot number does not fit
+    """
+    if slot is None:
+        slot = 0
+    if not 0 <= base_number <= BASE_MASK or not 0 <= slot <= SLOT_MASK:
+        raise ValueError(f"Cannot pack base number {base_number} and slot {slot}")
+    return ((order.value - 1) << ORDER_SHIFT) | (base_number << BASE_SHIFT) | slot
+
+
+def unpack_order(packed_order: int) -> tuple[Orders, int, int]:
+    """
+    Unpack a single byte value back into the order, base number and slot number.
+
+    :param packed_order: int: The packed byte value
+    :return: tuple[Orders, int, int]: The order, base number and slot number (0 for orders without a slot)
+    """
+    return _UNPACKED_ORDERS[packed_order]
+
+
+# Lookup tables for all 256 byte values so unpacking and printing never do any bit math
+_UNPACKED_ORDERS = [(Orders((value >> ORDER_SHIFT) + 1), (value >> BASE_SHIFT) & BASE_MASK, value & SLOT_MASK)
+                    for value in range(256)]
+_ORDER_TEXT = [f"{ORDER_NAMES[order]} {base_number}, " for order, base_number, _ in _UNPACKED_ORDERS]
+_ORDER_TEXT[SKIPPED_ORDER] = ""
+
+
+def check_number_of_bases(number_of_bases: int):
+    """
+    Check that build orders with bases numbered 1 to number_of_bases can be packed.
+
+    :param number_of_bases: int: The number of bases, or the highest base number
+    :raises: ValueError: If there are more than MAX_NUMBER_OF_BASES bases
+    """
+    if number_of_bases > MAX_NUMBER_OF_BASES:
+        raise ValueError(f"Packed build orders support at most {MAX_NUMBER_OF_BASES} bases, numbered 1 to "
+                         f"{MAX_NUMBER_OF_BASES}, got {number_of_bases}")
+
+
+def encode_build_order(build_order: list) -> bytes:
+    """
+    Encode a build order in list format ([Orders, Base, SlotNumbers] for each order). Orders that have been marked
+    SKIPPED are left out, the same way build_order_print leaves them out.
+
+    :param build_order: list: The build order in its list format
+    :return: bytes: The packed build order
+    :raises: ValueError: If a base number is higher than MAX_NUMBER_OF_BASES
+    """
+    check_number_of_bases(max((order[1].base_number for order in build_order if isinstance(order[0], Orders)),
+                              default=0))
+    return bytes(pack_order(order[0], order[1].base_number, None if order[2] is None else order[2].value)
+                 for order in build_order if isinstance(order[0], Orders))
+
+
+def decode_build_order(packed_build_order: bytes, base_list: list[Base]) -> list:
+    """
+    Decode a packed build order into a new build order list, using the bases in the base list. Every call returns new
+    lists, so the simulation can mark orders as SKIPPED without changing anything else. SKIPPED_ORDER placeholders are
+    decoded to orders that are already marked SKIPPED, which the simulation skips the same way.
+
+    :param packed_build_order: bytes: The packed build order
+    :param base_list: list[Base]: The bases to use, matched by base number
+    :return: list: The build order in its list format
+    """
+    bases = {base.base_number: base for base in base_list}
+    build_order = []
+    for packed_order in packed_build_order:
+        if packed_order == SKIPPED_ORDER:
+            build_order.append(["SKIPPED", None, None])
+            continue
+        order, base_number, slot = _UNPACKED_ORDERS[packed_order]
+        build_order.append([order, bases[base_number], SlotNumbers(slot) if slot else None])
+    return build_order
+
+
+def packed_to_text(packed_build_order: bytes) -> str:
+    """
+    Convert a packed build order to the same text as GenerateOrdersBuildingBlocks.build_order_print.
+
+    :param packed_build_order: bytes: The packed build order
+    :return: str: The build order string
+    """
+    return "".join([_ORDER_TEXT[packed_order] for packed_order in packed_build_order])
+
+
+def text_to_packed(build_order_string: str) -> bytes:
+    """
+    Convert a build order string from build_order_print (or the results csv files) back to a packed build order. The
+    text does not have the slot numbers, so they are given out the same way generate_random_build_orders does: supply
+    pads and temples take the next free slot on their base, and supply pad upgrades take the next built slot on their
+    base, skipping the temple slot. Older results without base numbers ("SUPPLY, ") are for base 1.
+
+    :param build_order_string: str: The build order string
+    :return: bytes: The packed build order
+    :raises: ValueError: If the string has an unknown order in it
+    """
+    build_index = {}
+    upgrade_index = {}
+    temple_slot = {}
+    packed_build_order = bytearray()
+    for token in build_order_string.split(","):
+        token = token.strip()
+        if not token:
+            continue
+        name, _, base_text = token.partition(" ")
+        if name not in ORDERS_BY_NAME:
+            raise ValueError(f"Unknown order in build order string: {token}")
+        order = ORDERS_BY_NAME[name]
+        base_number = int(base_text) if base_text else 1
+
+        slot = None
+        if order == Orders.BUILD_SUPPLY_PAD or order == Orders.BUILD_TEMPLE:
+            slot = build_index.get(base_number, 1)
+            build_index[base_number] = slot + 1
+            if order == Orders.BUILD_TEMPLE:
+                temple_slot[base_number] = slot
+        elif order == Orders.UPGRADE_SUPPLY_PAD:
+            slot = upgrade_index.get(base_number, 1)
+            if temple_slot.get(base_number) == slot:
+                slot += 1
+            upgrade_index[base_number] = slot + 1
+        packed_build_order.append(pack_order(order, base_number, slot))
+
+    return bytes(packed_build_order)
+
+
+def fingerprint(packed_build_order: bytes) -> int:
+    """
+    Stable 64-bit fingerprint of a packed build order. Unlike the built-in hash, it is the same in every process and
+    every session, so it can be saved and compared later.
+
+    :param packed_build_order: bytes: The packed build order
+    :return: int: The fingerprint
+    """
+    return int.from_bytes(hashlib.blake2b(packed_build_order, digest_size=FINGERPRINT_SIZE).digest(), "little")
@@ -0,0 +1,455 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Branch and bound search over every valid build order, used to find the provably fastest build order for a scenario.
+
+"""
+import copy
+import itertools
+import math
+
+from libraries.BaseConstants import *
+from libraries.BuildOrderEncoding import pack_order, packed_to_text
+from libraries.GenerateOrdersBuildingBlocks import MAX_BUILD_ORDER_LENGTH, BaseBuildCounters
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+# The base level each build slot needs
+SLOT_LEVEL_NEEDED = {1: BaseLevel.OUTPOST, 2: BaseLevel.OUTPOST, 3: BaseLevel.OUTPOST, 4: BaseLevel.KEEP,
+                     5: BaseLevel.KEEP, 6: BaseLevel.CITADEL, 7: BaseLevel.CITADEL}
+
+# Time to reach each base level from the level below it
+BASE_LEVEL_TIME = {BaseLevel.OUTPOST: BASE_BUILD_TIME_SECONDS, BaseLevel.KEEP: KEEP_UPGRADE_TIME_SECONDS,
+                   BaseLevel.CITADEL: CITADEL_UPGRADE_TIME_SECONDS}
+
+# Cost to reach each base level from the level below it
+BASE_LEVEL_COST = {BaseLevel.OUTPOST: BASE_BUILD_COST, BaseLevel.KEEP: KEEP_UPGRADE_COST,
+                   BaseLevel.CITADEL: CITADEL_UPGRADE_COST}
+
+# Game ticks from a build starting to the next build on the same base starting. The finished build is removed from the
+# build queue the tick after it finishes, and the next build starts the tick after that
+BUILD_QUEUE_SPACING = SUPPLY_PAD_BUILD_TIME_SECONDS + 2
+
+# Game ticks from a supply pad upgrade being approved to the heavy supply pad adding money
+UPGRADE_TICKS = math.ceil(SUPPLY_PAD_UPGRADE_TIME_SECONDS) + 1
+
+# Supply rates without the flooring done by the ResourceManager, so they are never lower than the real rates
+LITE_SUPPLY_RATE = 2.5 * 1.75
+HEAVY_SUPPLY_RATE = 3.5 * 1.75
+
+
+def _get_supply_rate(lite_quantity: int, heavy_quantity: int) -> float:
+    """
+    The supply pad equation from ResourceManager.update, without any flooring.
+
+    :param lite_quantity: int: The number of lite supply pads
+    :param heavy_quantity: int: The number of heavy supply pads
+    :return: float: The supplies per second
+    """
+    return (LITE_SUPPLY_RATE * lite_quantity + HEAVY_SUPPLY_RATE * heavy_quantity) / \
+        ((lite_quantity + heavy_quantity) / 9 + 1)
+
+
+class EnumerationNode:
+    """
+    One build order prefix in the search. The simulation is stopped at the start of the game tick where the next build
+    order would be tried, so every build order that starts with this prefix can continue from a copy of it.
+
+    Args:
+        sim_wrapper (SimulatorWrapper): The simulation, after all the orders in the prefix were approved or skipped
+        simulation_time (int): The game tick the next order would be tried on
+        base_counters (list[BaseBuildCounters]): The counters generate_random_build_orders would have for the prefix
+        temple_build_index (int): The build slot the temple was ordered on, 0 if no temple has been ordered
+        temple_base_index (int): The index of the base the temple was ordered on
+        temple_approved (bool): If the temple order was approved in the simulation
+        packed_build_order (bytes): The prefix, packed with BuildOrderEncoding
+
+    """
+    def __init__(self, sim_wrapper: SimulatorWrapper, simulation_time: int, base_counters: list[BaseBuildCounters],
+                 temple_build_index=0, temple_base_index=0, temple_approved=False, packed_build_order=b""):
+        self.sim_wrapper = sim_wrapper
+        self.simulation_time = simulation_time
+        self.base_counters = base_counters
+        self.temple_build_index = temple_build_index
+        self.temple_base_index = temple_base_index
+        self.temple_approved = temple_approved
+        self.packed_build_order = packed_build_order
+
+
+class BuildOrderEnumerator:
+    """
+    The BuildOrderEnumerator walks every build order generate_random_build_orders could make for a scenario, using the
+    same BaseBuildCounters rules, and finds the one that reaches the resource trigger the fastest.
+
+    Build orders are searched depth first as a tree of prefixes. Each prefix is simulated once and copied for every
+    order that can follow it, and a prefix is pruned when even an optimistic estimate of the money it could have by
+    the current best time minus one second is under the resource trigger. The estimate lets every supply pad that is
+    still possible be built as early as the build queues and base levels allow, upgrades them as soon as a temple could
+    be done, and leaves out the flooring of the supply rates, so it never prunes a prefix that could beat the current
+    best. When the search finishes, the best build order found is the fastest one there is.
+
+    Since the simulation ends as soon as the trigger is reached, orders after that point never happen. When a temple is
+    required, the temple order has to be approved before the trigger is reached, otherwise a temple could be listed at
+    the end of any build order for free.
+
+    Args:
+        starting_money (int): The amount of money to start with
+        number_of_bases (int): Number of bases, the first starts as a KEEP and the others are empty
+        resource_trigger (int): The amount of resources to reach the exit scenario
+        simulation_time_seconds (int): Maximum time for each simulation
+        require_temple (bool): If the build order needs an approved temple to count
+        max_build_order_length (int): The most orders a build order can have
+        pause_timer (int): Pause timer of every base after the first, see Base
+        temple_needed_to_clear_second_base (bool): If the pause timer of the bases after the first only counts down
+            once there is a tech level, see Base
+        progress_callback (callable): Called with a progress message for every new best build order found during the
+            search, for example print. None for no progress messages
+
+    """
+    def __init__(self, starting_money: int, number_of_bases: int, resource_trigger: int, simulation_time_seconds: int,
+                 require_temple=True, max_build_order_length=MAX_BUILD_ORDER_LENGTH, pause_timer=0,
+                 temple_needed_to_clear_second_base=False, progress_callback=None):
+        self.starting_money = starting_money
+        self.number_of_bases = number_of_bases
+        self.resource_trigger = resource_trigger
+        self.simulation_time_seconds = simulation_time_seconds
+        self.require_temple = require_temple
+        self.max_build_order_length = max_build_order_length
+        self.pause_timer = pause_timer
+        self.temple_needed_to_clear_second_base = temple_needed_to_clear_second_base
+        self.progress_callback = progress_callback
+
+        self.best_time = math.inf
+        self.best_build_order = None
+        self.nodes_searched = 0
+        self.nodes_pruned = 0
+
+    def run(self, best_time=None) -> tuple[int, bytes]:
+        """
+        Search every build order for the fastest one.
+
+        :param best_time: int: A known final time, for example from the random simulations, used to prune from the
+            start. Only build orders faster than it are looked for
+        :return: tuple[int, bytes]: The fastest final time and its packed build order, (None, None) if no build order
+            is faster than best_time or reaches the resource trigger in time
+        """
+        self.best_time = math.inf if best_time is None else best_time
+        self.best_build_order = None
+        self.nodes_searched = 0
+        self.nodes_pruned = 0
+
+        sim_wrapper = SimulatorWrapper(starting_money=self.starting_money, fine_debug=False)
+        sim_wrapper.add_bases(self.number_of_bases, pause_timer=self.pause_timer,
+                              temple_needed_to_clear_second_base=self.temple_needed_to_clear_second_base)
+        base_counters = [BaseBuildCounters(base=j, current_base_level=base.base_upgrade_level)
+                         for j, base in enumerate(sim_wrapper.base_list)]
+
+        self._search(EnumerationNode(sim_wrapper=sim_wrapper, simulation_time=0, base_counters=base_counters))
+
+        if self.best_build_order is None:
+            return None, None
+        return self.best_time, self.best_build_order
+
+    def _update_best(self, final_time: int, packed_build_order: bytes):
+        """
+        Keep the final time and build order if it is faster than the best so far.
+
+        :param final_time: int: The final time of the build order
+        :param packed_build_order: bytes: The packed build order
+        """
+        if final_time < self.best_time:
+            self.best_time = final_time
+            self.best_build_order = packed_build_order
+            if self.progress_callback is not None:
+                self.progress_callback(f"New best: {final_time} seconds, orders: {packed_to_text(packed_build_order)}")
+
+    def _search(self, node: EnumerationNode):
+        """
+        Search the build order prefix, and every build order that starts with it.
+
+        :param node: EnumerationNode: The build order prefix
+        """
+        self.nodes_searched += 1
+
+        # The build order can end here
+        if node.temple_approved or not self.require_temple:
+            sim_wrapper = node.sim_wrapper.copy()
+            _, final_time, reached = sim_wrapper.runtime_building_blocks.run_next_order(
+                build_orders=[], i=0, simulation_time=node.simulation_time, resource_amount=self.resource_trigger,
+                simulation_time_max=self.simulation_time_seconds, base_list=sim_wrapper.base_list)
+            if reached:
+                self._update_best(final_time, node.packed_build_order)
+
+        if len(node.packed_build_order) >= self.max_build_order_length:
+            return
+
+        for order, base_index, slot in self._get_next_orders(node):
+            child = self._make_child(node, order, base_index, slot)
+            if child is not None:
+                self._search(child)
+
+    def _get_next_orders(self, node: EnumerationNode) -> list:
+        """
+        Get every order generate_random_build_orders could add after the prefix, with the same checks it makes through
+        the BaseBuildCounters.
+
+        :param node: EnumerationNode: The build order prefix
+        :return: list: [Orders, base index, SlotNumbers] for each possible next order
+        """
+        next_orders = []
+        for base_index, counters in enumerate(node.base_counters):
+            if counters.build_index <= counters.current_base_slots:
+                next_orders.append([Orders.BUILD_SUPPLY_PAD, base_index, get_slot_number(counters.build_index)])
+
+        for base_index, counters in enumerate(node.base_counters):
+            if node.temple_build_index == 0 and counters.build_index <= counters.current_base_slots:
+                next_orders.append([Orders.BUILD_TEMPLE, base_index, get_slot_number(counters.build_index)])
+
+        for base_index, counters in enumerate(node.base_counters):
+            if node.temple_build_index > 0 and counters.build_index < 8:
+                upgrade_index = counters.upgrade_supply_pad_index
+                if upgrade_index == node.temple_build_index:
+                    # The generator skips over the temple slot on the temple base, and can never get past the temple
+                    # slot number on the other bases
+                    if base_index != node.temple_base_index:
+                        continue
+                    upgrade_index += 1
+                if upgrade_index < counters.build_index:
+                    next_orders.append([Orders.UPGRADE_SUPPLY_PAD, base_index, get_slot_number(upgrade_index)])
+
+        for base_index, counters in enumerate(node.base_counters):
+            if counters.current_base_level != BaseLevel.CITADEL:
+                next_orders.append([Orders.UPGRADE_BASE, base_index, None])
+
+        return next_orders
+
+    def _make_child(self, node: EnumerationNode, order: Orders, base_index: int, slot: SlotNumbers):
+        """
+        Add an order to the prefix and simulate it, starting from a copy of the prefix simulation.
+
+        :param node: EnumerationNode: The build order prefix
+        :param order: Orders: The order to add
+        :param base_index: int: The index of the base the order is for
+        :param slot: SlotNumbers: The slot the order is for, None for base upgrades
+        :return: EnumerationNode: The new prefix, None if it finished, timed out or was pruned
+        """
+        sim_wrapper = node.sim_wrapper.copy()
+        base = sim_wrapper.base_list[base_index]
+        build_orders = [[order, base, slot]]
+        i, simulation_time, reached = sim_wrapper.runtime_building_blocks.run_next_order(
+            build_orders=build_orders, i=0, simulation_time=node.simulation_time,
+            resource_amount=self.resource_trigger, simulation_time_max=self.simulation_time_seconds,
+            base_list=sim_wrapper.base_list)
+
+        approved = i == 1 and build_orders[0][0] != "SKIPPED"
+        temple_approved = node.temple_approved or (order == Orders.BUILD_TEMPLE and approved)
+        packed_build_order = node.packed_build_order + bytes([pack_order(order, base.base_number,
+                                                                         None if slot is None else slot.value)])
+        if reached:
+            # If the order was still waiting when the trigger was reached, this is the same as ending the build order
+            # before it, which was already checked
+            if approved and (temple_approved or not self.require_temple):
+                self._update_best(simulation_time, packed_build_order)
+            return None
+        if simulation_time >= self.simulation_time_seconds:
+            return None
+
+        # Update the counters the same way generate_random_build_orders does
+        base_counters = list(node.base_counters)
+        counters = copy.copy(base_counters[base_index])
+        base_counters[base_index] = counters
+        temple_build_index = node.temple_build_index
+        temple_base_index = node.temple_base_index
+        if order == Orders.BUILD_SUPPLY_PAD:
+            counters.increment_build_index()
+        elif order == Orders.BUILD_TEMPLE:
+            temple_build_index = counters.build_index
+            temple_base_index = base_index
+            counters.increment_build_index()
+        elif order == Orders.UPGRADE_BASE:
+            counters.upgrade_base_level()
+        else:
+            counters.upgrade_supply_pad_index = slot.value + 1
+
+        child = EnumerationNode(sim_wrapper=sim_wrapper,
+                                simulation_time=simulation_time,
+                                base_counters=base_counters,
+                                temple_build_index=temple_build_index,
+                                temple_base_index=temple_base_index,
+                                temple_approved=temple_approved,
+                                packed_build_order=packed_build_order)
+
+        if self.get_money_upper_bound(child, self.best_time - 1, self.resource_trigger) < self.resource_trigger:
+            self.nodes_pruned += 1
+            return None
+        return child
+
+    def get_money_upper_bound(self, node: EnumerationNode, final_time: int, money_needed=math.inf) -> float:
+        """
+        Optimistic estimate of the most money any build order starting with the prefix could have at the end of game
+        tick final_time, before the resource trigger is checked. If it is under the resource trigger, no build order
+        starting with the prefix can reach the trigger by final_time.
+
+        The estimate starts with the money and supply pads the prefix has, and adds:
+            - Supply pads already ordered finish as soon as their build queue allows, ignoring base upgrades
+            - Every build slot the BaseBuildCounters still allow gets a supply pad as soon as the build queue and the
+              base level allow, kept only if the supply pad pays for itself by final_time. Each supply pad can add at
+              most the lite supply rate difference of one more pad, and pads are kept in the order they could finish
+            - Every supply pad could be upgraded as soon as it is built and a temple could be done, kept only if the
+              upgrade pays for itself, adding at most the difference between a heavy and a lite pad
+            - The temple cost is taken off if a temple is required and has not been approved yet
+        This is done for every combination of levels the bases could be upgraded to, taking off the base upgrade costs,
+        and the most money of all the combinations is the estimate.
+
+        :param node: EnumerationNode: The build order prefix
+        :param final_time: int: The game tick to estimate the money for
+        :param money_needed: int: Stop as soon as one combination of base levels has this much money
+        :return: float: The most money the prefix could have, -inf if final_time is before the prefix
+        """
+        simulation_time = node.simulation_time
+        if final_time < simulation_time:
+            return -math.inf
+
+        resource_manager = node.sim_wrapper.resource_manager
+        money = resource_manager.current_money
+        if self.require_temple and not node.temple_approved:
+            money -= TEMPLE_COST
+
+        # Pads already paid for: (game tick, lite change, heavy change)
+        pad_events = []
+        # Each possible new supply pad: (earliest game tick it could add money, base index, base level it needs)
+        new_pads = []
+        # Each supply pad that could still be upgraded: (earliest game tick it is built, base index, base level needed)
+        upgradable_pads = []
+        # The base levels each base could be upgraded to, and the cost to get there
+        base_level_options = []
+
+        tech_time = simulation_time if resource_manager.current_tech_level >= 1 else None
+        for base_index, base in enumerate(node.sim_wrapper.base_list):
+            counters = node.base_counters[base_index]
+
+            # When the base is next IDLE, slot timers are stopped until then. A base upgrade in progress is paid for
+            level = base.base_upgrade_level
+            if base.base_status == BaseState.UPGRADING:
+                idle_time = simulation_time + max(base.build_timer, 0)
+                level = BaseLevel(level.value + 1)
+            elif base.base_status == BaseState.PAUSED:
+                idle_time = simulation_time + max(base.pause_timer, 0)
+            else:
+                idle_time = simulation_time
+
+            # Every base upgrade already ordered is either done, in progress or was skipped, so the base can only get
+            # as many more levels as there are base upgrade orders left
+            upgrades_left = BaseLevel.CITADEL.value - counters.current_base_level.value
+            level_times = {level: idle_time}
+            level_options = [(level.value, 0)]
+            level_time = idle_time
+            level_cost = 0
+            for level_value in range(level.value + 1, min(level.value + upgrades_left, BaseLevel.CITADEL.value) + 1):
+                level_time += BASE_LEVEL_TIME[BaseLevel(level_value)]
+                level_times[BaseLevel(level_value)] = level_time
+                level_cost += BASE_LEVEL_COST[BaseLevel(level_value)]
+                level_options.append((level_value, level_cost))
+            # Try the highest levels first, they are the most likely to reach the money needed
+            base_level_options.append(level_options[::-1])
+
+            # Builds waiting in the build queue
+            next_build_start = idle_time
+            for slot in base.build_queue:
+                if slot.status == BuildSlotState.BUILDING:
+                    done_time = idle_time + max(math.ceil(slot.build_timer), 0)
+                elif slot.status == BuildSlotState.IDLE:
+                    done_time = next_build_start + slot.build_timer
+                else:
+                    continue
+                next_build_start = done_time + BUILD_QUEUE_SPACING - SUPPLY_PAD_BUILD_TIME_SECONDS
+                if slot.build_type == BuildSlotType.SUPPLY_PAD:
+                    pad_events.append((done_time, 1, 0))
+                    if slot.build_slot >= counters.upgrade_supply_pad_index:
+                        upgradable_pads.append((done_time, base_index, 0))
+                elif tech_time is None or done_time < tech_time:
+                    tech_time = done_time
+
+            # Pads already built or upgrading
+            for slot_name, slot in base.build_slots.items():
+                if slot.build_type != BuildSlotType.SUPPLY_PAD:
+                    continue
+                if slot.status == BuildSlotState.UPGRADING:
+                    pad_events.append((idle_time + max(math.ceil(slot.build_timer), 0), -1, 1))
+                elif slot.status == BuildSlotState.BUILT and slot_name >= counters.upgrade_supply_pad_index:
+                    upgradable_pads.append((simulation_time - 1, base_index, 0))
+
+            # Build slots the counters can still order supply pads on
+            for slot_value in range(counters.build_index, len(SLOT_LEVEL_NEEDED) + 1):
+                level_needed = SLOT_LEVEL_NEEDED[slot_value]
+                if level_needed not in level_times and level_needed.value > level.value:
+                    break
+                start_time = max(next_build_start, level_times.get(level_needed, idle_time))
+                done_time = start_time + SUPPLY_PAD_BUILD_TIME_SECONDS
+                next_build_start = start_time + BUILD_QUEUE_SPACING
+                new_pads.append((done_time, base_index, level_needed.value))
+                upgradable_pads.append((done_time, base_index, level_needed.value))
+
+        if tech_time is None:
+            # The temple still has to be ordered and built
+            tech_time = simulation_time + TEMPLE_BUILD_TIME_SECONDS
+
+        # Money from the pads already paid for
+        lite_quantity = resource_manager.supply_pad_lite_quantity
+        heavy_quantity = resource_manager.supply_pad_heavy_quantity
+        pad_events.sort()
+        money_time = simulation_time
+        pad_counts = []
+        for event_time, lite_change, heavy_change in pad_events:
+            if event_time > final_time:
+                break
+            money += (event_time - money_time) * _get_supply_rate(lite_quantity, heavy_quantity)
+            money_time = event_time
+            lite_quantity += lite_change
+            heavy_quantity += heavy_change
+            pad_counts.append((event_time, lite_quantity + heavy_quantity))
+        money += (final_time + 1 - money_time) * _get_supply_rate(lite_quantity, heavy_quantity)
+
+        # Supply pad upgrades, each one on its own
+        upgrade_rate = (HEAVY_SUPPLY_RATE - LITE_SUPPLY_RATE) / \
+            (max(resource_manager.supply_pad_lite_quantity + resource_manager.supply_pad_heavy_quantity, 1) / 9 + 1)
+        upgrades = []
+        for done_time, base_index, level_needed in upgradable_pads:
+            upgrade_time = max(done_time + 1, tech_time + 1, simulation_time) + UPGRADE_TICKS - 1
+            upgrade_money = upgrade_rate * (final_time + 1 - upgrade_time) - SUPPLY_PAD_UPGRADE_COST
+            if upgrade_money > 0:
+                upgrades.append((base_index, level_needed, upgrade_money))
+
+        new_pads.sort()
+        current_pads = resource_manager.supply_pad_lite_quantity + resource_manager.supply_pad_heavy_quantity
+        best_money = -math.inf
+        for base_levels in itertools.product(*base_level_options):
+            level_money = money - sum(level_cost for _, level_cost in base_levels)
+
+            # New supply pads, in the order they could finish, while they pay for themselves
+            pad_quantity = current_pads
+            count_index = 0
+            for done_time, base_index, level_needed in new_pads:
+                if level_needed > base_levels[base_index][0]:
+                    continue
+                while count_index < len(pad_counts) and pad_counts[count_index][0] <= done_time:
+                    pad_quantity += pad_counts[count_index][1] - (pad_counts[count_index - 1][1] if count_index
+                                                                  else current_pads)
+                    count_index += 1
+                pad_money = (_get_supply_rate(pad_quantity + 1, 0) - _get_supply_rate(pad_quantity, 0)) * \
+                    (final_time + 1 - done_time) - SUPPLY_PAD_COST
+                if pad_money <= 0:
+                    break
+                level_money += pad_money
+                pad_quantity += 1
+
+            for base_index, level_needed, upgrade_money in upgrades:
+                if level_needed <= base_levels[base_index][0]:
+                    level_money += upgrade_money
+
+            if level_money > best_money:
+                best_money = level_money
+                if best_money >= money_needed:
+                    break
+
+        return best_money
@@ -6,11 +6,21 @@ Build Slots used for designating and defining what buildings can be made in buil
 
 """
 from abc import ABC, abstractmethod
+import math
 
 
 from libraries.ResourceManager import ResourceManager
 from libraries.BaseConstants import BaseLevel, BuildSlotState, BuildSlotType, SUPPLY_PAD_UPGRADE_COST, SUPPLY_PAD_COST, \
     SUPPLY_PAD_UPGRADE_TIME_SECONDS, SUPPLY_PAD_BUILD_TIME_SECONDS, TEMPLE_BUILD_TIME_SECONDS
+from libraries.TraceRecorder import TraceEvent
+
+# The build slot states as module names, so the checks that run every in game second skip the Enum attribute lookup.
+# BaseClass imports them
+_SLOT_IDLE = BuildSlotState.IDLE
+_SLOT_BUILDING = BuildSlotState.BUILDING
+_SLOT_BUILT = BuildSlotState.BUILT
+_SLOT_UPGRADING = BuildSlotState.UPGRADING
+_SLOT_UPGRADED = BuildSlotState.UPGRADED
 
 
 class BuildSlot(ABC):
@@ -23,17 +33,23 @@ class BuildSlot(ABC):
         status (BuildSlotState): Current status of the slot based on the slot state machine
         build_timer (int): Current build timer for specific slot
         build_type (BuildSlotType): They build type that this slot is
-        print_mode (bool): Will print debug print  statements
+        base_number (int): The number of the base the slot is on, for the trace events
+        trace_recorder (TraceRecorder): The recorder TracedTemple and TracedSupplyPad record the debug trace events
+            in, which TracedBase builds instead of Temple and SupplyPad
         name (str): Build slot name. Used for printing.
 
     """
-    def __init__(self, resource_manager: ResourceManager, build_slot: int, print_mode: bool = True):
+    __slots__ = ("build_slot", "resource_manager", "status", "build_timer", "build_type", "base_number",
+                 "trace_recorder", "name")
+
+    def __init__(self, resource_manager: ResourceManager, build_slot: int, base_number=0, trace_recorder=None):
         self.build_slot = build_slot
         self.resource_manager = resource_manager
-        self.status = BuildSlotState.IDLE
+        self.status = _SLOT_IDLE
         self.build_timer = 0
         self.build_type = BuildSlotType.EMTPY
-        self.print_mode = print_mode
+        self.base_number = base_number
+        self.trace_recorder = trace_recorder
         self.name = "build_slot"
 
     @abstractmethod
@@ -44,6 +60,29 @@ class BuildSlot(ABC):
     def update(self):
         pass
 
+    def get_quiet_ticks(self) -> float:
+        """
+        Get how many of the next update calls will only count the build timer down, without finishing a build or
+        upgrade. Used by the event driven simulation to skip over in game seconds where nothing happens.
+
+        :return: float: Number of quiet update calls, math.inf if the slot will never change on its own
+        """
+        if self.status is _SLOT_BUILDING or self.status is _SLOT_UPGRADING:
+            if self.build_timer > 0:
+                return math.ceil(self.build_timer)
+            return 0
+        return math.inf
+
+    def skip_ticks(self, ticks: int):
+        """
+        Count the build timer down by several update calls at once. Only valid if ticks is not larger than the value
+        returned by get_quiet_ticks.
+
+        :param ticks: int: The number of update calls to skip
+        """
+        if self.status is _SLOT_BUILDING or self.status is _SLOT_UPGRADING:
+            self.build_timer = self.build_timer - ticks
+
 
 class EmptySLot(BuildSlot):
     """
@@ -52,8 +91,10 @@ class EmptySLot(BuildSlot):
 
     No resource manager is needed.
     """
+    __slots__ = ("upgrade_level_needed",)
+
     def __init__(self, build_slot: str, upgrade_level_needed: BaseLevel):
-        super().__init__(resource_manager=None, build_slot=build_slot, print_mode=None)
+        super().__init__(resource_manager=None, build_slot=build_slot)
         self.build_type = BuildSlotType.EMTPY
         self.upgrade_level_needed = upgrade_level_needed
         self.name = "EMPTY_SLOT"
@@ -73,8 +114,11 @@ class Temple(BuildSlot):
     Temple is the build slot that upgrades the base tech level.
 
     """
-    def __init__(self, resource_manager: ResourceManager, build_slot, print_mode=True):
-        super().__init__(resource_manager=resource_manager, build_slot=build_slot, print_mode=print_mode)
+    __slots__ = ()
+
+    def __init__(self, resource_manager: ResourceManager, build_slot, base_number=0, trace_recorder=None):
+        super().__init__(resource_manager=resource_manager, build_slot=build_slot, base_number=base_number,
+                         trace_recorder=trace_recorder)
         self.name = "TEMPLE    "  # Note, spacing is used for formatting reasons when printing
 
     def build(self):
@@ -83,11 +127,9 @@ class Temple(BuildSlot):
         a temple is being constructed. The tech level won't increase until after the temple is complete.
 
         """
-        self.status = BuildSlotState.IDLE
+        self.status = _SLOT_IDLE
         self.build_timer = TEMPLE_BUILD_TIME_SECONDS
         self.resource_manager.add_temple()
-        if self.print_mode:
-            print(f"Building Temple...: {self.build_slot}")
 
     def update(self):
         """
@@ -95,19 +137,17 @@ class Temple(BuildSlot):
         levels, etc.
 
         """
-        if self.status == BuildSlotState.IDLE:
+        if self.status is _SLOT_IDLE:
             pass
-        elif self.status == BuildSlotState.BUILDING:
+        elif self.status is _SLOT_BUILDING:
             # If the timer is larger than 0, building is being built, subtract from timer
             if self.build_timer > 0:
                 self.build_timer = self.build_timer - 1
 
             # If not IDLE or BUILDING, then the temple has been built, add it to the resource manger and change status
             else:
-                if self.print_mode:
-                    print(f"Temple complete: {self.build_slot}")
                 self.resource_manager.add_tech_level()
-                self.status = BuildSlotState.BUILT
+                self.status = _SLOT_BUILT
                 self.build_timer = 0
 
 
@@ -115,8 +155,11 @@ class SupplyPad(BuildSlot):
     """
     Supply pad adds supplies at a specific rate to the resource manager.
     """
-    def __init__(self, resource_manager: ResourceManager, build_slot: int, print_mode=True):
-        super().__init__(resource_manager=resource_manager, build_slot=build_slot, print_mode=print_mode)
+    __slots__ = ()
+
+    def __init__(self, resource_manager: ResourceManager, build_slot: int, base_number=0, trace_recorder=None):
+        super().__init__(resource_manager=resource_manager, build_slot=build_slot, base_number=base_number,
+                         trace_recorder=trace_recorder)
         self.build_type = BuildSlotType.SUPPLY_PAD
         self.name = "SUPPLY_PAD"
 
@@ -125,12 +168,10 @@ class SupplyPad(BuildSlot):
         Perform the build operation for adding a supply pad.
 
         """
-        self.status = BuildSlotState.IDLE
+        self.status = _SLOT_IDLE
         self.build_timer = SUPPLY_PAD_BUILD_TIME_SECONDS
         # Note that a supply pad is being built. Used for checking status of supply pad
         self.resource_manager.note_supply_pad_is_being_built()
-        if self.print_mode:
-            print(f"Building Supply Pad...: {self.build_slot}")
 
     def upgrade(self):
         """
@@ -139,42 +180,94 @@ class SupplyPad(BuildSlot):
 
         """
         if self.resource_manager.current_tech_level >= 1:
-            if self.print_mode:
-                print(f"Upgrading Supply Pad...: {self.build_slot}")
-            self.status = BuildSlotState.UPGRADING
+            self.status = _SLOT_UPGRADING
             self.build_timer = SUPPLY_PAD_UPGRADE_TIME_SECONDS
-        else:
-            if self.print_mode:
-                print(f"Not high enough tech level {self.build_slot}")
 
     def update(self):
         """
         Update loop for the supply pad. If IDLE do nothing, but if BUILDING or UPGRADENg check the build timer.
 
         """
-        if self.status == BuildSlotState.IDLE:
+        if self.status is _SLOT_IDLE:
             pass
-        elif self.status == BuildSlotState.BUILDING or self.status == BuildSlotState.UPGRADING:
+        elif self.status is _SLOT_BUILDING or self.status is _SLOT_UPGRADING:
             if self.build_timer > 0:
                 self.build_timer = self.build_timer - 1
             else:
                 # When the timer is 0 and still in BUILDING state, that means build is done. Change state and add
-                if self.status == BuildSlotState.BUILDING:
-                    self.status = BuildSlotState.BUILT
+                if self.status is _SLOT_BUILDING:
+                    self.status = _SLOT_BUILT
                     self.resource_manager.add_lite_supply_pad()
-                    if self.print_mode:
-                        print(f"Supply pad complete: {self.build_slot}")
                 # When the timer is 0 and still in UPGRADING state, that means build is done. Change state and add
-                elif self.status == BuildSlotState.UPGRADING:
-                    self.status = BuildSlotState.UPGRADED
+                elif self.status is _SLOT_UPGRADING:
+                    self.status = _SLOT_UPGRADED
                     self.resource_manager.add_heavy_supply_pad()
                     self.resource_manager.remove_lite_supply_pad()
                     self.build_type = BuildSlotType.HEAVY_SUPPLY_PAD
-                    if self.print_mode:
-                        print(f"Supply pad upgraded: {self.build_slot}")
                 self.build_timer = 0
 
 
+class TracedTemple(Temple):
+    """
+    Temple that records its trace events, so the Temple itself never checks for a recorder. TracedBase builds it.
+
+    """
+    __slots__ = ()
+
+    def build(self):
+        """
+        Build the temple and record that it is building.
+
+        """
+        super().build()
+        self.trace_recorder.record(TraceEvent.TEMPLE_BUILDING, self.base_number, self.build_slot)
+
+    def update(self):
+        """
+        Update the temple and record when it is complete.
+
+        """
+        status = self.status
+        super().update()
+        if status is _SLOT_BUILDING and self.status is _SLOT_BUILT:
+            self.trace_recorder.record(TraceEvent.TEMPLE_COMPLETE, self.base_number, self.build_slot)
+
 
+class TracedSupplyPad(SupplyPad):
+    """
+    Supply pad that records its trace events, so the SupplyPad itself never checks for a recorder. TracedBase builds
+    it.
+
+    """
+    __slots__ = ()
 
+    def build(self):
+        """
+        Build the supply pad and record that it is building.
 
+        """
+        super().build()
+        self.trace_recorder.record(TraceEvent.SUPPLY_PAD_BUILDING, self.base_number, self.build_slot)
+
+    def upgrade(self):
+        """
+        Upgrade the supply pad and record if it started upgrading or there was no tech level.
+
+        """
+        super().upgrade()
+        if self.status is _SLOT_UPGRADING:
+            self.trace_recorder.record(TraceEvent.SUPPLY_PAD_UPGRADING, self.base_number, self.build_slot)
+        else:
+            self.trace_recorder.record(TraceEvent.SUPPLY_PAD_UPGRADE_NO_TECH, self.base_number, self.build_slot)
+
+    def update(self):
+        """
+        Update the supply pad and record when it is built or upgraded.
+
+        """
+        status = self.status
+        super().update()
+        if status is _SLOT_BUILDING and self.status is _SLOT_BUILT:
+            self.trace_recorder.record(TraceEvent.SUPPLY_PAD_COMPLETE, self.base_number, self.build_slot)
+        elif status is _SLOT_UPGRADING and self.status is _SLOT_UPGRADED:
+            self.trace_recorder.record(TraceEvent.SUPPLY_PAD_UPGRADED, self.base_number, self.build_slot)
@@ -0,0 +1,224 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Canonical build orders, and a cache of simulation results keyed on the orders the simulation approved and the game
+ticks they were approved on, so build orders that only differ in orders that were skipped or never reached are simulated
+once.
+
+"""
+from libraries.BaseConstants import BuildOrderResults, Orders
+from libraries.BuildOrderEncoding import SKIPPED_ORDER, packed_to_text, unpack_order
+
+# Default most number of entries kept in the cache. Each entry is a short bytes key or a tuple of game ticks, about
+# 150 bytes of memory
+DEFAULT_MAX_ENTRIES = 2000000
+# Number of bytes used for the game tick an approved order was approved on
+_TICK_SIZE = 4
+
+
+def canonicalize_build_order(packed_build_order: bytes) -> bytes:
+    """
+    Get the canonical form of a packed build order, with every order that is always SKIPPED the moment it is tried
+    replaced by SKIPPED_ORDER. The orders are replaced instead of dropped, since a skipped order still uses up the game
+    tick it was tried on, so the canonical build order has the same final time.
+
+    Upgrading a build slot that no earlier order builds a supply pad on is the only order that can be known to be
+    skipped before simulating. Other orders that look impossible, like a second TEMPLE, still run when the order before
+    them was skipped, so they are left for the CanonicalResultCache, which finds them after simulating.
+
+    :param packed_build_order: bytes: The packed build order
+    :return: bytes: The canonical build order
+    """
+    supply_pad_slots = set()
+    canonical_build_order = bytearray()
+    for packed_order in packed_build_order:
+        if packed_order != SKIPPED_ORDER:
+            order, base_number, slot = unpack_order(packed_order)
+            if order == Orders.BUILD_SUPPLY_PAD:
+                supply_pad_slots.add((base_number, slot))
+            elif order == Orders.UPGRADE_SUPPLY_PAD and (base_number, slot) not in supply_pad_slots:
+                packed_order = SKIPPED_ORDER
+        canonical_build_order.append(packed_order)
+    return bytes(canonical_build_order)
+
+
+class CanonicalResultCache:
+    """
+    The CanonicalResultCache keeps what happened to every step of the simulated build orders, keyed on the orders that
+    were approved before it, so the result of a new build order can be found without simulating it whenever an
+    equivalent build order was already simulated.
+
+    The simulation tries the orders of a build order one at a time, the next one on the game tick after the last one
+    was approved or skipped. Skipped and waiting orders change nothing but the time, so the state of the simulation on
+    every game tick only depends on the approved history: each approved order and the game tick it was approved on.
+    Trying an order on that history from a game tick gives the same result as trying it on any later game tick it was
+    still waiting on, so each step is saved with the range of game ticks it holds for, from the tick it was first tried
+    to the tick it was approved or skipped. That way a skip before an order that waits anyway, or a skip that waited a
+    different number of game ticks, does not make a build order miss. Orders that were never tried do not change the
+    result at all.
+
+    add_result saves, for each approved history of a simulated build order, what trying its next order did, and the
+    last game tick and result of the simulation, which are the same for every build order with that approved history
+    that approves nothing else before it ends: build orders whose orders after it are all skipped, or still waiting on
+    that game tick. get_result walks a canonical build order through the saved steps, and returns the result once it
+    reaches the end of a simulation, or None as soon as it tries an order that was never tried on that history and game
+    tick.
+
+    Args:
+        max_entries (int): Most number of entries kept, new ones are not added once the cache is full
+        step_results (dict): Approved history and next order to a list of (first game tick, last game tick, approved)
+            for each range of game ticks trying that order was saved for
+        waiting_results (dict): Approved history and next order to a list of (first game tick, last game tick, result)
+            for simulations that ended while that order was waiting
+        end_results (dict): Approved history to (last game tick, result) for the simulations that ended on it
+        number_of_entries (int): Number of entries in the dicts and lists
+        hits (int): Number of get_result calls that found a result
+        misses (int): Number of get_result calls that did not
+
+    """
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.step_results = {}
+        self.waiting_results = {}
+        self.end_results = {}
+        self.number_of_entries = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_result(self, canonical_build_order: bytes):
+        """
+        Get the result of a canonical build order from the equivalent build orders that were already simulated.
+
+        :param canonical_build_order: bytes: The canonical build order, from canonicalize_build_order
+        :return: list: [final time, build order string] the same as simulating the canonical build order, the final
+            time is None if it timed out. None if there is no equivalent build order in the cache
+        """
+        history = b""
+        # The game tick the next order is first tried on
+        game_tick = 0
+        approved_orders = bytearray()
+        for k, packed_order in enumerate(canonical_build_order):
+            end_result = self.end_results.get(history)
+            if end_result is not None and game_tick > end_result[0]:
+                # The simulation ended before this order was tried
+                return self._get_hit(end_result[1], approved_orders, canonical_build_order[k:])
+            if packed_order == SKIPPED_ORDER:
+                # SKIPPED_ORDER placeholders are skipped on the game tick they are tried
+                game_tick += 1
+                continue
+
+            key = history + bytes([packed_order])
+            step = _find_range(self.step_results.get(key), game_tick)
+            if step is None:
+                waiting_result = _find_range(self.waiting_results.get(key), game_tick)
+                if waiting_result is not None:
+                    return self._get_hit(waiting_result[2], approved_orders, canonical_build_order[k:])
+                self.misses += 1
+                return None
+            _, last_tick, approved = step
+            if approved:
+                approved_orders.append(packed_order)
+                history = key + last_tick.to_bytes(_TICK_SIZE, "little")
+            game_tick = last_tick + 1
+
+        # Every order was approved or skipped, so the simulation ends the same as any other with this history
+        end_result = self.end_results.get(history)
+        if end_result is not None:
+            return self._get_hit(end_result[1], approved_orders, b"")
+        self.misses += 1
+        return None
+
+    def _get_hit(self, final_time, approved_orders: bytearray, orders_not_done: bytes) -> list:
+        """
+        Helper for get_result to count a hit and make its result.
+
+        :param final_time: int: The final time, None if it timed out
+        :param approved_orders: bytearray: The orders that were approved
+        :param orders_not_done: bytes: The orders that were never approved or skipped
+        :return: list: [final time, build order string]
+        """
+        self.hits += 1
+        # The orders that were not done are in the build order string as they are, the same as build_order_print
+        return [final_time, packed_to_text(bytes(approved_orders) + orders_not_done)]
+
+    def get_hit_rate(self) -> float:
+        """
+        Get the share of the get_result calls that found a result.
+
+        :return: float: The hit rate from 0 to 1, 0 if get_result was never called
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def add_result(self, canonical_build_order: bytes, build_order: list, final_time, last_tick: int, order_index: int,
+                   order_result: BuildOrderResults, order_times: list[int]):
+        """
+        Save what happened to each step of a simulated canonical build order. The simulation must not have been stopped
+        at a cutoff time.
+
+        :param canonical_build_order: bytes: The canonical build order that was simulated
+        :param build_order: list: The build order list after the simulation, with the skipped orders marked SKIPPED
+        :param final_time: int: The final time, None if it timed out. Or the list of times from a simulation with
+            several resource triggers, which get_result then returns in its place
+        :param last_tick: int: The last game tick of the simulation, the final time if it reached the resource trigger
+            or one less than the simulation time if it timed out
+        :param order_index: int: The index of the current build order when the simulation ended, last_order_index of
+            RuntimeBuildingBlocks
+        :param order_result: BuildOrderResults: The result of the order tried in the last game tick, None if no order
+            was tried, last_order_result of RuntimeBuildingBlocks
+        :param order_times: list[int]: The game tick each order was approved or skipped on, last_order_times of
+            RuntimeBuildingBlocks
+        """
+        history = b""
+        first_tick = 0
+        for k in range(order_index):
+            packed_order = canonical_build_order[k]
+            approved = build_order[k][0] != "SKIPPED"
+            # SKIPPED_ORDER placeholders are always skipped right away, so they are not looked up
+            if packed_order != SKIPPED_ORDER:
+                self._add_range(self.step_results, history + bytes([packed_order]),
+                                (first_tick, order_times[k], approved))
+            if approved:
+                history += bytes([packed_order]) + order_times[k].to_bytes(_TICK_SIZE, "little")
+            first_tick = order_times[k] + 1
+
+        if order_result == BuildOrderResults.WAITING:
+            self._add_range(self.waiting_results, history + bytes([canonical_build_order[order_index]]),
+                            (first_tick, last_tick, final_time))
+        if history not in self.end_results and self.number_of_entries < self.max_entries:
+            self.end_results[history] = (last_tick, final_time)
+            self.number_of_entries += 1
+
+    def _add_range(self, results: dict, key: bytes, game_tick_range: tuple):
+        """
+        Add a range of game ticks to one of the dicts, if no saved range has its first game tick and the cache is not
+        full.
+
+        :param results: dict: The dict to add to
+        :param key: bytes: The key
+        :param game_tick_range: tuple: The first game tick, the last game tick and the result of the range
+        """
+        if self.number_of_entries >= self.max_entries:
+            return
+        game_tick_ranges = results.setdefault(key, [])
+        if _find_range(game_tick_ranges, game_tick_range[0]) is None:
+            game_tick_ranges.append(game_tick_range)
+            self.number_of_entries += 1
+
+
+def _find_range(game_tick_ranges: list, game_tick: int):
+    """
+    Find the saved range of game ticks that holds a game tick.
+
+    :param game_tick_ranges: list: The saved ranges, each starting with the first and last game tick. None for none
+    :param game_tick: int: The game tick
+    :return: tuple: The range, None if no range holds the game tick
+    """
+    if game_tick_ranges is not None:
+        for game_tick_range in game_tick_ranges:
+            if game_tick_range[0] <= game_tick <= game_tick_range[1]:
+                return game_tick_range
+    return None
@@ -0,0 +1,175 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Columnar binary format for simulation results, with the build orders dictionary encoded, that NumPy can memory map
+instead of parsing the results csv files.
+
+"""
+import csv
+import json
+import os
+from array import array
+
+import numpy as np
+
+# The final time saved for build orders that timed out, since the final times are an integer array
+TIMED_OUT_TIME = -1
+
+# Files of a columnar results directory. Each is a NumPy .npy file that can be memory mapped, except the dictionary
+FINAL_TIMES_FILE = "final_times.npy"
+TOKENS_FILE = "tokens.npy"
+OFFSETS_FILE = "offsets.npy"
+DICTIONARY_FILE = "dictionary.json"
+
+
+def write_columnar_results(results, output_directory: str) -> int:
+    """
+    Write results in the columnar format. Each order of a build order string ("SUPPLY 1", the order type and base
+    number) is a token, and the dictionary gives every different token a number. The directory gets:
+        - final_times.npy: int16 final time of each build order, TIMED_OUT_TIME if it timed out
+        - tokens.npy: uint8 token numbers of every build order, one after the other
+        - offsets.npy: int64 start of each build order in tokens.npy, with one more at the end, so the tokens of build
+          order i are tokens[offsets[i]:offsets[i + 1]]
+        - dictionary.json: the token text of each token number
+
+    The results are read one at a time into compact arrays, so an iterator over a large csv file can be written without
+    keeping the strings in memory.
+
+    :param results: iterable: [final time, build order string] for each result, the final time is None if it timed
+        out. For example StreamingResultsWriter.read_results or read_results_csv
+    :param output_directory: str: The directory to write the files in, made if it does not exist
+    :return: int: The number of results written
+    """
+    final_times = array('h')
+    tokens = array('B')
+    offsets = array('q', [0])
+    dictionary = {}
+    for final_time, build_order_string in results:
+        final_times.append(TIMED_OUT_TIME if final_time is None else final_time)
+        for token in build_order_string.split(","):
+            token = token.strip()
+            if not token:
+                continue
+            token_number = dictionary.get(token)
+            if token_number is None:
+                token_number = len(dictionary)
+                dictionary[token] = token_number
+            tokens.append(token_number)
+        offsets.append(len(tokens))
+
+    os.makedirs(output_directory, exist_ok=True)
+    np.save(os.path.join(output_directory, FINAL_TIMES_FILE), np.frombuffer(final_times, dtype=np.int16))
+    np.save(os.path.join(output_directory, TOKENS_FILE), np.frombuffer(tokens, dtype=np.uint8))
+    np.save(os.path.join(output_directory, OFFSETS_FILE), np.frombuffer(offsets, dtype=np.int64))
+    with open(os.path.join(output_directory, DICTIONARY_FILE), 'w') as dictionary_file:
+        json.dump(list(dictionary), dictionary_file)
+    return len(final_times)
+
+
+def read_results_csv(csv_path: str):
+    """
+    Read a results csv file written by RuntimeBuildingBlocks.results_to_csv or StreamingResultsWriter one row at a time.
+    Header rows are skipped, some legacy files are several runs saved one after the other.
+
+    :param csv_path: str: The path of the csv file
+    :return: generator: [final time, build order string] for each row, the final time is None if it timed out
+    """
+    with open(csv_path, newline='') as csvfile:
+        for row in csv.reader(csvfile):
+            if len(row) < 2 or row[0] == "Number":
+                continue
+            yield [int(row[0]) if row[0] else None, row[1]]
+
+
+def convert_results_directory(results_directory: str, output_directory: str) -> list:
+    """
+    Convert every results csv file in a directory and its legacy_runs directory to the columnar format. Each csv file
+    gets a columnar directory with the same name without .csv, legacy runs in a legacy_runs directory.
+
+    :param results_directory: str: The results directory
+    :param output_directory: str: The directory to write the columnar directories in
+    :return: list: [csv path, columnar directory, number of results] for each converted file
+    """
+    converted = []
+    for directory, output_subdirectory in [(results_directory, output_directory),
+                                           (os.path.join(results_directory, "legacy_runs"),
+                                            os.path.join(output_directory, "legacy_runs"))]:
+        if not os.path.isdir(directory):
+            continue
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith(".csv"):
+                continue
+            csv_path = os.path.join(directory, file_name)
+            columnar_directory = os.path.join(output_subdirectory, file_name[:-len(".csv")])
+            number_of_results = write_columnar_results(read_results_csv(csv_path), columnar_directory)
+            converted.append([csv_path, columnar_directory, number_of_results])
+    return converted
+
+
+class ColumnarResults:
+    """
+    The ColumnarResults loads a directory written by write_columnar_results. The arrays are memory mapped by default,
+    so opening even the largest results only reads the parts that are used, and the final times can be used with NumPy
+    directly, for example results.final_times[results.get_finished_mask()].min().
+
+    Args:
+        directory (str): The columnar results directory
+        mmap_mode (str): The np.load memory map mode, None to read the arrays into memory
+
+    """
+    def __init__(self, directory: str, mmap_mode='r'):
+        self.directory = directory
+        self.final_times = np.load(os.path.join(directory, FINAL_TIMES_FILE), mmap_mode=mmap_mode)
+        self.tokens = np.load(os.path.join(directory, TOKENS_FILE), mmap_mode=mmap_mode)
+        self.offsets = np.load(os.path.join(directory, OFFSETS_FILE), mmap_mode=mmap_mode)
+        with open(os.path.join(directory, DICTIONARY_FILE)) as dictionary_file:
+            self.dictionary = json.load(dictionary_file)
+
+    def __len__(self):
+        return len(self.final_times)
+
+    def get_finished_mask(self) -> np.ndarray:
+        """
+        Get which build orders reached the resource trigger.
+
+        :return: np.ndarray: True for each build order that did not time out
+        """
+        return self.final_times != TIMED_OUT_TIME
+
+    def get_final_time(self, index: int):
+        """
+        Get the final time of a build order.
+
+        :param index: int: The build order index
+        :return: int: The final time, None if it timed out
+        """
+        final_time = int(self.final_times[index])
+        return None if final_time == TIMED_OUT_TIME else final_time
+
+    def get_build_order_tokens(self, index: int) -> np.ndarray:
+        """
+        Get the token numbers of a build order, the dictionary has the text of each.
+
+        :param index: int: The build order index
+        :return: np.ndarray: The token numbers
+        """
+        return self.tokens[self.offsets[index]:self.offsets[index + 1]]
+
+    def get_build_order_string(self, index: int) -> str:
+        """
+        Get a build order in the same text format as the results csv files.
+
+        :param index: int: The build order index
+        :return: str: The build order string
+        """
+        return "".join([f"{self.dictionary[token_number]}, " for token_number in self.get_build_order_tokens(index)])
+
+    def read_results(self):
+        """
+        Read the results back in the csv format, one at a time.
+
+        :return: generator: [final time, build order string] for each result, the final time is None if it timed out
+        """
+        for index in range(len(self)):
+            yield [self.get_final_time(index), self.get_build_order_string(index)]
@@ -0,0 +1,475 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Simulator that runs a batch of build orders in one call of a simulation kernel compiled with Numba, using integer coded
+arrays instead of the ResourceManager, Base and BuildSlot objects. Numba is optional, without it the build orders are
+simulated with the pure Python classes.
+
+"""
+import math
+
+import numpy as np
+
+from libraries.BaseClass import Base
+from libraries.BaseConstants import *
+from libraries.BatchSimulator import BUILD_QUEUE_SIZE, SLOT_KIND_EMPTY, SLOT_KIND_SUPPLY_PAD, SLOT_KIND_TEMPLE, \
+    BatchSimulator, EncodedBuildOrders
+from libraries.BuildOrderEncoding import decode_build_order, packed_to_text, unpack_order
+from libraries.ResourceManager import ResourceManager
+from libraries.RuntimeBuildingBlocks import RuntimeBuildingBlocks
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+# Numba is only needed for the compiled kernel
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# If the compiled kernel can be used
+NUMBA_AVAILABLE = numba is not None
+
+# Final time codes of the kernel, for a timeout and for a build order that builds a supply pad on top of a Temple,
+# which is not supported by the compiled kernel. SimulatorWrapper simulates those build orders
+_TIMED_OUT = -1
+_UNSUPPORTED = -2
+
+# Build order result codes used inside the kernel
+_WAITING = BuildOrderResults.WAITING.value
+_APPROVED = BuildOrderResults.APPROVED.value
+_SKIPPED = BuildOrderResults.SKIPPED.value
+
+# Integer codes of the orders, 0 is an order that is already marked SKIPPED
+_BUILD_SUPPLY_PAD = Orders.BUILD_SUPPLY_PAD.value
+_BUILD_TEMPLE = Orders.BUILD_TEMPLE.value
+_UPGRADE_BASE = Orders.UPGRADE_BASE.value
+_UPGRADE_SUPPLY_PAD = Orders.UPGRADE_SUPPLY_PAD.value
+
+# Integer codes of the build slot and base states
+_IDLE = BuildSlotState.IDLE.value
+_BUILDING = BuildSlotState.BUILDING.value
+_BUILT = BuildSlotState.BUILT.value
+_UPGRADING = BuildSlotState.UPGRADING.value
+_UPGRADED = BuildSlotState.UPGRADED.value
+_BASE_IDLE = BaseState.IDLE.value
+_BASE_UPGRADING = BaseState.UPGRADING.value
+_BASE_PAUSED = BaseState.PAUSED.value
+_CITADEL = BaseLevel.CITADEL.value
+
+# Number of build slots on a base, plus slot 0 which is unused so slot numbers can be used directly
+_NUMBER_OF_SLOTS = len(SlotNumbers) + 1
+
+# The build slot timers count down one per update while above 0, so the 17.5 second upgrade takes 18 updates
+_SUPPLY_PAD_UPGRADE_TICKS = math.ceil(SUPPLY_PAD_UPGRADE_TIME_SECONDS)
+
+# Base level needed for each build slot, index 0 is unused so slot numbers can be used directly
+_SLOT_LEVEL_NEEDED = np.array([0,
+                               BaseLevel.OUTPOST.value, BaseLevel.OUTPOST.value, BaseLevel.OUTPOST.value,
+                               BaseLevel.KEEP.value, BaseLevel.KEEP.value,
+                               BaseLevel.CITADEL.value, BaseLevel.CITADEL.value], dtype=np.int64)
+
+# Base build/upgrade cost and time, indexed by the current base level
+_BASE_UPGRADE_COST = np.array([BASE_BUILD_COST, KEEP_UPGRADE_COST, CITADEL_UPGRADE_COST, 0], dtype=np.int64)
+_BASE_UPGRADE_TIME = np.array([BASE_BUILD_TIME_SECONDS, KEEP_UPGRADE_TIME_SECONDS, CITADEL_UPGRADE_TIME_SECONDS, 0],
+                              dtype=np.int64)
+
+
+def _simulate_batch(order_types, order_bases, order_slots, lengths, starting_money, base_levels, pause_timers,
+                    temple_needed, income_table, resource_trigger, simulation_time_max, final_times, skipped):
+    """
+    Simulation kernel. Runs every build order of the batch one after the other, with the same rules and the same order
+    of checks as RuntimeBuildingBlocks.run_simulation, build_verifier, Base and the build slot classes, one in game
+    second at a time. Only uses loops, integers and NumPy arrays, so Numba can compile it, and the state arrays are made
+    once for the whole batch.
+
+    :param order_types: np.ndarray: (N, L) Orders values of the build orders, 0 for an order already marked SKIPPED
+    :param order_bases: np.ndarray: (N, L) base indexes of the build orders
+    :param order_slots: np.ndarray: (N, L) slot numbers of the build orders, 0 for orders without a slot
+    :param lengths: np.ndarray: (N,) number of orders in each build order
+    :param starting_money: int: The starting money
+    :param base_levels: np.ndarray: The starting BaseLevel value of each base
+    :param pause_timers: np.ndarray: The starting pause timer of each base
+    :param temple_needed: np.ndarray: If each base needs a temple to clear its pause timer
+    :param income_table: np.ndarray: Money added per second for every number of lite and heavy supply pads
+    :param resource_trigger: int: The amount of resources to reach the exit scenario
+    :param simulation_time_max: int: Maximum time for each simulation
+    :param final_times: np.ndarray: (N,) set to the final time of each build order, _TIMED_OUT or _UNSUPPORTED
+    :param skipped: np.ndarray: (N, L) set to True for every order that was skipped
+    """
+    number_of_bases = base_levels.shape[0]
+    base_level = np.zeros(number_of_bases, dtype=np.int64)
+    base_status = np.zeros(number_of_bases, dtype=np.int64)
+    base_timer = np.zeros(number_of_bases, dtype=np.int64)
+    pause_timer = np.zeros(number_of_bases, dtype=np.int64)
+    slot_kind = np.zeros((number_of_bases, _NUMBER_OF_SLOTS), dtype=np.int64)
+    slot_status = np.zeros((number_of_bases, _NUMBER_OF_SLOTS), dtype=np.int64)
+    slot_timer = np.zeros((number_of_bases, _NUMBER_OF_SLOTS), dtype=np.int64)
+    queue = np.zeros((number_of_bases, BUILD_QUEUE_SIZE), dtype=np.int64)
+    queue_head = np.zeros(number_of_bases, dtype=np.int64)
+    queue_length = np.zeros(number_of_bases, dtype=np.int64)
+
+    for n in range(lengths.shape[0]):
+        # Reset the state to the start of the scenario
+        money = starting_money
+        lite = 0
+        heavy = 0
+        tech_level = 0
+        temple_count = 0
+        pad_flag = False
+        for b in range(number_of_bases):
+            base_level[b] = base_levels[b]
+            base_status[b] = _BASE_PAUSED if pause_timers[b] > 0 else _BASE_IDLE
+            base_timer[b] = 0
+            pause_timer[b] = pause_timers[b]
+            queue_head[b] = 0
+            queue_length[b] = 0
+            for s in range(_NUMBER_OF_SLOTS):
+                slot_kind[b, s] = SLOT_KIND_EMPTY
+                slot_status[b, s] = _IDLE
+                slot_timer[b, s] = 0
+
+        length = lengths[n]
+        final_time = _TIMED_OUT
+        i = 0
+        simulation_time = 0
+        while simulation_time < simulation_time_max:
+            # Try the current build order, same as build_verifier
+            if i < length:
+                order = order_types[n, i]
+                b = order_bases[n, i]
+                s = order_slots[n, i]
+                result = _SKIPPED
+                if order == _BUILD_SUPPLY_PAD or order == _BUILD_TEMPLE:
+                    if order == _BUILD_TEMPLE and temple_count > 0:
+                        result = _SKIPPED
+                    # A temple has the EMPTY build type, so only a supply pad is already built
+                    elif slot_kind[b, s] == SLOT_KIND_SUPPLY_PAD:
+                        result = _SKIPPED
+                    elif slot_kind[b, s] == SLOT_KIND_TEMPLE:
+                        final_time = _UNSUPPORTED
+                        break
+                    elif base_level[b] < _SLOT_LEVEL_NEEDED[s]:
+                        result = _WAITING if base_status[b] == _BASE_UPGRADING else _SKIPPED
+                    else:
+                        cost = TEMPLE_COST if order == _BUILD_TEMPLE else SUPPLY_PAD_COST
+                        if money >= cost:
+                            money -= cost
+                            slot_status[b, s] = _IDLE
+                            if order == _BUILD_TEMPLE:
+                                slot_kind[b, s] = SLOT_KIND_TEMPLE
+                                slot_timer[b, s] = TEMPLE_BUILD_TIME_SECONDS
+                                temple_count += 1
+                            else:
+                                slot_kind[b, s] = SLOT_KIND_SUPPLY_PAD
+                                slot_timer[b, s] = SUPPLY_PAD_BUILD_TIME_SECONDS
+                                pad_flag = True
+                            queue[b, queue_head[b] + queue_length[b]] = s
+                            queue_length[b] += 1
+                            result = _APPROVED
+                        else:
+                            result = _WAITING if pad_flag else _SKIPPED
+                elif order == _UPGRADE_BASE:
+                    if base_status[b] == _BASE_PAUSED:
+                        result = _WAITING if temple_needed[b] and temple_count > 0 else _SKIPPED
+                    elif base_status[b] != _BASE_IDLE:
+                        result = _WAITING
+                    elif base_level[b] == _CITADEL:
+                        result = _SKIPPED
+                    else:
+                        cost = _BASE_UPGRADE_COST[base_level[b]]
+                        if money >= cost:
+                            money -= cost
+                            base_status[b] = _BASE_UPGRADING
+                            base_timer[b] = _BASE_UPGRADE_TIME[base_level[b]]
+                            result = _APPROVED
+                        else:
+                            result = _WAITING if pad_flag else _SKIPPED
+                elif order == _UPGRADE_SUPPLY_PAD:
+                    # A heavy supply pad is no longer the SUPPLY_PAD build type
+                    if slot_kind[b, s] != SLOT_KIND_SUPPLY_PAD or slot_status[b, s] == _UPGRADED:
+                        result = _SKIPPED
+                    elif slot_status[b, s] == _BUILDING:
+                        result = _WAITING
+                    elif slot_status[b, s] != _BUILT:
+                        result = _SKIPPED
+                    elif tech_level < 1:
+                        result = _WAITING if temple_count == 1 else _SKIPPED
+                    elif money >= SUPPLY_PAD_UPGRADE_COST:
+                        money -= SUPPLY_PAD_UPGRADE_COST
+                        slot_status[b, s] = _UPGRADING
+                        slot_timer[b, s] = _SUPPLY_PAD_UPGRADE_TICKS
+                        queue[b, queue_head[b] + queue_length[b]] = s
+                        queue_length[b] += 1
+                        result = _APPROVED
+                    else:
+                        result = _WAITING if pad_flag else _SKIPPED
+
+                if result == _APPROVED:
+                    i += 1
+                elif result == _SKIPPED:
+                    skipped[n, i] = True
+                    i += 1
+
+            # Update the bases, same as Base.update and the build slot update methods
+            for b in range(number_of_bases):
+                if base_status[b] == _BASE_IDLE:
+                    if queue_length[b] > 0:
+                        front = queue[b, queue_head[b]]
+                        if slot_status[b, front] == _IDLE:
+                            slot_status[b, front] = _BUILDING
+                        elif slot_status[b, front] != _BUILDING:
+                            queue_head[b] += 1
+                            queue_length[b] -= 1
+                    for s in range(1, _NUMBER_OF_SLOTS):
+                        status = slot_status[b, s]
+                        if status == _BUILDING or status == _UPGRADING:
+                            if slot_timer[b, s] > 0:
+                                slot_timer[b, s] -= 1
+                            else:
+                                if slot_kind[b, s] == SLOT_KIND_TEMPLE:
+                                    tech_level += 1
+                                    slot_status[b, s] = _BUILT
+                                elif status == _BUILDING:
+                                    lite += 1
+                                    slot_status[b, s] = _BUILT
+                                else:
+                                    heavy += 1
+                                    lite -= 1
+                                    slot_status[b, s] = _UPGRADED
+                                slot_timer[b, s] = 0
+                elif base_status[b] == _BASE_UPGRADING:
+                    if base_timer[b] > 0:
+                        base_timer[b] -= 1
+                    else:
+                        base_level[b] = min(base_level[b] + 1, _CITADEL)
+                        base_status[b] = _BASE_IDLE
+                        base_timer[b] = 0
+                elif base_status[b] == _BASE_PAUSED:
+                    if temple_needed[b] and tech_level <= 0:
+                        continue
+                    if pause_timer[b] > 0:
+                        pause_timer[b] -= 1
+                    else:
+                        base_status[b] = _BASE_IDLE
+                        pause_timer[b] = 0
+
+            money += income_table[lite, heavy]
+            if money >= resource_trigger:
+                final_time = simulation_time
+                break
+            simulation_time += 1
+
+        final_times[n] = final_time
+
+
+# The compiled kernel, None without Numba. Compiled the first time it is called, and cached to disk after that
+_compiled_simulate_batch = None
+if NUMBA_AVAILABLE:
+    _compiled_simulate_batch = numba.njit(cache=True, nogil=True)(_simulate_batch)
+
+
+class CompiledSimulator:
+    """
+    The CompiledSimulator runs a batch of build orders for the same scenario with one call of the compiled simulation
+    kernel, when Numba is installed. The kernel keeps the state of one simulation in small integer arrays, and steps
+    through every in game second the same way RuntimeBuildingBlocks.run_simulation does, so the final times and the
+    SKIPPED orders are the same as running each build order through its own SimulatorWrapper. verify checks this on any
+    build orders.
+
+    Without Numba, or with use_compiled_kernel False, every build order is simulated with the pure Python classes and
+    the event driven simulation instead, which has the same results.
+
+    Bases are added the same way as with the SimulatorWrapper and the BatchSimulator, and build orders are matched to
+    the bases by base number.
+
+    Args:
+        starting_money (int): The starting money for every build order
+        use_compiled_kernel (bool): If the compiled kernel is used, True if Numba is installed
+        base_levels (list): The starting BaseLevel of each base
+        base_numbers (list): The base number of each base, used to match build orders to bases
+        pause_timers (list): The pause timer of each base
+        temple_needed_list (list): If a temple is needed to clear each base
+
+    """
+    def __init__(self, starting_money: int, use_compiled_kernel=NUMBA_AVAILABLE):
+        self.starting_money = starting_money
+        self.use_compiled_kernel = use_compiled_kernel and NUMBA_AVAILABLE
+        self.base_levels = []
+        self.base_numbers = []
+        self.pause_timers = []
+        self.temple_needed_list = []
+
+    def add_base(self, upgrade_level: BaseLevel, base_number: int, pause_timer=0,
+                 temple_needed_to_clear_second_base=False):
+        """
+        Method to add a base to every simulation in the batch. Same as SimulatorWrapper.add_base.
+
+        :param upgrade_level: BaseLevel: Starting level of the base
+        :param base_number: int: Base identification number
+        :param pause_timer: int: Starting pause timer of the base
+        :param temple_needed_to_clear_second_base: bool: If a temple is needed for the pause timer to count down
+        """
+        self.base_levels.append(upgrade_level)
+        self.base_numbers.append(base_number)
+        self.pause_timers.append(pause_timer)
+        self.temple_needed_list.append(temple_needed_to_clear_second_base)
+
+    # The starting bases of a scenario, the same as SimulatorWrapper.add_bases
+    add_bases = SimulatorWrapper.add_bases
+
+    def get_base_list(self) -> list[Base]:
+        """
+        Make a new set of bases with their own ResourceManager, with the starting money, for simulating or decoding a
+        build order with the Python classes.
+
+        :return: list[Base]: The bases
+        """
+        resource_manager = ResourceManager()
+        resource_manager.add_money(self.starting_money)
+        return [Base(resource_manager=resource_manager, upgrade_level=upgrade_level, base_number=base_number,
+                     pause_timer=pause_timer, temple_needed_to_clear_second_base=temple_needed)
+                for upgrade_level, base_number, pause_timer, temple_needed in zip(self.base_levels, self.base_numbers,
+                                                                                  self.pause_timers,
+                                                                                  self.temple_needed_list)]
+
+    def encode_packed_build_orders(self, packed_build_orders: list[bytes]) -> EncodedBuildOrders:
+        """
+        Convert packed build orders straight to the integer arrays of the kernel, without decoding them to lists.
+
+        :param packed_build_orders: list[bytes]: The packed build orders
+        :return: EncodedBuildOrders: The encoded build orders
+        """
+        base_index = {base_number: index for index, base_number in enumerate(self.base_numbers)}
+        longest = max((len(packed_build_order) for packed_build_order in packed_build_orders), default=0)
+        # One extra column of 0 so the arrays match BatchSimulator.encode_build_orders
+        order_types = np.zeros((len(packed_build_orders), longest + 1), dtype=np.int8)
+        order_bases = np.zeros((len(packed_build_orders), longest + 1), dtype=np.int8)
+        order_slots = np.zeros((len(packed_build_orders), longest + 1), dtype=np.int8)
+        lengths = np.zeros(len(packed_build_orders), dtype=np.int64)
+
+        for n, packed_build_order in enumerate(packed_build_orders):
+            lengths[n] = len(packed_build_order)
+            for i, packed_order in enumerate(packed_build_order):
+                order, base_number, slot = unpack_order(packed_order)
+                order_types[n, i] = order.value
+                order_bases[n, i] = base_index[base_number]
+                order_slots[n, i] = slot
+
+        return EncodedBuildOrders(order_types=order_types, order_bases=order_bases, order_slots=order_slots,
+                                  lengths=lengths)
+
+    def run_encoded(self, encoded: EncodedBuildOrders, resource_trigger: int, simulation_time_seconds: int,
+                    compiled=True) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Batch entry point, runs every encoded build order with a single call of the kernel.
+
+        :param encoded: EncodedBuildOrders: The encoded build orders to run
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param simulation_time_seconds: int: Maximum time for the simulation to reach
+        :param compiled: bool: Run the compiled kernel if there is one, False to always run the kernel as Python code,
+            which is much slower
+        :return: tuple[np.ndarray, np.ndarray]: The final times (-1 for a timeout, -2 for a build order that is not
+            supported by the compiled kernel, use SimulatorWrapper) and the (N, L) mask of skipped orders
+        """
+        final_times = np.full(len(encoded), _TIMED_OUT, dtype=np.int64)
+        skipped = np.zeros(encoded.order_types.shape, dtype=np.bool_)
+        simulate_batch = _compiled_simulate_batch if compiled and _compiled_simulate_batch is not None \
+            else _simulate_batch
+        simulate_batch(encoded.order_types, encoded.order_bases, encoded.order_slots, encoded.lengths,
+                       self.starting_money,
+                       np.array([level.value for level in self.base_levels], dtype=np.int64),
+                       np.array(self.pause_timers, dtype=np.int64),
+                       np.array(self.temple_needed_list, dtype=np.bool_),
+                       BatchSimulator.get_income_table(len(SlotNumbers) * len(self.base_numbers)),
+                       resource_trigger, simulation_time_seconds, final_times, skipped)
+        return final_times, skipped[:, :-1]
+
+    def run_packed(self, packed_build_orders: list[bytes], resource_trigger: int,
+                   simulation_time_seconds: int) -> list:
+        """
+        Simulate a batch of packed build orders, with the compiled kernel if it is used.
+
+        :param packed_build_orders: list[bytes]: The packed build orders to simulate
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param simulation_time_seconds: int: Maximum time for each simulation
+        :return: list: [final time, build order string] for each build order, in the same order as the packed build
+            orders. The final time is None if the build order timed out
+        :raises: ValueError: If a build order builds a supply pad on top of a Temple
+        """
+        if not self.use_compiled_kernel:
+            return [self._run_python(packed_build_order, resource_trigger, simulation_time_seconds)
+                    for packed_build_order in packed_build_orders]
+
+        final_times, skipped = self.run_encoded(self.encode_packed_build_orders(packed_build_orders),
+                                                resource_trigger=resource_trigger,
+                                                simulation_time_seconds=simulation_time_seconds)
+        if np.any(final_times == _UNSUPPORTED):
+            raise ValueError("Build order builds a supply pad on top of a Temple, which is not supported by the "
+                             "compiled kernel, use SimulatorWrapper")
+        results = []
+        for packed_build_order, final_time, skipped_orders in zip(packed_build_orders, final_times, skipped):
+            # Skipped orders are left out of the build order string, the same way build_order_print leaves them out
+            approved_orders = bytes(packed_order for packed_order, was_skipped in zip(packed_build_order,
+                                                                                      skipped_orders)
+                                    if not was_skipped)
+            results.append([None if final_time == _TIMED_OUT else int(final_time), packed_to_text(approved_orders)])
+        return results
+
+    def _run_python(self, packed_build_order: bytes, resource_trigger: int, simulation_time_seconds: int,
+                    event_driven=True) -> list:
+        """
+        Simulate one packed build order with the pure Python classes.
+
+        :param packed_build_order: bytes: The packed build order
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param simulation_time_seconds: int: Maximum time for the simulation
+        :param event_driven: bool: Use the event driven simulation instead of one tick at a time
+        :return: list: [final time, build order string], the final time is None if the build order timed out
+        """
+        base_list = self.get_base_list()
+        build_order = decode_build_order(packed_build_order, base_list)
+        runtime_building_blocks = RuntimeBuildingBlocks(resource_manager=base_list[0].resource_manager)
+        if event_driven:
+            run_simulation = runtime_building_blocks.run_simulation_event_driven
+        else:
+            run_simulation = runtime_building_blocks.run_simulation
+        final_time = run_simulation(build_orders=build_order,
+                                    resource_amount=resource_trigger,
+                                    simulation_time_max=simulation_time_seconds,
+                                    base_list=base_list,
+                                    fine_debug=False)
+        approved_orders = bytes(packed_order for packed_order, order in zip(packed_build_order, build_order)
+                                if order[0] != "SKIPPED")
+        return [final_time, packed_to_text(approved_orders)]
+
+    def verify(self, packed_build_orders: list[bytes], resource_trigger: int, simulation_time_seconds: int) -> list:
+        """
+        Check the kernel against RuntimeBuildingBlocks.run_simulation, one tick at a time with the Python classes. The
+        compiled kernel is checked if Numba is installed, otherwise the kernel is run as Python code, so its rules can
+        be checked without Numba.
+
+        :param packed_build_orders: list[bytes]: The packed build orders to check, for example a seeded corpus
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param simulation_time_seconds: int: Maximum time for each simulation
+        :return: list: A message for each build order with a different final time or different SKIPPED orders, empty
+            if they all match
+        """
+        final_times, skipped = self.run_encoded(self.encode_packed_build_orders(packed_build_orders),
+                                                resource_trigger=resource_trigger,
+                                                simulation_time_seconds=simulation_time_seconds)
+        messages = []
+        for packed_build_order, final_time, skipped_orders in zip(packed_build_orders, final_times, skipped):
+            # Not supported by the compiled kernel, so there is no kernel result to compare to SimulatorWrapper
+            if final_time == _UNSUPPORTED:
+                continue
+            expected_time, expected_string = self._run_python(packed_build_order, resource_trigger,
+                                                              simulation_time_seconds, event_driven=False)
+            approved_orders = bytes(packed_order for packed_order, was_skipped in zip(packed_build_order,
+                                                                                      skipped_orders)
+                                    if not was_skipped)
+            kernel_time = None if final_time == _TIMED_OUT else int(final_time)
+            if kernel_time != expected_time or packed_to_text(approved_orders) != expected_string:
+                messages.append(f"{packed_to_text(packed_build_order)}: kernel {kernel_time} "
+                                f"'{packed_to_text(approved_orders)}', run_simulation {expected_time} "
+                                f"'{expected_string}'")
+        return messages
@@ -0,0 +1,282 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+On disk store for simulation results, so results can be kept and reused across runs.
+
+"""
+import csv
+import os
+import re
+import sqlite3
+
+from libraries.BuildOrderEncoding import fingerprint, text_to_packed
+
+# Number of results to add before committing them to the database. Committed results survive a crash or a stopped run
+COMMIT_INTERVAL = 1000
+
+# Defaults for the results csv files, which do not save the settings they were run with. The pause timer and temple
+# flag were never passed to the bases by run_build_combinations, so those runs all used the Base defaults
+CSV_STARTING_MONEY = 800
+CSV_SIMULATION_TIME_SECONDS = 1000
+CSV_PAUSE_TIMER_SECONDS = 0
+CSV_TEMPLE_NEEDED = False
+
+# Results file names, for example 3000r_2b_10k_iterations.csv and legacy_runs/6800_supplies_two_bases_output.csv
+_RESULTS_FILE_NAME = re.compile(r"^(\d+)r_(\d+)b_")
+_LEGACY_RESULTS_FILE_NAME = re.compile(r"^(\d+)_supplies_(one|two|three|four)_bases?_")
+_NUMBER_WORDS = {"one": 1, "two": 2, "three": 3, "four": 4}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    scenario_id INTEGER PRIMARY KEY,
+    starting_money INTEGER NOT NULL,
+    number_of_bases INTEGER NOT NULL,
+    resource_trigger INTEGER NOT NULL,
+    simulation_time_seconds INTEGER NOT NULL,
+    pause_timer INTEGER NOT NULL,
+    temple_needed INTEGER NOT NULL,
+    UNIQUE (starting_money, number_of_bases, resource_trigger, simulation_time_seconds, pause_timer, temple_needed)
+);
+CREATE TABLE IF NOT EXISTS results (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios (scenario_id),
+    fingerprint INTEGER NOT NULL,
+    build_order BLOB NOT NULL,
+    final_time INTEGER,
+    build_order_string TEXT NOT NULL,
+    PRIMARY KEY (scenario_id, fingerprint)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS generated_build_orders (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios (scenario_id),
+    build_order BLOB NOT NULL,
+    PRIMARY KEY (scenario_id, build_order)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS imported_files (
+    path TEXT PRIMARY KEY
+);
+"""
+
+
+def get_results_file_settings(file_name: str):
+    """
+    Read the resource trigger and number of bases a results file was run with from its name.
+
+    :param file_name: str: The file or directory name, for example 3000r_2b_10k_iterations.csv
+    :return: tuple[int, int]: The resource trigger and number of bases, None if the name does not match
+    """
+    match = _RESULTS_FILE_NAME.match(file_name)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    match = _LEGACY_RESULTS_FILE_NAME.match(file_name)
+    if match:
+        return int(match.group(1)), _NUMBER_WORDS[match.group(2)]
+    return None
+
+
+class ExperimentStore:
+    """
+    The ExperimentStore keeps every simulated build order in a SQLite database, keyed by the fingerprint of the build
+    order string and the scenario it was simulated in (starting money, number of bases, resource trigger, simulation
+    time, pause timer and if a temple is needed to start the pause timer). Before simulating, the build orders already
+    in the store can be loaded into the seen set of GenerateOrdersBuildingBlocks, so a new run only simulates build
+    orders no earlier run has covered, and a stopped run can be started again without losing what was already
+    committed.
+
+    The fingerprint is of the build order string after the simulation, packed with text_to_packed, for new and imported
+    results alike, so a build order is only stored once no matter which generated build order it came from. Every
+    packed build order that was generated, before any orders were SKIPPED, is also saved in generated_build_orders,
+    which is what fills the seen set. The results csv files only have the build order string, so imported results save
+    that string packed instead.
+
+    Args:
+        database_path (str): The path of the SQLite database file, created if it does not exist
+
+    """
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path)
+        self.connection.executescript(_SCHEMA)
+        self.uncommitted_results = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Commit any remaining results and close the database.
+        """
+        self.connection.commit()
+        self.connection.close()
+
+    @staticmethod
+    def _to_sqlite_integer(build_order_fingerprint: int) -> int:
+        """
+        SQLite integers are signed 64-bit, so fingerprints with the top bit set are saved as negative numbers.
+
+        :param build_order_fingerprint: int: The unsigned 64-bit fingerprint
+        :return: int: The signed 64-bit value
+        """
+        if build_order_fingerprint >= 1 << 63:
+            return build_order_fingerprint - (1 << 64)
+        return build_order_fingerprint
+
+    def get_scenario_id(self, starting_money: int, number_of_bases: int, resource_trigger: int,
+                        simulation_time_seconds: int, pause_timer: int, temple_needed: bool) -> int:
+        """
+        Get the id of a scenario, adding it to the store if it is new.
+
+        :param starting_money: int: The amount of money to start with
+        :param number_of_bases: int: Number of bases the simulation was run with
+        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param simulation_time_seconds: int: Maximum time for each simulation
+        :param pause_timer: int: Pause timer of the bases after the first one
+        :param temple_needed: bool: If a temple is needed to start the pause timer
+        :return: int: The scenario id
+        """
+        scenario = (starting_money, number_of_bases, resource_trigger, simulation_time_seconds, pause_timer,
+                    int(temple_needed))
+        self.connection.execute("INSERT OR IGNORE INTO scenarios (starting_money, number_of_bases, resource_trigger, "
+                                "simulation_time_seconds, pause_timer, temple_needed) VALUES (?, ?, ?, ?, ?, ?)",
+                                scenario)
+        row = self.connection.execute("SELECT scenario_id FROM scenarios WHERE starting_money = ? AND "
+                                      "number_of_bases = ? AND resource_trigger = ? AND simulation_time_seconds = ? "
+                                      "AND pause_timer = ? AND temple_needed = ?", scenario).fetchone()
+        return row[0]
+
+    @classmethod
+    def _get_key(cls, build_order_string: str) -> int:
+        """
+        Get the key of a result in the results table, the fingerprint of the packed build order string.
+
+        :param build_order_string: str: The build order string after the simulation, from build_order_print
+        :return: int: The signed 64-bit key
+        """
+        return cls._to_sqlite_integer(fingerprint(text_to_packed(build_order_string)))
+
+    def add_result(self, scenario_id: int, packed_build_order: bytes, final_time: int, build_order_string: str):
+        """
+        Add a simulation result to the store. Results already in the store are kept as they are, including the ones
+        with the same build order string from a different generated build order.
+
+        :param scenario_id: int: The scenario id from get_scenario_id
+        :param packed_build_order: bytes: The packed build order that was simulated
+        :param final_time: int: The time the build order took, None if it timed out
+        :param build_order_string: str: The build order string after the simulation, from build_order_print
+        """
+        self.connection.execute("INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, ?)",
+                                (scenario_id, self._get_key(build_order_string), packed_build_order, final_time,
+                                 build_order_string))
+        self.connection.execute("INSERT OR IGNORE INTO generated_build_orders VALUES (?, ?)",
+                                (scenario_id, packed_build_order))
+        self.uncommitted_results += 1
+        if self.uncommitted_results >= COMMIT_INTERVAL:
+            self.commit()
+
+    def commit(self):
+        """
+        Commit the added results to the database file.
+        """
+        self.connection.commit()
+        self.uncommitted_results = 0
+
+    def has_result(self, scenario_id: int, build_order_string: str) -> bool:
+        """
+        Check if a build order has already been simulated in a scenario.
+
+        :param scenario_id: int: The scenario id from get_scenario_id
+        :param build_order_string: str: The build order string after the simulation, from build_order_print
+        :return: bool: True if the build order is in the store
+        """
+        row = self.connection.execute("SELECT 1 FROM results WHERE scenario_id = ? AND fingerprint = ?",
+                                      (scenario_id, self._get_key(build_order_string)))
+        return row.fetchone() is not None
+
+    def get_build_orders(self, scenario_id: int) -> set:
+        """
+        Get every packed build order simulated in a scenario, used for filling the seen set of
+        GenerateOrdersBuildingBlocks. This includes the build orders with the same build order string as a result
+        already in the store.
+
+        :param scenario_id: int: The scenario id from get_scenario_id
+        :return: set: The packed build orders
+        """
+        rows = self.connection.execute("SELECT build_order FROM results WHERE scenario_id = ? UNION "
+                                       "SELECT build_order FROM generated_build_orders WHERE scenario_id = ?",
+                                       (scenario_id, scenario_id))
+        return {row[0] for row in rows}
+
+    def get_results(self, scenario_id: int) -> list:
+        """
+        Get every result in a scenario, in the same [final time, build order string] format as the final results list.
+
+        :param scenario_id: int: The scenario id from get_scenario_id
+        :return: list: The results
+        """
+        rows = self.connection.execute("SELECT final_time, build_order_string FROM results WHERE scenario_id = ?",
+                                       (scenario_id,))
+        return [list(row) for row in rows]
+
+    def import_results_csv(self, csv_path: str, scenario_id: int) -> int:
+        """
+        Import a results csv file written by RuntimeBuildingBlocks.results_to_csv. Files that have been imported before
+        are not read again. Some legacy runs were made with an older generator that could upgrade more supply pads than
+        a base has, those build orders cannot be packed and are left out, since they can never be generated again.
+
+        :param csv_path: str: The path of the csv file
+        :param scenario_id: int: The scenario id from get_scenario_id the file was run with
+        :return: int: The number of rows imported from the file, 0 if the file was already imported
+        """
+        path = os.path.abspath(csv_path)
+        if self.connection.execute("SELECT 1 FROM imported_files WHERE path = ?", (path,)).fetchone() is not None:
+            return 0
+
+        number_of_rows = 0
+        with open(csv_path, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            for row in reader:
+                # Skip header rows, some legacy files are several runs saved one after the other
+                if len(row) < 2 or row[0] == "Number":
+                    continue
+                # Timed out runs have an empty time
+                final_time = int(row[0]) if row[0] else None
+                try:
+                    packed_build_order = text_to_packed(row[1])
+                except ValueError:
+                    continue
+                self.add_result(scenario_id, packed_build_order, final_time, row[1])
+                number_of_rows += 1
+
+        self.connection.execute("INSERT INTO imported_files VALUES (?)", (path,))
+        self.commit()
+        return number_of_rows
+
+    def import_results_directory(self, results_directory: str) -> int:
+        """
+        Import all the results csv files in a directory and its legacy_runs directory. The resource trigger and number
+        of bases are read from the file names, and the other settings use the CSV_ defaults. Files with names that do
+        not match are left out.
+
+        :param results_directory: str: The results directory
+        :return: int: The number of rows imported
+        """
+        number_of_rows = 0
+        for directory in [results_directory, os.path.join(results_directory, "legacy_runs")]:
+            if not os.path.isdir(directory):
+                continue
+            for file_name in sorted(os.listdir(directory)):
+                file_settings = get_results_file_settings(file_name)
+                if file_settings is None:
+                    continue
+                resource_trigger, number_of_bases = file_settings
+
+                scenario_id = self.get_scenario_id(starting_money=CSV_STARTING_MONEY,
+                                                   number_of_bases=number_of_bases,
+                                                   resource_trigger=resource_trigger,
+                                                   simulation_time_seconds=CSV_SIMULATION_TIME_SECONDS,
+                                                   pause_timer=CSV_PAUSE_TIMER_SECONDS,
+                                                   temple_needed=CSV_TEMPLE_NEEDED)
+                number_of_rows += self.import_results_csv(os.path.join(directory, file_name), scenario_id)
+        return number_of_rows
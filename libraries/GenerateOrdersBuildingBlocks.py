@@ -6,9 +6,16 @@ Building Blocks class file responsible for generating random build orders and ut
 
 """
 import random
+from bisect import bisect_right
 
 from libraries.BaseClass import Base
 from libraries.BaseConstants import BaseLevel, BaseState, Orders, get_slot_number
+from libraries.BuildOrderEncoding import check_number_of_bases, encode_build_order, fingerprint, pack_order, \
+    unpack_order
+
+# The most orders generate_random_build_orders can make: a random length of up to 28, and the generation loop runs while
+# the order count is less than or equal to the length
+MAX_BUILD_ORDER_LENGTH = 29
 
 
 class BaseBuildCounters:
@@ -100,8 +107,14 @@ class GenerateOrdersBuildingBlocks:
         upgrade_supply_pad_range_lower (int): The lower value for which a temple build command will be generated
         top_random_number_value (int): The max value for the random number for the build order select will be
         max_number_of_builds_in_build_order_random_top (int): Max value for how many orders to put in build order
-        seen_hash_list (set): The set containing previously seen hash values used for comparison. This is a set
-            for faster comparison compared to a list
+        seen_hash_list (set): The set containing previously seen build orders, in their packed form from
+            BuildOrderEncoding, used for comparison. This is a set for faster comparison compared to a list, and since
+            the packed build orders themselves are saved there can never be a false match
+        random_generator (random.Random): The random number generator used for the build orders. Defaults to the
+            random module itself, but a seeded random.Random can be used for reproducible build orders
+        legal_move_generation (bool): Generate the build orders with generate_legal_build_orders, which picks from the
+            legal orders directly instead of drawing again until an order is valid. Same distribution of build orders,
+            but different ones for the same seed
 
     """
     def __init__(self,
@@ -113,7 +126,9 @@ class GenerateOrdersBuildingBlocks:
                  upgrade_base_range_upper=4,
                  upgrade_supply_pad_range_lower=4,
                  top_random_number_value=6,
-                 max_number_of_builds_in_build_order_random_top=28):
+                 max_number_of_builds_in_build_order_random_top=28,
+                 random_generator=None,
+                 legal_move_generation=False):
 
         self.build_supply_pad_range_lower = build_supply_pad_range_lower
         self.build_supply_pad_range_upper = build_supply_pad_range_upper
@@ -125,6 +140,8 @@ class GenerateOrdersBuildingBlocks:
         self.top_random_number_value = top_random_number_value
         self.max_number_of_builds_in_build_order_random_top = max_number_of_builds_in_build_order_random_top
         self.seen_hash_list = set()
+        self.random_generator = random if random_generator is None else random_generator
+        self.legal_move_generation = legal_move_generation
 
     def generate_random_build_orders(self, input_base_list: list[Base]) -> list:
         """
@@ -136,6 +153,9 @@ class GenerateOrdersBuildingBlocks:
         :return: list: The build order list that has been generated
 
         """
+        if self.legal_move_generation:
+            return self.generate_legal_build_orders(input_base_list)
+
         build_order = []
 
         # Be able to take in a dynamic amount of bases
@@ -150,7 +170,8 @@ class GenerateOrdersBuildingBlocks:
                 base_helper_list.append(BaseBuildCounters(base=base, current_base_level=BaseLevel.EMPTY))
             i += 1
 
-        random_build_order_length = random.randint(2, self.max_number_of_builds_in_build_order_random_top)
+        random_build_order_length = self.random_generator.randint(2,
+                                                                  self.max_number_of_builds_in_build_order_random_top)
         # used to increment through the orders
         build_order_increment = 0
 
@@ -162,9 +183,9 @@ class GenerateOrdersBuildingBlocks:
 
         while build_order_increment <= random_build_order_length:
             # random number to select base build
-            r_b_s = random.randint(0, number_of_bases)
+            r_b_s = self.random_generator.randint(0, number_of_bases)
             # random number to select build order
-            random_number = random.randint(0, self.top_random_number_value)
+            random_number = self.random_generator.randint(0, self.top_random_number_value)
 
             # Build supply pad orders
             if self.build_supply_pad_range_lower <= random_number < self.build_supply_pad_range_upper:
@@ -220,36 +241,262 @@ class GenerateOrdersBuildingBlocks:
                                 build_order_increment += 1
         return build_order
 
-    def get_build_order_hash(self, build_order: list) -> hash:
+    def get_order_weights(self) -> dict:
+        """
+        Get how likely generate_random_build_orders is to draw each order, as the number of random numbers that select
+        it.
+
+        :return: dict: Orders to weight
+        """
+        order_weights = {order: 0 for order in Orders}
+        for random_number in range(self.top_random_number_value + 1):
+            if self.build_supply_pad_range_lower <= random_number < self.build_supply_pad_range_upper:
+                order_weights[Orders.BUILD_SUPPLY_PAD] += 1
+            elif self.build_temple_range_lower <= random_number < self.build_temple_range_upper:
+                order_weights[Orders.BUILD_TEMPLE] += 1
+            elif self.upgrade_base_range_lower <= random_number < self.upgrade_base_range_upper:
+                order_weights[Orders.UPGRADE_BASE] += 1
+            elif random_number >= self.upgrade_supply_pad_range_lower:
+                order_weights[Orders.UPGRADE_SUPPLY_PAD] += 1
+        return order_weights
+
+    @staticmethod
+    def _get_upgrade_supply_pad_slot(counters: BaseBuildCounters, is_temple_base: bool, temple_build_index: int) -> int:
+        """
+        Helper for generate_legal_build_orders to get the slot a supply pad upgrade drawn for a base goes to, with the
+        same checks as generate_random_build_orders. On the temple base that can be the temple slot, which is stepped
+        over without an order. The other bases never get past the temple slot number.
+
+        :param counters: BaseBuildCounters: The counters of the base
+        :param is_temple_base: bool: If the temple is on this base
+        :param temple_build_index: int: The slot of the temple, 0 if there is no temple yet
+        :return: int: The slot number, 0 if a supply pad upgrade can not be drawn for the base
         """
-        Generate a hash of the build order list so it can be cross compared later on. Perform the print operation on
-        the build order list as well, so it can be hashed correctly (otherwise the object addresses print out which
-        changes the hash values)
+        if temple_build_index == 0 or counters.build_index >= 8:
+            return 0
+        slot = counters.upgrade_supply_pad_index
+        if slot >= counters.build_index or (slot == temple_build_index and not is_temple_base):
+            return 0
+        return slot
+
+    def generate_legal_build_orders(self, input_base_list: list[Base]) -> list:
+        """
+        Same as generate_random_build_orders, but without drawing again until an order is valid. Each step lists the
+        moves that are legal on every base, with the same checks as generate_random_build_orders, and picks one with a
+        single draw, weighted by get_order_weights. No draw is wasted, so the cost of a build order only depends on its
+        length and the number of bases.
+
+        The moves that change the counters without adding an order in generate_random_build_orders are kept, so both
+        generators give every build order the same probability: a supply pad drawn for a base without a free slot still
+        counts as one of the orders, and a supply pad upgrade drawn for the temple slot steps over it without counting.
+        The second one only happens once per build order.
+
+        :param input_base_list: list[Base]: Input list with all bases that will be used
+        :return: list: The build order list that has been generated
+        """
+        order_weights = self.get_order_weights()
+        supply_pad_weight = order_weights[Orders.BUILD_SUPPLY_PAD]
+        temple_weight = order_weights[Orders.BUILD_TEMPLE]
+        upgrade_base_weight = order_weights[Orders.UPGRADE_BASE]
+        upgrade_supply_pad_weight = order_weights[Orders.UPGRADE_SUPPLY_PAD]
+
+        # If this is the first base, it starts as a KEEP. Any subsequent base starts as empty
+        base_helper_list = [BaseBuildCounters(base=base,
+                                              current_base_level=BaseLevel.KEEP if j == 0 else BaseLevel.EMPTY)
+                            for j, base in enumerate(input_base_list)]
+        random_build_order_length = self.random_generator.randint(2,
+                                                                  self.max_number_of_builds_in_build_order_random_top)
+
+        temple_build_index = 0
+        temple_base_index = 0
+        build_order = []
+        # used to increment through the orders
+        build_order_increment = 0
+        # The legal moves of the step as (order, base index, slot number), and their cumulative weights. None adds
+        # nothing
+        moves = []
+        move_weights = []
+        while build_order_increment <= random_build_order_length:
+            moves.clear()
+            move_weights.clear()
+            total_weight = 0
+            number_of_full_bases = 0
+            for j, counters in enumerate(base_helper_list):
+                if counters.build_index <= counters.current_base_slots:
+                    if supply_pad_weight:
+                        total_weight += supply_pad_weight
+                        moves.append((Orders.BUILD_SUPPLY_PAD, j, counters.build_index))
+                        move_weights.append(total_weight)
+                    if temple_build_index == 0 and temple_weight:
+                        total_weight += temple_weight
+                        moves.append((Orders.BUILD_TEMPLE, j, counters.build_index))
+                        move_weights.append(total_weight)
+                else:
+                    number_of_full_bases += 1
+                if counters.current_base_level != BaseLevel.CITADEL and upgrade_base_weight:
+                    total_weight += upgrade_base_weight
+                    moves.append((Orders.UPGRADE_BASE, j, None))
+                    move_weights.append(total_weight)
+                if temple_build_index and upgrade_supply_pad_weight:
+                    slot = self._get_upgrade_supply_pad_slot(counters, j == temple_base_index, temple_build_index)
+                    if slot:
+                        total_weight += upgrade_supply_pad_weight
+                        moves.append((Orders.UPGRADE_SUPPLY_PAD, j, slot))
+                        move_weights.append(total_weight)
+            if number_of_full_bases and supply_pad_weight:
+                total_weight += supply_pad_weight * number_of_full_bases
+                moves.append(None)
+                move_weights.append(total_weight)
+            # Nothing can be added anymore
+            if not moves:
+                break
+
+            move = moves[bisect_right(move_weights, self.random_generator.random() * total_weight)]
+            if move is None:
+                build_order_increment += 1
+                continue
+            order, j, slot = move
+            counters = base_helper_list[j]
+            if order == Orders.UPGRADE_SUPPLY_PAD and slot == temple_build_index:
+                # Step over the temple, the next step is drawn again
+                counters.increment_upgrade_supply_pad_index()
+                continue
+            if order == Orders.BUILD_SUPPLY_PAD or order == Orders.BUILD_TEMPLE:
+                if order == Orders.BUILD_TEMPLE:
+                    temple_build_index = slot
+                    temple_base_index = j
+                counters.increment_build_index()
+            elif order == Orders.UPGRADE_BASE:
+                counters.upgrade_base_level()
+            else:
+                counters.increment_upgrade_supply_pad_index()
+            build_order.append([order, counters.base, None if slot is None else get_slot_number(slot)])
+            build_order_increment += 1
+        return build_order
+
+    def generate_random_packed_build_order(self, number_of_bases: int) -> bytes:
+        """
+        Same as generate_random_build_orders, or generate_legal_build_orders with legal_move_generation, but returns
+        the build order in the packed form from BuildOrderEncoding, so no Base objects are needed. The bases are
+        numbered 1 to number_of_bases, with base 1 starting as a KEEP.
+
+        :param number_of_bases: int: The number of bases to generate orders for, at most MAX_NUMBER_OF_BASES
+        :return: bytes: The packed build order
+        :raises: ValueError: If there are more bases than a packed build order supports
+
+        """
+        check_number_of_bases(number_of_bases)
+        # Base numbers are used in place of the Base objects, the generator only passes them through
+        build_order = self.generate_random_build_orders(list(range(1, number_of_bases + 1)))
+        return bytes(pack_order(order, base_number, None if slot is None else slot.value)
+                     for order, base_number, slot in build_order)
+
+    @staticmethod
+    def get_build_order_genes(packed_build_order: bytes) -> list:
+        """
+        Get the orders and base numbers of a packed build order, without the slots, for changing the build order and
+        repairing it with repair_build_order.
+
+        :param packed_build_order: bytes: The packed build order
+        :return: list: (Orders, base number) for each order
+        """
+        return [unpack_order(packed_order)[:2] for packed_order in packed_build_order]
+
+    @staticmethod
+    def repair_build_order(genes: list, number_of_bases: int) -> bytes:
+        """
+        Turn orders and base numbers into a valid packed build order, with the same BaseBuildCounters checks as
+        generate_random_build_orders, so the result is a build order it could have generated. Orders that would not be
+        generated at that point are dropped, and orders for bases that do not exist are dropped. Supply pad upgrades on
+        the temple base skip over the temple slot, and the slots are given out again. Used for changing build orders
+        in the optimizers without making invalid ones.
+
+        :param genes: list: (Orders, base number) for each order, from get_build_order_genes
+        :param number_of_bases: int: The number of bases, base 1 starts as a KEEP and the others are empty
+        :return: bytes: The packed build order
+        """
+        base_counters = [BaseBuildCounters(base=j + 1, current_base_level=BaseLevel.KEEP if j == 0 else BaseLevel.EMPTY)
+                         for j in range(number_of_bases)]
+        temple_build_index = 0
+        temple_base_number = 0
+        packed_orders = []
+        for order, base_number in genes:
+            if len(packed_orders) >= MAX_BUILD_ORDER_LENGTH:
+                break
+            if base_number > number_of_bases:
+                continue
+            counters = base_counters[base_number - 1]
+            slot = None
+
+            if order == Orders.BUILD_SUPPLY_PAD or order == Orders.BUILD_TEMPLE:
+                if counters.build_index > counters.current_base_slots:
+                    continue
+                if order == Orders.BUILD_TEMPLE:
+                    if temple_build_index > 0:
+                        continue
+                    temple_build_index = counters.build_index
+                    temple_base_number = base_number
+                slot = counters.build_index
+                counters.increment_build_index()
+
+            elif order == Orders.UPGRADE_BASE:
+                if not counters.upgrade_base_level():
+                    continue
+
+            else:
+                if temple_build_index == 0 or counters.build_index >= 8:
+                    continue
+                if counters.upgrade_supply_pad_index == temple_build_index:
+                    # The generator can never get past the temple slot number on the bases without the temple
+                    if base_number != temple_base_number:
+                        continue
+                    counters.increment_upgrade_supply_pad_index()
+                if counters.upgrade_supply_pad_index >= counters.build_index:
+                    continue
+                slot = counters.upgrade_supply_pad_index
+                counters.increment_upgrade_supply_pad_index()
+
+            packed_orders.append(pack_order(order, base_number, slot))
+        return bytes(packed_orders)
+
+    def get_build_order_hash(self, build_order: list) -> int:
+        """
+        Generate a fingerprint of the build order list so it can be cross compared later on. The build order is packed
+        first, which only uses the base numbers (otherwise the object addresses would change the values), and the
+        fingerprint is the same in every process and every session.
 
         :param build_order: List: The build order in its list format.
-        :return: hash: The value of the hash that was performed on the build order.
+        :return: int: The 64-bit fingerprint of the build order.
 
         """
-        return hash(self.build_order_print(build_order))
+        return fingerprint(encode_build_order(build_order))
 
     def is_build_order_seen(self, build_order: list) -> bool:
         """
-        Take in a build order list. Print the build order using the build_order_print helper method, and check a given
-        hash list to see if it has been seen before. If it has, add it to the list.
+        Take in a build order list. Pack the build order using BuildOrderEncoding, and check the seen set to see if it
+        has been seen before. If it has not, add it to the set.
 
-        This way, all the needed checks, conversions, and additions happen inside this method for simplicity. Decided
-        to NOT include the seen_hash_list in the class itself in case the clas sis re-used, and there are values still
-        populated within it.
+        This way, all the needed checks, conversions, and additions happen inside this method for simplicity.
 
         :param build_order: List: The build order in its list format.
-        :return: bool: True if the build order has been seen in the previous hash list, false if not
+        :return: bool: True if the build order has been seen before, false if not
+
+        """
+        return self.is_packed_build_order_seen(encode_build_order(build_order))
+
+    def is_packed_build_order_seen(self, packed_build_order: bytes) -> bool:
+        """
+        Same as is_build_order_seen, but for a build order that is already packed. Used for the build orders from
+        generate_random_packed_build_order, or build orders that were generated in another process.
+
+        :param packed_build_order: bytes: The packed build order
+        :return: bool: True if the build order has been seen before, false if not
 
         """
-        build_order_hash = self.get_build_order_hash(build_order)
-        if build_order_hash in self.seen_hash_list:
+        if packed_build_order in self.seen_hash_list:
             return True
         else:
-            self.seen_hash_list.add(build_order_hash)
+            self.seen_hash_list.add(packed_build_order)
             return False
 
     @staticmethod
@@ -263,21 +510,22 @@ class GenerateOrdersBuildingBlocks:
         :return: str: The build order sting that has been correctly formatted
 
         """
-        build_string = ""
+        build_strings = []
 
         for order in build_order:
             if str(order[0]) == "Orders.BUILD_SUPPLY_PAD":
-                build_string = build_string + "SUPPLY " + str(order[1].base_number) + ", "
+                build_strings.append("SUPPLY " + str(order[1].base_number) + ", ")
             elif str(order[0]) == "Orders.UPGRADE_SUPPLY_PAD":
-                build_string = build_string + "U_SPLY " + str(order[1].base_number) + ", "
+                build_strings.append("U_SPLY " + str(order[1].base_number) + ", ")
             elif str(order[0]) == "Orders.BUILD_TEMPLE":
-                build_string = build_string + "TEMPLE " + str(order[1].base_number) + ", "
+                build_strings.append("TEMPLE " + str(order[1].base_number) + ", ")
             elif str(order[0]) == "Orders.UPGRADE_BASE":
-                build_string = build_string + "U_BASE " + str(order[1].base_number) + ", "
+                build_strings.append("U_BASE " + str(order[1].base_number) + ", ")
             elif str(order[0]) == "SKIPPED":
                 # Note, previously had the skipped value print from here, but found it made reading the results
                 # confusing
                 pass
             else:
-                build_string = str(order[0]) + ", "
-        return build_string
+                build_strings = [str(order[0]) + ", "]
+        # Join once at the end, adding to a string in the loop copies the whole string every time
+        return "".join(build_strings)
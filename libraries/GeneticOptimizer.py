@@ -0,0 +1,295 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Genetic algorithm that evolves build orders towards the fastest time, instead of only sampling random ones.
+
+"""
+import csv
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from libraries.BaseConstants import Orders
+from libraries.BuildOrderEncoding import decode_build_order, text_to_packed
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+# The order types a mutation can pick from
+GENE_ORDERS = [Orders.BUILD_SUPPLY_PAD, Orders.BUILD_TEMPLE, Orders.UPGRADE_BASE, Orders.UPGRADE_SUPPLY_PAD]
+
+# Number of times a child that was already simulated is mutated again to look for a new build order
+NEW_CHILD_ATTEMPTS = 3
+
+
+def evaluate_build_orders(packed_build_orders: list[bytes], starting_money: int, number_of_bases: int,
+                          resource_trigger: int, simulation_time_seconds: int, pause_timer=0,
+                          temple_needed_to_clear_second_base=False) -> list:
+    """
+    Worker function that simulates packed build orders with the event driven SimulatorWrapper, each with its own
+    SimulatorWrapper, the same way run_build_combinations does.
+
+    :param packed_build_orders: list[bytes]: The packed build orders to simulate
+    :param starting_money: int: The amount of money to start with
+    :param number_of_bases: int: Number of bases to perform the simulation with
+    :param resource_trigger: int: The amount of resources to reach the exit scenario
+    :param simulation_time_seconds: int: Maximum time for each simulation
+    :param pause_timer: int: Pause timer of every base after the first, see Base
+    :param temple_needed_to_clear_second_base: bool: If the pause timer of the bases after the first only counts down
+        once there is a tech level, see Base
+    :return: list: [final time, simulated build order string] for each build order
+    """
+    results = []
+    for packed_build_order in packed_build_orders:
+        sim_wrapper = SimulatorWrapper(starting_money=starting_money, fine_debug=False, event_driven=True)
+        sim_wrapper.add_bases(number_of_bases, pause_timer=pause_timer,
+                              temple_needed_to_clear_second_base=temple_needed_to_clear_second_base)
+        build_order = decode_build_order(packed_build_order, sim_wrapper.base_list)
+        final_sim_time = sim_wrapper.run_simulation(build_order=build_order,
+                                                    resource_trigger=resource_trigger,
+                                                    simulation_time_seconds=simulation_time_seconds)
+        results.append([final_sim_time, GenerateOrdersBuildingBlocks.build_order_print(build_order)])
+    return results
+
+
+def read_best_build_orders(csv_paths: list[str], number_of_rows: int) -> list[bytes]:
+    """
+    Read the fastest build orders from results csv files written by RuntimeBuildingBlocks.results_to_csv, used to seed
+    the first population. Rows that timed out or cannot be packed are left out.
+
+    :param csv_paths: list[str]: The results csv files
+    :param number_of_rows: int: How many of the fastest build orders to return
+    :return: list[bytes]: The packed build orders, fastest first
+    """
+    rows = []
+    for csv_path in csv_paths:
+        with open(csv_path, newline='') as csvfile:
+            for row in csv.reader(csvfile):
+                # Skip header rows and timed out runs
+                if len(row) < 2 or not row[0].isdigit():
+                    continue
+                try:
+                    rows.append((int(row[0]), text_to_packed(row[1])))
+                except ValueError:
+                    continue
+    rows.sort(key=lambda result: result[0])
+    return [packed_build_order for _, packed_build_order in rows[:number_of_rows]]
+
+
+class GeneticOptimizer:
+    """
+    The GeneticOptimizer searches for the fastest build order with a genetic algorithm. Each generation, the population
+    is simulated, the fastest build orders are kept as they are, and the rest of the next population is made from
+    parents picked by tournament, with crossover and mutation.
+
+    Crossover and mutation work on the orders and bases of a build order without the slots. Every child is then
+    repaired with GenerateOrdersBuildingBlocks.repair_build_order, so every child is a build order the random generator
+    could have made, and the results can be mixed with the random runs.
+
+    Build orders are only simulated once per optimizer, and children that were already simulated are mutated again a
+    few times to look for a new build order.
+
+    Args:
+        starting_money (int): The amount of money to start with
+        number_of_bases (int): Number of bases, the first starts as a KEEP and the others are empty
+        resource_trigger (int): The amount of resources to reach the exit scenario
+        simulation_time_seconds (int): Maximum time for each simulation
+        population_size (int): Number of build orders in each generation
+        number_of_generations (int): Number of generations to run
+        elite_size (int): Number of the fastest build orders kept as they are in the next generation
+        tournament_size (int): Number of build orders in each parent tournament
+        crossover_rate (float): Chance a child is made with crossover instead of copying the first parent
+        mutation_rate (float): Chance a child is mutated
+        require_temple (bool): If build orders without a temple count as timed out
+        number_of_workers (int): Number of worker processes to simulate each generation with
+        pause_timer (int): Pause timer of every base after the first, see Base
+        temple_needed_to_clear_second_base (bool): If the pause timer of the bases after the first only counts down
+            once there is a tech level, see Base
+        random_generator (random.Random): The random number generator, defaults to the random module itself
+        progress_callback (callable): Called with a progress message with the best time of every generation, for
+            example print. None for no progress messages
+
+    """
+    def __init__(self, starting_money: int, number_of_bases: int, resource_trigger: int, simulation_time_seconds: int,
+                 population_size=200, number_of_generations=50, elite_size=10, tournament_size=3, crossover_rate=0.7,
+                 mutation_rate=0.6, require_temple=True, number_of_workers=1, pause_timer=0,
+                 temple_needed_to_clear_second_base=False, random_generator=None, progress_callback=None):
+        self.starting_money = starting_money
+        self.number_of_bases = number_of_bases
+        self.resource_trigger = resource_trigger
+        self.simulation_time_seconds = simulation_time_seconds
+        self.population_size = population_size
+        self.number_of_generations = number_of_generations
+        self.elite_size = elite_size
+        self.tournament_size = tournament_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.require_temple = require_temple
+        self.number_of_workers = number_of_workers
+        self.pause_timer = pause_timer
+        self.temple_needed_to_clear_second_base = temple_needed_to_clear_second_base
+        self.random_generator = random if random_generator is None else random_generator
+        self.progress_callback = progress_callback
+
+        self.generate_orders_building_blocks = GenerateOrdersBuildingBlocks(random_generator=self.random_generator)
+        # Packed build order to [final time, build order string], for every build order simulated
+        self.results = {}
+        self.best_time = None
+        self.best_build_order = None
+
+    def run(self, seed_build_orders=None) -> list:
+        """
+        Run the genetic algorithm.
+
+        :param seed_build_orders: list[bytes]: Packed build orders to start the first population with, for example from
+            read_best_build_orders. They are repaired first, and the rest of the population is random
+        :return: list: [packed build order, final time, build order string] for every build order simulated, in the
+            order they were simulated
+        """
+        population = []
+        for packed_build_order in seed_build_orders or []:
+            packed_build_order = GenerateOrdersBuildingBlocks.repair_build_order(
+                GenerateOrdersBuildingBlocks.get_build_order_genes(packed_build_order), self.number_of_bases)
+            if packed_build_order not in population:
+                population.append(packed_build_order)
+        population = population[:self.population_size]
+        while len(population) < self.population_size:
+            population.append(self.generate_orders_building_blocks.generate_random_packed_build_order(
+                self.number_of_bases))
+
+        executor = None
+        if self.number_of_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.number_of_workers)
+        try:
+            for generation in range(self.number_of_generations):
+                self._evaluate(population, executor)
+                population.sort(key=self.get_fitness)
+                if self.progress_callback is not None:
+                    self.progress_callback(f"Generation {generation}: best {self.best_time} seconds, "
+                                           f"{len(self.results)} build orders simulated")
+                if generation == self.number_of_generations - 1:
+                    break
+                population = self._next_generation(population)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return [[packed_build_order, final_time, build_order_string]
+                for packed_build_order, (final_time, build_order_string) in self.results.items()]
+
+    def get_fitness(self, packed_build_order: bytes) -> float:
+        """
+        Fitness of a simulated build order, lower is better.
+
+        :param packed_build_order: bytes: The packed build order
+        :return: float: The final time, math.inf if it timed out or needs a temple it does not have
+        """
+        final_time, build_order_string = self.results[packed_build_order]
+        if final_time is None or (self.require_temple and "TEMPLE" not in build_order_string):
+            return math.inf
+        return final_time
+
+    def _evaluate(self, population: list[bytes], executor: ProcessPoolExecutor):
+        """
+        Simulate the build orders of the population that have not been simulated yet.
+
+        :param population: list[bytes]: The packed build orders
+        :param executor: ProcessPoolExecutor: The process pool, None to simulate in this process
+        """
+        new_build_orders = list(dict.fromkeys(packed_build_order for packed_build_order in population
+                                              if packed_build_order not in self.results))
+        settings = (self.starting_money, self.number_of_bases, self.resource_trigger, self.simulation_time_seconds,
+                    self.pause_timer, self.temple_needed_to_clear_second_base)
+        if executor is None:
+            results = evaluate_build_orders(new_build_orders, *settings)
+        else:
+            # One chunk per worker, map returns the chunks in order
+            chunks = [new_build_orders[j::self.number_of_workers] for j in range(self.number_of_workers)]
+            chunk_results = executor.map(evaluate_build_orders, chunks, *[[setting] * len(chunks)
+                                                                           for setting in settings])
+            results = [None] * len(new_build_orders)
+            for j, chunk_result in enumerate(chunk_results):
+                results[j::self.number_of_workers] = chunk_result
+
+        for packed_build_order, result in zip(new_build_orders, results):
+            self.results[packed_build_order] = result
+            fitness = self.get_fitness(packed_build_order)
+            if fitness != math.inf and (self.best_time is None or fitness < self.best_time):
+                self.best_time = fitness
+                self.best_build_order = packed_build_order
+
+    def _next_generation(self, population: list[bytes]) -> list[bytes]:
+        """
+        Make the next population from a population sorted by fitness.
+
+        :param population: list[bytes]: The sorted population
+        :return: list[bytes]: The next population
+        """
+        next_population = population[:self.elite_size]
+        while len(next_population) < self.population_size:
+            parent = self._tournament(population)
+            if self.random_generator.random() < self.crossover_rate:
+                child = self.crossover(parent, self._tournament(population))
+            else:
+                child = parent
+            if child == parent or self.random_generator.random() < self.mutation_rate:
+                child = self.mutate(child)
+
+            attempts = 0
+            while child in self.results and attempts < NEW_CHILD_ATTEMPTS:
+                child = self.mutate(child)
+                attempts += 1
+            next_population.append(child)
+        return next_population
+
+    def _tournament(self, population: list[bytes]) -> bytes:
+        """
+        Pick a parent by tournament: the fittest of a few random build orders.
+
+        :param population: list[bytes]: The population
+        :return: bytes: The parent
+        """
+        return min(self.random_generator.sample(population, min(self.tournament_size, len(population))),
+                   key=self.get_fitness)
+
+    def crossover(self, first_parent: bytes, second_parent: bytes) -> bytes:
+        """
+        One point crossover: the start of the first parent up to a random point, then the rest of the second parent from
+        its own random point, repaired.
+
+        :param first_parent: bytes: The first packed build order
+        :param second_parent: bytes: The second packed build order
+        :return: bytes: The child packed build order
+        """
+        first_point = self.random_generator.randint(0, len(first_parent))
+        second_point = self.random_generator.randint(0, len(second_parent))
+        genes = GenerateOrdersBuildingBlocks.get_build_order_genes(first_parent[:first_point]) + \
+            GenerateOrdersBuildingBlocks.get_build_order_genes(second_parent[second_point:])
+        return GenerateOrdersBuildingBlocks.repair_build_order(genes, self.number_of_bases)
+
+    def mutate(self, packed_build_order: bytes) -> bytes:
+        """
+        Make one random change to a build order, repaired: add an order, remove an order, change the order type or base
+        of an order, or swap two orders next to each other.
+
+        :param packed_build_order: bytes: The packed build order
+        :return: bytes: The mutated packed build order
+        """
+        genes = GenerateOrdersBuildingBlocks.get_build_order_genes(packed_build_order)
+        mutation = self.random_generator.randint(0, 3) if genes else 0
+        if mutation == 0:
+            genes.insert(self.random_generator.randint(0, len(genes)),
+                         (self.random_generator.choice(GENE_ORDERS),
+                          self.random_generator.randint(1, self.number_of_bases)))
+        elif mutation == 1:
+            del genes[self.random_generator.randrange(len(genes))]
+        elif mutation == 2:
+            j = self.random_generator.randrange(len(genes))
+            if self.random_generator.random() < 0.5:
+                genes[j] = (self.random_generator.choice(GENE_ORDERS), genes[j][1])
+            else:
+                genes[j] = (genes[j][0], self.random_generator.randint(1, self.number_of_bases))
+        elif len(genes) > 1:
+            j = self.random_generator.randrange(len(genes) - 1)
+            genes[j], genes[j + 1] = genes[j + 1], genes[j]
+        return GenerateOrdersBuildingBlocks.repair_build_order(genes, self.number_of_bases)
@@ -0,0 +1,158 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Parallel runner used for splitting the random build order simulations across several processes.
+
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from libraries.BuildOrderEncoding import decode_build_order
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+# Packed build orders that were simulated before this run, set in each worker process by _set_known_build_orders
+_known_build_orders = frozenset()
+
+
+def _set_known_build_orders(known_build_orders: frozenset):
+    """
+    Worker process initializer, so the known build orders are only sent to each worker once instead of with every chunk.
+
+    :param known_build_orders: frozenset: Packed build orders that do not need to be simulated
+    """
+    global _known_build_orders
+    _known_build_orders = known_build_orders
+
+
+def simulate_chunk(chunk_index: int, number_of_iterations: int, seed: int, starting_money: int, number_of_bases: int,
+                   resource_trigger: int, simulation_time_seconds: int, event_driven: bool,
+                   legal_move_generation=False, pause_timer=0, temple_needed_to_clear_second_base=False) -> list:
+    """
+    Worker function that generates and simulates one chunk of random build orders. Every chunk has its own
+    GenerateOrdersBuildingBlocks and its own random number generator, seeded from the runner seed and the chunk index,
+    so a chunk always generates the same build orders no matter which process runs it.
+
+    Build orders seen before in the same chunk, or known from before the run, are not simulated again. Build orders seen
+    in other chunks are removed when the chunks are merged.
+
+    :param chunk_index: int: The index of the chunk, used for the random number generator seed
+    :param number_of_iterations: int: How many build orders to generate in this chunk
+    :param seed: int: The seed of the runner
+    :param starting_money: int: The amount of money to start with
+    :param number_of_bases: int: Number of bases to perform the simulation with
+    :param resource_trigger: int: The amount of resources to reach the exit scenario
+    :param simulation_time_seconds: int: Maximum time for each simulation
+    :param event_driven: bool: If the event driven simulation should be used
+    :param legal_move_generation: bool: If the build orders should be generated with generate_legal_build_orders
+    :param pause_timer: int: Pause timer of every base after the first, see Base
+    :param temple_needed_to_clear_second_base: bool: If the pause timer of the bases after the first only counts down
+        once there is a tech level, see Base
+    :return: list: [packed build order, final time, simulated build order string] for each simulation
+    """
+    generate_orders_building_blocks = GenerateOrdersBuildingBlocks(
+        random_generator=random.Random(f"{seed}:{chunk_index}"), legal_move_generation=legal_move_generation)
+
+    chunk_results = []
+    x = 0
+    while x < number_of_iterations:
+        # The packed build order is what the build order is de-duplicated on, and is small to send back to the runner
+        packed_build_order = generate_orders_building_blocks.generate_random_packed_build_order(number_of_bases)
+        if (packed_build_order not in _known_build_orders
+                and not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order)):
+            sim_wrapper = SimulatorWrapper(starting_money=starting_money,
+                                           debug_mode=False,
+                                           fine_debug=False,
+                                           event_driven=event_driven)
+            sim_wrapper.add_bases(number_of_bases, pause_timer=pause_timer,
+                                  temple_needed_to_clear_second_base=temple_needed_to_clear_second_base)
+
+            generated_build_order = decode_build_order(packed_build_order, sim_wrapper.base_list)
+            final_sim_time = sim_wrapper.run_simulation(build_order=generated_build_order,
+                                                        resource_trigger=resource_trigger,
+                                                        simulation_time_seconds=simulation_time_seconds)
+            chunk_results.append([packed_build_order,
+                                  final_sim_time,
+                                  generate_orders_building_blocks.build_order_print(generated_build_order)])
+        x += 1
+
+    return chunk_results
+
+
+class ParallelSimulationRunner:
+    """
+    The ParallelSimulationRunner splits the simulation iterations into chunks and runs the chunks on a process pool.
+    The results are merged in chunk order and de-duplicated the same way as the single process loop does with
+    is_build_order_seen, so the results only depend on the seed and chunk size, not on the number of workers.
+
+    Args:
+        number_of_workers (int): Number of worker processes to use
+        chunk_size (int): Number of iterations given to a worker at a time
+        seed (int): The seed used for the random number generators of every chunk
+        starting_money (int): The amount of money to start with
+        number_of_bases (int): Number of bases to perform the simulation with
+        resource_trigger (int): The amount of resources to reach the exit scenario
+        simulation_time_seconds (int): Maximum time for each simulation
+        event_driven (bool): If the event driven simulation should be used
+        legal_move_generation (bool): If the build orders should be generated with generate_legal_build_orders
+        pause_timer (int): Pause timer of every base after the first, see Base
+        temple_needed_to_clear_second_base (bool): If the pause timer of the bases after the first only counts down
+            once there is a tech level, see Base
+
+    """
+    def __init__(self, number_of_workers: int, chunk_size: int, seed: int, starting_money: int, number_of_bases: int,
+                 resource_trigger: int, simulation_time_seconds: int, event_driven=True, legal_move_generation=False,
+                 pause_timer=0, temple_needed_to_clear_second_base=False):
+        self.number_of_workers = number_of_workers
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.starting_money = starting_money
+        self.number_of_bases = number_of_bases
+        self.resource_trigger = resource_trigger
+        self.simulation_time_seconds = simulation_time_seconds
+        self.event_driven = event_driven
+        self.legal_move_generation = legal_move_generation
+        self.pause_timer = pause_timer
+        self.temple_needed_to_clear_second_base = temple_needed_to_clear_second_base
+
+    def run(self, number_of_iterations: int, known_build_orders=None) -> list:
+        """
+        Run the given number of iterations across the process pool.
+
+        :param number_of_iterations: int: Total number of build orders to generate
+        :param known_build_orders: set: Packed build orders simulated before this run, which are skipped
+        :return: list: [packed build order, final time, build order string] for each unique build order
+        """
+        known_build_orders = frozenset() if known_build_orders is None else frozenset(known_build_orders)
+        chunk_sizes = []
+        remaining = number_of_iterations
+        while remaining > 0:
+            chunk_sizes.append(min(self.chunk_size, remaining))
+            remaining -= chunk_sizes[-1]
+
+        number_of_chunks = len(chunk_sizes)
+        # The generator is only used for the merged de-duplication
+        generate_orders_building_blocks = GenerateOrdersBuildingBlocks()
+        final_list = []
+        with ProcessPoolExecutor(max_workers=self.number_of_workers,
+                                 initializer=_set_known_build_orders,
+                                 initargs=(known_build_orders,)) as executor:
+            # map returns the chunks in order, no matter what order the workers finish in
+            for chunk_results in executor.map(simulate_chunk,
+                                              range(number_of_chunks),
+                                              chunk_sizes,
+                                              [self.seed] * number_of_chunks,
+                                              [self.starting_money] * number_of_chunks,
+                                              [self.number_of_bases] * number_of_chunks,
+                                              [self.resource_trigger] * number_of_chunks,
+                                              [self.simulation_time_seconds] * number_of_chunks,
+                                              [self.event_driven] * number_of_chunks,
+                                              [self.legal_move_generation] * number_of_chunks,
+                                              [self.pause_timer] * number_of_chunks,
+                                              [self.temple_needed_to_clear_second_base] * number_of_chunks):
+                for packed_build_order, final_sim_time, build_order_string in chunk_results:
+                    if not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+                        final_list.append([packed_build_order, final_sim_time, build_order_string])
+
+        return final_list
@@ -0,0 +1,337 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Parameter sweep that simulates the same random build orders for every cell of a grid of scenario settings and
+BaseConstants costs and times, across several processes, and writes a results table for each cell and a summary of the
+fastest build order of each cell.
+
+"""
+import csv
+import itertools
+import multiprocessing
+import os
+import random
+import sys
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+# Only modules that do not read the costs and times when they are imported can be imported here, see
+# _set_constants. The simulation modules are imported in the worker processes once the constants are set
+import libraries.BaseConstants as base_constants
+from libraries.ResultsAggregator import ResultsAggregator
+from libraries.StreamingResultsWriter import StreamingResultsWriter
+
+# The scenario settings a grid can sweep, and the value used when the grid does not have them. The same settings as
+# ExperimentStore.get_scenario_id. The pause timer and temple flag are for every base after the first
+SCENARIO_DEFAULTS = {
+    "starting_money": base_constants.STARTING_MONEY,
+    "number_of_bases": 2,
+    "resource_trigger": 3000,
+    "simulation_time_seconds": 1000,
+    "pause_timer": 0,
+    "temple_needed": False,
+}
+# The BaseConstants a grid can sweep
+SWEEP_CONSTANTS = [
+    "BASE_BUILD_TIME_SECONDS",
+    "KEEP_UPGRADE_TIME_SECONDS",
+    "CITADEL_UPGRADE_TIME_SECONDS",
+    "SUPPLY_PAD_COST",
+    "SUPPLY_PAD_UPGRADE_COST",
+    "TEMPLE_COST",
+    "TEMPLE_BUILD_TIME_SECONDS",
+    "SUPPLY_PAD_BUILD_TIME_SECONDS",
+    "SUPPLY_PAD_UPGRADE_TIME_SECONDS",
+    "BASE_BUILD_COST",
+    "KEEP_UPGRADE_COST",
+    "CITADEL_UPGRADE_COST",
+]
+# Modules that copy the BaseConstants costs and times when they are imported, so the constants have to be set before
+# they are
+_CONSTANT_MODULES = [
+    "libraries.BaseClass",
+    "libraries.BuildSlotClasses",
+    "libraries.RuntimeBuildingBlocks",
+    "libraries.BatchSimulator",
+    "libraries.CompiledSimulator",
+    "libraries.BuildOrderEnumerator",
+]
+# File name of the summary of the cells, in the sweep directory
+SUMMARY_FILE = "summary.csv"
+
+
+def _set_constants(constants: dict):
+    """
+    Set BaseConstants costs and times in this process. Only works before the modules in _CONSTANT_MODULES are imported,
+    which is why every chunk of the sweep runs in a new process.
+
+    :param constants: dict: Constant name to value
+    :raises: RuntimeError: If a module that already copied the constants has been imported
+    """
+    imported_modules = [module_name for module_name in _CONSTANT_MODULES if module_name in sys.modules]
+    if constants and imported_modules:
+        raise RuntimeError(f"Cannot change the BaseConstants after {', '.join(imported_modules)} were imported. The "
+                           f"main module of a parameter sweep must not import the simulation modules")
+    for name, value in constants.items():
+        setattr(base_constants, name, value)
+
+
+def _get_build_order_string(packed_build_order: bytes, build_order: list, order_times: list[int], final_time,
+                            packed_to_text) -> str:
+    """
+    Get the build order string a simulation stopped at final_time would have, from a simulation that ran on past it.
+    The orders approved or skipped up to final_time are done, and the ones after it were never tried.
+
+    :param packed_build_order: bytes: The packed build order that was simulated
+    :param build_order: list: The build order list after the simulation, with the skipped orders marked SKIPPED
+    :param order_times: list[int]: The game tick each order was approved or skipped on, last_order_times of
+        RuntimeBuildingBlocks
+    :param final_time: int: The final time, None if it timed out
+    :param packed_to_text: function: BuildOrderEncoding.packed_to_text, imported by the worker
+    :return: str: The build order string, the same as build_order_print
+    """
+    number_done = len(order_times) if final_time is None else bisect_right(order_times, final_time)
+    done_orders = bytes(packed_build_order[k] for k in range(number_done) if build_order[k][0] != "SKIPPED")
+    return packed_to_text(done_orders + packed_build_order[number_done:])
+
+
+def simulate_cell_group(constants: dict, scenario: dict, resource_triggers: list[int],
+                        packed_build_orders: list[bytes], event_driven: bool) -> list:
+    """
+    Worker function that simulates a chunk of build orders for a group of cells that only differ in the resource
+    trigger. Each build order is simulated once, up to the largest resource trigger, and the result of every cell is
+    taken from that one simulation. Runs in a new process, so the constants can be set before the simulation modules
+    are imported.
+
+    :param constants: dict: The BaseConstants values of the cells, by name
+    :param scenario: dict: The scenario settings of the cells, the resource trigger is not used
+    :param resource_triggers: list[int]: The sorted resource triggers of the cells
+    :param packed_build_orders: list[bytes]: The packed build orders to simulate
+    :param event_driven: bool: If the event driven simulation should be used
+    :return: list: For each build order, [final time, build order string] for each resource trigger
+    """
+    _set_constants(constants)
+    # Imported once the constants are set, since these modules copy them when they are imported
+    from libraries.BuildOrderEncoding import decode_build_order, packed_to_text
+    from libraries.SimulatorWrapper import SimulatorWrapper
+
+    chunk_results = []
+    for packed_build_order in packed_build_orders:
+        sim_wrapper = SimulatorWrapper(starting_money=scenario["starting_money"],
+                                       debug_mode=False,
+                                       fine_debug=False,
+                                       event_driven=event_driven)
+        sim_wrapper.add_bases(scenario["number_of_bases"], pause_timer=scenario["pause_timer"],
+                              temple_needed_to_clear_second_base=scenario["temple_needed"])
+
+        build_order = decode_build_order(packed_build_order, sim_wrapper.base_list)
+        final_times = sim_wrapper.run_simulation(build_order=build_order,
+                                                 resource_trigger=resource_triggers,
+                                                 simulation_time_seconds=scenario["simulation_time_seconds"])
+        order_times = sim_wrapper.runtime_building_blocks.last_order_times
+        chunk_results.append([[final_time, _get_build_order_string(packed_build_order, build_order, order_times,
+                                                                   final_time, packed_to_text)]
+                              for final_time in final_times])
+    return chunk_results
+
+
+class SweepCell:
+    """
+    One cell of the parameter sweep grid.
+
+    Args:
+        number (int): The cell number, in the order of the grid
+        name (str): Name of the cell, the start of its results file names
+        scenario (dict): The value of every scenario setting in SCENARIO_DEFAULTS
+        constants (dict): The BaseConstants values of the cell, for the constants in the grid
+
+    """
+    def __init__(self, number: int, scenario: dict, constants: dict):
+        self.number = number
+        self.name = f"cell_{number:03d}"
+        self.scenario = scenario
+        self.constants = constants
+
+
+class ParameterSweep:
+    """
+    The ParameterSweep runs every combination of the values in a scenario grid and a constants grid. Settings that are
+    not in the grids keep their default value.
+
+    The work is shared between the cells as much as possible:
+        - The random build orders are generated once for each number of bases, and every cell with that number of bases
+          simulates the same ones
+        - Cells that only differ in the resource trigger are one group, and each build order of a group is simulated
+          once, up to its largest resource trigger
+        - The build orders of each group are split into chunks of chunk_size, which are spread over number_of_workers
+          processes, the longest chunks first. Each chunk runs in a new process, since the BaseConstants can only be
+          changed before the simulation modules are imported
+
+    The results of each cell are written to csv files in the same format as run_build_combinations, and the summary has
+    the settings, number of results and fastest build order of every cell.
+
+    Args:
+        scenario_grid (dict): Scenario setting name from SCENARIO_DEFAULTS to the list of values to sweep
+        constants_grid (dict): Constant name from SWEEP_CONSTANTS to the list of values to sweep
+        number_of_build_orders (int): Number of random build orders generated for each number of bases. Duplicates are
+            only simulated once
+        seed (int): Seed for the random build orders
+        number_of_workers (int): Number of worker processes
+        chunk_size (int): Number of build orders simulated in each worker process
+        event_driven (bool): If the event driven simulation should be used
+        require_temple (bool): If build orders without a TEMPLE are left out of the results files and fastest build
+            orders, the same as REMOVE_IF_NO_TEMPLE of run_build_combinations
+        build_orders (dict): Number of bases to the list of packed build orders for it
+        sweep_directory (str): The directory of the last run, with the results files and the summary
+
+    """
+    def __init__(self, scenario_grid: dict, constants_grid: dict, number_of_build_orders: int, seed: int,
+                 number_of_workers=1, chunk_size=1000, event_driven=True, require_temple=True):
+        for name in scenario_grid:
+            if name not in SCENARIO_DEFAULTS:
+                raise ValueError(f"Unknown scenario setting {name}, must be one of {', '.join(SCENARIO_DEFAULTS)}")
+        for name in constants_grid:
+            if name not in SWEEP_CONSTANTS:
+                raise ValueError(f"Unknown constant {name}, must be one of {', '.join(SWEEP_CONSTANTS)}")
+
+        self.scenario_grid = scenario_grid
+        self.constants_grid = constants_grid
+        self.number_of_build_orders = number_of_build_orders
+        self.seed = seed
+        self.number_of_workers = number_of_workers
+        self.chunk_size = chunk_size
+        self.event_driven = event_driven
+        self.require_temple = require_temple
+        self.build_orders = {}
+        self.sweep_directory = None
+
+    def get_cells(self) -> list[SweepCell]:
+        """
+        Get every cell of the grid.
+
+        :return: list[SweepCell]: The cells, numbered from 1
+        """
+        scenario_values = [self.scenario_grid.get(name, [default]) for name, default in SCENARIO_DEFAULTS.items()]
+        constant_values = [self.constants_grid[name] for name in self.constants_grid]
+        cells = []
+        for scenario in itertools.product(*scenario_values):
+            for constants in itertools.product(*constant_values):
+                cells.append(SweepCell(number=len(cells) + 1,
+                                       scenario=dict(zip(SCENARIO_DEFAULTS, scenario)),
+                                       constants=dict(zip(self.constants_grid, constants))))
+        return cells
+
+    def get_build_orders(self, number_of_bases: int) -> list[bytes]:
+        """
+        Get the random build orders for a number of bases, generated the first time they are needed.
+
+        :param number_of_bases: int: Number of bases
+        :return: list[bytes]: The packed build orders, without duplicates
+        """
+        if number_of_bases not in self.build_orders:
+            # Only imported in the main process, the workers are given the packed build orders
+            from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+
+            generate_orders_building_blocks = GenerateOrdersBuildingBlocks(
+                random_generator=random.Random(f"{self.seed}:{number_of_bases}"))
+            build_orders = []
+            for _ in range(self.number_of_build_orders):
+                packed_build_order = generate_orders_building_blocks.generate_random_packed_build_order(number_of_bases)
+                if not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+                    build_orders.append(packed_build_order)
+            self.build_orders[number_of_bases] = build_orders
+        return self.build_orders[number_of_bases]
+
+    @staticmethod
+    def get_cell_groups(cells: list[SweepCell]) -> list[list[SweepCell]]:
+        """
+        Group the cells that only differ in the resource trigger, so they can share their simulations.
+
+        :param cells: list[SweepCell]: The cells
+        :return: list[list[SweepCell]]: The groups, each sorted by resource trigger
+        """
+        groups = {}
+        for cell in cells:
+            key = (tuple(value for name, value in cell.scenario.items() if name != "resource_trigger"),
+                   tuple(cell.constants.items()))
+            groups.setdefault(key, []).append(cell)
+        return [sorted(group, key=lambda cell: cell.scenario["resource_trigger"]) for group in groups.values()]
+
+    def run(self, output_directory: str) -> list:
+        """
+        Run the sweep, and write the results of each cell and the summary to a new sweep directory.
+
+        :param output_directory: str: The directory the sweep directory is made in
+        :return: list: The summary rows, [cell, results aggregator] for each cell
+        """
+        self.sweep_directory = os.path.join(output_directory, time.strftime("sweep_%Y%m%d_%H%M%S"))
+        cells = self.get_cells()
+        results_writers = {}
+        results_aggregators = {}
+        for cell in cells:
+            results_writers[cell.number] = StreamingResultsWriter(output_directory=self.sweep_directory,
+                                                                  file_prefix=cell.name)
+            results_aggregators[cell.number] = ResultsAggregator(
+                max_time_seconds=cell.scenario["simulation_time_seconds"], require_temple=self.require_temple)
+
+        # [group, chunk of packed build orders] for each worker task, the longest first. The sort is stable, so the
+        # chunks of a group stay in order and the results files are the same every time
+        tasks = []
+        for group in self.get_cell_groups(cells):
+            build_orders = self.get_build_orders(group[0].scenario["number_of_bases"])
+            for cell in group:
+                for _ in range(self.number_of_build_orders - len(build_orders)):
+                    results_aggregators[cell.number].add_duplicate()
+            for start in range(0, len(build_orders), self.chunk_size):
+                tasks.append([group, build_orders[start:start + self.chunk_size]])
+        tasks.sort(key=lambda task: -len(task[1]) * task[0][0].scenario["number_of_bases"] *
+                   task[0][0].scenario["simulation_time_seconds"])
+
+        # Spawned processes start without the simulation modules, and each one only runs one chunk
+        with ProcessPoolExecutor(max_workers=self.number_of_workers, mp_context=multiprocessing.get_context("spawn"),
+                                 max_tasks_per_child=1) as executor:
+            futures = []
+            for group, packed_build_orders in tasks:
+                futures.append(executor.submit(simulate_cell_group,
+                                               group[0].constants,
+                                               group[0].scenario,
+                                               [cell.scenario["resource_trigger"] for cell in group],
+                                               packed_build_orders,
+                                               self.event_driven))
+
+            for (group, packed_build_orders), future in zip(tasks, futures):
+                for packed_build_order, cell_results in zip(packed_build_orders, future.result()):
+                    for cell, (final_time, build_order_string) in zip(group, cell_results):
+                        results_aggregators[cell.number].add(final_time, build_order_string, packed_build_order)
+                        if not self.require_temple or "TEMPLE" in build_order_string:
+                            results_writers[cell.number].write(final_time, build_order_string)
+
+        for results_writer in results_writers.values():
+            results_writer.close()
+        summary = [[cell, results_aggregators[cell.number]] for cell in cells]
+        self.write_summary(summary, os.path.join(self.sweep_directory, SUMMARY_FILE), results_writers)
+        return summary
+
+    def write_summary(self, summary: list, output_file_path: str, results_writers: dict):
+        """
+        Write the settings, number of results and fastest build order of every cell to a csv file.
+
+        :param summary: list: [cell, results aggregator] for each cell
+        :param output_file_path: str: The csv file to write
+        :param results_writers: dict: Cell number to the StreamingResultsWriter of the cell
+        """
+        os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
+        with open(output_file_path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["Cell"] + list(SCENARIO_DEFAULTS) + list(self.constants_grid) +
+                            ["Results", "Finished", "Best time", "Best build order", "Results files"])
+            for cell, results_aggregator in summary:
+                best_time, best_build_order = results_aggregator.get_best_result()
+                results_files = [os.path.basename(output_path)
+                                 for output_path in results_writers[cell.number].output_paths]
+                writer.writerow([cell.name] + list(cell.scenario.values()) + list(cell.constants.values()) +
+                                [results_aggregator.number_of_results, results_aggregator.get_number_finished(),
+                                 best_time if best_build_order is not None else None, best_build_order,
+                                 " ".join(results_files)])
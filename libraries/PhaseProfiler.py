@@ -0,0 +1,185 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Opt in profiler that times each phase of a run, such as build_verifier, Base.update and ResourceManager.update, and can
+capture a cProfile of a few of the simulations.
+
+"""
+import cProfile
+import inspect
+import io
+import pstats
+import time
+
+from libraries.BaseClass import Base
+from libraries.BuildSlotClasses import EmptySLot, SupplyPad, Temple
+from libraries.CanonicalResultCache import CanonicalResultCache
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.ResourceManager import ResourceManager
+from libraries.RuntimeBuildingBlocks import RuntimeBuildingBlocks
+from libraries.SimulatorWrapper import SimulatorWrapper
+from libraries.StreamingResultsWriter import StreamingResultsWriter
+
+# The methods each phase is timed on, [class, method name] for each. The phases can be inside each other, for example
+# Base.update calls the build slot updates, so each phase time includes the phases it calls
+PHASES = {
+    "generation": [[GenerateOrdersBuildingBlocks, "generate_random_build_orders"]],
+    "dedupe": [[GenerateOrdersBuildingBlocks, "is_packed_build_order_seen"], [CanonicalResultCache, "get_result"]],
+    "simulation": [[SimulatorWrapper, "run_simulation"]],
+    "build_verifier": [[RuntimeBuildingBlocks, "build_verifier"]],
+    "quiet tick search": [[RuntimeBuildingBlocks, "_get_quiet_ticks"]],
+    "Base.update": [[Base, "update"]],
+    "Base.skip_ticks": [[Base, "skip_ticks"]],
+    "build slot update": [[EmptySLot, "update"], [SupplyPad, "update"], [Temple, "update"]],
+    "ResourceManager.update": [[ResourceManager, "update"]],
+    "build order string": [[GenerateOrdersBuildingBlocks, "build_order_print"]],
+    "csv output": [[StreamingResultsWriter, "write"], [StreamingResultsWriter, "flush"]],
+}
+
+# Number of functions printed from the cProfile capture
+PROFILE_PRINT_LINES = 25
+
+
+class PhaseProfiler:
+    """
+    The PhaseProfiler adds up the wall time and number of calls of each phase in PHASES over a run. Nothing in the
+    simulation checks if profiling is on: enable replaces the methods of each phase on their classes with a timed
+    version, and disable puts the original methods back. When the profiler is not enabled the simulation runs the
+    original methods, so it costs nothing.
+
+    With profile_iterations, every profile_every-th call of SimulatorWrapper.run_simulation is also run with cProfile,
+    until profile_iterations simulations are captured, for a function level profile of simulations spread over the run.
+
+    Only the process the profiler is enabled in is profiled, so the worker processes of the parallel runner are not.
+
+    Args:
+        profile_iterations (int): Number of simulations to capture with cProfile, 0 for none
+        profile_every (int): Capture every profile_every-th simulation
+
+    """
+    def __init__(self, profile_iterations=0, profile_every=1):
+        self.profile_iterations = profile_iterations
+        self.profile_every = profile_every
+
+        # Phase name to [total seconds, number of calls]
+        self.phase_totals = {phase_name: [0.0, 0] for phase_name in PHASES}
+        # [class, method name, original attribute] of every replaced method, to put them back
+        self.original_methods = []
+        self.enabled_time = None
+        self.wall_seconds = 0.0
+        self.profile = cProfile.Profile() if profile_iterations > 0 else None
+        self.simulations_seen = 0
+        self.profiled_iterations = 0
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def enable(self):
+        """
+        Start timing the phases, replacing their methods with timed versions.
+        """
+        if self.original_methods:
+            return
+        for phase_name, methods in PHASES.items():
+            for cls, method_name in methods:
+                original = inspect.getattr_static(cls, method_name)
+                self.original_methods.append([cls, method_name, original])
+                setattr(cls, method_name, self._get_timed_method(original, self.phase_totals[phase_name],
+                                                                 profile=phase_name == "simulation"))
+        self.enabled_time = time.perf_counter()
+
+    def disable(self):
+        """
+        Stop timing the phases, putting the original methods back.
+        """
+        for cls, method_name, original in reversed(self.original_methods):
+            setattr(cls, method_name, original)
+        self.original_methods = []
+        if self.enabled_time is not None:
+            self.wall_seconds += time.perf_counter() - self.enabled_time
+            self.enabled_time = None
+
+    def _get_timed_method(self, original, totals: list, profile: bool):
+        """
+        Make the timed version of a method.
+
+        :param original: The method as it is on its class, a function or staticmethod
+        :param totals: list: [total seconds, number of calls] of the phase, added to on every call
+        :param profile: bool: Capture the sampled calls with cProfile
+        :return: The timed method, a staticmethod if the original is one
+        """
+        is_static = isinstance(original, staticmethod)
+        function = original.__func__ if is_static else original
+        perf_counter = time.perf_counter
+
+        if profile and self.profile is not None:
+            def timed_method(*args, **kwargs):
+                self.simulations_seen += 1
+                start = perf_counter()
+                if self.profiled_iterations < self.profile_iterations and \
+                        (self.simulations_seen - 1) % self.profile_every == 0:
+                    self.profiled_iterations += 1
+                    result = self.profile.runcall(function, *args, **kwargs)
+                else:
+                    result = function(*args, **kwargs)
+                totals[0] += perf_counter() - start
+                totals[1] += 1
+                return result
+        else:
+            def timed_method(*args, **kwargs):
+                start = perf_counter()
+                result = function(*args, **kwargs)
+                totals[0] += perf_counter() - start
+                totals[1] += 1
+                return result
+
+        timed_method.__name__ = function.__name__
+        timed_method.__doc__ = function.__doc__
+        return staticmethod(timed_method) if is_static else timed_method
+
+    def get_summary_string(self) -> str:
+        """
+        Get the table of the phase times. Phases that were never called are left out.
+
+        :return: str: The summary table
+        """
+        wall_seconds = self.wall_seconds
+        if self.enabled_time is not None:
+            wall_seconds += time.perf_counter() - self.enabled_time
+        lines = [f"Phase times over {wall_seconds:.3f} seconds, each phase includes the phases it calls:",
+                 f"    {'phase':<24}{'calls':>12}{'seconds':>12}{'us/call':>12}{'% of run':>10}"]
+        for phase_name, (seconds, calls) in sorted(self.phase_totals.items(), key=lambda phase: -phase[1][0]):
+            if calls:
+                share = seconds / wall_seconds if wall_seconds else 0.0
+                lines.append(f"    {phase_name:<24}{calls:>12}{seconds:>12.3f}{seconds / calls * 1e6:>12.2f}"
+                             f"{share:>10.1%}")
+        return "\n".join(lines)
+
+    def get_profile_string(self, sort_key="cumulative", number_of_lines=PROFILE_PRINT_LINES) -> str:
+        """
+        Get the cProfile capture of the sampled simulations.
+
+        :param sort_key: str: The pstats sort key
+        :param number_of_lines: int: Number of functions to include
+        :return: str: The pstats table, empty if nothing was captured
+        """
+        if not self.profiled_iterations:
+            return ""
+        output = io.StringIO()
+        output.write(f"cProfile of {self.profiled_iterations} simulations:\n")
+        pstats.Stats(self.profile, stream=output).sort_stats(sort_key).print_stats(number_of_lines)
+        return output.getvalue()
+
+    def dump_profile(self, output_path: str):
+        """
+        Save the cProfile capture, for pstats or a viewer like snakeviz.
+
+        :param output_path: str: The file to save to
+        """
+        if self.profiled_iterations:
+            self.profile.dump_stats(output_path)
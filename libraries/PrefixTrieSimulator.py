@@ -0,0 +1,163 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Batch simulator that puts build orders into a prefix trie, so the orders that several build orders start with are only
+simulated once.
+
+"""
+from libraries.BuildOrderEncoding import decode_build_order, packed_to_text
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+
+class PrefixTrieNode:
+    """
+    One node of the prefix trie, standing for the build order prefix on the path from the root to it.
+
+    Args:
+        depth (int): The number of orders in the prefix
+
+    """
+    def __init__(self, depth: int):
+        self.depth = depth
+        # Packed order byte to the node of the prefix with that order added
+        self.children = {}
+        # Indexes of the build orders that are exactly this prefix
+        self.build_order_indexes = []
+
+    def get_build_order_indexes(self) -> list:
+        """
+        Get the indexes of every build order that starts with this prefix.
+
+        :return: list: The build order indexes
+        """
+        build_order_indexes = list(self.build_order_indexes)
+        for child in self.children.values():
+            build_order_indexes.extend(child.get_build_order_indexes())
+        return build_order_indexes
+
+
+class PrefixTrieSimulator:
+    """
+    The PrefixTrieSimulator runs a batch of packed build orders with the event driven simulation, one order at a time
+    with RuntimeBuildingBlocks.run_next_order. The build orders are put into a prefix trie first, and the trie is walked
+    depth first. At every branch point the simulation, with its ResourceManager, Bases and BuildSlots, is copied with
+    SimulatorWrapper.copy, and each branch continues from its own copy, so the orders the build orders share at the
+    start are simulated once instead of once per build order. The last branch of a node takes the simulation itself,
+    so a prefix with a single branch is never copied.
+
+    Build orders that reach the resource trigger or time out before their last order is done all get the same result
+    as the prefix they stopped in, without simulating the rest of them.
+
+    The results are the same as simulating every build order with its own SimulatorWrapper, including the orders that
+    are marked SKIPPED in the build order strings.
+
+    Args:
+        starting_money (int): The amount of money to start with
+        number_of_bases (int): Number of bases, the first starts as a KEEP and the others are empty
+        resource_trigger (int): The amount of resources to reach the exit scenario
+        simulation_time_seconds (int): Maximum time for each simulation
+        pause_timer (int): Pause timer of every base after the first, see Base
+        temple_needed_to_clear_second_base (bool): If the pause timer of the bases after the first only counts down
+            once there is a tech level, see Base
+
+    """
+    def __init__(self, starting_money: int, number_of_bases: int, resource_trigger: int, simulation_time_seconds: int,
+                 pause_timer=0, temple_needed_to_clear_second_base=False):
+        self.starting_money = starting_money
+        self.number_of_bases = number_of_bases
+        self.resource_trigger = resource_trigger
+        self.simulation_time_seconds = simulation_time_seconds
+        self.pause_timer = pause_timer
+        self.temple_needed_to_clear_second_base = temple_needed_to_clear_second_base
+
+        self.packed_build_orders = []
+        self.results = []
+        # Number of orders simulated in the last run, against the sum of the build order lengths without the trie
+        self.orders_simulated = 0
+
+    def run_simulation(self, packed_build_orders: list[bytes]) -> list:
+        """
+        Simulate a batch of packed build orders.
+
+        :param packed_build_orders: list[bytes]: The packed build orders to simulate
+        :return: list: [final time, build order string] for each build order, in the same order as the packed build
+            orders. The final time is None if the build order timed out
+        """
+        self.packed_build_orders = packed_build_orders
+        self.results = [None] * len(packed_build_orders)
+        self.orders_simulated = 0
+
+        root = PrefixTrieNode(depth=0)
+        for index, packed_build_order in enumerate(packed_build_orders):
+            node = root
+            for packed_order in packed_build_order:
+                child = node.children.get(packed_order)
+                if child is None:
+                    child = PrefixTrieNode(depth=node.depth + 1)
+                    node.children[packed_order] = child
+                node = child
+            node.build_order_indexes.append(index)
+
+        sim_wrapper = SimulatorWrapper(starting_money=self.starting_money, fine_debug=False, event_driven=True)
+        sim_wrapper.add_bases(self.number_of_bases, pause_timer=self.pause_timer,
+                              temple_needed_to_clear_second_base=self.temple_needed_to_clear_second_base)
+
+        self._simulate_node(root, sim_wrapper, simulation_time=0, approved_orders=b"")
+        return self.results
+
+    def _set_results(self, node: PrefixTrieNode, final_time, approved_orders: bytes):
+        """
+        Set the result of every build order starting with the prefix, for when the simulation ended in the prefix. The
+        orders after the prefix never ran, so they are in the build order string as they are.
+
+        :param node: PrefixTrieNode: The prefix the simulation ended in
+        :param final_time: int: The final time, None if the simulation timed out
+        :param approved_orders: bytes: The orders of the prefix that were not SKIPPED
+        """
+        for index in node.get_build_order_indexes():
+            build_order_string = packed_to_text(approved_orders + self.packed_build_orders[index][node.depth:])
+            self.results[index] = [final_time, build_order_string]
+
+    def _simulate_node(self, node: PrefixTrieNode, sim_wrapper: SimulatorWrapper, simulation_time: int,
+                       approved_orders: bytes):
+        """
+        Finish the build orders that are exactly the prefix, then simulate each order that follows the prefix and
+        continue down the trie. The simulation is at the start of the game tick the next order is tried on.
+
+        :param node: PrefixTrieNode: The prefix that has been simulated
+        :param sim_wrapper: SimulatorWrapper: The simulation after the prefix, used by the last branch
+        :param simulation_time: int: The game tick the next order would be tried on
+        :param approved_orders: bytes: The orders of the prefix that were not SKIPPED
+        """
+        branches_left = len(node.children) + (1 if node.build_order_indexes else 0)
+
+        if node.build_order_indexes:
+            branches_left -= 1
+            branch_wrapper = sim_wrapper.copy() if branches_left else sim_wrapper
+            _, final_time, reached = branch_wrapper.runtime_building_blocks.run_next_order(
+                build_orders=[], i=0, simulation_time=simulation_time, resource_amount=self.resource_trigger,
+                simulation_time_max=self.simulation_time_seconds, base_list=branch_wrapper.base_list)
+            build_order_string = packed_to_text(approved_orders)
+            for index in node.build_order_indexes:
+                self.results[index] = [final_time if reached else None, build_order_string]
+
+        for packed_order, child in node.children.items():
+            branches_left -= 1
+            branch_wrapper = sim_wrapper.copy() if branches_left else sim_wrapper
+            build_orders = decode_build_order(bytes([packed_order]), branch_wrapper.base_list)
+            _, child_time, reached = branch_wrapper.runtime_building_blocks.run_next_order(
+                build_orders=build_orders, i=0, simulation_time=simulation_time, resource_amount=self.resource_trigger,
+                simulation_time_max=self.simulation_time_seconds, base_list=branch_wrapper.base_list)
+            self.orders_simulated += 1
+
+            child_approved_orders = approved_orders
+            if build_orders[0][0] != "SKIPPED":
+                child_approved_orders += bytes([packed_order])
+
+            if reached:
+                self._set_results(child, child_time, child_approved_orders)
+            elif child_time >= self.simulation_time_seconds:
+                self._set_results(child, None, child_approved_orders)
+            else:
+                self._simulate_node(child, branch_wrapper, child_time, child_approved_orders)
@@ -7,6 +7,10 @@ Resource Manger used for keeping track of the resources and tech levels in a spe
 """
 import math
 
+# Largest number of lite or heavy supply pads in the precomputed income table, enough for 9 bases with 7 supply pads.
+# The income for more supply pads than this is calculated when it is needed
+INCOME_TABLE_SIZE = 63
+
 
 class ResourceManager:
     """
@@ -88,7 +92,7 @@ class ResourceManager:
         """
         self.current_temple_count = self.current_temple_count + 1
 
-    def update(self) -> str:
+    def update(self):
         """
         Main update method. This method performs the calculation to see how many new resources are added to the money
         pool based on how many lite and heavy supply pads there are. This calculation is intended to take place for
@@ -108,17 +112,105 @@ class ResourceManager:
             not match in game supply rates. This was updated with trial and error and the current equation seems to be
             very accurate even over very long periods of in game time.
 
+        The supply rate only depends on the number of lite and heavy supply pads, so the money added every second is
+        looked up in a precomputed table instead of doing the equation every second.
+
+        """
+        self.current_money = self.current_money + self.get_income(self.supply_pad_lite_quantity,
+                                                                  self.supply_pad_heavy_quantity)
+
+    def get_update_string(self) -> str:
+        """
+        Debug string of the supply pad equation with the current supply pads.
+
         :return: str: A string containing the calculation information, number of supply pads, types, and resources made
         """
-        total_supply_pad = self.supply_pad_lite_quantity + self.supply_pad_heavy_quantity
-        # Multiply by 10 and divide by 10 to round to the nearest decimal place. Also floor results.
-        heavy_rate = math.floor(self.supply_pad_heavy_quantity * (3.5 * 1.75)/((total_supply_pad/9) + 1) * 10) / 10
-        lite_rate = math.floor(self.supply_pad_lite_quantity * (2.5 * 1.75)/((total_supply_pad/9) + 1) * 10) / 10
-        final_rate = math.floor((heavy_rate + lite_rate) * 10) / 10
-        self.current_money = int(self.current_money + final_rate)
+        final_rate, heavy_rate, lite_rate = self.calculate_supply_rates(self.supply_pad_lite_quantity,
+                                                                        self.supply_pad_heavy_quantity)
         return f"MONEY: {self.current_money} total: {final_rate} heavy: {heavy_rate} lite: {lite_rate}, lite Q: " \
                f"{self.supply_pad_lite_quantity} heavy Q {self.supply_pad_heavy_quantity}"
 
+    @staticmethod
+    def calculate_supply_rates(lite_quantity: int, heavy_quantity: int) -> tuple[float, float, float]:
+        """
+        Perform the supply pad equation described in the update method for a given number of lite and heavy supply
+        pads.
+
+        :param lite_quantity: int: The number of lite supply pads
+        :param heavy_quantity: int: The number of heavy supply pads
+        :return: tuple[float, float, float]: The total, heavy and lite supply rates, floored to one decimal place
+        """
+        total_supply_pad = lite_quantity + heavy_quantity
+        # Multiply by 10 and divide by 10 to round to the nearest decimal place. Also floor results.
+        heavy_rate = math.floor(heavy_quantity * (3.5 * 1.75)/((total_supply_pad/9) + 1) * 10) / 10
+        lite_rate = math.floor(lite_quantity * (2.5 * 1.75)/((total_supply_pad/9) + 1) * 10) / 10
+        final_rate = math.floor((heavy_rate + lite_rate) * 10) / 10
+        return final_rate, heavy_rate, lite_rate
+
+    @staticmethod
+    def calculate_unfloored_supply_rate(lite_quantity: int, heavy_quantity: int) -> float:
+        """
+        Perform the supply pad equation described in the update method without any flooring, so it is never lower than
+        the money get_income adds every second. Used for optimistic estimates of the money a simulation could make.
+
+        :param lite_quantity: int: The number of lite supply pads
+        :param heavy_quantity: int: The number of heavy supply pads
+        :return: float: The total supply rate
+        """
+        return (lite_quantity * (2.5 * 1.75) + heavy_quantity * (3.5 * 1.75)) / \
+            ((lite_quantity + heavy_quantity) / 9 + 1)
+
+    @staticmethod
+    def get_income(lite_quantity: int, heavy_quantity: int) -> int:
+        """
+        Get the money added every in game second for a given number of lite and heavy supply pads. Since the money is
+        stored as an int, the decimal part of the supply rate is always dropped.
+
+        :param lite_quantity: int: The number of lite supply pads
+        :param heavy_quantity: int: The number of heavy supply pads
+        :return: int: The money added per second
+        """
+        if lite_quantity <= INCOME_TABLE_SIZE and heavy_quantity <= INCOME_TABLE_SIZE:
+            return _INCOME_TABLE[lite_quantity][heavy_quantity]
+        final_rate, _, _ = ResourceManager.calculate_supply_rates(lite_quantity, heavy_quantity)
+        return int(final_rate)
+
+    def get_money_per_second(self) -> int:
+        """
+        Get the amount of money the update method will add every in game second with the current supply pads.
+
+        :return: int: The money added per second
+        """
+        return self.get_income(self.supply_pad_lite_quantity, self.supply_pad_heavy_quantity)
+
+    def money_after_seconds(self, seconds: int) -> int:
+        """
+        Get the amount of money there will be after the update method is called for the given number of in game
+        seconds, if the supply pads do not change.
+
+        :param seconds: int: The number of in game seconds
+        :return: int: The money after the seconds
+        """
+        return self.current_money + seconds * self.get_money_per_second()
+
+    def seconds_until_money(self, amount: int):
+        """
+        Get the number of in game seconds the update method has to be called for until there is at least the given
+        amount of money, if the supply pads do not change.
+
+        :param amount: int: The amount of money to reach
+        :return: int: The number of in game seconds, 0 if there is already enough money, math.inf if the money is never
+            reached
+        """
+        missing_money = amount - self.current_money
+        if missing_money <= 0:
+            return 0
+        money_per_second = self.get_money_per_second()
+        if money_per_second <= 0:
+            return math.inf
+        # Ceiling division, kept in ints so it is exact
+        return -(-missing_money // money_per_second)
+
     def add_lite_supply_pad(self):
         """
         Helper method to add a lite supply pad to the resource manager.
@@ -145,4 +237,10 @@ class ResourceManager:
         Helper method to remove a heavy supply pad to the resource manager.
 
         """
-        self.supply_pad_heavy_quantity = self.supply_pad_heavy_quantity - 1
\ No newline at end of file
+        self.supply_pad_heavy_quantity = self.supply_pad_heavy_quantity - 1
+
+
+# Money added per second for every number of lite (first index) and heavy (second index) supply pads
+_INCOME_TABLE = [[int(ResourceManager.calculate_supply_rates(lite_quantity, heavy_quantity)[0])
+                  for heavy_quantity in range(INCOME_TABLE_SIZE + 1)]
+                 for lite_quantity in range(INCOME_TABLE_SIZE + 1)]
@@ -0,0 +1,201 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Online aggregator that keeps the fastest build orders and the distribution of the final times as the results come in,
+without keeping the results themselves.
+
+"""
+import heapq
+import math
+
+
+class ResultsAggregator:
+    """
+    The ResultsAggregator is given every simulated build order as it finishes, and keeps:
+        - A heap of the top_k fastest build orders. With require_temple, build orders without a TEMPLE are left out, the
+          same as RuntimeBuildingBlocks.report_quickest_run. Build orders that tie keep the one that came first
+        - A histogram of the final times, in bins of histogram_bin_seconds, that the quantiles are read from. With one
+          second bins the quantiles are exact, since the final times are whole seconds
+        - Counts of the results, timeouts, build orders without a TEMPLE, SKIPPED orders and duplicate build orders
+
+    The memory used only depends on top_k and the number of histogram bins, not the number of results, and everything
+    can be read at any point during a run.
+
+    Args:
+        max_time_seconds (int): The longest final time, normally the simulation timeout. Longer times go in the last bin
+        top_k (int): Number of the fastest build orders to keep
+        require_temple (bool): If build orders without a TEMPLE are left out of the fastest build orders
+        histogram_bin_seconds (int): Width of each histogram bin in seconds
+
+    """
+    def __init__(self, max_time_seconds: int, top_k=10, require_temple=True, histogram_bin_seconds=1):
+        self.max_time_seconds = max_time_seconds
+        self.top_k = top_k
+        self.require_temple = require_temple
+        self.histogram_bin_seconds = histogram_bin_seconds
+
+        # Max heap of the fastest build orders as [-final time, -result number, build order string], so the slowest one,
+        # and the latest of the slowest ones if they tie, is the first to be replaced
+        self.top_heap = []
+        self.top_build_order_strings = set()
+        self.histogram = [0] * (max_time_seconds // histogram_bin_seconds + 1)
+
+        self.number_of_results = 0
+        self.number_of_timeouts = 0
+        self.number_without_temple = 0
+        self.number_of_duplicates = 0
+        # Number of SKIPPED orders, and of the build orders with at least one
+        self.number_of_skipped_orders = 0
+        self.number_with_skipped_orders = 0
+        # Sum of the final times for the mean, and the fastest and slowest final times
+        self.time_sum = 0
+        self.min_time = None
+        self.max_time = None
+
+    def add(self, final_time, build_order_string: str, packed_build_order=None):
+        """
+        Add a simulated build order.
+
+        :param final_time: int: The time the build order took, None if it timed out
+        :param build_order_string: str: The build order string from build_order_print
+        :param packed_build_order: bytes: The packed build order that was simulated, used to count the SKIPPED orders
+            since they are not in the build order string. None if it is not known
+        """
+        self.number_of_results += 1
+        has_temple = "TEMPLE" in build_order_string
+        if not has_temple:
+            self.number_without_temple += 1
+
+        if packed_build_order is not None:
+            # Each order in the build order string ends with ", "
+            skipped_orders = len(packed_build_order) - build_order_string.count(", ")
+            if skipped_orders > 0:
+                self.number_of_skipped_orders += skipped_orders
+                self.number_with_skipped_orders += 1
+
+        if final_time is None:
+            self.number_of_timeouts += 1
+            return
+
+        self.histogram[min(final_time // self.histogram_bin_seconds, len(self.histogram) - 1)] += 1
+        self.time_sum += final_time
+        if self.min_time is None or final_time < self.min_time:
+            self.min_time = final_time
+        if self.max_time is None or final_time > self.max_time:
+            self.max_time = final_time
+
+        if (self.require_temple and not has_temple) or build_order_string in self.top_build_order_strings:
+            return
+        entry = [-final_time, -self.number_of_results, build_order_string]
+        if len(self.top_heap) < self.top_k:
+            heapq.heappush(self.top_heap, entry)
+            self.top_build_order_strings.add(build_order_string)
+        elif self.top_k > 0 and final_time < -self.top_heap[0][0]:
+            removed_entry = heapq.heapreplace(self.top_heap, entry)
+            self.top_build_order_strings.discard(removed_entry[2])
+            self.top_build_order_strings.add(build_order_string)
+
+    def add_duplicate(self):
+        """
+        Count a build order that was not simulated since it had been simulated before.
+        """
+        self.number_of_duplicates += 1
+
+    def get_top_results(self) -> list:
+        """
+        Get the fastest build orders.
+
+        :return: list: [final time, build order string] for up to top_k build orders, fastest first
+        """
+        return [[-negative_time, build_order_string]
+                for negative_time, _, build_order_string in sorted(self.top_heap, reverse=True)]
+
+    def get_best_result(self) -> list:
+        """
+        Get the fastest build order.
+
+        :return: list: [final time, build order string], [math.inf, None] if there is none yet
+        """
+        top_results = self.get_top_results()
+        return top_results[0] if top_results else [math.inf, None]
+
+    def get_number_finished(self) -> int:
+        """
+        Get the number of build orders that reached the resource trigger.
+
+        :return: int: The number of results that did not time out
+        """
+        return self.number_of_results - self.number_of_timeouts
+
+    def get_mean_time(self):
+        """
+        Get the mean final time of the build orders that reached the resource trigger.
+
+        :return: float: The mean final time, None if there are no finished results
+        """
+        number_finished = self.get_number_finished()
+        return self.time_sum / number_finished if number_finished else None
+
+    def get_quantile(self, fraction: float):
+        """
+        Get a quantile of the final times of the build orders that reached the resource trigger, read from the
+        histogram with the nearest rank method.
+
+        :param fraction: float: The quantile between 0 and 1, for example 0.5 for the median
+        :return: int: The start of the histogram bin the quantile is in, None if there are no finished results
+        """
+        number_finished = self.get_number_finished()
+        if not number_finished:
+            return None
+        rank = max(math.ceil(fraction * number_finished), 1)
+        count = 0
+        for bin_index, bin_count in enumerate(self.histogram):
+            count += bin_count
+            if count >= rank:
+                return bin_index * self.histogram_bin_seconds
+        return self.max_time
+
+    def get_histogram(self) -> list:
+        """
+        Get the histogram bins that have results in them.
+
+        :return: list: [bin start time, count] for each bin with results, fastest first
+        """
+        return [[bin_index * self.histogram_bin_seconds, bin_count]
+                for bin_index, bin_count in enumerate(self.histogram) if bin_count]
+
+    def get_progress_string(self) -> str:
+        """
+        Get a one line summary of the results so far, for printing during a run.
+
+        :return: str: The summary
+        """
+        best_time, _ = self.get_best_result()
+        return f"{self.number_of_results} results, {self.number_of_timeouts} timed out, " \
+               f"{self.number_of_duplicates} duplicates, best {best_time} seconds, " \
+               f"median {self.get_quantile(0.5)} seconds"
+
+    def report(self):
+        """
+        Print the fastest build order the same way as RuntimeBuildingBlocks.report_quickest_run, followed by the other
+        fastest build orders and the statistics of the final times.
+        """
+        best_time, best_build_order_string = self.get_best_result()
+
+        # Final printout
+        print('\n')
+        print('\n')
+        print('\n')
+        print(f"final quickest results: {best_time} seconds, orders: {best_build_order_string}")
+        print(f"Fastest {len(self.top_heap)} build orders:")
+        for final_time, build_order_string in self.get_top_results():
+            print(f"    {final_time} seconds, orders: {build_order_string}")
+        print(f"{self.number_of_results} results: {self.get_number_finished()} finished, "
+              f"{self.number_of_timeouts} timed out, {self.number_without_temple} without a TEMPLE, "
+              f"{self.number_with_skipped_orders} with {self.number_of_skipped_orders} SKIPPED orders, "
+              f"{self.number_of_duplicates} duplicates not simulated")
+        if self.get_number_finished():
+            print(f"Final times: min {self.min_time}, 10% {self.get_quantile(0.1)}, "
+                  f"median {self.get_quantile(0.5)}, 90% {self.get_quantile(0.9)}, max {self.max_time}, "
+                  f"mean {self.get_mean_time():.1f} seconds")
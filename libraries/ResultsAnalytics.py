@@ -0,0 +1,291 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Analytics over the saved simulation results, to find which opening prefixes and order positions go with fast final
+times.
+
+"""
+import os
+
+import numpy as np
+
+from libraries.BuildOrderEncoding import ORDERS_BY_NAME
+from libraries.ColumnarResults import ColumnarResults, TIMED_OUT_TIME
+from libraries.ExperimentStore import get_results_file_settings
+
+# The token number of the steps after the end of a build order in the token matrix
+PADDING_TOKEN = -1
+
+# Order type names, in the same order as the Orders values
+ORDER_TYPE_NAMES = list(ORDERS_BY_NAME)
+
+
+def get_token_name(token: str) -> str:
+    """
+    Get the canonical name of an order token from a build order string. Older results without base numbers ("SUPPLY")
+    are for base 1, the same as BuildOrderEncoding.text_to_packed.
+
+    :param token: str: The token, for example "SUPPLY 2" or "SUPPLY"
+    :return: str: The token with its base number, for example "SUPPLY 2" or "SUPPLY 1"
+    """
+    name, _, base_text = token.strip().partition(" ")
+    return f"{name} {base_text or 1}"
+
+
+class ResultsAnalytics:
+    """
+    The ResultsAnalytics loads results from any number of ColumnarResults into one token matrix, with a row per build
+    order and a column per step, so every query is a vectorized NumPy operation over all the results at once:
+        - get_mask selects build orders by resource trigger, number of bases, TEMPLE and opening prefix
+        - get_first_step finds the step each build order first has an order on, for example the TEMPLE step
+        - get_best gives the fastest build orders of a selection
+        - get_prefix_statistics gives the sample count, min, mean and quantiles of the final times of every opening
+          prefix of a length
+        - get_position_effects gives the marginal effect of each order at each step, the mean final time of the build
+          orders with that order at that step less the mean of every build order with any order at that step
+
+    Each token is an order type plus base number, for example "SUPPLY 1". The prefix index has an integer key for the
+    prefix of each length of every build order, made once per length and kept, so prefix lookups and groupings compare
+    one integer per build order instead of the tokens.
+
+    Args:
+        results (list): [ColumnarResults, resource trigger, number of bases, source name] for each results set
+
+    """
+    def __init__(self, results: list):
+        self.token_names = sorted({get_token_name(token) for columnar_results, _, _, _ in results
+                                   for token in columnar_results.dictionary})
+        if len(self.token_names) >= np.iinfo(np.int8).max:
+            raise ValueError(f"Too many different orders for the token matrix: {len(self.token_names)}")
+        token_numbers = {token_name: token_number for token_number, token_name in enumerate(self.token_names)}
+        # Order type index (ORDER_TYPE_NAMES) of each token number
+        self.token_order_types = np.array([ORDER_TYPE_NAMES.index(token_name.split(" ")[0])
+                                           for token_name in self.token_names], dtype=np.int8)
+
+        self.source_names = [source_name for _, _, _, source_name in results]
+        lengths = [np.diff(np.asarray(columnar_results.offsets)) for columnar_results, _, _, _ in results]
+        number_of_rows = sum(len(results_lengths) for results_lengths in lengths)
+        max_length = max([int(results_lengths.max()) for results_lengths in lengths if len(results_lengths)] + [0])
+
+        self.token_matrix = np.full((number_of_rows, max_length), PADDING_TOKEN, dtype=np.int8)
+        self.lengths = np.zeros(number_of_rows, dtype=np.int16)
+        self.final_times = np.zeros(number_of_rows, dtype=np.int16)
+        self.resource_triggers = np.zeros(number_of_rows, dtype=np.int32)
+        self.numbers_of_bases = np.zeros(number_of_rows, dtype=np.int8)
+        self.sources = np.zeros(number_of_rows, dtype=np.int16)
+
+        start = 0
+        for source, ((columnar_results, resource_trigger, number_of_bases, _), results_lengths) in \
+                enumerate(zip(results, lengths)):
+            end = start + len(results_lengths)
+            # Token numbers of the results set to the token numbers of the matrix
+            token_map = np.array([token_numbers[get_token_name(token)] for token in columnar_results.dictionary],
+                                 dtype=np.int8)
+            rows = np.repeat(np.arange(start, end), results_lengths)
+            offsets = np.asarray(columnar_results.offsets)
+            steps = np.arange(offsets[-1]) - np.repeat(offsets[:-1], results_lengths)
+            self.token_matrix[rows, steps] = token_map[np.asarray(columnar_results.tokens)]
+
+            self.lengths[start:end] = results_lengths
+            self.final_times[start:end] = columnar_results.final_times
+            self.resource_triggers[start:end] = resource_trigger
+            self.numbers_of_bases[start:end] = number_of_bases
+            self.sources[start:end] = source
+            start = end
+
+        self.finished = self.final_times != TIMED_OUT_TIME
+        # Prefix length to the prefix key of every build order
+        self.prefix_keys = {0: np.zeros(number_of_rows, dtype=np.int64)}
+
+    @classmethod
+    def from_columnar_directory(cls, columnar_directory: str):
+        """
+        Load every columnar results directory written by convert_results_directory, including the legacy runs. The
+        resource trigger and number of bases are read from the directory names, and directories with names that do not
+        match are left out.
+
+        :param columnar_directory: str: The directory with the columnar results directories
+        :return: ResultsAnalytics: The analytics over all the results
+        """
+        results = []
+        for directory in [columnar_directory, os.path.join(columnar_directory, "legacy_runs")]:
+            if not os.path.isdir(directory):
+                continue
+            for directory_name in sorted(os.listdir(directory)):
+                file_settings = get_results_file_settings(directory_name)
+                if file_settings is None:
+                    continue
+                results.append([ColumnarResults(os.path.join(directory, directory_name)), *file_settings,
+                                directory_name])
+        return cls(results)
+
+    def __len__(self):
+        return len(self.final_times)
+
+    def get_token_numbers(self, order_name: str, base_number=None) -> list:
+        """
+        Get the token numbers of an order type, on one base or any base.
+
+        :param order_name: str: The order type name, for example "TEMPLE"
+        :param base_number: int: The base number, None for every base
+        :return: list: The token numbers
+        """
+        return [token_number for token_number, token_name in enumerate(self.token_names)
+                if token_name.split(" ")[0] == order_name and
+                (base_number is None or token_name == f"{order_name} {base_number}")]
+
+    def get_prefix_keys(self, prefix_length: int) -> np.ndarray:
+        """
+        Get the prefix key of every build order for the first prefix_length steps. Build orders that are shorter than
+        the prefix length have a key of their own, different from every longer build order.
+
+        :param prefix_length: int: The number of steps in the prefix
+        :return: np.ndarray: The int64 prefix key of each build order
+        :raises: ValueError: If the prefix is too long for the keys to fit in 64 bits
+        """
+        number_of_keys = len(self.token_names) + 1
+        if number_of_keys ** prefix_length >= np.iinfo(np.int64).max:
+            raise ValueError(f"Prefix length {prefix_length} is too long for the prefix keys")
+        for length in range(max(self.prefix_keys) + 1, prefix_length + 1):
+            # Each step adds a digit to the key, with the padding as 0
+            tokens = self.token_matrix[:, length - 1] if length <= self.token_matrix.shape[1] else PADDING_TOKEN
+            self.prefix_keys[length] = self.prefix_keys[length - 1] * number_of_keys + (tokens + 1)
+        return self.prefix_keys[prefix_length]
+
+    def get_first_step(self, order_name: str, base_number=None) -> np.ndarray:
+        """
+        Get the step each build order first has an order type on, for example the TEMPLE step.
+
+        :param order_name: str: The order type name, for example "TEMPLE"
+        :param base_number: int: The base number, None for every base
+        :return: np.ndarray: The step of each build order, starting at 1, 0 if the build order does not have the order
+        """
+        matches = np.isin(self.token_matrix, self.get_token_numbers(order_name, base_number))
+        return np.where(matches.any(axis=1), matches.argmax(axis=1) + 1, 0)
+
+    def get_mask(self, resource_trigger=None, number_of_bases=None, require_temple=False, prefix=None,
+                 finished_only=True) -> np.ndarray:
+        """
+        Select build orders.
+
+        :param resource_trigger: int: Only the results with this resource trigger, None for every one
+        :param number_of_bases: int: Only the results with this number of bases, None for every one
+        :param require_temple: bool: Only the build orders with a TEMPLE
+        :param prefix: str: Only the build orders that start with this build order string, for example
+            "SUPPLY 1, SUPPLY 1, ". None for every build order
+        :param finished_only: bool: Only the build orders that did not time out
+        :return: np.ndarray: True for each selected build order
+        """
+        mask = self.finished.copy() if finished_only else np.ones(len(self), dtype=bool)
+        if resource_trigger is not None:
+            mask &= self.resource_triggers == resource_trigger
+        if number_of_bases is not None:
+            mask &= self.numbers_of_bases == number_of_bases
+        if require_temple:
+            mask &= self.get_first_step("TEMPLE") > 0
+        if prefix is not None:
+            prefix_tokens = [get_token_name(token) for token in prefix.split(",") if token.strip()]
+            if any(token not in self.token_names for token in prefix_tokens):
+                return np.zeros(len(self), dtype=bool)
+            prefix_key = 0
+            for token in prefix_tokens:
+                prefix_key = prefix_key * (len(self.token_names) + 1) + self.token_names.index(token) + 1
+            mask &= self.get_prefix_keys(len(prefix_tokens)) == prefix_key
+        return mask
+
+    def get_build_order_string(self, index: int, number_of_steps=None) -> str:
+        """
+        Get a build order, or its first steps, in the same text format as build_order_print.
+
+        :param index: int: The build order index
+        :param number_of_steps: int: The number of steps to include, None for the whole build order
+        :return: str: The build order string
+        """
+        tokens = self.token_matrix[index, :self.lengths[index] if number_of_steps is None else number_of_steps]
+        return "".join([f"{self.token_names[token]}, " for token in tokens if token != PADDING_TOKEN])
+
+    def get_best(self, mask: np.ndarray, number_of_results=10) -> list:
+        """
+        Get the fastest selected build orders. Build orders that tie are in the order they were loaded in.
+
+        :param mask: np.ndarray: The selected build orders, from get_mask
+        :param number_of_results: int: The number of build orders to return
+        :return: list: [final time, build order string, source name] for each build order, fastest first
+        """
+        indexes = np.flatnonzero(mask & self.finished)
+        indexes = indexes[np.argsort(self.final_times[indexes], kind="stable")[:number_of_results]]
+        return [[int(self.final_times[index]), self.get_build_order_string(index),
+                 self.source_names[self.sources[index]]] for index in indexes]
+
+    def get_prefix_statistics(self, prefix_length: int, mask=None, quantiles=(0.5, 0.9), min_samples=1) -> list:
+        """
+        Get the final time statistics of every opening prefix of a length, over the selected build orders that did not
+        time out. Build orders shorter than the prefix length are grouped as a prefix of their own.
+
+        :param prefix_length: int: The number of steps in the prefixes
+        :param mask: np.ndarray: The selected build orders, from get_mask. None for every build order
+        :param quantiles: tuple: The quantiles between 0 and 1 to include, the lower nearest value of each
+        :param min_samples: int: Leave out the prefixes with fewer build orders than this
+        :return: list: [prefix string, sample count, min, mean, quantiles...] for each prefix, fastest min first, then
+            fastest mean
+        """
+        indexes = np.flatnonzero(self.finished if mask is None else mask & self.finished)
+        if not len(indexes):
+            return []
+        keys = self.get_prefix_keys(prefix_length)[indexes]
+        final_times = self.final_times[indexes]
+
+        # Sort by prefix, then final time, so each prefix is one run of sorted final times
+        order = np.lexsort((final_times, keys))
+        keys = keys[order]
+        final_times = final_times[order].astype(np.float64)
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        counts = np.diff(np.r_[starts, len(keys)])
+        minimums = final_times[starts]
+        means = np.add.reduceat(final_times, starts) / counts
+        quantile_values = [final_times[starts + np.floor(quantile * (counts - 1)).astype(np.int64)]
+                           for quantile in quantiles]
+
+        keep = np.flatnonzero(counts >= min_samples)
+        keep = keep[np.lexsort((means[keep], minimums[keep]))]
+        return [[self.get_build_order_string(indexes[order[starts[group]]], prefix_length), int(counts[group]),
+                 int(minimums[group]), float(means[group]), *[int(values[group]) for values in quantile_values]]
+                for group in keep]
+
+    def get_position_effects(self, mask=None, by_order_type=False) -> list:
+        """
+        Get the marginal effect of each order at each step on the final time, over the selected build orders that did
+        not time out. The effect is the mean final time of the build orders with the order at the step, less the mean
+        final time of every build order with any order at the step, so a negative effect goes with faster build orders.
+
+        :param mask: np.ndarray: The selected build orders, from get_mask. None for every build order
+        :param by_order_type: bool: Group the orders by order type only, instead of order type and base number
+        :return: list: [effects, counts, labels]. Effects and counts are arrays with a row per step and a column per
+            label, the effect is NaN where no build order has the order at the step
+        """
+        indexes = np.flatnonzero(self.finished if mask is None else mask & self.finished)
+        token_matrix = self.token_matrix[indexes]
+        final_times = self.final_times[indexes].astype(np.float64)
+
+        rows, steps = np.nonzero(token_matrix != PADDING_TOKEN)
+        tokens = token_matrix[rows, steps].astype(np.int64)
+        if by_order_type:
+            tokens = self.token_order_types[tokens].astype(np.int64)
+            labels = ORDER_TYPE_NAMES
+        else:
+            labels = self.token_names
+        number_of_steps = self.token_matrix.shape[1]
+        number_of_labels = len(labels)
+
+        cells = steps * number_of_labels + tokens
+        counts = np.bincount(cells, minlength=number_of_steps * number_of_labels)
+        sums = np.bincount(cells, weights=final_times[rows], minlength=number_of_steps * number_of_labels)
+        step_counts = np.bincount(steps, minlength=number_of_steps)
+        step_sums = np.bincount(steps, weights=final_times[rows], minlength=number_of_steps)
+
+        counts = counts.reshape(number_of_steps, number_of_labels)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            effects = sums.reshape(number_of_steps, number_of_labels) / counts - (step_sums / step_counts)[:, None]
+        effects[counts == 0] = np.nan
+        return [effects, counts, list(labels)]
@@ -11,6 +11,7 @@ import csv
 from libraries.BaseClass import Base
 from libraries.ResourceManager import ResourceManager
 from libraries.BaseConstants import *
+from libraries.TraceRecorder import TraceEvent, get_print_mode_recorder
 
 
 class RuntimeBuildingBlocks:
@@ -23,64 +24,26 @@ class RuntimeBuildingBlocks:
 
     Args:
         resource_manager (ResourceManager): The resource manager instance that handles the resources
-        print_mode (bool): If print mode on, print out the debugging messages and more details
+        trace_recorder (TraceRecorder): The recorder TracedRuntimeBuildingBlocks records the debug trace events of the
+            build orders in. RuntimeBuildingBlocks itself never records anything, use make_runtime_building_blocks to
+            get a TracedRuntimeBuildingBlocks when there is a recorder
 
     """
-    def __init__(self, resource_manager: ResourceManager, print_mode=True):
+    def __init__(self, resource_manager: ResourceManager, trace_recorder=None):
 
         self.resource_manager = resource_manager
-        self.print_mode = print_mode
-
-    def _build_order_helper(self, build_request_result: BuildResult, base: Base, order: Orders) -> BuildOrderResults:
-        """
-        Generic check that can be used for new build orders and a helper class for the build verifier.
-
-        :param build_request_result: BuildResult The build result form the build
-        :param base: Base: The base that is being passed on
-        :return: BuildOrderResults: The results of the build order
-
-        """
-        # If build request has bene approved, then ready,
-        if build_request_result == BuildResult.APPROVED:
-            if self.print_mode:
-                print(f"Build approved: {order}")
-            return BuildOrderResults.APPROVED
-
-        # If not enough resources, loop again until there is enough
-        if build_request_result == BuildResult.NOT_ENOUGH_RESOURCES:
-            # Check to ensure there are supply pads to actually make more supplies, or at least one is being built. If
-            # not enough money and no supply pads, skip
-            if not self.resource_manager.is_supply_pad_built_or_being_built():
-                if self.print_mode:
-                    print(f"Not enough resources to build, and no supply pads detected... skipping  {order}")
-                return BuildOrderResults.SKIPPED
-
-            if self.print_mode:
-                print(f"WAITING for more resources to build: {order}")
-            return BuildOrderResults.WAITING
-
-        # Ensure there is enough tech level
-        if build_request_result == BuildResult.NOT_ENOUGH_TECH:
-            if self.print_mode:
-                print(f"Not enough tech level for build order: {order}")
-            return BuildOrderResults.SKIPPED
-
-        # If the base is not upgraded enough, check if it is upgrading. If it is, loop, if not, cancel
-        if build_request_result == BuildResult.BASE_NOT_UPGRADED_ENOUGH:
-            if base.base_status == BaseState.UPGRADING:
-                if self.print_mode:
-                    print(f"WAITING for base to upgrade: {order}")
-                return BuildOrderResults.WAITING
-            else:
-                # if not upgrading, skip this build
-                if self.print_mode:
-                    print(f"Skipping build order since not enough build slots: {order}")
-                return BuildOrderResults.SKIPPED
-
-        # All other scenarios, skip
-        if self.print_mode:
-            print(f"Edge case scenario, skipping: {order} {build_request_result}")
-        return BuildOrderResults.SKIPPED
+        self.trace_recorder = trace_recorder
+        # How the last run_simulation or run_simulation_event_driven call ended
+        self.last_simulation_outcome = None
+        # Where the build orders were when the last run reached the resource amount or timed out: the index of the
+        # current build order, the result of the order tried in the last game tick (None if no order was tried), and
+        # the game tick each order before the index was approved or skipped on
+        self.last_order_index = None
+        self.last_order_result = None
+        self.last_order_times = []
+        # The game tick each of the lower resource thresholds of the last run was reached on, in order, for the ones
+        # that were reached
+        self.last_threshold_times = []
 
     def build_verifier(self, order: Orders, base: Base, slot: SlotNumbers) -> BuildOrderResults:
         """
@@ -100,134 +63,454 @@ class RuntimeBuildingBlocks:
         :return: BuildOrderResults: The final outcome of the build order, if it is Approved, waiting, skipped, etc
         """
         if order == Orders.UPGRADE_BASE:
-            result = base.upgrade_base()
+            build_result = base.upgrade_base()
+        elif order == Orders.BUILD_SUPPLY_PAD:
+            build_result = base.build_supply_pad(build_slot_name=slot.value)
+        elif order == Orders.BUILD_TEMPLE:
+            build_result = base.build_temple(build_slot_name=slot.value)
+        elif order == Orders.UPGRADE_SUPPLY_PAD:
+            build_result = base.upgrade_supply_pad(build_slot_name=slot.value)
+        else:
+            build_result = None
+        return self._get_order_result(order, base, slot, build_result)
+
+    def _get_order_result(self, order: Orders, base: Base, slot: SlotNumbers,
+                          build_result: BuildResult) -> BuildOrderResults:
+        """
+        Helper for the build verifier, decides if the build order was approved, has to wait or is skipped from the
+        result of the build attempt.
+
+        :param order: Orders: The Order enum of the build order
+        :param base: Base: The base the order was performed on
+        :param slot: SlotNumbers: The slot on the base the order was performed on
+        :param build_result: BuildResult: The result of the build attempt, None if the order is not an Orders value
+        :return: BuildOrderResults: The results of the build order
+        """
+        if build_result is None:
+            return BuildOrderResults.SKIPPED
+
+        if order == Orders.UPGRADE_BASE:
             # Check if the building is paused, check to ensure the temple needed flag is on or not. If it is, and not
             # is being built, this command will have to be skipped
-            if result == BuildResult.PAUSED:
+            if build_result == BuildResult.PAUSED and base.temple_needed_to_clear_second_base:
                 # if a temple count is needed, and the building is paused, ensure a temple is being built, if so wait,
                 # if not skip
-                if base.temple_needed_to_clear_second_base:
-                    if self.resource_manager.current_temple_count > 0:
-                        return BuildOrderResults.WAITING
-                    # If here, waiting for temple but no temple is being built, skip
-                    else:
-                        if self.print_mode:
-                            print(f"temple_needed_to_clear_second_base set to TRUE but no temple being made needed for "
-                                  f"subsequent base unpause, skipping: {order}")
-                        return BuildOrderResults.SKIPPED
+                if self.resource_manager.current_temple_count > 0:
+                    return BuildOrderResults.WAITING
+                return BuildOrderResults.SKIPPED
 
             # Check if the building is busy, if so wait for it to finish
-            if result == BuildResult.BUILDING_BUSY:
-                if self.print_mode:
-                    print(f"Building currently busy: {order}")
+            if build_result == BuildResult.BUILDING_BUSY:
                 return BuildOrderResults.WAITING
 
-            return self._build_order_helper(build_request_result=result, order=order, base=base)
-
-        elif order == Orders.BUILD_SUPPLY_PAD:
-            result = base.build_supply_pad(build_slot_name=slot.value)
-            return self._build_order_helper(build_request_result=result, order=order, base=base)
-
         elif order == Orders.BUILD_TEMPLE:
-            result = base.build_temple(build_slot_name=slot.value)
-
             # Check if Temple has already been built, if it has been, skip
-            if result == BuildResult.ALREADY_BUILT:
-                if self.print_mode:
-                    print(f"Temple already built, skipping order: {order}")
+            if build_result == BuildResult.ALREADY_BUILT:
                 return BuildOrderResults.SKIPPED
 
-            return self._build_order_helper(build_request_result=result, order=order, base=base)
-
         elif order == Orders.UPGRADE_SUPPLY_PAD:
-            result = base.upgrade_supply_pad(build_slot_name=slot.value)
             # check the tech level, if a temple is being built, then wait
-            if result == BuildResult.NOT_ENOUGH_TECH:
+            if build_result == BuildResult.NOT_ENOUGH_TECH:
                 # if there is a temple but no tech, temple is being made, wait for it
                 if self.resource_manager.current_temple_count == 1:
-                    if self.print_mode:
-                        print(f"WAITING for temple to finish: {order}")
                     return BuildOrderResults.WAITING
-                else:
-                    if self.print_mode:
-                        print(f"NO temple for tech level, skipping build order: {order}")
-                    return BuildOrderResults.SKIPPED
+                return BuildOrderResults.SKIPPED
 
             # Check if the supply pad is currently being built
-            if result == BuildResult.BUILD_IN_PROGRESS:
-                if self.print_mode:
-                    print(f"WAITING for supply pad to finish building: {order}")
+            if build_result == BuildResult.BUILD_IN_PROGRESS:
                 return BuildOrderResults.WAITING
 
-            return self._build_order_helper(build_request_result=result, order=order, base=base)
+        # If build request has bene approved, then ready,
+        if build_result == BuildResult.APPROVED:
+            return BuildOrderResults.APPROVED
 
-        else:
-            if self.print_mode:
-                print("Not selected")
+        # If not enough resources, loop again until there is enough
+        if build_result == BuildResult.NOT_ENOUGH_RESOURCES:
+            # Check to ensure there are supply pads to actually make more supplies, or at least one is being built. If
+            # not enough money and no supply pads, skip
+            if not self.resource_manager.is_supply_pad_built_or_being_built():
+                return BuildOrderResults.SKIPPED
+            return BuildOrderResults.WAITING
+
+        # Ensure there is enough tech level
+        if build_result == BuildResult.NOT_ENOUGH_TECH:
             return BuildOrderResults.SKIPPED
 
+        # If the base is not upgraded enough, check if it is upgrading. If it is, loop, if not, cancel
+        if build_result == BuildResult.BASE_NOT_UPGRADED_ENOUGH:
+            if base.base_status == BaseState.UPGRADING:
+                return BuildOrderResults.WAITING
+            # if not upgrading, skip this build
+            return BuildOrderResults.SKIPPED
+
+        # All other scenarios, skip
+        return BuildOrderResults.SKIPPED
+
     def run_simulation(self, build_orders: list[list], resource_amount: int, simulation_time_max: int,
-                       base_list: list[Base], fine_debug=True) -> int:
+                       base_list: list[Base], fine_debug=True, cutoff_time=None, timeline=None,
+                       resource_thresholds=None) -> int:
         """
-        The method used to execute a simulation run. Contains the main loop, which checks the build can be done, the
-        build orders are approved, or skipped, updates the bases and the resource manager, checks the exit conditions,
-        and has the main state machine of the game.
+        The method used to execute a simulation run, one game tick at a time. The main loop is _run_ticks, which checks
+        the build can be done, the build orders are approved, or skipped, updates the bases and the resource manager,
+        checks the exit conditions, and has the main state machine of the game.
 
         :param build_orders: list[list]: Total build orders in list format
         :param resource_amount: int: Number of resources to hit before reporting results
         :param simulation_time_max: int: Maximum time for simulation to run before timeout
         :param base_list: list[Base]: List of bases currently in simulation
         :param fine_debug: bool: If the debug print out values are desired
-        :return: int: The final time it took to reach the desired number of resources
+        :param cutoff_time: int: Stop the simulation as soon as it can no longer reach the resource amount before this
+            time, for example the best time found so far. None to always run to the end
+        :param timeline: SimulationTimeline: Records the money, supply pads and events of every second, None to not
+            record them
+        :param resource_thresholds: list[int]: Sorted amounts of resources below the resource amount. The game tick
+            each one is reached on is saved in last_threshold_times, in the same simulation. None for no thresholds
+        :return: int: The final time it took to reach the desired number of resources, None if it timed out or was
+            stopped at the cutoff time, see last_simulation_outcome
+        """
+        return self._run_simulation(build_orders=build_orders, resource_amount=resource_amount,
+                                    simulation_time_max=simulation_time_max, base_list=base_list, event_driven=False,
+                                    fine_debug=fine_debug, cutoff_time=cutoff_time, timeline=timeline,
+                                    resource_thresholds=resource_thresholds)
+
+    def _note_thresholds(self, resource_thresholds: list[int], threshold_index: int, resource_amount: int,
+                         simulation_time: int) -> tuple[int, int]:
+        """
+        Helper for the simulations to save the game tick of every resource threshold the money has reached.
+
+        :param resource_thresholds: list[int]: The sorted resource thresholds
+        :param threshold_index: int: The index of the first threshold not reached before this game tick
+        :param resource_amount: int: Number of resources the simulation stops at
+        :param simulation_time: int: The game tick
+        :return: tuple[int, int]: The index of the first threshold not reached yet, and the next amount of money to note
+            or stop at
+        """
+        money = self.resource_manager.current_money
+        while threshold_index < len(resource_thresholds) and money >= resource_thresholds[threshold_index]:
+            self.last_threshold_times.append(simulation_time)
+            threshold_index += 1
+        if threshold_index < len(resource_thresholds):
+            return threshold_index, resource_thresholds[threshold_index]
+        return threshold_index, resource_amount
+
+    def _run_simulation(self, build_orders: list[list], resource_amount: int, simulation_time_max: int,
+                        base_list: list[Base], event_driven: bool, fine_debug: bool, cutoff_time, timeline,
+                        resource_thresholds) -> int:
         """
-        # 'i' is used to increment through the build orders. Simulation time always updates
-        i = 0
-        simulation_time = 0
+        Helper for run_simulation and run_simulation_event_driven, runs the build orders from game tick 0 with
+        _run_ticks and reports how the simulation ended.
+
+        :param build_orders: list[list]: Total build orders in list format
+        :param resource_amount: int: Number of resources to hit before reporting results
+        :param simulation_time_max: int: Maximum time for simulation to run before timeout
+        :param base_list: list[Base]: List of bases currently in simulation
+        :param event_driven: bool: Jump over the game ticks where nothing happens
+        :param fine_debug: bool: If the debug print out values are desired
+        :param cutoff_time: int: The time the simulation has to be able to beat, None to always run to the end
+        :param timeline: SimulationTimeline: Records every second, None to not record them
+        :param resource_thresholds: list[int]: Sorted amounts of resources below the resource amount, None for none
+        :return: int: The final time, None if it timed out or was stopped at the cutoff time
+        """
+        if timeline is not None:
+            timeline.start(base_list)
+        self.last_order_times = []
+        self.last_threshold_times = []
+        i, simulation_time, outcome, result = self._run_ticks(build_orders=build_orders, i=0, simulation_time=0,
+                                                              resource_amount=resource_amount,
+                                                              simulation_time_max=simulation_time_max,
+                                                              base_list=base_list, event_driven=event_driven,
+                                                              cutoff_time=cutoff_time, timeline=timeline,
+                                                              resource_thresholds=resource_thresholds)
+
+        if fine_debug:
+            if outcome == SimulationOutcome.REACHED:
+                minutes = math.floor(simulation_time / 60)
+                print(f"FINAL: Reached {resource_amount} resources in {simulation_time} seconds or "
+                      f"{minutes} minutes, {simulation_time % 60} seconds")
+            elif outcome == SimulationOutcome.ABORTED:
+                print(f"ABORTED: Cannot reach {resource_amount} resources before {cutoff_time} seconds, stopped at "
+                      f"{simulation_time} seconds")
+            else:
+                # If at this point, simulation time has maxed out, report results
+                print(f"MAX SIM TIME: Reached {resource_amount} resources in {simulation_time} seconds")
+
+        self.last_simulation_outcome = outcome
+        if outcome == SimulationOutcome.ABORTED:
+            self.last_order_index = None
+            self.last_order_result = None
+        else:
+            self.last_order_index = i
+            self.last_order_result = result
+        if outcome == SimulationOutcome.REACHED:
+            return simulation_time
+        return None
+
+    def _run_ticks(self, build_orders: list[list], i: int, simulation_time: int, resource_amount: int,
+                   simulation_time_max: int, base_list: list[Base], event_driven: bool, single_order=False,
+                   cutoff_time=None, timeline=None, resource_thresholds=None) -> tuple:
+        """
+        The main loop of every simulation. Each game tick the current build order is tried, the bases and the resource
+        manager are updated, and the exit conditions are checked. In the event driven simulation, a game tick where no
+        build order was approved or skipped is followed by a jump over every game tick where nothing happens.
+
+        :param build_orders: list[list]: Total build orders in list format
+        :param i: int: The index of the current build order
+        :param simulation_time: int: The game tick to start at
+        :param resource_amount: int: Number of resources to hit before reporting results
+        :param simulation_time_max: int: Maximum time for simulation to run before timeout
+        :param base_list: list[Base]: List of bases currently in simulation
+        :param event_driven: bool: Jump over the game ticks where nothing happens
+        :param single_order: bool: Stop at the end of the game tick build order i is approved or skipped on
+        :param cutoff_time: int: Stop the simulation as soon as it can no longer reach the resource amount before this
+            time. None to always run to the end
+        :param timeline: SimulationTimeline: Records the money, supply pads and events of every second, None to not
+            record them
+        :param resource_thresholds: list[int]: Sorted amounts of resources below the resource amount, the game tick
+            each one is reached on is saved in last_threshold_times. None for no thresholds
+        :return: tuple: The index of the next build order, the game tick the simulation stopped at (the final time if
+            the resource amount was reached), the SimulationOutcome (None if it stopped after build order i with
+            single_order) and the result of the order tried in the last game tick (None if no order was tried)
+        """
+        max_income_per_second = None
+        if cutoff_time is not None:
+            max_income_per_second = self.get_max_income_per_second(build_orders=build_orders, i=i, base_list=base_list)
+        result = None
+        # The thresholds from threshold_index on have not been reached yet. next_resource_amount is the next amount
+        # of money to note or to stop at
+        if resource_thresholds is None:
+            resource_thresholds = ()
+        threshold_index = 0
+        next_resource_amount = resource_thresholds[0] if resource_thresholds else resource_amount
+        # Looked up once, since it is called every game tick
+        try_order = self._try_order
         # Main simulation loop
         while simulation_time < simulation_time_max:
-            if i < len(build_orders):
-                result = self.build_verifier(order=build_orders[i][0],
-                                             base=build_orders[i][1],
-                                             slot=build_orders[i][2])
-
-                # If result has been approved or skipped, increment counter build order, otherwise continue
-                if result == BuildOrderResults.APPROVED:
-                    i += 1
-                # If a build order has been permanently skipped, write over it in the report log
-                elif result == BuildOrderResults.SKIPPED:
-                    build_orders[i][0] = "SKIPPED"
-                    i += 1
+            if cutoff_time is not None and self.resource_manager.current_money + \
+                    max_income_per_second * (cutoff_time - simulation_time) < resource_amount:
+                return i, simulation_time, SimulationOutcome.ABORTED, result
+
+            result = try_order(build_orders, i, simulation_time, timeline)
+            # If result has been approved or skipped, increment counter build order, otherwise continue
+            if result == BuildOrderResults.APPROVED:
+                i += 1
+            elif result == BuildOrderResults.SKIPPED:
+                i += 1
+                # A skipped supply pad or upgrade lowers the most money a second there can be
+                if cutoff_time is not None:
+                    max_income_per_second = self.get_max_income_per_second(build_orders=build_orders, i=i,
+                                                                           base_list=base_list)
+            elif event_driven:
+                # Nothing was approved or skipped, so jump over all the ticks where nothing happens
+                quiet_ticks = min(self._get_quiet_ticks(build_orders=build_orders,
+                                                        i=i,
+                                                        resource_amount=next_resource_amount,
+                                                        base_list=base_list),
+                                  simulation_time_max - simulation_time)
+                if quiet_ticks > 0:
+                    for base in base_list:
+                        base.skip_ticks(quiet_ticks)
+                    if timeline is not None:
+                        timeline.record_quiet_seconds(simulation_time, quiet_ticks, self.resource_manager)
+                    self.resource_manager.current_money = self.resource_manager.money_after_seconds(quiet_ticks)
+                    simulation_time = simulation_time + quiet_ticks
+                    continue
 
             # Update the bases every cycle
             for base in base_list:
                 base.update()
             self.resource_manager.update()
+            if timeline is not None:
+                timeline.record_second(simulation_time, self.resource_manager, base_list)
 
-            # Extra debug print output
-            # print(f"Sim time: {simulation_time} {output}")
+            if self.resource_manager.current_money >= next_resource_amount and \
+                    threshold_index < len(resource_thresholds):
+                threshold_index, next_resource_amount = self._note_thresholds(resource_thresholds, threshold_index,
+                                                                              resource_amount, simulation_time)
 
             # Check exit condition if the resources have exceeded resource amount
             if self.resource_manager.current_money >= resource_amount:
-                minutes = math.floor(simulation_time / 60)
+                return i, simulation_time, SimulationOutcome.REACHED, result
 
-                if fine_debug:
-                    print(f"FINAL: Reached {resource_amount} resources in {simulation_time} seconds or "
-                          f"{minutes} minutes, {simulation_time % 60} seconds")
+            simulation_time = simulation_time + 1
+            if single_order and (result == BuildOrderResults.APPROVED or result == BuildOrderResults.SKIPPED):
+                return i, simulation_time, None, result
 
-                if self.print_mode:
-                    for base in base_list:
-                        base.print_base()
+        return i, simulation_time, SimulationOutcome.TIMED_OUT, result
 
-                return simulation_time
+    def _try_order(self, build_orders: list[list], i: int, simulation_time: int, timeline) -> BuildOrderResults:
+        """
+        Helper for the simulation loop, tries the current build order at the start of a game tick. A skipped build
+        order is written over with SKIPPED, and the game tick an order is approved or skipped on is added to
+        last_order_times.
 
-            simulation_time = simulation_time + 1
+        :param build_orders: list[list]: Total build orders in list format
+        :param i: int: The index of the current build order
+        :param simulation_time: int: The game tick
+        :param timeline: SimulationTimeline: Records the approved and skipped orders, None to not record them
+        :return: BuildOrderResults: The result of the build order, None if there are no build orders left
+        """
+        if i >= len(build_orders):
+            return None
+        build_order = build_orders[i]
+        result = self.build_verifier(build_order[0], build_order[1], build_order[2])
+        if timeline is not None:
+            timeline.record_order(simulation_time, result, build_order)
+
+        if result == BuildOrderResults.APPROVED:
+            self.last_order_times.append(simulation_time)
+        # If a build order has been permanently skipped, write over it in the report log
+        elif result == BuildOrderResults.SKIPPED:
+            build_order[0] = "SKIPPED"
+            self.last_order_times.append(simulation_time)
+        return result
+
+    def get_max_income_per_second(self, build_orders: list[list], i: int, base_list: list[Base]) -> float:
+        """
+        Optimistic estimate of the most money a second the simulation could ever make from now on. Every supply pad
+        being built and every supply pad order left is counted as if it was done right away, and upgraded if there are
+        enough supply pad upgrades being done or left in the build orders. The supply pad equation is used without any
+        flooring, so the estimate is never lower than the real money a second.
 
-        if fine_debug:
-            # If at this point, simulation time has maxed out, report results
-            print(f"MAX SIM TIME: Reached {resource_amount} resources in {simulation_time} seconds")
-        if self.print_mode:
-            for base in base_list:
-                base.print_base()
+        The money a second can go down with more supply pads once there are a lot of heavy supply pads, so the most for
+        any number of supply pads from the current number up to the most there could be is used.
+
+        :param build_orders: list[list]: Total build orders in list format
+        :param i: int: The index of the current build order
+        :param base_list: list[Base]: List of bases currently in simulation
+        :return: float: The most money a second there could be
+        """
+        supply_pads = self.resource_manager.supply_pad_lite_quantity + self.resource_manager.supply_pad_heavy_quantity
+        most_supply_pads = supply_pads
+        most_heavy_supply_pads = self.resource_manager.supply_pad_heavy_quantity
+        for base in base_list:
+            for slot in base.build_slots.values():
+                if slot.build_type == BuildSlotType.SUPPLY_PAD:
+                    if slot.status == BuildSlotState.IDLE or slot.status == BuildSlotState.BUILDING:
+                        most_supply_pads += 1
+                    elif slot.status == BuildSlotState.UPGRADING:
+                        most_heavy_supply_pads += 1
+        # Skipped orders are marked with "SKIPPED" and are left out
+        for order in build_orders[i:]:
+            if order[0] == Orders.BUILD_SUPPLY_PAD:
+                most_supply_pads += 1
+            elif order[0] == Orders.UPGRADE_SUPPLY_PAD:
+                most_heavy_supply_pads += 1
+
+        max_income_per_second = 0
+        for supply_pad_quantity in range(supply_pads, most_supply_pads + 1):
+            heavy_quantity = min(supply_pad_quantity, most_heavy_supply_pads)
+            max_income_per_second = max(max_income_per_second,
+                                        ResourceManager.calculate_unfloored_supply_rate(
+                                            supply_pad_quantity - heavy_quantity, heavy_quantity))
+        return max_income_per_second
+
+    @staticmethod
+    def get_order_cost(order: Orders, base: Base) -> int:
+        """
+        Helper method to get the amount of resources a build order will cost when it is approved.
+
+        :param order: Orders: The Order enum that is to be performed
+        :param base: Base: The base that is going to receive the order
+        :return: int: The cost of the order, or None if the order has no cost (already max level base, skipped, etc)
+        """
+        if order == Orders.BUILD_SUPPLY_PAD:
+            return SUPPLY_PAD_COST
+        elif order == Orders.BUILD_TEMPLE:
+            return TEMPLE_COST
+        elif order == Orders.UPGRADE_SUPPLY_PAD:
+            return SUPPLY_PAD_UPGRADE_COST
+        elif order == Orders.UPGRADE_BASE and base.base_upgrade_level != BaseLevel.CITADEL:
+            return base.get_next_build_cost()
+        return None
+
+    def _get_quiet_ticks(self, build_orders: list[list], i: int, resource_amount: int, base_list: list[Base]) -> int:
+        """
+        Helper for the event driven simulation. Called at the start of a game tick where the current build order is
+        WAITING (or there are no build orders left), and finds how many game ticks in a row, starting with this one,
+        will do nothing but count timers down and add money. None of these ticks can approve or skip a build order,
+        finish a build or upgrade, change a build queue or reach the resource amount.
+
+        :param build_orders: list[list]: Total build orders in list format
+        :param i: int: The index of the current build order
+        :param resource_amount: int: Number of resources to hit before reporting results
+        :param base_list: list[Base]: List of bases currently in simulation
+        :return: int: The number of quiet ticks, can be 0
+        """
+        quiet_ticks = math.inf
+        for base in base_list:
+            quiet_ticks = min(quiet_ticks, base.get_quiet_ticks())
+            if quiet_ticks == 0:
+                return 0
+
+        # The money after each of the quiet ticks has to stay under the resource amount
+        quiet_ticks = min(quiet_ticks, self.resource_manager.seconds_until_money(resource_amount) - 1)
+
+        # If the waiting order might be waiting on money, the first tick with enough money has to be simulated
+        if i < len(build_orders):
+            order_cost = self.get_order_cost(order=build_orders[i][0], base=build_orders[i][1])
+            if order_cost is not None and self.resource_manager.current_money < order_cost:
+                quiet_ticks = min(quiet_ticks, self.resource_manager.seconds_until_money(order_cost))
+
+        return max(quiet_ticks, 0)
+
+    def run_simulation_event_driven(self, build_orders: list[list], resource_amount: int, simulation_time_max: int,
+                                    base_list: list[Base], fine_debug=True, cutoff_time=None,
+                                    timeline=None, resource_thresholds=None) -> int:
+        """
+        Event driven version of the run_simulation method. Instead of stepping through every in game second, when the
+        current build order is WAITING (or all build orders are done) it jumps straight to the next in game second
+        where something can happen: a build or upgrade finishing, a pause timer running out, the money reaching the
+        cost of the waiting build order or the money reaching the next resource threshold or the resource amount.
+
+        The seconds that are jumped over would only have counted timers down and added the same amount of money every
+        second, so the final time is the same as run_simulation.
+
+        :param build_orders: list[list]: Total build orders in list format
+        :param resource_amount: int: Number of resources to hit before reporting results
+        :param simulation_time_max: int: Maximum time for simulation to run before timeout
+        :param base_list: list[Base]: List of bases currently in simulation
+        :param fine_debug: bool: If the debug print out values are desired
+        :param cutoff_time: int: Stop the simulation as soon as it can no longer reach the resource amount before this
+            time, for example the best time found so far. None to always run to the end
+        :param timeline: SimulationTimeline: Records the money, supply pads and events of every second, None to not
+            record them
+        :param resource_thresholds: list[int]: Sorted amounts of resources below the resource amount. The game tick
+            each one is reached on is saved in last_threshold_times, in the same simulation. None for no thresholds
+        :return: int: The final time it took to reach the desired number of resources, None if it timed out or was
+            stopped at the cutoff time, see last_simulation_outcome
+        """
+        return self._run_simulation(build_orders=build_orders, resource_amount=resource_amount,
+                                    simulation_time_max=simulation_time_max, base_list=base_list, event_driven=True,
+                                    fine_debug=fine_debug, cutoff_time=cutoff_time, timeline=timeline,
+                                    resource_thresholds=resource_thresholds)
+
+    def run_next_order(self, build_orders: list[list], i: int, simulation_time: int, resource_amount: int,
+                       simulation_time_max: int, base_list: list[Base]) -> tuple[int, int, bool]:
+        """
+        Resumable piece of the event driven simulation. Starting at the beginning of game tick simulation_time with
+        build order i as the current order, run until build order i has been approved or skipped, the resource amount
+        has been reached, or the simulation time has maxed out. If there are no build orders left, run until the
+        resource amount is reached or the time maxes out.
+
+        Calling this once for every build order gives the same final time as run_simulation_event_driven, but the
+        simulation can be copied in between, so build orders that start the same only simulate the start once. The game
+        tick each order is approved or skipped on is added to last_order_times.
+
+        :param build_orders: list[list]: Total build orders in list format
+        :param i: int: The index of the current build order
+        :param simulation_time: int: The game tick to start at
+        :param resource_amount: int: Number of resources to hit before reporting results
+        :param simulation_time_max: int: Maximum time for simulation to run before timeout
+        :param base_list: list[Base]: List of bases currently in simulation
+        :return: tuple[int, int, bool]: The index of the next build order, the game tick to continue from (or the final
+            time if the resource amount was reached), and True if the resource amount was reached
+        """
+        i, simulation_time, outcome, _ = self._run_ticks(build_orders=build_orders, i=i,
+                                                         simulation_time=simulation_time,
+                                                         resource_amount=resource_amount,
+                                                         simulation_time_max=simulation_time_max,
+                                                         base_list=base_list, event_driven=True, single_order=True)
+        return i, simulation_time, outcome == SimulationOutcome.REACHED
 
     @staticmethod
     def results_to_csv(result_list: list, output_file_path: str):
@@ -274,3 +557,110 @@ class RuntimeBuildingBlocks:
         print(f"final quickest results: {lowest_integer} seconds, orders: {corresponding_build_order}")
 
 
+class TracedRuntimeBuildingBlocks(RuntimeBuildingBlocks):
+    """
+    RuntimeBuildingBlocks that records the events of the build orders and sets the tick of the trace recorder, so the
+    simulation loops themselves never check for a recorder. Made by make_runtime_building_blocks when there is a
+    recorder.
+
+    """
+    def _get_order_result(self, order: Orders, base: Base, slot: SlotNumbers,
+                          build_result: BuildResult) -> BuildOrderResults:
+        """
+        Decide the result of the build order and record why it was approved, has to wait or was skipped.
+
+        :param order: Orders: The Order enum of the build order
+        :param base: Base: The base the order was performed on
+        :param slot: SlotNumbers: The slot on the base the order was performed on
+        :param build_result: BuildResult: The result of the build attempt, None if the order is not an Orders value
+        :return: BuildOrderResults: The results of the build order
+        """
+        result = super()._get_order_result(order, base, slot, build_result)
+        trace_recorder = self.trace_recorder
+        if build_result is None:
+            trace_recorder.record(TraceEvent.ORDER_NOT_SELECTED, detail=order)
+        elif (order == Orders.UPGRADE_BASE and build_result == BuildResult.PAUSED
+              and base.temple_needed_to_clear_second_base):
+            if result == BuildOrderResults.SKIPPED:
+                trace_recorder.record(TraceEvent.ORDER_SKIPPED_NO_TEMPLE_FOR_UNPAUSE, base.base_number, detail=order)
+        elif order == Orders.UPGRADE_BASE and build_result == BuildResult.BUILDING_BUSY:
+            trace_recorder.record(TraceEvent.ORDER_WAITING_BASE_BUSY, base.base_number, detail=order)
+        elif order == Orders.BUILD_TEMPLE and build_result == BuildResult.ALREADY_BUILT:
+            trace_recorder.record(TraceEvent.ORDER_SKIPPED_TEMPLE_ALREADY_BUILT, base.base_number, slot.value, order)
+        elif order == Orders.UPGRADE_SUPPLY_PAD and build_result == BuildResult.NOT_ENOUGH_TECH:
+            if result == BuildOrderResults.WAITING:
+                trace_recorder.record(TraceEvent.ORDER_WAITING_FOR_TEMPLE, base.base_number, slot.value, order)
+            else:
+                trace_recorder.record(TraceEvent.ORDER_SKIPPED_NO_TEMPLE, base.base_number, slot.value, order)
+        elif order == Orders.UPGRADE_SUPPLY_PAD and build_result == BuildResult.BUILD_IN_PROGRESS:
+            trace_recorder.record(TraceEvent.ORDER_WAITING_FOR_SUPPLY_PAD, base.base_number, slot.value, order)
+        elif build_result == BuildResult.APPROVED:
+            trace_recorder.record(TraceEvent.ORDER_APPROVED, base.base_number, detail=order)
+        elif build_result == BuildResult.NOT_ENOUGH_RESOURCES:
+            if result == BuildOrderResults.SKIPPED:
+                trace_recorder.record(TraceEvent.ORDER_SKIPPED_NO_SUPPLY_PADS, base.base_number, detail=order)
+            else:
+                trace_recorder.record(TraceEvent.ORDER_WAITING_FOR_RESOURCES, base.base_number, detail=order)
+        elif build_result == BuildResult.NOT_ENOUGH_TECH:
+            trace_recorder.record(TraceEvent.ORDER_SKIPPED_NOT_ENOUGH_TECH, base.base_number, detail=order)
+        elif build_result == BuildResult.BASE_NOT_UPGRADED_ENOUGH:
+            if result == BuildOrderResults.WAITING:
+                trace_recorder.record(TraceEvent.ORDER_WAITING_FOR_BASE_UPGRADE, base.base_number, detail=order)
+            else:
+                trace_recorder.record(TraceEvent.ORDER_SKIPPED_NO_BUILD_SLOT, base.base_number, detail=order)
+        else:
+            trace_recorder.record(TraceEvent.ORDER_SKIPPED_EDGE_CASE, base.base_number, detail=(order, build_result))
+        return result
+
+    def _try_order(self, build_orders: list[list], i: int, simulation_time: int, timeline) -> BuildOrderResults:
+        """
+        Set the tick of the trace recorder and try the current build order.
+
+        :param build_orders: list[list]: Total build orders in list format
+        :param i: int: The index of the current build order
+        :param simulation_time: int: The game tick
+        :param timeline: SimulationTimeline: Records the approved and skipped orders, None to not record them
+        :return: BuildOrderResults: The result of the build order, None if there are no build orders left
+        """
+        self.trace_recorder.tick = simulation_time
+        return super()._try_order(build_orders, i, simulation_time, timeline)
+
+    def _run_simulation(self, build_orders: list[list], resource_amount: int, simulation_time_max: int,
+                        base_list: list[Base], event_driven: bool, fine_debug: bool, cutoff_time, timeline,
+                        resource_thresholds) -> int:
+        """
+        Run the simulation, and print the bases at the end if the trace recorder prints its events.
+
+        :param build_orders: list[list]: Total build orders in list format
+        :param resource_amount: int: Number of resources to hit before reporting results
+        :param simulation_time_max: int: Maximum time for simulation to run before timeout
+        :param base_list: list[Base]: List of bases currently in simulation
+        :param event_driven: bool: Jump over the game ticks where nothing happens
+        :param fine_debug: bool: If the debug print out values are desired
+        :param cutoff_time: int: The time the simulation has to be able to beat, None to always run to the end
+        :param timeline: SimulationTimeline: Records every second, None to not record them
+        :param resource_thresholds: list[int]: Sorted amounts of resources below the resource amount, None for none
+        :return: int: The final time, None if it timed out or was stopped at the cutoff time
+        """
+        final_time = super()._run_simulation(build_orders, resource_amount, simulation_time_max, base_list,
+                                             event_driven, fine_debug, cutoff_time, timeline, resource_thresholds)
+        if self.trace_recorder.print_events:
+            for base in base_list:
+                base.print_base()
+        return final_time
+
+
+def make_runtime_building_blocks(resource_manager: ResourceManager, trace_recorder=None,
+                                 print_mode=None) -> RuntimeBuildingBlocks:
+    """
+    Make a RuntimeBuildingBlocks, or a TracedRuntimeBuildingBlocks when there is a trace recorder.
+
+    :param resource_manager: ResourceManager: The resource manager instance that handles the resources
+    :param trace_recorder: TraceRecorder: Records the debug trace events, None to not record anything
+    :param print_mode: bool: Deprecated, True is the same as a TraceRecorder with print_events on
+    :return: RuntimeBuildingBlocks: The new RuntimeBuildingBlocks
+    """
+    trace_recorder = get_print_mode_recorder(resource_manager, trace_recorder, print_mode)
+    if trace_recorder is None:
+        return RuntimeBuildingBlocks(resource_manager=resource_manager)
+    return TracedRuntimeBuildingBlocks(resource_manager=resource_manager, trace_recorder=trace_recorder)
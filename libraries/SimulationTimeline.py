@@ -0,0 +1,248 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Per second timeline of the economy of a simulation, and the build order approvals, skips and completions, for checking
+a build order against the game and plotting supply curves.
+
+"""
+import csv
+import os
+from array import array
+from enum import Enum
+
+from libraries.BaseConstants import BuildOrderResults, BuildSlotState
+from libraries.BuildSlotClasses import SupplyPad, Temple
+
+# The per second columns of the timeline, [name, array typecode] for each
+TIMELINE_COLUMNS = [
+    ["money", "q"],
+    ["income", "l"],
+    ["lite_supply_pads", "H"],
+    ["heavy_supply_pads", "H"],
+    ["tech_level", "B"],
+]
+# File name of the events when saving a timeline
+TIMELINE_EVENTS_FILE = "events.csv"
+# The states of a supply pad that has finished building
+_BUILT_SUPPLY_PAD_STATES = (BuildSlotState.BUILT, BuildSlotState.UPGRADING, BuildSlotState.UPGRADED)
+
+
+# The events of a timeline
+class TimelineEvent(Enum):
+    APPROVED = 0
+    SKIPPED = 1
+    SUPPLY_PAD_COMPLETE = 2
+    SUPPLY_PAD_UPGRADED = 3
+    TEMPLE_COMPLETE = 4
+    BASE_UPGRADED = 5
+
+
+class SimulationTimeline:
+    """
+    The SimulationTimeline has the money, income, lite and heavy supply pads and tech level at the end of every in game
+    second of a simulation, in typed arrays allocated once for the longest the simulation can run. The income of a
+    second is the money the ResourceManager added in that second.
+
+    The events are (second, TimelineEvent, base_number, slot, detail) tuples: the build order for APPROVED and SKIPPED,
+    the new BaseLevel for BASE_UPGRADED and None for the other completions.
+
+    RuntimeBuildingBlocks fills in the timeline while it simulates. The seconds the event driven simulation jumps over
+    are filled in all at once, since their income does not change. Completions are only looked for on the seconds the
+    supply pads, tech level or base levels changed, so recording costs little next to the simulation itself.
+
+    Args:
+        max_seconds (int): The longest the simulation can run, in in game seconds
+
+    """
+    def __init__(self, max_seconds: int):
+        self.max_seconds = max_seconds
+        self.columns = {name: array(typecode, bytes(array(typecode).itemsize * max_seconds))
+                        for name, typecode in TIMELINE_COLUMNS}
+        self.money = self.columns["money"]
+        self.income = self.columns["income"]
+        self.lite_supply_pads = self.columns["lite_supply_pads"]
+        self.heavy_supply_pads = self.columns["heavy_supply_pads"]
+        self.tech_level = self.columns["tech_level"]
+        self.events = []
+        # Number of seconds recorded
+        self.number_of_seconds = 0
+
+        # The supply pads, tech level and base levels at the last recorded second, to notice completions
+        self.last_state = None
+        self.last_base_levels = None
+        # (base index, slot name) to the BuildSlotState of each build slot at the last check
+        self.slot_states = {}
+
+    def __len__(self):
+        return self.number_of_seconds
+
+    def record_order(self, second: int, result: BuildOrderResults, build_order: list):
+        """
+        Add the event of a build order that was approved or skipped, nothing if it is waiting.
+
+        :param second: int: The in game second
+        :param result: BuildOrderResults: The result of build_verifier for the build order
+        :param build_order: list: The build order, [order, base, slot]
+        """
+        if result == BuildOrderResults.APPROVED:
+            event = TimelineEvent.APPROVED
+        elif result == BuildOrderResults.SKIPPED:
+            event = TimelineEvent.SKIPPED
+        else:
+            return
+        order, base, slot = build_order
+        self.events.append((second, event, base.base_number, slot.value if slot is not None else None, order))
+
+    def record_second(self, second: int, resource_manager, base_list: list):
+        """
+        Record the end of an in game second, after the bases and the resource manager are updated.
+
+        :param second: int: The in game second
+        :param resource_manager: ResourceManager: The resource manager of the simulation
+        :param base_list: list[Base]: The bases of the simulation
+        """
+        lite_quantity = resource_manager.supply_pad_lite_quantity
+        heavy_quantity = resource_manager.supply_pad_heavy_quantity
+        tech_level = resource_manager.current_tech_level
+        self.money[second] = resource_manager.current_money
+        self.income[second] = resource_manager.get_income(lite_quantity, heavy_quantity)
+        self.lite_supply_pads[second] = lite_quantity
+        self.heavy_supply_pads[second] = heavy_quantity
+        self.tech_level[second] = tech_level
+        self.number_of_seconds = second + 1
+
+        state = (lite_quantity, heavy_quantity, tech_level)
+        if state != self.last_state:
+            self.last_state = state
+            self._record_slot_completions(second, base_list)
+        for i, base in enumerate(base_list):
+            if base.base_upgrade_level is not self.last_base_levels[i]:
+                self.last_base_levels[i] = base.base_upgrade_level
+                self.events.append((second, TimelineEvent.BASE_UPGRADED, base.base_number, None,
+                                    base.base_upgrade_level))
+
+    def record_quiet_seconds(self, second: int, number_of_seconds: int, resource_manager):
+        """
+        Record the in game seconds the event driven simulation jumps over, before the money is added. Nothing but the
+        money changes in them.
+
+        :param second: int: The first in game second jumped over
+        :param number_of_seconds: int: The number of seconds jumped over
+        :param resource_manager: ResourceManager: The resource manager of the simulation
+        """
+        end = second + number_of_seconds
+        income = resource_manager.get_money_per_second()
+        money = resource_manager.current_money
+        if income > 0:
+            self.money[second:end] = array("q", range(money + income, money + income * number_of_seconds + 1, income))
+        else:
+            self.money[second:end] = array("q", [money]) * number_of_seconds
+        self.income[second:end] = array("l", [income]) * number_of_seconds
+        self.lite_supply_pads[second:end] = array("H", [resource_manager.supply_pad_lite_quantity]) * number_of_seconds
+        self.heavy_supply_pads[second:end] = array("H", [resource_manager.supply_pad_heavy_quantity]) * \
+            number_of_seconds
+        self.tech_level[second:end] = array("B", [resource_manager.current_tech_level]) * number_of_seconds
+        self.number_of_seconds = end
+
+    def start(self, base_list: list):
+        """
+        Note the starting base levels and supply pads, so only later changes are recorded as events.
+
+        :param base_list: list[Base]: The bases of the simulation
+        """
+        self.last_base_levels = [base.base_upgrade_level for base in base_list]
+        self.last_state = None
+        self.slot_states = {}
+        self._record_slot_completions(None, base_list)
+
+    def _record_slot_completions(self, second, base_list: list):
+        """
+        Add an event for every supply pad or temple that finished building or upgrading since it was last checked.
+
+        :param second: int: The in game second, None to only note the state of the slots
+        :param base_list: list[Base]: The bases of the simulation
+        """
+        slot_states = self.slot_states
+        for i, base in enumerate(base_list):
+            for slot_name, slot in base.build_slots.items():
+                # Empty slots have no resource manager
+                if slot.resource_manager is None:
+                    continue
+                status = slot.status
+                key = (i, slot_name)
+                last_status = slot_states.get(key)
+                if status is last_status:
+                    continue
+                slot_states[key] = status
+                if second is None:
+                    continue
+
+                if isinstance(slot, Temple):
+                    if status == BuildSlotState.BUILT:
+                        self.events.append((second, TimelineEvent.TEMPLE_COMPLETE, base.base_number, slot_name, None))
+                elif isinstance(slot, SupplyPad):
+                    if status in _BUILT_SUPPLY_PAD_STATES and last_status not in _BUILT_SUPPLY_PAD_STATES:
+                        self.events.append((second, TimelineEvent.SUPPLY_PAD_COMPLETE, base.base_number, slot_name,
+                                            None))
+                    if status == BuildSlotState.UPGRADED:
+                        self.events.append((second, TimelineEvent.SUPPLY_PAD_UPGRADED, base.base_number, slot_name,
+                                            None))
+
+    def get_column(self, name: str) -> array:
+        """
+        Get the recorded seconds of a column.
+
+        :param name: str: The column name, from TIMELINE_COLUMNS
+        :return: array: The values of each recorded second
+        """
+        return self.columns[name][:self.number_of_seconds]
+
+    def to_numpy(self) -> dict:
+        """
+        Get the recorded seconds of every column as NumPy arrays, without copying them.
+
+        :return: dict: Column name to NumPy array
+        """
+        import numpy as np
+
+        return {name: np.frombuffer(self.columns[name], dtype=np.dtype(typecode))[:self.number_of_seconds]
+                for name, typecode in TIMELINE_COLUMNS}
+
+    def save_npy(self, output_directory: str):
+        """
+        Save each column to <column name>.npy, and the events to TIMELINE_EVENTS_FILE.
+
+        :param output_directory: str: The directory to save to, made if it does not exist
+        """
+        import numpy as np
+
+        os.makedirs(output_directory, exist_ok=True)
+        for name, values in self.to_numpy().items():
+            np.save(os.path.join(output_directory, f"{name}.npy"), values)
+        self.save_events_csv(os.path.join(output_directory, TIMELINE_EVENTS_FILE))
+
+    def save_csv(self, output_file_path: str):
+        """
+        Save the columns to a csv file, one row per in game second.
+
+        :param output_file_path: str: The csv file to save to
+        """
+        with open(output_file_path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["second"] + [name for name, _ in TIMELINE_COLUMNS])
+            writer.writerows(zip(range(self.number_of_seconds),
+                                 *[self.get_column(name) for name, _ in TIMELINE_COLUMNS]))
+
+    def save_events_csv(self, output_file_path: str):
+        """
+        Save the events to a csv file.
+
+        :param output_file_path: str: The csv file to save to
+        """
+        with open(output_file_path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["second", "event", "base", "slot", "detail"])
+            for second, event, base_number, slot, detail in self.events:
+                writer.writerow([second, event.name, base_number, "" if slot is None else slot,
+                                 "" if detail is None else detail.name])
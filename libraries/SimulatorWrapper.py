@@ -5,10 +5,14 @@ March 19th, 2024
 Simulation Wrapper to take care of setting up a simulation for the user with all the correct objects and defaults.
 
 """
-from libraries.BaseClass import Base
+import copy
+
+from libraries.BaseClass import make_base
 from libraries.ResourceManager import ResourceManager
 from libraries.BaseConstants import BaseLevel
-from libraries.RuntimeBuildingBlocks import RuntimeBuildingBlocks
+from libraries.RuntimeBuildingBlocks import make_runtime_building_blocks
+from libraries.SimulationTimeline import SimulationTimeline
+from libraries.TraceRecorder import DEFAULT_TRACE_CAPACITY, TraceRecorder
 
 
 class SimulatorWrapper:
@@ -20,46 +24,154 @@ class SimulatorWrapper:
     Ultimately, Takes care of all the nitty gritty with setting up a simulation, and keeps track of specific objects,
     like the ResourceManger, base list, debug modes,etc.
 
+    With debug_mode the debug messages are printed as the simulation runs. With trace_capacity the last trace_capacity
+    events are only recorded in trace_recorder, cheap enough to trace a sample of the simulations of a run, and the
+    messages can be made afterwards with trace_recorder.get_messages.
+
     """
-    def __init__(self, starting_money: int, debug_mode=False, fine_debug=True):
+    def __init__(self, starting_money: int, debug_mode=False, fine_debug=True, event_driven=False, trace_capacity=0):
         self.resource_manager = ResourceManager()
         self.resource_manager.add_money(starting_money)
         self.debug_mode = debug_mode
         self.fine_debug = fine_debug
-        self.runtime_building_blocks = RuntimeBuildingBlocks(resource_manager=self.resource_manager,
-                                                             print_mode=debug_mode)
+        # Event driven simulations skip over the in game seconds where nothing happens, same results but faster
+        self.event_driven = event_driven
+        # Records the debug trace events, None when not debugging or tracing
+        self.trace_recorder = None
+        if debug_mode or trace_capacity > 0:
+            self.trace_recorder = TraceRecorder(resource_manager=self.resource_manager,
+                                                capacity=trace_capacity or DEFAULT_TRACE_CAPACITY,
+                                                print_events=debug_mode)
+        self.runtime_building_blocks = make_runtime_building_blocks(resource_manager=self.resource_manager,
+                                                                    trace_recorder=self.trace_recorder)
         self.base_list = []
+        # How the last run_simulation call ended, a SimulationOutcome
+        self.last_simulation_outcome = None
 
-    def add_base(self, upgrade_level: BaseLevel, base_number: int):
+    def add_base(self, upgrade_level: BaseLevel, base_number: int, pause_timer=0,
+                 temple_needed_to_clear_second_base=False):
         """
         Method to add a base to the simulation, to add before running the simulation. This is its own method since
         different bases and a different number of bases can be added later with different properties.
 
         :param upgrade_level: BaseLevel: Starting level of the base
         :param base_number: int: Base identification number
+        :param pause_timer: int: Starting pause timer of the base, the time it takes to clear the base before it can be
+            built. 0 for no pause
+        :param temple_needed_to_clear_second_base: bool: If a temple is needed for the pause timer to count down
         """
-        base_to_add = Base(resource_manager=self.resource_manager,
-                           upgrade_level=upgrade_level,
-                           print_mode=self.debug_mode,
-                           base_number=base_number)
+        base_to_add = make_base(resource_manager=self.resource_manager,
+                                upgrade_level=upgrade_level,
+                                trace_recorder=self.trace_recorder,
+                                base_number=base_number,
+                                pause_timer=pause_timer,
+                                temple_needed_to_clear_second_base=temple_needed_to_clear_second_base)
 
         self.base_list.append(base_to_add)
 
-    def run_simulation(self, build_order: list, resource_trigger: int, simulation_time_seconds: int) -> int:
+    def add_bases(self, number_of_bases: int, pause_timer=0, temple_needed_to_clear_second_base=False):
+        """
+        Add the starting bases of a scenario. The first base starts off as a KEEP, the others are empty and paused for
+        the pause timer. Only calls add_base, so BatchSimulator and CompiledSimulator share it.
+
+        :param number_of_bases: int: Number of bases to add, numbered from 1
+        :param pause_timer: int: Pause timer of every base after the first, 0 for no pause
+        :param temple_needed_to_clear_second_base: bool: If the pause timer of the bases after the first only counts
+            down once there is a tech level
+        """
+        for j in range(number_of_bases):
+            if j == 0:
+                self.add_base(upgrade_level=BaseLevel.KEEP, base_number=j + 1)
+            else:
+                self.add_base(upgrade_level=BaseLevel.EMPTY,
+                              base_number=j + 1,
+                              pause_timer=pause_timer,
+                              temple_needed_to_clear_second_base=temple_needed_to_clear_second_base)
+
+    def run_simulation(self, build_order: list, resource_trigger, simulation_time_seconds: int,
+                       cutoff_time=None, record_timeline=False):
         """
         Used to run the simulation. Primarily, provides the base list and debug attributes for the user.
 
+        With a sorted list of resource triggers, one simulation runs until the last one is reached, and the time each
+        of them was reached is returned, instead of simulating the build order once for each of them.
+
+        With record_timeline, the money, income, supply pads and tech level of every in game second and the build order
+        approvals, skips and completions are recorded in a SimulationTimeline, which is returned with the final time.
+
         :param build_order: list: Builds to execute in the simulation
-        :param resource_trigger: int: The amount of resources to reach the exit scenario
+        :param resource_trigger: int or list[int]: The amount of resources to reach the exit scenario, or a sorted list
+            of amounts to get the time of, the simulation exits at the last one
         :param simulation_time_seconds: int: Maximum time for the simulation to reach
-        :return: int: The final number of seconds it took to reach the designated amount of resources
+        :param cutoff_time: int: Stop the simulation as soon as it can no longer reach the (last) resource trigger
+            before this time. None to always run to the end
+        :param record_timeline: bool: Also return the SimulationTimeline of the simulation
+        :return: int: The final number of seconds it took to reach the designated amount of resources, None if it timed
+            out or was stopped at the cutoff time, see last_simulation_outcome. With a list of resource triggers, a list
+            of the number of seconds for each of them, None for the ones not reached. With record_timeline, a tuple of
+            the final time(s) and the SimulationTimeline
         """
+        resource_thresholds = None
+        if isinstance(resource_trigger, list):
+            if resource_trigger != sorted(resource_trigger):
+                raise ValueError(f"Resource triggers must be sorted, got {resource_trigger}")
+            resource_thresholds = resource_trigger[:-1]
+            resource_trigger = resource_trigger[-1]
+
+        timeline = SimulationTimeline(simulation_time_seconds) if record_timeline else None
         # Run the actual simulation
-        final_sim_time = self.runtime_building_blocks.run_simulation(build_orders=build_order,
-                                                                     resource_amount=resource_trigger,
-                                                                     simulation_time_max=simulation_time_seconds,
-                                                                     base_list=self.base_list,
-                                                                     fine_debug=self.fine_debug)
+        if self.event_driven:
+            run_simulation = self.runtime_building_blocks.run_simulation_event_driven
+        else:
+            run_simulation = self.runtime_building_blocks.run_simulation
+        final_sim_time = run_simulation(build_orders=build_order,
+                                        resource_amount=resource_trigger,
+                                        simulation_time_max=simulation_time_seconds,
+                                        base_list=self.base_list,
+                                        fine_debug=self.fine_debug,
+                                        cutoff_time=cutoff_time,
+                                        timeline=timeline,
+                                        resource_thresholds=resource_thresholds)
+        self.last_simulation_outcome = self.runtime_building_blocks.last_simulation_outcome
+        if resource_thresholds is not None:
+            threshold_times = self.runtime_building_blocks.last_threshold_times
+            final_sim_time = threshold_times + [None] * (len(resource_thresholds) - len(threshold_times)) + \
+                [final_sim_time]
+        if record_timeline:
+            return final_sim_time, timeline
         return final_sim_time
 
+    def copy(self):
+        """
+        Make a copy of the simulation, including the money, supply pads, bases, build slots and build queues, so the
+        copy can be simulated further without changing this one. Empty build slots are never changed, so they are
+        shared between the copies instead of copied.
+
+        :return: SimulatorWrapper: The copy of the simulation
+        """
+        sim_copy = copy.copy(self)
+        sim_copy.resource_manager = copy.copy(self.resource_manager)
+        if self.trace_recorder is not None:
+            sim_copy.trace_recorder = self.trace_recorder.copy(sim_copy.resource_manager)
+        sim_copy.runtime_building_blocks = make_runtime_building_blocks(resource_manager=sim_copy.resource_manager,
+                                                                        trace_recorder=sim_copy.trace_recorder)
+        sim_copy.base_list = []
+        for base in self.base_list:
+            base_copy = copy.copy(base)
+            base_copy.resource_manager = sim_copy.resource_manager
+            base_copy.trace_recorder = sim_copy.trace_recorder
+            base_copy.build_slots = {}
+            copied_slots = {}
+            for slot_name, slot in base.build_slots.items():
+                if slot.resource_manager is not None:
+                    slot_copy = copy.copy(slot)
+                    slot_copy.resource_manager = sim_copy.resource_manager
+                    slot_copy.trace_recorder = sim_copy.trace_recorder
+                    copied_slots[id(slot)] = slot_copy
+                    slot = slot_copy
+                base_copy.build_slots[slot_name] = slot
+            base_copy.build_queue = [copied_slots.get(id(slot), slot) for slot in base.build_queue]
+            sim_copy.base_list.append(base_copy)
+        return sim_copy
+
 
@@ -0,0 +1,138 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Results writer that saves the simulation results to csv files as they are made, instead of all at once at the end.
+
+"""
+import csv
+import os
+import time
+
+
+class StreamingResultsWriter:
+    """
+    The StreamingResultsWriter keeps a small buffer of [final time, build order string] results, and appends it to the
+    current csv file every flush_rows results or flush_seconds seconds, whichever comes first. Each flush is synced to
+    disk, so a crash only loses the results since the last flush, and the buffer is the only part of the results kept
+    in memory.
+
+    Every writer starts a new file instead of overwriting the results of an earlier run, named with the time the writer
+    was made, and starts the next file once a file has max_rows_per_file results. The files have the same format as
+    RuntimeBuildingBlocks.results_to_csv, with one more column after the build order string for each extra column, such
+as the time each lower resource threshold was reached.
+
+    Args:
+        output_directory (str): The directory to write the csv files in
+        file_prefix (str): Start of the csv file names, followed by the start time and the file number
+        max_rows_per_file (int): Number of results in a file before starting the next one
+        flush_rows (int): Number of buffered results that triggers a flush
+        flush_seconds (float): Seconds since the last flush that triggers a flush on the next result
+        extra_columns (list[str]): Header names of the extra columns
+
+    """
+    def __init__(self, output_directory: str, file_prefix="output", max_rows_per_file=100000, flush_rows=1000,
+                 flush_seconds=10.0, extra_columns=()):
+        self.output_directory = output_directory
+        self.file_prefix = file_prefix
+        self.max_rows_per_file = max_rows_per_file
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.extra_columns = list(extra_columns)
+
+        self.run_name = f"{file_prefix}_{time.strftime('%Y%m%d_%H%M%S')}"
+        self.output_paths = []
+        self.buffer = []
+        self.rows_in_file = 0
+        self.rows_written = 0
+        self.last_flush_time = time.monotonic()
+        self.csvfile = None
+        self.writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_next_file(self):
+        """
+        Close the current csv file and start the next one with a header row. File numbers that are already taken, for
+        example by a run started in the same second, are skipped.
+        """
+        if self.csvfile is not None:
+            self.csvfile.close()
+
+        os.makedirs(self.output_directory, exist_ok=True)
+        file_number = len(self.output_paths) + 1
+        output_path = os.path.join(self.output_directory, f"{self.run_name}_{file_number:03d}.csv")
+        while os.path.exists(output_path):
+            file_number += 1
+            output_path = os.path.join(self.output_directory, f"{self.run_name}_{file_number:03d}.csv")
+
+        self.csvfile = open(output_path, 'w', newline='')
+        self.writer = csv.writer(self.csvfile)
+        self.writer.writerow(["Number", "Character"] + self.extra_columns)  # Write header row
+        self.output_paths.append(output_path)
+        self.rows_in_file = 0
+
+    def write(self, final_time, build_order_string: str, extra_values=None):
+        """
+        Add a result to the buffer, and flush the buffer if it is full or the last flush was too long ago.
+
+        :param final_time: int: The time the build order took, None if it timed out
+        :param build_order_string: str: The build order string from build_order_print
+        :param extra_values: list: The value of each extra column, None to leave them empty
+        """
+        if self.extra_columns:
+            if extra_values is None:
+                extra_values = [None] * len(self.extra_columns)
+            self.buffer.append([final_time, build_order_string, *extra_values])
+        else:
+            self.buffer.append([final_time, build_order_string])
+        if len(self.buffer) >= self.flush_rows or time.monotonic() - self.last_flush_time >= self.flush_seconds:
+            self.flush()
+
+    def flush(self):
+        """
+        Append the buffered results to the csv files and sync them to disk, starting new files as they fill up.
+        """
+        start = 0
+        while start < len(self.buffer):
+            if self.writer is None or self.rows_in_file >= self.max_rows_per_file:
+                self._open_next_file()
+            end = min(len(self.buffer), start + self.max_rows_per_file - self.rows_in_file)
+            self.writer.writerows(self.buffer[start:end])
+            self.rows_in_file += end - start
+            start = end
+
+        if self.csvfile is not None:
+            self.csvfile.flush()
+            os.fsync(self.csvfile.fileno())
+        self.rows_written += len(self.buffer)
+        self.buffer = []
+        self.last_flush_time = time.monotonic()
+
+    def close(self):
+        """
+        Flush the remaining results and close the current csv file.
+        """
+        self.flush()
+        if self.csvfile is not None:
+            self.csvfile.close()
+            self.csvfile = None
+            self.writer = None
+
+    def read_results(self):
+        """
+        Read back every result written by this writer, one at a time, so the results can be gone through again without
+        keeping them all in memory. Results still in the buffer are not included.
+
+        :return: generator: [final time, build order string] for each result, the final time is None if it timed out
+        """
+        for output_path in self.output_paths:
+            with open(output_path, newline='') as csvfile:
+                reader = csv.reader(csvfile)
+                next(reader)  # Skip header row
+                for row in reader:
+                    yield [int(row[0]) if row[0] else None, row[1]]
@@ -0,0 +1,261 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Structured trace of a simulation. The Base, build slots and RuntimeBuildingBlocks record compact event tuples into a
+ring buffer, and the debug messages are only made from them when they are asked for.
+
+"""
+import warnings
+from collections import deque
+from enum import Enum
+
+# Number of events kept by default, the oldest events are dropped first
+DEFAULT_TRACE_CAPACITY = 4096
+
+
+# The events that can be recorded, each has a message in TRACE_MESSAGES
+class TraceEvent(Enum):
+    # Base build slot checks
+    SLOT_DOES_NOT_EXIST = 0
+    SLOT_NOT_EMPTY = 1
+    BASE_NOT_UPGRADED_ENOUGH = 2
+    BUILDING_NOT_ENOUGH_TECH = 3
+    BUILDING_NOT_ENOUGH_RESOURCES = 4
+    SUPPLY_PAD_BUILD_RESULT = 5
+    TEMPLE_ALREADY_BUILT = 6
+    TEMPLE_BUILD_RESULT = 7
+    NOT_A_SUPPLY_PAD = 8
+    SUPPLY_PAD_ALREADY_UPGRADED = 9
+    SUPPLY_PAD_BUILD_IN_PROGRESS = 10
+    SUPPLY_PAD_ALREADY_UPGRADING = 11
+    SUPPLY_PAD_NOT_BUILT = 12
+    SUPPLY_PAD_UPGRADE_NOT_ENOUGH_TECH = 13
+    SUPPLY_PAD_UPGRADE_APPROVED = 14
+    SUPPLY_PAD_UPGRADE_NOT_ENOUGH_RESOURCES = 15
+
+    # Base upgrades and state changes
+    BASE_UPGRADE_STARTED = 20
+    BASE_UPGRADE_NOT_ENOUGH_RESOURCES = 21
+    BASE_PAUSED = 22
+    BASE_BUSY = 23
+    BASE_MAX_LEVEL = 24
+    INVALID_BASE_LEVEL = 25
+    BASE_UPGRADED = 26
+    BASE_UNPAUSED = 27
+    NO_NEXT_BUILD_COST = 28
+
+    # Build slots
+    TEMPLE_BUILDING = 40
+    TEMPLE_COMPLETE = 41
+    SUPPLY_PAD_BUILDING = 42
+    SUPPLY_PAD_UPGRADING = 43
+    SUPPLY_PAD_UPGRADE_NO_TECH = 44
+    SUPPLY_PAD_COMPLETE = 45
+    SUPPLY_PAD_UPGRADED = 46
+
+    # Build orders in RuntimeBuildingBlocks
+    ORDER_APPROVED = 60
+    ORDER_SKIPPED_NO_SUPPLY_PADS = 61
+    ORDER_WAITING_FOR_RESOURCES = 62
+    ORDER_SKIPPED_NOT_ENOUGH_TECH = 63
+    ORDER_WAITING_FOR_BASE_UPGRADE = 64
+    ORDER_SKIPPED_NO_BUILD_SLOT = 65
+    ORDER_SKIPPED_EDGE_CASE = 66
+    ORDER_SKIPPED_NO_TEMPLE_FOR_UNPAUSE = 67
+    ORDER_WAITING_BASE_BUSY = 68
+    ORDER_SKIPPED_TEMPLE_ALREADY_BUILT = 69
+    ORDER_WAITING_FOR_TEMPLE = 70
+    ORDER_SKIPPED_NO_TEMPLE = 71
+    ORDER_WAITING_FOR_SUPPLY_PAD = 72
+    ORDER_NOT_SELECTED = 73
+
+
+# The message of each event, formatted with the base_number, slot and detail of the event tuple
+TRACE_MESSAGES = {
+    TraceEvent.SLOT_DOES_NOT_EXIST: "Desired build slot does not exist",
+    TraceEvent.SLOT_NOT_EMPTY: "Build slot {slot} is not empty for new building",
+    TraceEvent.BASE_NOT_UPGRADED_ENOUGH: "Base is not upgraded enough to build there",
+    TraceEvent.BUILDING_NOT_ENOUGH_TECH: "Tech level for desired building is not high enough",
+    TraceEvent.BUILDING_NOT_ENOUGH_RESOURCES: "Not enough resources to build: {slot}",
+    TraceEvent.SUPPLY_PAD_BUILD_RESULT: "Supply pad build {detail}: {slot}",
+    TraceEvent.TEMPLE_ALREADY_BUILT: "Temple already built {slot}",
+    TraceEvent.TEMPLE_BUILD_RESULT: "Temple Build {detail}: {slot}",
+    TraceEvent.NOT_A_SUPPLY_PAD: "Not a Supply Pad: {slot}",
+    TraceEvent.SUPPLY_PAD_ALREADY_UPGRADED: "Supply Pad already upgraded: {slot}",
+    TraceEvent.SUPPLY_PAD_BUILD_IN_PROGRESS: "Supply Pad building in progress: {slot}",
+    TraceEvent.SUPPLY_PAD_ALREADY_UPGRADING: "Supply Pad already upgrading: {slot}",
+    TraceEvent.SUPPLY_PAD_NOT_BUILT: "Supply pad not built: {slot}",
+    TraceEvent.SUPPLY_PAD_UPGRADE_NOT_ENOUGH_TECH: "Not high enough tech to upgrade supply pad: {slot}",
+    TraceEvent.SUPPLY_PAD_UPGRADE_APPROVED: "Supply Pad upgrade APPROVED: {slot}",
+    TraceEvent.SUPPLY_PAD_UPGRADE_NOT_ENOUGH_RESOURCES: "Not enough money to upgrade supply pad: {slot}",
+
+    TraceEvent.BASE_UPGRADE_STARTED: "Building {detail}",
+    TraceEvent.BASE_UPGRADE_NOT_ENOUGH_RESOURCES: "Not enough resources for {detail}",
+    TraceEvent.BASE_PAUSED: "Base {base_number} is currently PAUSED",
+    TraceEvent.BASE_BUSY: "Base {base_number} state is not idle, currently {detail}",
+    TraceEvent.BASE_MAX_LEVEL: "already max level",
+    TraceEvent.INVALID_BASE_LEVEL: "Invalid Base level",
+    TraceEvent.BASE_UPGRADED: "BASE UPGRADED: IS NOW {detail[0]}, {detail[1]}",
+    TraceEvent.BASE_UNPAUSED: "BASE is no longer paused: IS NOW {detail}",
+    TraceEvent.NO_NEXT_BUILD_COST: "not an option for get_next_build_cost",
+
+    TraceEvent.TEMPLE_BUILDING: "Building Temple...: {slot}",
+    TraceEvent.TEMPLE_COMPLETE: "Temple complete: {slot}",
+    TraceEvent.SUPPLY_PAD_BUILDING: "Building Supply Pad...: {slot}",
+    TraceEvent.SUPPLY_PAD_UPGRADING: "Upgrading Supply Pad...: {slot}",
+    TraceEvent.SUPPLY_PAD_UPGRADE_NO_TECH: "Not high enough tech level {slot}",
+    TraceEvent.SUPPLY_PAD_COMPLETE: "Supply pad complete: {slot}",
+    TraceEvent.SUPPLY_PAD_UPGRADED: "Supply pad upgraded: {slot}",
+
+    TraceEvent.ORDER_APPROVED: "Build approved: {detail}",
+    TraceEvent.ORDER_SKIPPED_NO_SUPPLY_PADS: "Not enough resources to build, and no supply pads detected... skipping  "
+                                             "{detail}",
+    TraceEvent.ORDER_WAITING_FOR_RESOURCES: "WAITING for more resources to build: {detail}",
+    TraceEvent.ORDER_SKIPPED_NOT_ENOUGH_TECH: "Not enough tech level for build order: {detail}",
+    TraceEvent.ORDER_WAITING_FOR_BASE_UPGRADE: "WAITING for base to upgrade: {detail}",
+    TraceEvent.ORDER_SKIPPED_NO_BUILD_SLOT: "Skipping build order since not enough build slots: {detail}",
+    TraceEvent.ORDER_SKIPPED_EDGE_CASE: "Edge case scenario, skipping: {detail[0]} {detail[1]}",
+    TraceEvent.ORDER_SKIPPED_NO_TEMPLE_FOR_UNPAUSE: "temple_needed_to_clear_second_base set to TRUE but no temple "
+                                                    "being made needed for subsequent base unpause, skipping: "
+                                                    "{detail}",
+    TraceEvent.ORDER_WAITING_BASE_BUSY: "Building currently busy: {detail}",
+    TraceEvent.ORDER_SKIPPED_TEMPLE_ALREADY_BUILT: "Temple already built, skipping order: {detail}",
+    TraceEvent.ORDER_WAITING_FOR_TEMPLE: "WAITING for temple to finish: {detail}",
+    TraceEvent.ORDER_SKIPPED_NO_TEMPLE: "NO temple for tech level, skipping build order: {detail}",
+    TraceEvent.ORDER_WAITING_FOR_SUPPLY_PAD: "WAITING for supply pad to finish building: {detail}",
+    TraceEvent.ORDER_NOT_SELECTED: "Not selected",
+}
+
+
+def render_trace_event(trace_event: tuple) -> str:
+    """
+    Make the debug message of a recorded event.
+
+    :param trace_event: tuple: (tick, base_number, slot, event, money, detail) as recorded by TraceRecorder.record
+    :return: str: The debug message
+    """
+    tick, base_number, slot, event, money, detail = trace_event
+    return TRACE_MESSAGES[event].format(base_number=base_number, slot=slot, detail=detail)
+
+
+class TraceRecorder:
+    """
+    The TraceRecorder keeps the last capacity events of a simulation as (tick, base_number, slot, event, money, detail)
+    tuples, where event is a TraceEvent and detail is whatever the message of the event needs, like the build order or
+    the BuildResult. The messages are only formatted by get_messages, or right away if print_events is on, which gives
+    the same output as the old print mode.
+
+    The Base, build slots and RuntimeBuildingBlocks keep the recorder in their trace_recorder attribute, and their
+    traced subclasses (TracedBase, TracedSupplyPad, TracedTemple and TracedRuntimeBuildingBlocks) record the events
+    around the untraced methods, so a simulation without a recorder never checks for one. make_base and
+    make_runtime_building_blocks pick the traced class when there is a recorder, and TracedBase builds the traced
+    build slots. Recording is one tuple appended to a deque, cheap enough to trace every n-th
+    simulation of a run.
+
+    The tick is set by the simulation loop in TracedRuntimeBuildingBlocks, and the money is read from the resource
+    manager.
+
+    Args:
+        resource_manager (ResourceManager): The resource manager of the simulation, for the money of each event
+        capacity (int): Number of events to keep, the oldest events are dropped first
+        print_events (bool): Print the message of each event as it is recorded
+
+    """
+    def __init__(self, resource_manager, capacity=DEFAULT_TRACE_CAPACITY, print_events=False):
+        self.resource_manager = resource_manager
+        self.capacity = capacity
+        self.print_events = print_events
+        self.events = deque(maxlen=capacity)
+        # The game tick of the events being recorded
+        self.tick = 0
+        # Total events recorded, including the ones dropped from the ring buffer
+        self.number_recorded = 0
+
+    def __len__(self):
+        return len(self.events)
+
+    def record(self, event: TraceEvent, base_number=None, slot=None, detail=None):
+        """
+        Record an event at the current tick and money.
+
+        :param event: TraceEvent: The event
+        :param base_number: int: The number of the base of the event, None if there is none
+        :param slot: int: The build slot of the event, None if there is none
+        :param detail: Anything else the message of the event needs
+        """
+        trace_event = (self.tick, base_number, slot, event, self.resource_manager.current_money, detail)
+        self.events.append(trace_event)
+        self.number_recorded += 1
+        if self.print_events:
+            print(render_trace_event(trace_event))
+
+    def copy(self, resource_manager):
+        """
+        Make an empty recorder with the same settings, for a copy of the simulation.
+
+        :param resource_manager: ResourceManager: The resource manager of the copy
+        :return: TraceRecorder: The new recorder
+        """
+        trace_recorder = TraceRecorder(resource_manager, capacity=self.capacity, print_events=self.print_events)
+        trace_recorder.tick = self.tick
+        return trace_recorder
+
+    def clear(self):
+        """
+        Drop all the recorded events, to reuse the recorder for another simulation.
+        """
+        self.events.clear()
+        self.tick = 0
+        self.number_recorded = 0
+
+    def get_events(self, event=None) -> list[tuple]:
+        """
+        Get the recorded event tuples, oldest first.
+
+        :param event: TraceEvent: Only get this event, None for all of them
+        :return: list[tuple]: The (tick, base_number, slot, event, money, detail) tuples
+        """
+        if event is None:
+            return list(self.events)
+        return [trace_event for trace_event in self.events if trace_event[3] == event]
+
+    def get_messages(self) -> list[str]:
+        """
+        Get the debug message of every recorded event, with its tick, base and money.
+
+        :return: list[str]: One line per event, oldest first
+        """
+        return [f"{tick:>6} s  base {base_number if base_number is not None else '-'}  money {money:>9.2f}  "
+                f"{render_trace_event((tick, base_number, slot, event, money, detail))}"
+                for tick, base_number, slot, event, money, detail in self.events]
+
+    def print_trace(self):
+        """
+        Print the debug message of every recorded event.
+        """
+        dropped = self.number_recorded - len(self.events)
+        if dropped:
+            print(f"({dropped} older events dropped)")
+        for message in self.get_messages():
+            print(message)
+
+
+def get_print_mode_recorder(resource_manager, trace_recorder, print_mode):
+    """
+    Support the print_mode argument that Base and RuntimeBuildingBlocks had before the TraceRecorder, now taken by
+    make_base and make_runtime_building_blocks. print_mode is deprecated, and print_mode=True is the same as a
+    TraceRecorder with print_events on.
+
+    :param resource_manager: ResourceManager: The resource manager for a new recorder
+    :param trace_recorder: TraceRecorder: The recorder that was passed in, None if there is none
+    :param print_mode: bool: The print_mode that was passed in, None if it was not
+    :return: TraceRecorder: The recorder to use, None to not record anything
+    """
+    if print_mode is None:
+        return trace_recorder
+    warnings.warn("print_mode is deprecated, pass trace_recorder=TraceRecorder(resource_manager, print_events=True) "
+                  "instead", DeprecationWarning, stacklevel=3)
+    if print_mode and trace_recorder is None:
+        return TraceRecorder(resource_manager=resource_manager, print_events=True)
+    return trace_recorder
@@ -0,0 +1,61 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Executable for the benchmark suite. Times the simulator and build order generator on fixed seeded build orders,
+compares the results to the saved baseline, and flags any benchmark that got slower or whose results changed
+
+"""
+import sys
+
+from libraries.BenchmarkSuite import BenchmarkSuite, compare_to_baseline, get_changed_settings, load_baseline, \
+    save_baseline
+
+# Where the baseline results are saved. Rates depend on the computer, so the baseline is not shared
+BENCHMARK_BASELINE_PATH = "results/benchmark_baseline.json"
+# Save this run as the new baseline, for example after a change that is meant to be faster. The baseline is always
+# saved if there is none yet
+SAVE_BASELINE = False
+# Fraction a benchmark can be slower than the baseline before it is flagged as a regression. Raise it on a busy or
+# shared computer, where the run to run noise can be larger than this
+REGRESSION_THRESHOLD = 0.20
+# Number of build orders in each seeded corpus. Changing it changes the checksums, so they are not compared until a new
+# baseline is saved
+CORPUS_SIZE = 50
+# Number of timed runs of each benchmark, the fastest is kept
+REPEATS = 5
+# Check the compiled simulation kernel gives the same results as RuntimeBuildingBlocks.run_simulation on the seeded
+# corpora before timing anything. Without Numba the kernel is checked as Python code, which takes a few seconds
+VERIFY_COMPILED_KERNEL = True
+
+
+def main():
+    benchmark_suite = BenchmarkSuite(corpus_size=CORPUS_SIZE, repeats=REPEATS)
+    if VERIFY_COMPILED_KERNEL:
+        kernel_messages = benchmark_suite.verify_compiled_kernel()
+        for message in kernel_messages:
+            print(f"KERNEL MISMATCH: {message}")
+        if kernel_messages:
+            sys.exit(1)
+        print("Compiled kernel matches run_simulation on every corpus")
+    results = benchmark_suite.run()
+
+    baseline = load_baseline(BENCHMARK_BASELINE_PATH)
+    if not baseline or SAVE_BASELINE:
+        save_baseline(results, BENCHMARK_BASELINE_PATH, benchmark_suite.get_settings())
+        print(f"Baseline saved to {BENCHMARK_BASELINE_PATH}")
+        return
+
+    changed_settings = get_changed_settings(benchmark_suite.get_settings(), baseline)
+    for message in changed_settings:
+        print(f"SETTINGS CHANGED: {message}, so the checksums are not compared. Save a new baseline to compare them")
+    messages = compare_to_baseline(results, baseline, REGRESSION_THRESHOLD, compare_checksums=not changed_settings)
+    for message in messages:
+        print(f"REGRESSION: {message}")
+    if messages:
+        sys.exit(1)
+    print(f"No regressions against {BENCHMARK_BASELINE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
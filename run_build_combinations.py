@@ -5,22 +5,109 @@ March 19th, 2024
 Main executable for generating random build orders and running simulations against them
 
 """
-from libraries.BaseConstants import BaseLevel
+import glob
+import importlib.util
+import os
+import random
+
+from libraries.BaseConstants import SimulationOutcome
+from libraries.BuildOrderEncoding import decode_build_order, packed_to_text
+from libraries.AnnealingOptimizer import SimulatedAnnealingOptimizer
+from libraries.BuildOrderEnumerator import BuildOrderEnumerator
+from libraries.CanonicalResultCache import CanonicalResultCache, canonicalize_build_order
+from libraries.ExperimentStore import ExperimentStore
+from libraries.GeneticOptimizer import GeneticOptimizer, read_best_build_orders
 from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
-from libraries.RuntimeBuildingBlocks import RuntimeBuildingBlocks
+from libraries.ParallelSimulationRunner import ParallelSimulationRunner
+from libraries.PhaseProfiler import PhaseProfiler
+from libraries.PrefixTrieSimulator import PrefixTrieSimulator
+from libraries.ResultsAggregator import ResultsAggregator
 from libraries.SimulatorWrapper import SimulatorWrapper
+from libraries.StreamingResultsWriter import StreamingResultsWriter
 
 # Toggle debug mode. When true, all print statements will be turned on. Off for faster runtimes
 DEBUG_MODE = False
 # Fine debug mode will toggle printing the final print on the end of every run. Toggle off if doing very long runs
 FINE_DEBUG = False
+# Use the event driven simulation, which skips the in game seconds where nothing happens. Same results, faster runtimes
+EVENT_DRIVEN_SIMULATION = True
+# Search every valid build order with branch and bound instead of simulating random ones, and report the fastest one
+# possible. Takes seconds for one base, minutes for two bases, and much longer for every base after that
+ENUMERATE_BUILD_ORDERS = False
+# Stop simulating a build order as soon as it can no longer beat or tie the fastest time found so far in this run. Only
+# used when simulating one build order at a time. Much faster, but the stopped build orders have no time, so they are
+# left out of the results and the experiment store
+ABORT_SLOWER_THAN_BEST = False
+# Most number of entries kept in the cache of results keyed on the orders that were approved and when. Build orders that
+# only differ from one already simulated in orders that were skipped or never reached get its result without being
+# simulated, and results with the same final time and build order string as one already written are counted as
+# duplicates instead of being written again. Only used when simulating one build order at a time. The hit rate is
+# printed at the end of the run. Off by default, since a cache hit is only a little faster than an event driven
+# simulation. Set to 0 to disable
+CANONICAL_RESULT_CACHE_SIZE = 0
+# Number of build orders to simulate at once with the NumPy batch simulator. Not used with
+# LOWER_RESOURCE_TRIGGER_VALUES. Set to 0 to simulate one build order at a time with the SimulatorWrapper
+BATCH_SIMULATION_SIZE = 0
+# Number of build orders simulated with each call of the compiled kernel of the CompiledSimulator. The kernel is used
+# automatically when Numba is installed, for the runs that would otherwise simulate one build order at a time without
+# debug prints, ABORT_SLOWER_THAN_BEST, CANONICAL_RESULT_CACHE_SIZE or LOWER_RESOURCE_TRIGGER_VALUES. Same results as
+# the SimulatorWrapper. Set to 0 to never use it
+COMPILED_BATCH_SIZE = 1000
+# Number of build orders to simulate at once with the PrefixTrieSimulator, which simulates the orders that build orders
+# start with only once. Not used with LOWER_RESOURCE_TRIGGER_VALUES. Set to 0 to disable
+PREFIX_TRIE_BATCH_SIZE = 0
+# Number of worker processes to split the simulations across. Set to 1 to run everything in this process
+NUMBER_OF_WORKERS = 1
+# Number of simulation loops handed to a worker process at a time
+CHUNK_SIZE = 1000
+# Seed for the random build orders so a run can be repeated. Set to None to pick a new seed every run
+RANDOM_SEED = None
+# Generate the random build orders by picking from the orders that are legal on each step, instead of drawing again
+# until an order is valid. Same distribution of build orders without the wasted draws, but a seed gives different build
+# orders than with it off, so it is off by default to keep the build orders of earlier seeded runs
+LEGAL_MOVE_GENERATION = False
+# SQLite file that keeps every simulated build order across runs. Build orders already in it for the same settings are
+# not simulated again. None by default so each run simulates from scratch, set to a path like
+# "results/experiment_store.sqlite" to turn it on
+EXPERIMENT_STORE_PATH = None
+# Import the results csv files in the results directory into the experiment store. Files are only read the first time.
+# Needs EXPERIMENT_STORE_PATH
+IMPORT_RESULTS_CSV_FILES = False
+# Directory the results csv files are written to. Each run writes new files named output_<start time>_<file number>.csv,
+# and starts the next file every RESULTS_ROWS_PER_FILE results
+RESULTS_DIRECTORY = "results"
+RESULTS_ROWS_PER_FILE = 100000
+# The results are written to disk every RESULTS_FLUSH_ROWS results or RESULTS_FLUSH_SECONDS seconds, whichever comes
+# first. Only the results since the last write are kept in memory, and lost if the run crashes
+RESULTS_FLUSH_ROWS = 1000
+RESULTS_FLUSH_SECONDS = 10
+# Also save the results of the run in the columnar format of ColumnarResults, in RESULTS_DIRECTORY/columnar. Needs NumPy
+SAVE_COLUMNAR_RESULTS = False
+# Number of the fastest build orders reported at the end of the run
+RESULTS_TOP_K = 10
+# Print the results so far every RESULTS_REPORT_INTERVAL results, 0 to only report at the end of the run
+RESULTS_REPORT_INTERVAL = 0
+# Time each phase of the run (generation, dedupe, build_verifier, Base.update, ResourceManager.update, csv output and
+# more) and print a table of the times at the end. Only the main process is timed, not the parallel workers
+PROFILE_PHASES = False
+# With PROFILE_PHASES, also capture PROFILE_ITERATIONS simulations with cProfile, one every PROFILE_EVERY simulations,
+# and save the capture to PROFILE_OUTPUT_PATH. 0 for no capture
+PROFILE_ITERATIONS = 0
+PROFILE_EVERY = 100
+PROFILE_OUTPUT_PATH = "results/simulation_profile.prof"
 # The amount of money to start with, default is 800
 STARTING_RESOURCES = 800
 # The timeout for each individual simulated run that the run will exit if reaches, in-game SECONDS
 SIMULATION_TIME_SECONDS = 1000
 # Goal amount of resources to reach to exit simulation and report findings
 RESOURCE_TRIGGER_VALUE = 3000
-# Number of bases to perform simulation with. Can be 1 to as many as wanted
+# Lower resource amounts to also get the time of in the same simulations, each one an extra column of the results csv
+# files after the build order string. For example [3000, 3300] with RESOURCE_TRIGGER_VALUE = 6800 gets the times of all
+# three in one pass instead of a run for each. Only supported when simulating one build order at a time, so
+# BATCH_SIMULATION_SIZE and PREFIX_TRIE_BATCH_SIZE are not used when it is set, and the GeneticOptimizer,
+# SimulatedAnnealingOptimizer and NUMBER_OF_WORKERS > 1 raise an error. Set to [] to disable
+LOWER_RESOURCE_TRIGGER_VALUES = []
+# Number of bases to perform simulation with. Can be 1 to 7, the most bases a packed build order supports
 NUMBER_OF_BASES = 2
 # How many simulations should be run. 100 for 100 different iterations, etc
 NUMBER_OF_SIMULATION_LOOPS = 200
@@ -36,76 +123,563 @@ SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS = 120
 # clear the second base, in which case the temple order is irrelevant as the other teammate will do the job of base
 # clearing. In that scenario, the second base pause timer starts right away
 IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER = True
+# Evolve the build orders with the GeneticOptimizer instead of simulating random ones. The number of build orders
+# simulated comes from the population size and number of generations instead of NUMBER_OF_SIMULATION_LOOPS
+GENETIC_OPTIMIZER = False
+# Number of build orders in each generation of the GeneticOptimizer
+GENETIC_POPULATION_SIZE = 200
+# Number of generations the GeneticOptimizer runs for
+GENETIC_NUMBER_OF_GENERATIONS = 50
+# Results csv files the optimizers start from. The first GeneticOptimizer generation is seeded with the
+# GENETIC_SEED_ROWS fastest build orders in them, and the SimulatedAnnealingOptimizer starts from the fastest one. Set
+# to None to start from random build orders only
+OPTIMIZER_SEED_CSV_PATTERN = f"results/{RESOURCE_TRIGGER_VALUE}r_{NUMBER_OF_BASES}b_*.csv"
+GENETIC_SEED_ROWS = 20
+# Improve a build order with the SimulatedAnnealingOptimizer local search instead of simulating random ones. Each move
+# only simulates the part of the build order that changed
+SIMULATED_ANNEALING = False
+# Number of moves the SimulatedAnnealingOptimizer tries
+SIMULATED_ANNEALING_ITERATIONS = 5000
 
 
-def main():
+def add_bases(simulator):
     """
-    The run_build_combinations file is the main executable for running and finding random build combination values.
+    Add the number of bases desired to a simulator. First base is different from others, and the others are paused for
+    SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS.
 
-    This files primary purpose is to generate X amount of random build orders, simulate them using the halo wars
-    simulator, and report the time it takes to reach a specified resource value (or skip after maximum allotted time)
+    :param simulator: SimulatorWrapper, BatchSimulator or CompiledSimulator to add the bases to
+    """
+    simulator.add_bases(NUMBER_OF_BASES, pause_timer=SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS,
+                        temple_needed_to_clear_second_base=IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER)
 
-    Initial values will be reported on the command line, if toggled, but full values will be reported in a csv file.
 
+def get_resource_trigger():
     """
+    Get the resource trigger to simulate with, RESOURCE_TRIGGER_VALUE or the sorted list of it and the
+    LOWER_RESOURCE_TRIGGER_VALUES.
 
-    # Final output variables and building block generations
-    final_list = []
-    # Building block for helping generation build orders
-    generate_orders_building_blocks = GenerateOrdersBuildingBlocks()
+    :return: int or list[int]: The resource trigger for SimulatorWrapper.run_simulation
+    """
+    if LOWER_RESOURCE_TRIGGER_VALUES:
+        return sorted(LOWER_RESOURCE_TRIGGER_VALUES) + [RESOURCE_TRIGGER_VALUE]
+    return RESOURCE_TRIGGER_VALUE
+
+
+def split_resource_trigger_times(simulation_times):
+    """
+    Split the times returned by SimulatorWrapper.run_simulation for get_resource_trigger into the final time and the
+    times of the LOWER_RESOURCE_TRIGGER_VALUES.
+
+    :param simulation_times: int or list[int]: The times returned by the simulation
+    :return: tuple: The final time, and the list of lower trigger times or None if there are none
+    """
+    if LOWER_RESOURCE_TRIGGER_VALUES:
+        return simulation_times[-1], simulation_times[:-1]
+    return simulation_times, None
+
+
+def add_result(results_writer: StreamingResultsWriter, results_aggregator: ResultsAggregator, final_sim_time: int,
+               build_orders: str, packed_build_order: bytes, experiment_store: ExperimentStore, scenario_id: int,
+               lower_trigger_times=None):
+    """
+    Add a simulated build order to the results csv files, the results aggregator, and to the experiment store if there
+    is one.
+
+    :param results_writer: StreamingResultsWriter: The writer the results are streamed to
+    :param results_aggregator: ResultsAggregator: The aggregator of the fastest build orders and final times
+    :param final_sim_time: int: The time the build order took, None if it timed out
+    :param build_orders: str: The build order string from build_order_print
+    :param packed_build_order: bytes: The packed build order that was generated
+    :param experiment_store: ExperimentStore: The experiment store, None if disabled
+    :param scenario_id: int: The scenario id of this run in the experiment store
+    :param lower_trigger_times: list[int]: The time of each LOWER_RESOURCE_TRIGGER_VALUES, None if they were not
+        simulated
+    """
+    # Every result is stored and aggregated, the temple filter is only for this run's results
+    results_aggregator.add(final_sim_time, build_orders, packed_build_order)
+    if RESULTS_REPORT_INTERVAL > 0 and results_aggregator.number_of_results % RESULTS_REPORT_INTERVAL == 0:
+        print(results_aggregator.get_progress_string())
+    if experiment_store is not None:
+        experiment_store.add_result(scenario_id, packed_build_order, final_sim_time, build_orders)
+
+    # If it has been requested to ignore runs without temple, do so, otherwise default to save all runs
+    if REMOVE_IF_NO_TEMPLE:
+        if "TEMPLE" in build_orders:
+            results_writer.write(final_sim_time, build_orders, lower_trigger_times)
+    else:
+        results_writer.write(final_sim_time, build_orders, lower_trigger_times)
+
+
+def run_batch_simulations(generate_orders_building_blocks: GenerateOrdersBuildingBlocks,
+                          results_writer: StreamingResultsWriter, results_aggregator: ResultsAggregator,
+                          experiment_store: ExperimentStore, scenario_id: int):
+    """
+    Generate the random build orders in batches of BATCH_SIMULATION_SIZE and run each batch at once with the
+    BatchSimulator.
+
+    :param generate_orders_building_blocks: GenerateOrdersBuildingBlocks: The build order generator
+    :param results_writer: StreamingResultsWriter: The writer the results are streamed to
+    :param results_aggregator: ResultsAggregator: The aggregator of the fastest build orders and final times
+    :param experiment_store: ExperimentStore: The experiment store, None if disabled
+    :param scenario_id: int: The scenario id of this run in the experiment store
+    """
+    # NumPy is only needed for batch simulations
+    from libraries.BatchSimulator import BatchSimulator
+
+    batch_simulator = BatchSimulator(starting_money=STARTING_RESOURCES)
+    add_bases(batch_simulator)
+    # The bases of this wrapper are only used for generating the build orders, it is never simulated
+    sim_wrapper = SimulatorWrapper(starting_money=STARTING_RESOURCES)
+    add_bases(sim_wrapper)
 
-    print("Beginning execution...")
-    # Main execution loop
     x = 0
     while x < NUMBER_OF_SIMULATION_LOOPS:
-        # Instantiate SimulationWrapper object, which will take care of all the individual objects and variables needed
-        # to run the simulation
-        sim_wrapper = SimulatorWrapper(starting_money=STARTING_RESOURCES,
-                                       debug_mode=DEBUG_MODE,
-                                       fine_debug=FINE_DEBUG)
-
-        # Add the number of bases desired. First base is different from others
-        j = 0
-        while j < NUMBER_OF_BASES:
-            # first base starts off as a KEEP, other ones are empty
-            if j == 0:
-                sim_wrapper.add_base(upgrade_level=BaseLevel.KEEP,
-                                     base_number=j+1)
+        batch = []
+        packed_batch = []
+        while x < NUMBER_OF_SIMULATION_LOOPS and len(batch) < BATCH_SIMULATION_SIZE:
+            packed_build_order = generate_orders_building_blocks.generate_random_packed_build_order(NUMBER_OF_BASES)
+            if not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+                batch.append(decode_build_order(packed_build_order, sim_wrapper.base_list))
+                packed_batch.append(packed_build_order)
+            else:
+                results_aggregator.add_duplicate()
+                if DEBUG_MODE:
+                    print("Already have done build order, skipping")
+            x += 1
+
+        final_sim_times = batch_simulator.run_simulation(build_orders=batch,
+                                                         resource_trigger=RESOURCE_TRIGGER_VALUE,
+                                                         simulation_time_seconds=SIMULATION_TIME_SECONDS)
+        for final_sim_time, generated_build_order, packed_build_order in zip(final_sim_times, batch, packed_batch):
+            add_result(results_writer, results_aggregator, final_sim_time,
+                       generate_orders_building_blocks.build_order_print(generated_build_order),
+                       packed_build_order, experiment_store, scenario_id)
+
+
+def run_prefix_trie_simulations(generate_orders_building_blocks: GenerateOrdersBuildingBlocks,
+                                results_writer: StreamingResultsWriter, results_aggregator: ResultsAggregator,
+                                experiment_store: ExperimentStore, scenario_id: int):
+    """
+    Generate the random build orders in batches of PREFIX_TRIE_BATCH_SIZE and run each batch with the
+    PrefixTrieSimulator, so the orders the build orders of a batch start with are only simulated once.
+
+    :param generate_orders_building_blocks: GenerateOrdersBuildingBlocks: The build order generator
+    :param results_writer: StreamingResultsWriter: The writer the results are streamed to
+    :param results_aggregator: ResultsAggregator: The aggregator of the fastest build orders and final times
+    :param experiment_store: ExperimentStore: The experiment store, None if disabled
+    :param scenario_id: int: The scenario id of this run in the experiment store
+    """
+    prefix_trie_simulator = PrefixTrieSimulator(
+        starting_money=STARTING_RESOURCES,
+        number_of_bases=NUMBER_OF_BASES,
+        resource_trigger=RESOURCE_TRIGGER_VALUE,
+        simulation_time_seconds=SIMULATION_TIME_SECONDS,
+        pause_timer=SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS,
+        temple_needed_to_clear_second_base=IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER)
 
+    x = 0
+    while x < NUMBER_OF_SIMULATION_LOOPS:
+        packed_batch = []
+        while x < NUMBER_OF_SIMULATION_LOOPS and len(packed_batch) < PREFIX_TRIE_BATCH_SIZE:
+            packed_build_order = generate_orders_building_blocks.generate_random_packed_build_order(NUMBER_OF_BASES)
+            if not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+                packed_batch.append(packed_build_order)
             else:
-                sim_wrapper.add_base(upgrade_level=BaseLevel.EMPTY,
-                                     base_number=j+1)
-            j += 1
+                results_aggregator.add_duplicate()
+                if DEBUG_MODE:
+                    print("Already have done build order, skipping")
+            x += 1
 
-        # Generate random build order and the runtime building blocks to run the generated order
-        generated_build_order = generate_orders_building_blocks.generate_random_build_orders(sim_wrapper.base_list)
+        batch_results = prefix_trie_simulator.run_simulation(packed_batch)
+        for (final_sim_time, build_orders), packed_build_order in zip(batch_results, packed_batch):
+            add_result(results_writer, results_aggregator, final_sim_time, build_orders, packed_build_order,
+                       experiment_store, scenario_id)
 
-        # Check if the orders have already been done by checking the saved hash set.
-        if not generate_orders_building_blocks.is_build_order_seen(generated_build_order):
 
-            # Run the actual simulation
-            final_sim_time = sim_wrapper.run_simulation(build_order=generated_build_order,
-                                                        resource_trigger=RESOURCE_TRIGGER_VALUE,
-                                                        simulation_time_seconds=SIMULATION_TIME_SECONDS)
+def run_compiled_simulations(generate_orders_building_blocks: GenerateOrdersBuildingBlocks,
+                             results_writer: StreamingResultsWriter, results_aggregator: ResultsAggregator,
+                             experiment_store: ExperimentStore, scenario_id: int):
+    """
+    Generate the random build orders in batches of COMPILED_BATCH_SIZE and run each batch with one call of the compiled
+    kernel of the CompiledSimulator.
 
-            build_orders = generate_orders_building_blocks.build_order_print(generated_build_order)
+    :param generate_orders_building_blocks: GenerateOrdersBuildingBlocks: The build order generator
+    :param results_writer: StreamingResultsWriter: The writer the results are streamed to
+    :param results_aggregator: ResultsAggregator: The aggregator of the fastest build orders and final times
+    :param experiment_store: ExperimentStore: The experiment store, None if disabled
+    :param scenario_id: int: The scenario id of this run in the experiment store
+    """
+    # Numba and NumPy are only needed for compiled simulations
+    from libraries.CompiledSimulator import CompiledSimulator
+
+    compiled_simulator = CompiledSimulator(starting_money=STARTING_RESOURCES)
+    add_bases(compiled_simulator)
 
-            # If it has been requested to ignore runs without temple, do so, otherwise default to save all runs
-            if REMOVE_IF_NO_TEMPLE:
-                if "TEMPLE" in build_orders:
-                    final_list.append([final_sim_time, build_orders])
+    x = 0
+    while x < NUMBER_OF_SIMULATION_LOOPS:
+        packed_batch = []
+        while x < NUMBER_OF_SIMULATION_LOOPS and len(packed_batch) < COMPILED_BATCH_SIZE:
+            packed_build_order = generate_orders_building_blocks.generate_random_packed_build_order(NUMBER_OF_BASES)
+            if not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+                packed_batch.append(packed_build_order)
             else:
-                final_list.append([final_sim_time, build_orders])
+                results_aggregator.add_duplicate()
+            x += 1
 
-        else:
+        batch_results = compiled_simulator.run_packed(packed_batch, resource_trigger=RESOURCE_TRIGGER_VALUE,
+                                                      simulation_time_seconds=SIMULATION_TIME_SECONDS)
+        for (final_sim_time, build_orders), packed_build_order in zip(batch_results, packed_batch):
+            add_result(results_writer, results_aggregator, final_sim_time, build_orders, packed_build_order,
+                       experiment_store, scenario_id)
+
+
+def run_single_simulations(generate_orders_building_blocks: GenerateOrdersBuildingBlocks,
+                           results_writer: StreamingResultsWriter, results_aggregator: ResultsAggregator,
+                           experiment_store: ExperimentStore, scenario_id: int):
+    """
+    Generate and simulate the random build orders one at a time, each with its own SimulatorWrapper.
+
+    :param generate_orders_building_blocks: GenerateOrdersBuildingBlocks: The build order generator
+    :param results_writer: StreamingResultsWriter: The writer the results are streamed to
+    :param results_aggregator: ResultsAggregator: The aggregator of the fastest build orders and final times
+    :param experiment_store: ExperimentStore: The experiment store, None if disabled
+    :param scenario_id: int: The scenario id of this run in the experiment store
+    """
+    # Fastest time so far, and the number of build orders stopped since they could not beat it
+    best_time = None
+    aborted_simulations = 0
+    resource_trigger = get_resource_trigger()
+    result_cache = None
+    # The final time and build order string of every result written, so equivalent build orders are only written once
+    written_results = None
+    if CANONICAL_RESULT_CACHE_SIZE > 0:
+        result_cache = CanonicalResultCache(max_entries=CANONICAL_RESULT_CACHE_SIZE)
+        written_results = set()
+    # Main execution loop
+    x = 0
+    while x < NUMBER_OF_SIMULATION_LOOPS:
+        # Generate random build order in its packed form, no bases are needed for this
+        packed_build_order = generate_orders_building_blocks.generate_random_packed_build_order(NUMBER_OF_BASES)
+
+        # Check if the orders have already been done by checking the saved set. The bases are only made for new orders
+        if generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+            results_aggregator.add_duplicate()
             if DEBUG_MODE:
                 print("Already have done build order, skipping")
+            x += 1
+            continue
+
+        # Orders that are always skipped are replaced in the canonical build order, which is what gets simulated
+        canonical_build_order = canonicalize_build_order(packed_build_order)
+        cached_result = None
+        if result_cache is not None:
+            cached_result = result_cache.get_result(canonical_build_order)
+        if cached_result is not None:
+            # An equivalent build order was already simulated, so it has the same result
+            simulation_times, build_orders = cached_result
+            final_sim_time, lower_trigger_times = split_resource_trigger_times(simulation_times)
+        else:
+            # Instantiate SimulationWrapper object, which will take care of all the individual objects and variables
+            # needed to run the simulation
+            sim_wrapper = SimulatorWrapper(starting_money=STARTING_RESOURCES,
+                                           debug_mode=DEBUG_MODE,
+                                           fine_debug=FINE_DEBUG,
+                                           event_driven=EVENT_DRIVEN_SIMULATION)
+            add_bases(sim_wrapper)
+            generated_build_order = decode_build_order(canonical_build_order, sim_wrapper.base_list)
+
+            # Run the actual simulation. Build orders that tie the best time are still simulated to the end
+            cutoff_time = None
+            if ABORT_SLOWER_THAN_BEST and best_time is not None:
+                cutoff_time = best_time + 1
+            simulation_times = sim_wrapper.run_simulation(build_order=generated_build_order,
+                                                          resource_trigger=resource_trigger,
+                                                          simulation_time_seconds=SIMULATION_TIME_SECONDS,
+                                                          cutoff_time=cutoff_time)
+            final_sim_time, lower_trigger_times = split_resource_trigger_times(simulation_times)
+
+            if sim_wrapper.last_simulation_outcome == SimulationOutcome.ABORTED:
+                aborted_simulations += 1
+                x += 1
+                continue
+
+            build_orders = generate_orders_building_blocks.build_order_print(generated_build_order)
+            if result_cache is not None:
+                runtime_building_blocks = sim_wrapper.runtime_building_blocks
+                last_tick = final_sim_time if final_sim_time is not None else SIMULATION_TIME_SECONDS - 1
+                result_cache.add_result(canonical_build_order, generated_build_order, simulation_times, last_tick,
+                                        runtime_building_blocks.last_order_index,
+                                        runtime_building_blocks.last_order_result,
+                                        runtime_building_blocks.last_order_times)
+
+        if written_results is not None:
+            if (final_sim_time, build_orders) in written_results:
+                # The same result was already written, so only note this build order in the store
+                results_aggregator.add_duplicate()
+                if experiment_store is not None:
+                    experiment_store.add_result(scenario_id, packed_build_order, final_sim_time, build_orders)
+                if DEBUG_MODE:
+                    print("Already have the result of an equivalent build order, skipping")
+                x += 1
+                continue
+            written_results.add((final_sim_time, build_orders))
+
+        add_result(results_writer, results_aggregator, final_sim_time, build_orders, packed_build_order,
+                   experiment_store, scenario_id, lower_trigger_times)
+        if final_sim_time is not None and (best_time is None or final_sim_time < best_time) and \
+                (not REMOVE_IF_NO_TEMPLE or "TEMPLE" in build_orders):
+            best_time = final_sim_time
 
         x += 1
 
-    # Final print out logic and reporting to csv file
-    RuntimeBuildingBlocks.results_to_csv(final_list, "results/output.csv")
-    RuntimeBuildingBlocks.report_quickest_run(final_list)
+    if ABORT_SLOWER_THAN_BEST:
+        print(f"Stopped {aborted_simulations} simulations early that could not beat the fastest time")
+    if result_cache is not None:
+        print(f"Canonical result cache hit rate {result_cache.get_hit_rate():.1%}, did not simulate "
+              f"{result_cache.hits} of {result_cache.hits + result_cache.misses} build orders equivalent to one "
+              f"already simulated")
+
+
+def run_parallel_simulations(seed: int, results_writer: StreamingResultsWriter, results_aggregator: ResultsAggregator,
+                             experiment_store: ExperimentStore, scenario_id: int):
+    """
+    Generate and simulate the random build orders across NUMBER_OF_WORKERS processes, CHUNK_SIZE loops at a time.
+
+    :param seed: int: The seed for the random build orders
+    :param results_writer: StreamingResultsWriter: The writer the results are streamed to
+    :param results_aggregator: ResultsAggregator: The aggregator of the fastest build orders and final times
+    :param experiment_store: ExperimentStore: The experiment store, None if disabled
+    :param scenario_id: int: The scenario id of this run in the experiment store
+    """
+    parallel_simulation_runner = ParallelSimulationRunner(
+        number_of_workers=NUMBER_OF_WORKERS,
+        chunk_size=CHUNK_SIZE,
+        seed=seed,
+        starting_money=STARTING_RESOURCES,
+        number_of_bases=NUMBER_OF_BASES,
+        resource_trigger=RESOURCE_TRIGGER_VALUE,
+        simulation_time_seconds=SIMULATION_TIME_SECONDS,
+        event_driven=EVENT_DRIVEN_SIMULATION,
+        legal_move_generation=LEGAL_MOVE_GENERATION,
+        pause_timer=SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS,
+        temple_needed_to_clear_second_base=IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER)
+    known_build_orders = None
+    if experiment_store is not None:
+        known_build_orders = experiment_store.get_build_orders(scenario_id)
+    for packed_build_order, final_sim_time, build_orders in parallel_simulation_runner.run(NUMBER_OF_SIMULATION_LOOPS,
+                                                                                           known_build_orders):
+        add_result(results_writer, results_aggregator, final_sim_time, build_orders, packed_build_order,
+                   experiment_store, scenario_id)
+
+
+def run_genetic_optimizer(generate_orders_building_blocks: GenerateOrdersBuildingBlocks,
+                          results_writer: StreamingResultsWriter, results_aggregator: ResultsAggregator,
+                          experiment_store: ExperimentStore, scenario_id: int):
+    """
+    Evolve the build orders with the GeneticOptimizer, simulating each generation across NUMBER_OF_WORKERS processes.
+
+    :param generate_orders_building_blocks: GenerateOrdersBuildingBlocks: The build order generator, only used for its
+        seen set
+    :param results_writer: StreamingResultsWriter: The writer the results are streamed to
+    :param results_aggregator: ResultsAggregator: The aggregator of the fastest build orders and final times
+    :param experiment_store: ExperimentStore: The experiment store, None if disabled
+    :param scenario_id: int: The scenario id of this run in the experiment store
+    """
+    seed_build_orders = None
+    if OPTIMIZER_SEED_CSV_PATTERN is not None:
+        seed_build_orders = read_best_build_orders(sorted(glob.glob(OPTIMIZER_SEED_CSV_PATTERN)), GENETIC_SEED_ROWS)
+
+    genetic_optimizer = GeneticOptimizer(starting_money=STARTING_RESOURCES,
+                                         number_of_bases=NUMBER_OF_BASES,
+                                         resource_trigger=RESOURCE_TRIGGER_VALUE,
+                                         simulation_time_seconds=SIMULATION_TIME_SECONDS,
+                                         population_size=GENETIC_POPULATION_SIZE,
+                                         number_of_generations=GENETIC_NUMBER_OF_GENERATIONS,
+                                         require_temple=REMOVE_IF_NO_TEMPLE,
+                                         number_of_workers=NUMBER_OF_WORKERS,
+                                         pause_timer=SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS,
+                                         temple_needed_to_clear_second_base=IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER,
+                                         progress_callback=print if DEBUG_MODE else None)
+
+    for packed_build_order, final_sim_time, build_orders in genetic_optimizer.run(seed_build_orders):
+        # Build orders from earlier runs in the experiment store are already saved
+        if not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+            add_result(results_writer, results_aggregator, final_sim_time, build_orders, packed_build_order,
+                       experiment_store, scenario_id)
+
+
+def run_simulated_annealing(generate_orders_building_blocks: GenerateOrdersBuildingBlocks,
+                            results_writer: StreamingResultsWriter, results_aggregator: ResultsAggregator,
+                            experiment_store: ExperimentStore, scenario_id: int):
+    """
+    Improve the fastest build order from the results csv files with the SimulatedAnnealingOptimizer.
+
+    :param generate_orders_building_blocks: GenerateOrdersBuildingBlocks: The build order generator, only used for its
+        seen set
+    :param results_writer: StreamingResultsWriter: The writer the results are streamed to
+    :param results_aggregator: ResultsAggregator: The aggregator of the fastest build orders and final times
+    :param experiment_store: ExperimentStore: The experiment store, None if disabled
+    :param scenario_id: int: The scenario id of this run in the experiment store
+    """
+    starting_build_order = None
+    if OPTIMIZER_SEED_CSV_PATTERN is not None:
+        best_build_orders = read_best_build_orders(sorted(glob.glob(OPTIMIZER_SEED_CSV_PATTERN)), 1)
+        if best_build_orders:
+            starting_build_order = best_build_orders[0]
+
+    annealing_optimizer = SimulatedAnnealingOptimizer(
+        starting_money=STARTING_RESOURCES,
+        number_of_bases=NUMBER_OF_BASES,
+        resource_trigger=RESOURCE_TRIGGER_VALUE,
+        simulation_time_seconds=SIMULATION_TIME_SECONDS,
+        number_of_iterations=SIMULATED_ANNEALING_ITERATIONS,
+        require_temple=REMOVE_IF_NO_TEMPLE,
+        pause_timer=SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS,
+        temple_needed_to_clear_second_base=IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER,
+        progress_callback=print if DEBUG_MODE else None)
+
+    for packed_build_order, final_sim_time, build_orders in annealing_optimizer.run(starting_build_order):
+        # Build orders from earlier runs in the experiment store are already saved
+        if not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+            add_result(results_writer, results_aggregator, final_sim_time, build_orders, packed_build_order,
+                       experiment_store, scenario_id)
+
+
+def run_enumeration():
+    """
+    Search every valid build order with the BuildOrderEnumerator and report the fastest one.
+
+    """
+    print("Beginning enumeration of every build order...")
+    build_order_enumerator = BuildOrderEnumerator(
+        starting_money=STARTING_RESOURCES,
+        number_of_bases=NUMBER_OF_BASES,
+        resource_trigger=RESOURCE_TRIGGER_VALUE,
+        simulation_time_seconds=SIMULATION_TIME_SECONDS,
+        require_temple=REMOVE_IF_NO_TEMPLE,
+        pause_timer=SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS,
+        temple_needed_to_clear_second_base=IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER,
+        progress_callback=print)
+    final_time, packed_build_order = build_order_enumerator.run()
+    print(f"Searched {build_order_enumerator.nodes_searched} build order prefixes, pruned "
+          f"{build_order_enumerator.nodes_pruned}")
+    if packed_build_order is None:
+        print(f"No build order reaches {RESOURCE_TRIGGER_VALUE} resources in {SIMULATION_TIME_SECONDS} seconds")
+    else:
+        print(f"fastest possible results: {final_time} seconds, orders: {packed_to_text(packed_build_order)}")
+
+
+def main():
+    """
+    The run_build_combinations file is the main executable for running and finding random build combination values.
+
+    This files primary purpose is to generate X amount of random build orders, simulate them using the halo wars
+    simulator, and report the time it takes to reach a specified resource value (or skip after maximum allotted time)
+
+    Initial values will be reported on the command line, if toggled, but full values will be reported in a csv file.
+
+    """
+
+    if ENUMERATE_BUILD_ORDERS:
+        run_enumeration()
+        return
+
+    # Only the one build order at a time loop fills the columns of the lower resource triggers
+    if LOWER_RESOURCE_TRIGGER_VALUES and (GENETIC_OPTIMIZER or SIMULATED_ANNEALING or NUMBER_OF_WORKERS > 1):
+        raise ValueError("LOWER_RESOURCE_TRIGGER_VALUES is only supported when simulating one build order at a time, "
+                         "not with GENETIC_OPTIMIZER, SIMULATED_ANNEALING or NUMBER_OF_WORKERS > 1")
+
+    # Building block for helping generation build orders
+    generate_orders_building_blocks = GenerateOrdersBuildingBlocks(legal_move_generation=LEGAL_MOVE_GENERATION)
+
+    # Seed the random build orders, and print the seed so the run can be repeated
+    seed = RANDOM_SEED if RANDOM_SEED is not None else random.randrange(2 ** 32)
+    random.seed(seed)
+
+    # The fastest build orders and the final time statistics are kept as the results come in
+    results_aggregator = ResultsAggregator(max_time_seconds=SIMULATION_TIME_SECONDS, top_k=RESULTS_TOP_K)
+
+    # Open the experiment store, and mark every build order it already has for these settings as seen. Those build
+    # orders are not simulated again, so their results are added to the aggregator, and a resumed run reports every
+    # result for these settings
+    experiment_store = None
+    scenario_id = None
+    if EXPERIMENT_STORE_PATH is not None:
+        experiment_store = ExperimentStore(EXPERIMENT_STORE_PATH)
+        if IMPORT_RESULTS_CSV_FILES:
+            experiment_store.import_results_directory("results")
+        scenario_id = experiment_store.get_scenario_id(starting_money=STARTING_RESOURCES,
+                                                       number_of_bases=NUMBER_OF_BASES,
+                                                       resource_trigger=RESOURCE_TRIGGER_VALUE,
+                                                       simulation_time_seconds=SIMULATION_TIME_SECONDS,
+                                                       pause_timer=SUBSEQUENT_BASE_PAUSE_TIMER_SECONDS,
+                                                       temple_needed=IS_TEMPLE_REQUIRED_TO_START_PAUSE_TIMER)
+        generate_orders_building_blocks.seen_hash_list.update(experiment_store.get_build_orders(scenario_id))
+        stored_results = experiment_store.get_results(scenario_id)
+        for final_sim_time, build_orders in stored_results:
+            results_aggregator.add(final_sim_time, build_orders)
+        print(f"Loaded {len(stored_results)} results for these settings from the experiment store")
+
+    # Results are written to new csv files as they are made, so a crash only loses the last few
+    results_writer = StreamingResultsWriter(output_directory=RESULTS_DIRECTORY,
+                                            max_rows_per_file=RESULTS_ROWS_PER_FILE,
+                                            flush_rows=RESULTS_FLUSH_ROWS,
+                                            flush_seconds=RESULTS_FLUSH_SECONDS,
+                                            extra_columns=[str(resource_trigger_value) for resource_trigger_value in
+                                                           sorted(LOWER_RESOURCE_TRIGGER_VALUES)])
+
+    # The profiler only changes the simulation methods while it is enabled, so it costs nothing when it is off
+    phase_profiler = None
+    if PROFILE_PHASES:
+        phase_profiler = PhaseProfiler(profile_iterations=PROFILE_ITERATIONS, profile_every=PROFILE_EVERY)
+        phase_profiler.enable()
+
+    print(f"Beginning execution... random seed: {seed}")
+    if GENETIC_OPTIMIZER:
+        run_genetic_optimizer(generate_orders_building_blocks, results_writer, results_aggregator,
+                              experiment_store, scenario_id)
+    elif SIMULATED_ANNEALING:
+        run_simulated_annealing(generate_orders_building_blocks, results_writer, results_aggregator,
+                                experiment_store, scenario_id)
+    elif NUMBER_OF_WORKERS > 1:
+        run_parallel_simulations(seed, results_writer, results_aggregator, experiment_store, scenario_id)
+    elif BATCH_SIMULATION_SIZE > 0 and not LOWER_RESOURCE_TRIGGER_VALUES:
+        run_batch_simulations(generate_orders_building_blocks, results_writer, results_aggregator,
+                              experiment_store, scenario_id)
+    elif PREFIX_TRIE_BATCH_SIZE > 0 and not LOWER_RESOURCE_TRIGGER_VALUES:
+        run_prefix_trie_simulations(generate_orders_building_blocks, results_writer, results_aggregator,
+                                    experiment_store, scenario_id)
+    elif COMPILED_BATCH_SIZE > 0 and importlib.util.find_spec("numba") is not None and not DEBUG_MODE and \
+            not FINE_DEBUG and not ABORT_SLOWER_THAN_BEST and CANONICAL_RESULT_CACHE_SIZE == 0 and \
+            not LOWER_RESOURCE_TRIGGER_VALUES:
+        run_compiled_simulations(generate_orders_building_blocks, results_writer, results_aggregator,
+                                 experiment_store, scenario_id)
+    else:
+        run_single_simulations(generate_orders_building_blocks, results_writer, results_aggregator,
+                               experiment_store, scenario_id)
+
+    # Final print out logic
+    results_writer.close()
+    if phase_profiler is not None:
+        phase_profiler.disable()
+        print(phase_profiler.get_summary_string())
+        if phase_profiler.profiled_iterations:
+            print(phase_profiler.get_profile_string())
+            phase_profiler.dump_profile(PROFILE_OUTPUT_PATH)
+            print(f"cProfile capture saved to {PROFILE_OUTPUT_PATH}")
+    print(f"Results saved to {', '.join(results_writer.output_paths)}")
+    if SAVE_COLUMNAR_RESULTS:
+        # NumPy is only needed for the columnar results
+        from libraries.ColumnarResults import write_columnar_results
+
+        columnar_directory = os.path.join(RESULTS_DIRECTORY, "columnar", results_writer.run_name)
+        write_columnar_results(results_writer.read_results(), columnar_directory)
+        print(f"Columnar results saved to {columnar_directory}")
+    results_aggregator.report()
+    if experiment_store is not None:
+        print(f"Experiment store has {len(experiment_store.get_results(scenario_id))} results for these settings")
+        experiment_store.close()
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Executable for simulating the same random build orders over a grid of scenario settings and BaseConstants costs and
+times, instead of editing the settings of run_build_combinations and rerunning it for every scenario. Writes a results
+table for each cell of the grid and a summary of the fastest build order of each cell.
+
+Note: the worker processes import this file again, so it must not import the simulation modules, which copy the
+BaseConstants when they are imported.
+
+"""
+import os
+import random
+
+from libraries.ParameterSweep import ParameterSweep
+
+# Values of each scenario setting to sweep, every combination is a cell. Settings that are left out use the defaults
+# from ParameterSweep.SCENARIO_DEFAULTS. The pause timer and temple flag are for every base after the first
+SCENARIO_GRID = {
+    "starting_money": [800],
+    "number_of_bases": [1, 2],
+    "resource_trigger": [3000, 3300, 6800],
+    "simulation_time_seconds": [1000],
+    "pause_timer": [0],
+    "temple_needed": [False],
+}
+# Values of the BaseConstants costs and times to sweep, by name from ParameterSweep.SWEEP_CONSTANTS, every combination
+# with every scenario is a cell. Constants that are left out keep their BaseConstants value
+CONSTANTS_GRID = {
+}
+# Number of random build orders generated for each number of bases. Every cell with the same number of bases simulates
+# the same build orders
+NUMBER_OF_BUILD_ORDERS = 10000
+# Seed for the random build orders so a sweep can be repeated. Set to None to pick a new seed every sweep
+RANDOM_SEED = None
+# Number of worker processes the cells are spread over
+NUMBER_OF_WORKERS = os.cpu_count() or 1
+# Number of build orders simulated in each worker process
+CHUNK_SIZE = 2000
+# Use the event driven simulation, which skips the in game seconds where nothing happens. Same results, faster runtimes
+EVENT_DRIVEN_SIMULATION = True
+# If no Temple is listed in final results, remove it if enabled
+REMOVE_IF_NO_TEMPLE = True
+# Directory the sweep directory, with the results tables and the summary, is made in
+SWEEP_OUTPUT_DIRECTORY = "results/sweeps"
+
+
+def main():
+    seed = RANDOM_SEED if RANDOM_SEED is not None else random.randrange(2 ** 32)
+    parameter_sweep = ParameterSweep(scenario_grid=SCENARIO_GRID,
+                                     constants_grid=CONSTANTS_GRID,
+                                     number_of_build_orders=NUMBER_OF_BUILD_ORDERS,
+                                     seed=seed,
+                                     number_of_workers=NUMBER_OF_WORKERS,
+                                     chunk_size=CHUNK_SIZE,
+                                     event_driven=EVENT_DRIVEN_SIMULATION,
+                                     require_temple=REMOVE_IF_NO_TEMPLE)
+    cells = parameter_sweep.get_cells()
+    print(f"Sweeping {len(cells)} cells in {len(parameter_sweep.get_cell_groups(cells))} groups with "
+          f"{NUMBER_OF_WORKERS} workers... random seed: {seed}")
+
+    summary = parameter_sweep.run(SWEEP_OUTPUT_DIRECTORY)
+    for cell, results_aggregator in summary:
+        settings = ", ".join(f"{name} {value}" for name, value in {**cell.scenario, **cell.constants}.items())
+        best_time, best_build_order = results_aggregator.get_best_result()
+        print(f"{cell.name}: {settings}")
+        if best_build_order is None:
+            print(f"    No build order reached the resource trigger, {results_aggregator.number_of_results} results")
+        else:
+            print(f"    {best_time} seconds, orders: {best_build_order}")
+    print(f"Results saved to {parameter_sweep.sweep_directory}")
+
+
+if __name__ == "__main__":
+    main()
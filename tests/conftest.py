@@ -0,0 +1,26 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Fixtures shared by the tests: every scenario, a seeded corpus of build orders for it, and their results from the tick
+by tick simulation the other engines are checked against.
+
+"""
+import pytest
+
+from tests.simulation_helpers import SCENARIOS, get_build_orders, simulate
+
+
+@pytest.fixture(params=SCENARIOS, ids=lambda scenario: "{}b_{}p_{}".format(*scenario))
+def scenario(request) -> tuple:
+    return request.param
+
+
+@pytest.fixture
+def build_orders(scenario: tuple) -> list[bytes]:
+    return get_build_orders(scenario[0], seed=1234)
+
+
+@pytest.fixture
+def tick_results(scenario: tuple, build_orders: list[bytes]) -> list:
+    return [simulate(packed_build_order, scenario)[:2] for packed_build_order in build_orders]
@@ -0,0 +1,61 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Settings and helpers shared by the tests, to set up the scenarios of run_build_combinations, generate seeded build
+orders and simulate them one tick at a time with RuntimeBuildingBlocks.run_simulation.
+
+"""
+import random
+
+from libraries.BuildOrderEncoding import decode_build_order
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.SimulatorWrapper import SimulatorWrapper
+
+STARTING_MONEY = 800
+SIMULATION_TIME_SECONDS = 1000
+RESOURCE_TRIGGER = 3000
+NUMBER_OF_BUILD_ORDERS = 60
+
+# Number of bases, pause timer of the bases after the first and if a temple is needed to start it
+SCENARIOS = [(1, 0, False), (2, 0, False), (2, 120, True), (3, 30, False)]
+
+
+def make_sim_wrapper(number_of_bases: int, pause_timer: int, temple_needed: bool,
+                     event_driven=False) -> SimulatorWrapper:
+    """
+    Make a SimulatorWrapper with the bases of run_build_combinations, the first base a KEEP and the others empty and
+    paused for the pause timer.
+    """
+    sim_wrapper = SimulatorWrapper(starting_money=STARTING_MONEY, fine_debug=False, event_driven=event_driven)
+    sim_wrapper.add_bases(number_of_bases=number_of_bases, pause_timer=pause_timer,
+                          temple_needed_to_clear_second_base=temple_needed)
+    return sim_wrapper
+
+
+def get_build_orders(number_of_bases: int, seed: int) -> list[bytes]:
+    """
+    Generate a seeded corpus of packed build orders, without duplicates.
+    """
+    generate_orders_building_blocks = GenerateOrdersBuildingBlocks(random_generator=random.Random(seed))
+    packed_build_orders = []
+    while len(packed_build_orders) < NUMBER_OF_BUILD_ORDERS:
+        packed_build_order = generate_orders_building_blocks.generate_random_packed_build_order(number_of_bases)
+        if not generate_orders_building_blocks.is_packed_build_order_seen(packed_build_order):
+            packed_build_orders.append(packed_build_order)
+    return packed_build_orders
+
+
+def simulate(packed_build_order: bytes, scenario: tuple, resource_trigger=RESOURCE_TRIGGER, event_driven=False,
+             cutoff_time=None) -> list:
+    """
+    Simulate a packed build order with its own SimulatorWrapper.
+
+    :return: list: [final time, build order string, outcome]
+    """
+    sim_wrapper = make_sim_wrapper(*scenario, event_driven=event_driven)
+    build_order = decode_build_order(packed_build_order, sim_wrapper.base_list)
+    final_time = sim_wrapper.run_simulation(build_order=build_order, resource_trigger=resource_trigger,
+                                            simulation_time_seconds=SIMULATION_TIME_SECONDS, cutoff_time=cutoff_time)
+    return [final_time, GenerateOrdersBuildingBlocks.build_order_print(build_order),
+            sim_wrapper.last_simulation_outcome]
@@ -0,0 +1,51 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the SimulatedAnnealingOptimizer, which re-simulates each move from a checkpoint of the current build order,
+gives the same results as simulating every build order from the start.
+
+"""
+import random
+
+from libraries.AnnealingOptimizer import SimulatedAnnealingOptimizer, SimulationCheckpoints
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, STARTING_MONEY, make_sim_wrapper, \
+    simulate
+
+
+def make_optimizer(scenario: tuple, number_of_iterations=150) -> SimulatedAnnealingOptimizer:
+    number_of_bases, pause_timer, temple_needed = scenario
+    return SimulatedAnnealingOptimizer(starting_money=STARTING_MONEY, number_of_bases=number_of_bases,
+                                       resource_trigger=RESOURCE_TRIGGER,
+                                       simulation_time_seconds=SIMULATION_TIME_SECONDS,
+                                       number_of_iterations=number_of_iterations, pause_timer=pause_timer,
+                                       temple_needed_to_clear_second_base=temple_needed,
+                                       random_generator=random.Random(3))
+
+
+def test_checkpoint_simulation_matches_full_simulation(scenario, build_orders, tick_results):
+    annealing_optimizer = make_optimizer(scenario)
+    start = SimulationCheckpoints(b"", [[make_sim_wrapper(*scenario, event_driven=True), 0, b""]], 0, b"", None)
+    # Each build order continues from the checkpoints of the one before it, which share a prefix with some of them
+    parent = annealing_optimizer.simulate(build_orders[0], start)
+    for packed_build_order, tick_result in zip(build_orders, tick_results):
+        spliced_build_order = GenerateOrdersBuildingBlocks.repair_build_order(
+            GenerateOrdersBuildingBlocks.get_build_order_genes(parent.packed_build_order[:3] + packed_build_order[3:]),
+            scenario[0])
+        for child_build_order in (packed_build_order, packed_build_order[:-1], spliced_build_order):
+            child = annealing_optimizer.simulate(child_build_order, parent)
+            expected = tick_result if child_build_order == packed_build_order else \
+                simulate(child_build_order, scenario)[:2]
+            assert [child.final_time, child.build_order_string] == expected
+        parent = annealing_optimizer.simulate(packed_build_order, parent)
+
+
+def test_run_results_match_full_simulation(scenario):
+    annealing_optimizer = make_optimizer(scenario)
+    results = annealing_optimizer.run()
+    for packed_build_order, final_time, build_order_string in results:
+        assert simulate(packed_build_order, scenario)[:2] == [final_time, build_order_string]
+    fastest_times = [final_time for _, final_time, build_order_string in results
+                     if final_time is not None and "TEMPLE" in build_order_string]
+    assert annealing_optimizer.best_time == min(fastest_times, default=None)
@@ -0,0 +1,62 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks the compact state of Base and the build slots: no instance dicts, shared empty build slots that are only
+replaced once a build is approved, and copies of a simulation that do not share any state that changes.
+
+"""
+from libraries.BaseConstants import BuildResult
+from libraries.BuildOrderEncoding import decode_build_order
+from libraries.BuildSlotClasses import EmptySLot, SupplyPad
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, make_sim_wrapper
+
+
+def test_no_instance_dicts():
+    sim_wrapper = make_sim_wrapper(1, 0, False)
+    base = sim_wrapper.base_list[0]
+    assert base.build_supply_pad(1) == BuildResult.APPROVED
+    assert base.build_temple(2) == BuildResult.APPROVED
+    for instance in [base, *base.build_slots.values()]:
+        assert not hasattr(instance, "__dict__"), type(instance).__name__
+
+
+def test_empty_slots_shared_until_approved():
+    first_base, second_base = make_sim_wrapper(2, 0, False).base_list
+    assert all(first_base.build_slots[slot] is second_base.build_slots[slot] for slot in first_base.build_slots)
+
+    sim_wrapper = make_sim_wrapper(1, 0, False)
+    base = sim_wrapper.base_list[0]
+    sim_wrapper.resource_manager.current_money = 0
+    assert base.build_supply_pad(1) == BuildResult.NOT_ENOUGH_RESOURCES
+    assert type(base.build_slots[1]) is EmptySLot and base.build_queue == []
+
+    sim_wrapper.resource_manager.current_money = 800
+    assert base.build_supply_pad(1) == BuildResult.APPROVED
+    assert type(base.build_slots[1]) is SupplyPad and base.build_queue == [base.build_slots[1]]
+    # The other bases keep the shared empty slot
+    assert type(first_base.build_slots[1]) is EmptySLot
+
+
+def test_copy_does_not_share_state(scenario, build_orders):
+    for packed_build_order in build_orders[:10]:
+        sim_wrapper = make_sim_wrapper(*scenario)
+        base = sim_wrapper.base_list[0]
+        assert base.build_supply_pad(1) == BuildResult.APPROVED
+        money = sim_wrapper.resource_manager.current_money
+        slot_state = (base.build_slots[1].status, base.build_slots[1].build_timer)
+
+        sim_copy = sim_wrapper.copy()
+        copy_base = sim_copy.base_list[0]
+        assert copy_base.build_slots[1] is not base.build_slots[1]
+        assert copy_base.build_queue == [copy_base.build_slots[1]]
+        build_order = decode_build_order(packed_build_order[1:], sim_copy.base_list)
+        final_time = sim_copy.run_simulation(build_order=build_order, resource_trigger=RESOURCE_TRIGGER,
+                                             simulation_time_seconds=SIMULATION_TIME_SECONDS)
+
+        # The original did not change, and simulates the same as the copy
+        assert sim_wrapper.resource_manager.current_money == money
+        assert (base.build_slots[1].status, base.build_slots[1].build_timer) == slot_state
+        build_order = decode_build_order(packed_build_order[1:], sim_wrapper.base_list)
+        assert sim_wrapper.run_simulation(build_order=build_order, resource_trigger=RESOURCE_TRIGGER,
+                                          simulation_time_seconds=SIMULATION_TIME_SECONDS) == final_time
@@ -0,0 +1,24 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the BatchSimulator gives the same results as the tick by tick simulation.
+
+"""
+from libraries.BatchSimulator import BatchSimulator
+from libraries.BuildOrderEncoding import decode_build_order
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, STARTING_MONEY, make_sim_wrapper
+
+
+def test_batch_simulator_matches_tick(scenario, build_orders, tick_results):
+    number_of_bases, pause_timer, temple_needed = scenario
+    batch_simulator = BatchSimulator(starting_money=STARTING_MONEY)
+    batch_simulator.add_bases(number_of_bases, pause_timer, temple_needed)
+    base_list = make_sim_wrapper(*scenario).base_list
+    decoded_build_orders = [decode_build_order(packed_build_order, base_list) for packed_build_order in build_orders]
+
+    final_times = batch_simulator.run_simulation(decoded_build_orders, resource_trigger=RESOURCE_TRIGGER,
+                                                 simulation_time_seconds=SIMULATION_TIME_SECONDS)
+    assert [[final_time, GenerateOrdersBuildingBlocks.build_order_print(build_order)]
+            for final_time, build_order in zip(final_times, decoded_build_orders)] == tick_results
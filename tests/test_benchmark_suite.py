@@ -0,0 +1,70 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the benchmark baseline is saved with the settings of its run, that its checksums are only compared when the
+settings are the same, and that the tick and event driven simulations of a corpus have the same checksum.
+
+"""
+from libraries.BenchmarkSuite import BenchmarkSuite, compare_to_baseline, get_changed_settings, load_baseline, \
+    save_baseline
+
+
+def get_results(checksum: str, rate: float) -> dict:
+    """
+    Benchmark results with a single simulate benchmark.
+    """
+    return {"simulate_tick_1b_3000r": {"rate": rate, "unit": "simulations/s", "ticks_per_second": 0,
+                                       "peak_memory_kib": 0, "checksum": checksum}}
+
+
+def test_baseline_round_trip(tmp_path):
+    baseline_path = str(tmp_path / "benchmark_baseline.json")
+    assert load_baseline(baseline_path) == {}
+    settings = BenchmarkSuite(corpus_size=10, seed=7, update_calls=100).get_settings()
+    save_baseline(get_results("a", 100), baseline_path, settings)
+    baseline = load_baseline(baseline_path)
+    assert baseline == {"settings": {"corpus_size": 10, "seed": 7, "update_calls": 100},
+                        "results": get_results("a", 100)}
+    assert get_changed_settings(settings, baseline) == []
+
+
+def test_changed_checksum_flagged_with_same_settings(tmp_path):
+    baseline_path = str(tmp_path / "benchmark_baseline.json")
+    settings = BenchmarkSuite(corpus_size=10).get_settings()
+    save_baseline(get_results("a", 100), baseline_path, settings)
+    messages = compare_to_baseline(get_results("b", 100), load_baseline(baseline_path), 0.2)
+    assert len(messages) == 1 and "results changed" in messages[0]
+
+
+def test_checksums_skipped_with_changed_settings(tmp_path):
+    baseline_path = str(tmp_path / "benchmark_baseline.json")
+    save_baseline(get_results("a", 100), baseline_path, BenchmarkSuite(corpus_size=10).get_settings())
+    baseline = load_baseline(baseline_path)
+    changed_settings = get_changed_settings(BenchmarkSuite(corpus_size=20).get_settings(), baseline)
+    assert changed_settings == ["corpus_size is 20, the baseline was run with 10"]
+    assert compare_to_baseline(get_results("b", 100), baseline, 0.2, compare_checksums=False) == []
+    # Rates are still compared
+    messages = compare_to_baseline(get_results("b", 50), baseline, 0.2, compare_checksums=False)
+    assert len(messages) == 1 and "slower" in messages[0]
+
+
+def test_baseline_without_settings(tmp_path):
+    baseline_path = tmp_path / "benchmark_baseline.json"
+    baseline_path.write_text('{"simulate_tick_1b_3000r": {"rate": 100, "unit": "simulations/s", '
+                             '"ticks_per_second": 0, "peak_memory_kib": 0, "checksum": "a"}}')
+    baseline = load_baseline(str(baseline_path))
+    assert baseline["results"] == get_results("a", 100)
+    assert len(get_changed_settings(BenchmarkSuite().get_settings(), baseline)) == 3
+
+
+def test_tick_and_event_driven_checksums_match():
+    results = BenchmarkSuite(corpus_size=5, repeats=1, update_calls=100).run(print_mode=False)
+    tick_names = [name for name in results if name.startswith("simulate_tick_")]
+    assert tick_names
+    for name in tick_names:
+        assert results[name]["checksum"] == results[name.replace("_tick_", "_event_")]["checksum"]
+    # Seeded, so a second run has the same checksums
+    second_results = BenchmarkSuite(corpus_size=5, repeats=1, update_calls=100).run(print_mode=False)
+    assert {name: result["checksum"] for name, result in second_results.items()} == \
+        {name: result["checksum"] for name, result in results.items()}
@@ -0,0 +1,39 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the packed build orders round trip through the build order lists and text, and that their fingerprints
+are stable.
+
+"""
+import pytest
+
+from libraries.BuildOrderEncoding import MAX_NUMBER_OF_BASES, check_number_of_bases, decode_build_order, \
+    encode_build_order, fingerprint, packed_to_text, text_to_packed
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from tests.simulation_helpers import make_sim_wrapper
+
+
+def test_encoding_round_trip(scenario, build_orders):
+    base_list = make_sim_wrapper(*scenario).base_list
+    for packed_build_order in build_orders:
+        build_order = decode_build_order(packed_build_order, base_list)
+        assert encode_build_order(build_order) == packed_build_order
+        build_order_string = packed_to_text(packed_build_order)
+        assert build_order_string == GenerateOrdersBuildingBlocks.build_order_print(build_order)
+        assert packed_to_text(text_to_packed(build_order_string)) == build_order_string
+
+
+def test_too_many_bases_rejected():
+    check_number_of_bases(MAX_NUMBER_OF_BASES)
+    with pytest.raises(ValueError):
+        check_number_of_bases(MAX_NUMBER_OF_BASES + 1)
+    with pytest.raises(ValueError):
+        GenerateOrdersBuildingBlocks().generate_random_packed_build_order(MAX_NUMBER_OF_BASES + 1)
+
+
+def test_fingerprint_is_stable():
+    packed_build_order = bytes.fromhex("090a0b0c4d88c9")
+    # Saved in the experiment store, so it must be the same in every session, unlike the built-in hash
+    assert fingerprint(packed_build_order) == 9522847450773508899
+    assert fingerprint(packed_build_order) != fingerprint(packed_build_order[:-1])
@@ -0,0 +1,54 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the branch and bound BuildOrderEnumerator finds the same best time as an exhaustive search.
+
+"""
+import math
+import random
+
+import pytest
+
+from libraries.BuildOrderEnumerator import BuildOrderEnumerator
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from tests.simulation_helpers import SIMULATION_TIME_SECONDS, STARTING_MONEY, simulate
+
+
+class ExhaustiveBuildOrderEnumerator(BuildOrderEnumerator):
+    """
+    BuildOrderEnumerator that never prunes, so it simulates every build order in the search tree.
+    """
+    def get_money_upper_bound(self, node, final_time, money_needed=math.inf) -> float:
+        return math.inf
+
+
+@pytest.mark.parametrize("number_of_bases, resource_trigger, max_build_order_length, require_temple, pause_timer", [
+    (1, 1500, 5, False, 0),
+    (1, 3000, 6, True, 0),
+    (2, 2000, 5, False, 0),
+    (2, 3000, 5, True, 60),
+    (3, 2000, 4, True, 30),
+])
+def test_enumerator_matches_exhaustive_search(number_of_bases, resource_trigger, max_build_order_length,
+                                              require_temple, pause_timer):
+    settings = dict(starting_money=STARTING_MONEY, number_of_bases=number_of_bases, resource_trigger=resource_trigger,
+                    simulation_time_seconds=SIMULATION_TIME_SECONDS, require_temple=require_temple,
+                    max_build_order_length=max_build_order_length, pause_timer=pause_timer,
+                    temple_needed_to_clear_second_base=True)
+    build_order_enumerator = BuildOrderEnumerator(**settings)
+    best_time, packed_build_order = build_order_enumerator.run()
+    exhaustive_enumerator = ExhaustiveBuildOrderEnumerator(**settings)
+    assert exhaustive_enumerator.run()[0] == best_time
+    assert build_order_enumerator.nodes_searched <= exhaustive_enumerator.nodes_searched
+
+    scenario = (number_of_bases, pause_timer, True)
+    assert simulate(packed_build_order, scenario, resource_trigger)[0] == best_time
+    if not require_temple:
+        # No random build order of the same length is faster
+        generate_orders_building_blocks = GenerateOrdersBuildingBlocks(
+            max_number_of_builds_in_build_order_random_top=max_build_order_length, random_generator=random.Random(7))
+        for _ in range(200):
+            final_time = simulate(generate_orders_building_blocks.generate_random_packed_build_order(number_of_bases),
+                                  scenario, resource_trigger)[0]
+            assert final_time is None or final_time >= best_time
@@ -0,0 +1,105 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the CanonicalResultCache gives the same results as simulating, and that it finds the build orders that only
+differ in skipped orders after the last approved order, or in skipped orders before an order that waits anyway.
+
+"""
+import pytest
+
+from libraries.BaseConstants import Orders
+from libraries.BuildOrderEncoding import decode_build_order, pack_order, text_to_packed
+from libraries.CanonicalResultCache import CanonicalResultCache, canonicalize_build_order
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, make_sim_wrapper, simulate
+
+
+def simulate_and_add(result_cache: CanonicalResultCache, canonical_build_order: bytes, scenario: tuple,
+                     event_driven=False) -> list:
+    """
+    Simulate a canonical build order and add its result to the cache, the same as run_build_combinations.
+
+    :return: list: [final time, build order string]
+    """
+    sim_wrapper = make_sim_wrapper(*scenario, event_driven=event_driven)
+    build_order = decode_build_order(canonical_build_order, sim_wrapper.base_list)
+    final_time = sim_wrapper.run_simulation(build_order=build_order, resource_trigger=RESOURCE_TRIGGER,
+                                            simulation_time_seconds=SIMULATION_TIME_SECONDS)
+    runtime_building_blocks = sim_wrapper.runtime_building_blocks
+    last_tick = final_time if final_time is not None else SIMULATION_TIME_SECONDS - 1
+    result_cache.add_result(canonical_build_order, build_order, final_time, last_tick,
+                            runtime_building_blocks.last_order_index, runtime_building_blocks.last_order_result,
+                            runtime_building_blocks.last_order_times)
+    return [final_time, GenerateOrdersBuildingBlocks.build_order_print(build_order)]
+
+
+def get_cached_result(result_cache: CanonicalResultCache, build_order_string: str):
+    return result_cache.get_result(canonicalize_build_order(text_to_packed(build_order_string)))
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_matches_tick(scenario, build_orders, event_driven):
+    # Upgrading a slot without a supply pad is always skipped, so build orders that only differ in which empty slot
+    # they upgrade first are hits, the same as build orders that only differ in orders that were never reached or in a
+    # repeated order that is skipped
+    corpus = list(build_orders)
+    for slot in (6, 7):
+        empty_slot_upgrade = bytes([pack_order(Orders.UPGRADE_SUPPLY_PAD, 1, slot)])
+        corpus += [empty_slot_upgrade + packed_build_order for packed_build_order in build_orders[:20]]
+    corpus += [packed_build_order + packed_build_order[-1:] for packed_build_order in build_orders]
+    corpus += [packed_build_order[:k] + packed_build_order[k - 1:] for packed_build_order in build_orders
+               for k in (1, 3)]
+    result_cache = CanonicalResultCache()
+    for packed_build_order in corpus:
+        canonical_build_order = canonicalize_build_order(packed_build_order)
+        expected = simulate(packed_build_order, scenario)[:2]
+        cached_result = result_cache.get_result(canonical_build_order)
+        if cached_result is not None:
+            assert cached_result == expected
+        else:
+            assert simulate_and_add(result_cache, canonical_build_order, scenario, event_driven) == expected
+
+    assert result_cache.hits > 0
+
+
+def test_trailing_skips_hit():
+    result_cache = CanonicalResultCache()
+    # The supply pad upgrade is skipped, since nothing gives the tech level for it
+    expected = simulate_and_add(result_cache, canonicalize_build_order(text_to_packed("TEMPLE 1, SUPPLY 1, U_SPLY 1")),
+                                (1, 0, False))
+    assert expected == [995, "TEMPLE 1, SUPPLY 1, "]
+    assert get_cached_result(result_cache, "TEMPLE 1, SUPPLY 1") == expected
+    assert get_cached_result(result_cache, "TEMPLE 1, SUPPLY 1, U_SPLY 1, U_SPLY 1") == expected
+
+
+def test_skip_before_waiting_order_hits():
+    result_cache = CanonicalResultCache()
+    # Saves that a second TEMPLE is skipped right away
+    simulate_and_add(result_cache, canonicalize_build_order(text_to_packed("SUPPLY 1, TEMPLE 1, TEMPLE 1")),
+                     (1, 0, False))
+    expected = simulate_and_add(result_cache, canonicalize_build_order(text_to_packed("SUPPLY 1, TEMPLE 1, U_SPLY 1")),
+                                (1, 0, False))
+    # With the second TEMPLE the supply pad upgrade is tried a game tick later, and still waits for the tech level
+    # until the same game tick
+    assert get_cached_result(result_cache, "SUPPLY 1, TEMPLE 1, TEMPLE 1, U_SPLY 1") == expected
+    # An order that was never tried on that history is a miss
+    assert get_cached_result(result_cache, "SUPPLY 1, TEMPLE 1, SUPPLY 1") is None
+
+
+def test_hit_rate():
+    result_cache = CanonicalResultCache()
+    assert result_cache.get_hit_rate() == 0.0
+    simulate_and_add(result_cache, canonicalize_build_order(text_to_packed("SUPPLY 1, TEMPLE 1, TEMPLE 1")),
+                     (1, 0, False))
+    assert get_cached_result(result_cache, "SUPPLY 1, TEMPLE 1") is not None
+    assert get_cached_result(result_cache, "TEMPLE 1") is None
+    assert (result_cache.hits, result_cache.misses) == (1, 1)
+    assert result_cache.get_hit_rate() == 0.5
+
+
+def test_full_cache_adds_nothing():
+    result_cache = CanonicalResultCache(max_entries=0)
+    simulate_and_add(result_cache, canonicalize_build_order(text_to_packed("SUPPLY 1, TEMPLE 1")), (1, 0, False))
+    assert result_cache.number_of_entries == 0
+    assert get_cached_result(result_cache, "SUPPLY 1, TEMPLE 1") is None
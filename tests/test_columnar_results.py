@@ -0,0 +1,46 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that results round trip through the columnar format, from lists and from the results csv files.
+
+"""
+import os
+
+import pytest
+
+from libraries.ColumnarResults import ColumnarResults, convert_results_directory, read_results_csv, \
+    write_columnar_results
+from libraries.StreamingResultsWriter import StreamingResultsWriter
+
+
+@pytest.mark.parametrize("mmap_mode", ["r", None])
+def test_round_trip(tmp_path, tick_results, mmap_mode):
+    # An empty build order string and a timed out result, which every scenario might not have
+    results = tick_results + [[None, ""], [250, "SUPPLY 1, "]]
+    assert write_columnar_results(iter(results), str(tmp_path)) == len(results)
+
+    columnar_results = ColumnarResults(str(tmp_path), mmap_mode=mmap_mode)
+    assert len(columnar_results) == len(results)
+    assert list(columnar_results.read_results()) == results
+    assert columnar_results.get_finished_mask().tolist() == [final_time is not None for final_time, _ in results]
+    assert len(columnar_results.dictionary) == len({token for _, build_order_string in results
+                                                    for token in build_order_string.split(", ") if token})
+
+
+def test_convert_results_directory(tmp_path, tick_results):
+    results_directory = str(tmp_path / "results")
+    with StreamingResultsWriter(results_directory, flush_rows=7) as writer:
+        for final_time, build_order_string in tick_results:
+            writer.write(final_time, build_order_string)
+    # Legacy files can be several runs saved one after the other, each with a header row
+    os.makedirs(os.path.join(results_directory, "legacy_runs"))
+    legacy_path = os.path.join(results_directory, "legacy_runs", "output.csv")
+    with open(legacy_path, 'w') as legacy_file:
+        legacy_file.write("Number,Character\n300,\"SUPPLY, TEMPLE, \"\nNumber,Character\n,\"SUPPLY, \"\n")
+    assert list(read_results_csv(legacy_path)) == [[300, "SUPPLY, TEMPLE, "], [None, "SUPPLY, "]]
+
+    converted = convert_results_directory(results_directory, str(tmp_path / "columnar"))
+    assert [number_of_results for _, _, number_of_results in converted] == [len(tick_results), 2]
+    assert list(ColumnarResults(converted[0][1]).read_results()) == tick_results
+    assert list(ColumnarResults(converted[1][1]).read_results()) == [[300, "SUPPLY, TEMPLE, "], [None, "SUPPLY, "]]
@@ -0,0 +1,46 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the kernel of the CompiledSimulator gives the same results as the tick by tick simulation, run as Python
+code and, when Numba is installed, compiled.
+
+"""
+import numpy as np
+import pytest
+
+from libraries.CompiledSimulator import CompiledSimulator
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, STARTING_MONEY
+
+
+def test_compiled_kernel_matches_tick(scenario, build_orders, tick_results):
+    number_of_bases, pause_timer, temple_needed = scenario
+    compiled_simulator = CompiledSimulator(starting_money=STARTING_MONEY, use_compiled_kernel=False)
+    compiled_simulator.add_bases(number_of_bases, pause_timer, temple_needed)
+
+    # The kernel is run as Python code when Numba is not installed
+    assert compiled_simulator.verify(build_orders, resource_trigger=RESOURCE_TRIGGER,
+                                     simulation_time_seconds=SIMULATION_TIME_SECONDS) == []
+    assert compiled_simulator.run_packed(build_orders, resource_trigger=RESOURCE_TRIGGER,
+                                         simulation_time_seconds=SIMULATION_TIME_SECONDS) == tick_results
+
+
+def test_numba_kernel_matches_tick(scenario, build_orders, tick_results):
+    pytest.importorskip("numba")
+    number_of_bases, pause_timer, temple_needed = scenario
+    compiled_simulator = CompiledSimulator(starting_money=STARTING_MONEY, use_compiled_kernel=True)
+    compiled_simulator.add_bases(number_of_bases, pause_timer, temple_needed)
+    encoded = compiled_simulator.encode_packed_build_orders(build_orders)
+
+    final_times, skipped = compiled_simulator.run_encoded(encoded, resource_trigger=RESOURCE_TRIGGER,
+                                                          simulation_time_seconds=SIMULATION_TIME_SECONDS)
+    python_final_times, python_skipped = compiled_simulator.run_encoded(
+        encoded, resource_trigger=RESOURCE_TRIGGER, simulation_time_seconds=SIMULATION_TIME_SECONDS, compiled=False)
+    assert np.array_equal(final_times, python_final_times)
+    assert np.array_equal(skipped, python_skipped)
+
+    # Build orders the compiled kernel does not support raise in run_packed, SimulatorWrapper runs those
+    supported = [j for j, final_time in enumerate(final_times) if final_time >= -1]
+    assert compiled_simulator.run_packed([build_orders[j] for j in supported], resource_trigger=RESOURCE_TRIGGER,
+                                         simulation_time_seconds=SIMULATION_TIME_SECONDS) == \
+        [tick_results[j] for j in supported]
@@ -0,0 +1,22 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the cutoff time only aborts the simulations that could not reach the resource trigger before it.
+
+"""
+import pytest
+
+from libraries.BaseConstants import SimulationOutcome
+from tests.simulation_helpers import simulate
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_cutoff_only_aborts_slower_build_orders(scenario, build_orders, tick_results, event_driven):
+    for cutoff_time in (250, 350, 450):
+        for packed_build_order, (final_time, build_order_string) in zip(build_orders, tick_results):
+            result = simulate(packed_build_order, scenario, event_driven=event_driven, cutoff_time=cutoff_time)
+            if result[2] == SimulationOutcome.ABORTED:
+                assert final_time is None or final_time >= cutoff_time
+            else:
+                assert result[:2] == [final_time, build_order_string]
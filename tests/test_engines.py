@@ -0,0 +1,39 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that RuntimeBuildingBlocks.run_simulation, one tick at a time and event driven, gives the same results as the
+baseline commit, and that the event driven simulation gives the same results as the tick by tick one on fixed seeds.
+The other simulation engines are checked against the tick by tick simulation in their own test modules.
+
+"""
+import json
+import os
+
+import pytest
+
+from tests.simulation_helpers import simulate
+
+# Results of the baseline commit, before any engine was added, on seeded build orders of every scenario and a few
+# resource triggers. Made with that commit's SimulatorWrapper and Base, so a change to the tick by tick simulation that
+# every engine shares still shows up
+BASELINE_RESULTS_PATH = os.path.join(os.path.dirname(__file__), "baseline_results.json")
+
+
+def load_baseline_results() -> list[dict]:
+    with open(BASELINE_RESULTS_PATH) as baseline_file:
+        return json.load(baseline_file)
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_matches_baseline_commit(event_driven):
+    for row in load_baseline_results():
+        scenario = (row["number_of_bases"], row["pause_timer"], row["temple_needed_to_clear_second_base"])
+        result = simulate(bytes.fromhex(row["packed_build_order"]), scenario, row["resource_trigger"],
+                          event_driven=event_driven)
+        assert result[:2] == [row["final_time"], row["build_order_string"]], row
+
+
+def test_event_driven_matches_tick(scenario, build_orders, tick_results):
+    for packed_build_order, tick_result in zip(build_orders, tick_results):
+        assert simulate(packed_build_order, scenario, event_driven=True)[:2] == tick_result
@@ -0,0 +1,36 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the experiment store keeps the results and generated build orders of each scenario across sessions.
+
+"""
+from libraries.ExperimentStore import ExperimentStore
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, STARTING_MONEY
+
+
+def test_experiment_store_round_trip(tmp_path, scenario, build_orders, tick_results):
+    number_of_bases, pause_timer, temple_needed = scenario
+    database_path = str(tmp_path / "experiment_store.sqlite")
+    settings = (STARTING_MONEY, number_of_bases, RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, pause_timer, temple_needed)
+    with ExperimentStore(database_path) as experiment_store:
+        scenario_id = experiment_store.get_scenario_id(*settings)
+        for packed_build_order, (final_time, build_order_string) in zip(build_orders, tick_results):
+            experiment_store.add_result(scenario_id, packed_build_order, final_time, build_order_string)
+
+    with ExperimentStore(database_path) as experiment_store:
+        assert experiment_store.get_scenario_id(*settings) == scenario_id
+        assert experiment_store.get_build_orders(scenario_id) == set(build_orders)
+        # Results are keyed on the build order string, so only the first result of each build order string is kept
+        stored_results = experiment_store.get_results(scenario_id)
+        first_results = {}
+        for final_time, build_order_string in tick_results:
+            first_results.setdefault(build_order_string, [final_time, build_order_string])
+        assert sorted(stored_results, key=str) == sorted(first_results.values(), key=str)
+        assert all(experiment_store.has_result(scenario_id, build_order_string)
+                   for _, build_order_string in tick_results)
+
+        other_scenario_id = experiment_store.get_scenario_id(*settings[:4], pause_timer + 1, temple_needed)
+        assert other_scenario_id != scenario_id
+        assert experiment_store.get_results(other_scenario_id) == []
+        assert not experiment_store.has_result(other_scenario_id, tick_results[0][1])
@@ -0,0 +1,49 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the GeneticOptimizer results match the tick by tick simulation, do not depend on the number of workers,
+and keep the best seed build order.
+
+"""
+import random
+
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.GeneticOptimizer import GeneticOptimizer
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, STARTING_MONEY, get_build_orders, \
+    simulate
+
+
+def make_optimizer(scenario: tuple, number_of_workers=1) -> GeneticOptimizer:
+    number_of_bases, pause_timer, temple_needed = scenario
+    return GeneticOptimizer(starting_money=STARTING_MONEY, number_of_bases=number_of_bases,
+                            resource_trigger=RESOURCE_TRIGGER, simulation_time_seconds=SIMULATION_TIME_SECONDS,
+                            population_size=20, number_of_generations=4, elite_size=2,
+                            number_of_workers=number_of_workers, pause_timer=pause_timer,
+                            temple_needed_to_clear_second_base=temple_needed, random_generator=random.Random(11))
+
+
+def test_results_match_tick(scenario):
+    genetic_optimizer = make_optimizer(scenario)
+    results = genetic_optimizer.run()
+    assert len({packed_build_order for packed_build_order, _, _ in results}) == len(results)
+    for packed_build_order, final_time, build_order_string in results:
+        assert simulate(packed_build_order, scenario)[:2] == [final_time, build_order_string]
+        # Children are repaired, so they are build orders the random generator could have made
+        assert GenerateOrdersBuildingBlocks.repair_build_order(
+            GenerateOrdersBuildingBlocks.get_build_order_genes(packed_build_order), scenario[0]) == packed_build_order
+
+    assert genetic_optimizer.best_time == min(genetic_optimizer.get_fitness(packed_build_order)
+                                              for packed_build_order, _, _ in results)
+    assert make_optimizer(scenario, number_of_workers=2).run() == results
+
+
+def test_best_seed_build_order_kept(scenario):
+    seed_build_orders = get_build_orders(scenario[0], seed=5)[:10]
+    genetic_optimizer = make_optimizer(scenario)
+    genetic_optimizer.run(seed_build_orders)
+    seed_times = [final_time for final_time, build_order_string in
+                  (simulate(packed_build_order, scenario)[:2] for packed_build_order in seed_build_orders)
+                  if final_time is not None and "TEMPLE" in build_order_string]
+    if seed_times:
+        assert genetic_optimizer.best_time <= min(seed_times)
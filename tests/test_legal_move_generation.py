@@ -0,0 +1,74 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that generate_legal_build_orders only makes build orders the drawing generator could have made, and that both
+generators give about the same distribution of build orders.
+
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from libraries.BaseConstants import Orders
+from libraries.BuildOrderEncoding import unpack_order
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+
+# Number of build orders generated with each generator for the distribution test
+NUMBER_OF_SAMPLES = 4000
+
+
+def get_generator(legal_move_generation: bool, seed=7) -> GenerateOrdersBuildingBlocks:
+    return GenerateOrdersBuildingBlocks(random_generator=random.Random(seed),
+                                        legal_move_generation=legal_move_generation)
+
+
+def get_distribution(packed_build_orders: list[bytes]) -> tuple:
+    """
+    The mean length, the share of each order over every step, and the share of each first order of build orders.
+
+    :return: tuple: mean length, dict of Orders to share of the orders, dict of Orders to share of the first orders
+    """
+    order_counts = Counter(unpack_order(packed_order)[0] for packed_build_order in packed_build_orders
+                           for packed_order in packed_build_order)
+    first_order_counts = Counter(unpack_order(packed_build_order[0])[0] for packed_build_order in packed_build_orders
+                                 if packed_build_order)
+    number_of_orders = sum(order_counts.values())
+    return (number_of_orders / len(packed_build_orders),
+            {order: order_counts[order] / number_of_orders for order in Orders},
+            {order: first_order_counts[order] / len(packed_build_orders) for order in Orders})
+
+
+def test_order_weights():
+    assert get_generator(True).get_order_weights() == {Orders.BUILD_SUPPLY_PAD: 2, Orders.BUILD_TEMPLE: 1,
+                                                       Orders.UPGRADE_BASE: 1, Orders.UPGRADE_SUPPLY_PAD: 3}
+
+
+@pytest.mark.parametrize("number_of_bases", [1, 2, 3])
+def test_build_orders_are_valid(number_of_bases):
+    generate_orders_building_blocks = get_generator(True)
+    for _ in range(500):
+        packed_build_order = generate_orders_building_blocks.generate_random_packed_build_order(number_of_bases)
+        genes = GenerateOrdersBuildingBlocks.get_build_order_genes(packed_build_order)
+        assert GenerateOrdersBuildingBlocks.repair_build_order(genes, number_of_bases) == packed_build_order
+
+
+def test_seeded_build_orders_repeat():
+    first_build_orders = [get_generator(True, seed=3).generate_random_packed_build_order(2) for _ in range(50)]
+    second_build_orders = [get_generator(True, seed=3).generate_random_packed_build_order(2) for _ in range(50)]
+    assert first_build_orders == second_build_orders
+
+
+def test_same_distribution_as_drawing():
+    distributions = []
+    for legal_move_generation in (False, True):
+        generate_orders_building_blocks = get_generator(legal_move_generation)
+        distributions.append(get_distribution([generate_orders_building_blocks.generate_random_packed_build_order(2)
+                                               for _ in range(NUMBER_OF_SAMPLES)]))
+    (drawn_length, drawn_orders, drawn_first_orders), (legal_length, legal_orders, legal_first_orders) = distributions
+
+    assert legal_length == pytest.approx(drawn_length, abs=0.6)
+    for order in Orders:
+        assert legal_orders[order] == pytest.approx(drawn_orders[order], abs=0.02), order
+        assert legal_first_orders[order] == pytest.approx(drawn_first_orders[order], abs=0.04), order
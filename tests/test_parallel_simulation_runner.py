@@ -0,0 +1,39 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the ParallelSimulationRunner results only depend on the seed and chunk size, match the tick by tick
+simulation, and skip the known build orders.
+
+"""
+from libraries.ParallelSimulationRunner import ParallelSimulationRunner
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, STARTING_MONEY, simulate
+
+NUMBER_OF_ITERATIONS = 60
+CHUNK_SIZE = 16
+
+
+def make_runner(number_of_workers: int, scenario: tuple) -> ParallelSimulationRunner:
+    number_of_bases, pause_timer, temple_needed = scenario
+    return ParallelSimulationRunner(number_of_workers=number_of_workers, chunk_size=CHUNK_SIZE, seed=99,
+                                    starting_money=STARTING_MONEY, number_of_bases=number_of_bases,
+                                    resource_trigger=RESOURCE_TRIGGER,
+                                    simulation_time_seconds=SIMULATION_TIME_SECONDS, pause_timer=pause_timer,
+                                    temple_needed_to_clear_second_base=temple_needed)
+
+
+def test_results_do_not_depend_on_number_of_workers(scenario):
+    results = make_runner(1, scenario).run(NUMBER_OF_ITERATIONS)
+    assert make_runner(2, scenario).run(NUMBER_OF_ITERATIONS) == results
+
+    packed_build_orders = [packed_build_order for packed_build_order, _, _ in results]
+    assert len(set(packed_build_orders)) == len(packed_build_orders)
+    for packed_build_order, final_time, build_order_string in results:
+        assert simulate(packed_build_order, scenario)[:2] == [final_time, build_order_string]
+
+
+def test_known_build_orders_skipped(scenario):
+    results = make_runner(2, scenario).run(NUMBER_OF_ITERATIONS)
+    known_build_orders = {packed_build_order for packed_build_order, _, _ in results[::2]}
+    remaining_results = make_runner(2, scenario).run(NUMBER_OF_ITERATIONS, known_build_orders=known_build_orders)
+    assert remaining_results == [result for result in results if result[0] not in known_build_orders]
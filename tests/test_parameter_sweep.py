@@ -0,0 +1,118 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that every cell of a parameter sweep gets the same results as simulating its build orders on their own, that
+cells that only differ in the resource trigger share their simulations, and that every simulator adds the starting
+bases of a scenario the same way.
+
+"""
+import csv
+import glob
+import os
+
+import pytest
+
+from libraries.BaseConstants import SUPPLY_PAD_COST, BaseLevel
+from libraries.BatchSimulator import BatchSimulator
+from libraries.CompiledSimulator import CompiledSimulator
+from libraries.ParameterSweep import SCENARIO_DEFAULTS, SUMMARY_FILE, ParameterSweep, _set_constants, \
+    simulate_cell_group
+from tests.simulation_helpers import STARTING_MONEY, make_sim_wrapper, simulate
+
+
+def get_scenario(scenario: tuple) -> dict:
+    """
+    The ParameterSweep scenario settings of a test scenario.
+    """
+    number_of_bases, pause_timer, temple_needed = scenario
+    return dict(SCENARIO_DEFAULTS, starting_money=STARTING_MONEY, number_of_bases=number_of_bases,
+                pause_timer=pause_timer, temple_needed=temple_needed)
+
+
+def test_cell_group_matches_single_triggers(scenario, build_orders):
+    resource_triggers = [1500, 3000, 6800]
+    cell_results = simulate_cell_group({}, get_scenario(scenario), resource_triggers, build_orders[:20],
+                                       event_driven=True)
+    for packed_build_order, results in zip(build_orders[:20], cell_results):
+        # The build order string of each trigger only has the orders done before it was reached
+        assert results == [simulate(packed_build_order, scenario, resource_trigger)[:2]
+                           for resource_trigger in resource_triggers]
+
+
+def test_constants_only_set_before_import():
+    # The simulation modules are already imported in the test process
+    with pytest.raises(RuntimeError):
+        _set_constants({"SUPPLY_PAD_COST": 200})
+    _set_constants({})
+
+
+def test_cells_and_groups():
+    with pytest.raises(ValueError):
+        ParameterSweep({"number_of_base": [1]}, {}, number_of_build_orders=10, seed=1)
+    with pytest.raises(ValueError):
+        ParameterSweep({}, {"STARTING_MONEY": [800]}, number_of_build_orders=10, seed=1)
+
+    parameter_sweep = ParameterSweep({"resource_trigger": [6800, 3000], "pause_timer": [0, 30]},
+                                     {"SUPPLY_PAD_COST": [150, 200]}, number_of_build_orders=10, seed=1)
+    cells = parameter_sweep.get_cells()
+    assert len(cells) == 8
+    assert [cell.name for cell in cells[:2]] == ["cell_001", "cell_002"]
+    assert all(cell.scenario["number_of_bases"] == SCENARIO_DEFAULTS["number_of_bases"] for cell in cells)
+    groups = parameter_sweep.get_cell_groups(cells)
+    assert len(groups) == 4
+    for group in groups:
+        assert [cell.scenario["resource_trigger"] for cell in group] == [3000, 6800]
+        assert group[0].constants == group[1].constants
+    # Generated once for each number of bases, with the duplicates left out
+    build_orders = parameter_sweep.get_build_orders(2)
+    assert parameter_sweep.get_build_orders(2) is build_orders
+    assert len(set(build_orders)) == len(build_orders) <= 10
+
+
+def test_run(tmp_path):
+    parameter_sweep = ParameterSweep({"number_of_bases": [1], "resource_trigger": [1500, 3000]},
+                                     {"SUPPLY_PAD_COST": [SUPPLY_PAD_COST, 300]}, number_of_build_orders=30, seed=5,
+                                     number_of_workers=2, chunk_size=10, require_temple=False)
+    summary = parameter_sweep.run(str(tmp_path))
+    assert len(summary) == 4
+    build_orders = parameter_sweep.get_build_orders(1)
+
+    cell_times = {}
+    for cell, results_aggregator in summary:
+        assert results_aggregator.number_of_results == len(build_orders)
+        output_paths = glob.glob(os.path.join(parameter_sweep.sweep_directory, f"{cell.name}_*.csv"))
+        assert len(output_paths) == 1
+        with open(output_paths[0], newline='') as csv_file:
+            rows = list(csv.reader(csv_file))[1:]
+        assert len(rows) == len(build_orders)
+        cell_times[cell.constants["SUPPLY_PAD_COST"], cell.scenario["resource_trigger"]] = \
+            [int(row[0]) if row[0] else None for row in rows]
+
+    # The cells with the default supply pad cost match the simulations in this process
+    for resource_trigger in (1500, 3000):
+        assert cell_times[SUPPLY_PAD_COST, resource_trigger] == \
+            [simulate(packed_build_order, (1, 0, False), resource_trigger)[0] for packed_build_order in build_orders]
+    # The workers simulate with the supply pad cost of their cell
+    assert cell_times[300, 3000] != cell_times[SUPPLY_PAD_COST, 3000]
+
+    with open(os.path.join(parameter_sweep.sweep_directory, SUMMARY_FILE), newline='') as csv_file:
+        summary_rows = list(csv.reader(csv_file))
+    assert summary_rows[0][:2] == ["Cell", "starting_money"]
+    assert len(summary_rows) == 5
+
+
+def test_add_bases():
+    sim_wrapper = make_sim_wrapper(3, 30, True)
+    assert [base.base_number for base in sim_wrapper.base_list] == [1, 2, 3]
+    assert [base.base_upgrade_level for base in sim_wrapper.base_list] == [BaseLevel.KEEP, BaseLevel.EMPTY,
+                                                                           BaseLevel.EMPTY]
+    assert [base.pause_timer for base in sim_wrapper.base_list] == [0, 30, 30]
+    assert [base.temple_needed_to_clear_second_base for base in sim_wrapper.base_list] == [False, True, True]
+
+    for simulator in (BatchSimulator(starting_money=STARTING_MONEY), CompiledSimulator(starting_money=STARTING_MONEY)):
+        simulator.add_bases(3, pause_timer=30, temple_needed_to_clear_second_base=True)
+        assert simulator.base_numbers == [1, 2, 3]
+        assert simulator.base_levels == [BaseLevel.KEEP, BaseLevel.EMPTY, BaseLevel.EMPTY]
+        assert simulator.pause_timers == [0, 30, 30]
+        assert simulator.temple_needed_list == [False, True, True]
@@ -0,0 +1,41 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the PhaseProfiler counts the phase calls without changing the results, and puts the original methods back.
+
+"""
+import inspect
+
+from libraries.PhaseProfiler import PHASES, PhaseProfiler
+from tests.simulation_helpers import simulate
+
+
+def get_methods() -> list:
+    return [inspect.getattr_static(cls, method_name) for methods in PHASES.values() for cls, method_name in methods]
+
+
+def test_results_unchanged(scenario, build_orders, tick_results):
+    original_methods = get_methods()
+    with PhaseProfiler(profile_iterations=3, profile_every=10) as phase_profiler:
+        assert get_methods() != original_methods
+        for event_driven in (False, True):
+            assert [simulate(packed_build_order, scenario, event_driven=event_driven)[:2]
+                    for packed_build_order in build_orders] == tick_results
+    assert get_methods() == original_methods
+
+    assert phase_profiler.phase_totals["simulation"][1] == 2 * len(build_orders)
+    assert phase_profiler.phase_totals["build order string"][1] == 2 * len(build_orders)
+    assert phase_profiler.phase_totals["ResourceManager.update"][1] > 0
+    assert phase_profiler.profiled_iterations == 3
+    assert "cProfile of 3 simulations" in phase_profiler.get_profile_string()
+    assert "simulation" in phase_profiler.get_summary_string()
+
+
+def test_disabled_profiler_counts_nothing(scenario, build_orders):
+    phase_profiler = PhaseProfiler()
+    phase_profiler.enable()
+    phase_profiler.disable()
+    simulate(build_orders[0], scenario)
+    assert all(calls == 0 for _, calls in phase_profiler.phase_totals.values())
+    assert phase_profiler.get_profile_string() == ""
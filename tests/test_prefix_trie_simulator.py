@@ -0,0 +1,27 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the PrefixTrieSimulator, which shares the simulation of common prefixes, gives the same results as the tick
+by tick simulation.
+
+"""
+from libraries.PrefixTrieSimulator import PrefixTrieSimulator
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, STARTING_MONEY, simulate
+
+
+def test_prefix_trie_matches_tick(scenario, build_orders, tick_results):
+    number_of_bases, pause_timer, temple_needed = scenario
+    # Prefixes of other build orders and a duplicate, so the trie has nodes that end build orders and branch
+    extra_build_orders = [packed_build_order[:len(packed_build_order) // 2] for packed_build_order in build_orders[:10]]
+    extra_build_orders.append(build_orders[0])
+    prefix_trie_simulator = PrefixTrieSimulator(starting_money=STARTING_MONEY, number_of_bases=number_of_bases,
+                                                resource_trigger=RESOURCE_TRIGGER,
+                                                simulation_time_seconds=SIMULATION_TIME_SECONDS,
+                                                pause_timer=pause_timer,
+                                                temple_needed_to_clear_second_base=temple_needed)
+
+    results = prefix_trie_simulator.run_simulation(build_orders + extra_build_orders)
+    assert results[:len(build_orders)] == tick_results
+    assert results[len(build_orders):] == [simulate(packed_build_order, scenario)[:2]
+                                           for packed_build_order in extra_build_orders]
@@ -0,0 +1,29 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that simulating once with a list of resource triggers gives the same time for each trigger as simulating with
+each trigger on its own.
+
+"""
+from tests.simulation_helpers import RESOURCE_TRIGGER, simulate
+
+
+def test_matches_single_triggers(scenario, build_orders):
+    resource_triggers = [1500, 2500, RESOURCE_TRIGGER]
+    for packed_build_order in build_orders[:20]:
+        for event_driven in (False, True):
+            final_times = simulate(packed_build_order, scenario, resource_triggers, event_driven=event_driven)[0]
+            assert final_times == [simulate(packed_build_order, scenario, resource_trigger)[0]
+                                   for resource_trigger in resource_triggers]
+
+
+def test_unreached_triggers_are_none(scenario, build_orders):
+    # Far more money than any build order makes before the timeout
+    resource_triggers = [1500, RESOURCE_TRIGGER, 1000000]
+    for packed_build_order in build_orders[:10]:
+        for event_driven in (False, True):
+            final_times = simulate(packed_build_order, scenario, resource_triggers, event_driven=event_driven)[0]
+            assert final_times[:2] == [simulate(packed_build_order, scenario, resource_trigger)[0]
+                                       for resource_trigger in resource_triggers[:2]]
+            assert final_times[2] is None
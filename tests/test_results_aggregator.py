@@ -0,0 +1,85 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks the fastest build orders, quantiles and counts of the ResultsAggregator against sorting every result.
+
+"""
+import math
+import random
+
+import pytest
+
+from libraries.ResultsAggregator import ResultsAggregator
+
+MAX_TIME_SECONDS = 1000
+
+
+def get_results(number_of_results: int) -> list:
+    """
+    Random results with unique build order strings, some timed out and some without a TEMPLE.
+    """
+    random_generator = random.Random(42)
+    results = []
+    for j in range(number_of_results):
+        final_time = None if random_generator.random() < 0.1 else random_generator.randint(200, 900)
+        build_order_string = f"SUPPLY {j}, " + ("TEMPLE 1, " if random_generator.random() < 0.8 else "")
+        results.append([final_time, build_order_string])
+    return results
+
+
+def get_nearest_rank(sorted_times: list, fraction: float) -> int:
+    return sorted_times[max(math.ceil(fraction * len(sorted_times)), 1) - 1]
+
+
+@pytest.mark.parametrize("top_k", [1, 10, 50])
+def test_top_results_match_sorted(top_k):
+    results = get_results(2000)
+    results_aggregator = ResultsAggregator(MAX_TIME_SECONDS, top_k=top_k)
+    for final_time, build_order_string in results:
+        results_aggregator.add(final_time, build_order_string)
+
+    # A stable sort keeps the result that came first when the final times tie
+    expected = sorted([result for result in results if result[0] is not None and "TEMPLE" in result[1]],
+                      key=lambda result: result[0])[:top_k]
+    assert results_aggregator.get_top_results() == expected
+    assert results_aggregator.get_best_result() == expected[0]
+
+
+def test_duplicate_build_order_strings_kept_once():
+    results_aggregator = ResultsAggregator(MAX_TIME_SECONDS, top_k=3)
+    for final_time in (300, 300, 400, 500):
+        results_aggregator.add(final_time, "TEMPLE 1, ")
+    results_aggregator.add(450, "SUPPLY 1, TEMPLE 1, ")
+    assert results_aggregator.get_top_results() == [[300, "TEMPLE 1, "], [450, "SUPPLY 1, TEMPLE 1, "]]
+
+
+@pytest.mark.parametrize("histogram_bin_seconds", [1, 10])
+def test_quantiles_match_sorted(histogram_bin_seconds):
+    results = get_results(2000)
+    results_aggregator = ResultsAggregator(MAX_TIME_SECONDS, histogram_bin_seconds=histogram_bin_seconds)
+    assert results_aggregator.get_quantile(0.5) is None
+    for final_time, build_order_string in results:
+        results_aggregator.add(final_time, build_order_string)
+
+    sorted_times = sorted(final_time for final_time, _ in results if final_time is not None)
+    for fraction in (0, 0.1, 0.25, 0.5, 0.9, 1):
+        expected = get_nearest_rank(sorted_times, fraction)
+        # The quantile is the start of the bin it is in
+        assert results_aggregator.get_quantile(fraction) == expected - expected % histogram_bin_seconds
+    assert results_aggregator.get_number_finished() == len(sorted_times)
+    assert results_aggregator.get_mean_time() == pytest.approx(sum(sorted_times) / len(sorted_times))
+    assert (results_aggregator.min_time, results_aggregator.max_time) == (sorted_times[0], sorted_times[-1])
+    assert sum(count for _, count in results_aggregator.get_histogram()) == len(sorted_times)
+
+
+def test_counts():
+    results_aggregator = ResultsAggregator(MAX_TIME_SECONDS)
+    results_aggregator.add(None, "SUPPLY 1, ")
+    # Three orders were simulated, one was SKIPPED so it is not in the build order string
+    results_aggregator.add(300, "SUPPLY 1, TEMPLE 1, ", packed_build_order=bytes(3))
+    results_aggregator.add_duplicate()
+    assert (results_aggregator.number_of_results, results_aggregator.number_of_timeouts,
+            results_aggregator.number_without_temple, results_aggregator.number_of_duplicates,
+            results_aggregator.number_of_skipped_orders, results_aggregator.number_with_skipped_orders) == \
+        (2, 1, 1, 1, 1, 1)
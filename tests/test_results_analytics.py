@@ -0,0 +1,103 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks the vectorized ResultsAnalytics queries against the same queries done on the build order strings one at a time.
+
+"""
+import math
+
+import numpy as np
+import pytest
+
+from libraries.ColumnarResults import ColumnarResults, write_columnar_results
+from libraries.ResultsAnalytics import ResultsAnalytics
+from tests.simulation_helpers import RESOURCE_TRIGGER, simulate
+
+OTHER_RESOURCE_TRIGGER = 2000
+
+
+@pytest.fixture
+def results(scenario, build_orders, tick_results) -> list:
+    """
+    [final time, build order string, resource trigger] for each result, at two resource triggers.
+    """
+    other_results = [simulate(packed_build_order, scenario, OTHER_RESOURCE_TRIGGER)[:2]
+                     for packed_build_order in build_orders]
+    return [result + [RESOURCE_TRIGGER] for result in tick_results] + \
+        [result + [OTHER_RESOURCE_TRIGGER] for result in other_results]
+
+
+@pytest.fixture
+def results_analytics(tmp_path, scenario, results) -> ResultsAnalytics:
+    results_sets = []
+    for resource_trigger in (RESOURCE_TRIGGER, OTHER_RESOURCE_TRIGGER):
+        directory = str(tmp_path / str(resource_trigger))
+        write_columnar_results([result[:2] for result in results if result[2] == resource_trigger], directory)
+        results_sets.append([ColumnarResults(directory), resource_trigger, scenario[0], str(resource_trigger)])
+    return ResultsAnalytics(results_sets)
+
+
+def get_tokens(build_order_string: str) -> list:
+    return [token.strip() for token in build_order_string.split(",") if token.strip()]
+
+
+def test_build_order_strings(results_analytics, results):
+    assert [results_analytics.get_build_order_string(index) for index in range(len(results))] == \
+        [build_order_string for _, build_order_string, _ in results]
+    temple_steps = [next((step + 1 for step, token in enumerate(get_tokens(build_order_string))
+                          if token.startswith("TEMPLE")), 0) for _, build_order_string, _ in results]
+    assert results_analytics.get_first_step("TEMPLE").tolist() == temple_steps
+
+
+def test_mask_and_best(results_analytics, results):
+    prefix = "SUPPLY 1, SUPPLY 1, "
+    mask = results_analytics.get_mask(resource_trigger=RESOURCE_TRIGGER, require_temple=True, prefix=prefix)
+    expected = [index for index, (final_time, build_order_string, resource_trigger) in enumerate(results)
+                if final_time is not None and resource_trigger == RESOURCE_TRIGGER and
+                "TEMPLE" in build_order_string and build_order_string.startswith(prefix)]
+    assert np.flatnonzero(mask).tolist() == expected
+
+    all_finished = results_analytics.get_mask()
+    best = sorted([[final_time, build_order_string, str(resource_trigger)]
+                   for final_time, build_order_string, resource_trigger in results if final_time is not None],
+                  key=lambda result: result[0])[:5]
+    assert results_analytics.get_best(all_finished, number_of_results=5) == best
+    assert not results_analytics.get_mask(prefix="U_BASE 7, ").any()
+
+
+@pytest.mark.parametrize("prefix_length", [1, 2, 4])
+def test_prefix_statistics(results_analytics, results, prefix_length):
+    groups = {}
+    for final_time, build_order_string, _ in results:
+        if final_time is not None:
+            prefix = "".join(f"{token}, " for token in get_tokens(build_order_string)[:prefix_length])
+            groups.setdefault(prefix, []).append(final_time)
+    expected = []
+    for prefix, final_times in groups.items():
+        final_times.sort()
+        expected.append([prefix, len(final_times), final_times[0], float(np.mean(final_times)),
+                         final_times[math.floor(0.5 * (len(final_times) - 1))]])
+
+    prefix_statistics = results_analytics.get_prefix_statistics(prefix_length, quantiles=(0.5,))
+    assert sorted(prefix_statistics, key=str) == sorted(expected, key=str)
+    # Fastest min first, then fastest mean
+    assert [statistics[2:4] for statistics in prefix_statistics] == sorted(statistics[2:4]
+                                                                           for statistics in prefix_statistics)
+
+
+def test_position_effects(results_analytics, results):
+    effects, counts, labels = results_analytics.get_position_effects(by_order_type=True)
+    finished_results = [[final_time, get_tokens(build_order_string)] for final_time, build_order_string, _ in results
+                        if final_time is not None]
+    for step in range(2):
+        step_times = [final_time for final_time, tokens in finished_results if len(tokens) > step]
+        for label_index, label in enumerate(labels):
+            label_times = [final_time for final_time, tokens in finished_results
+                           if len(tokens) > step and tokens[step].split(" ")[0] == label]
+            assert counts[step, label_index] == len(label_times)
+            if label_times:
+                assert effects[step, label_index] == pytest.approx(sum(label_times) / len(label_times) -
+                                                                   sum(step_times) / len(step_times))
+            else:
+                assert np.isnan(effects[step, label_index])
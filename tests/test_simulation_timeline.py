@@ -0,0 +1,65 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that recording a SimulationTimeline does not change the results, and that the tick by tick and event driven
+simulations record the same timeline.
+
+"""
+import csv
+import os
+
+import numpy as np
+
+from libraries.BuildOrderEncoding import decode_build_order
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.SimulationTimeline import TIMELINE_COLUMNS, TIMELINE_EVENTS_FILE, TimelineEvent
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, make_sim_wrapper
+
+
+def simulate_with_timeline(packed_build_order: bytes, scenario: tuple, event_driven: bool) -> list:
+    """
+    Simulate a packed build order and record its timeline.
+
+    :return: list: [final time, build order string, SimulationTimeline]
+    """
+    sim_wrapper = make_sim_wrapper(*scenario, event_driven=event_driven)
+    build_order = decode_build_order(packed_build_order, sim_wrapper.base_list)
+    final_time, timeline = sim_wrapper.run_simulation(build_order=build_order, resource_trigger=RESOURCE_TRIGGER,
+                                                      simulation_time_seconds=SIMULATION_TIME_SECONDS,
+                                                      record_timeline=True)
+    return [final_time, GenerateOrdersBuildingBlocks.build_order_print(build_order), timeline]
+
+
+def test_tick_and_event_driven_timelines_match(scenario, build_orders, tick_results):
+    for packed_build_order, tick_result in zip(build_orders[:20], tick_results):
+        final_time, build_order_string, timeline = simulate_with_timeline(packed_build_order, scenario, False)
+        assert [final_time, build_order_string] == tick_result
+        event_final_time, _, event_timeline = simulate_with_timeline(packed_build_order, scenario, True)
+        assert event_final_time == final_time
+
+        assert len(event_timeline) == len(timeline) > 0
+        for name, _ in TIMELINE_COLUMNS:
+            assert event_timeline.get_column(name) == timeline.get_column(name), name
+        assert event_timeline.events == timeline.events
+
+        approved_events = [event for event in timeline.events if event[1] == TimelineEvent.APPROVED]
+        assert len(approved_events) <= build_order_string.count(", ")
+        if final_time is not None:
+            assert timeline.get_column("money")[-1] >= RESOURCE_TRIGGER
+
+
+def test_save(tmp_path, scenario, build_orders):
+    timeline = simulate_with_timeline(build_orders[0], scenario, True)[2]
+    timeline.save_npy(str(tmp_path))
+    for name, values in timeline.to_numpy().items():
+        assert np.array_equal(np.load(os.path.join(tmp_path, f"{name}.npy")), values)
+    with open(os.path.join(tmp_path, TIMELINE_EVENTS_FILE), newline='') as events_file:
+        assert len(list(csv.reader(events_file))) == len(timeline.events) + 1
+
+    csv_path = os.path.join(tmp_path, "timeline.csv")
+    timeline.save_csv(csv_path)
+    with open(csv_path, newline='') as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert len(rows) == len(timeline) + 1
+    assert [int(value) for value in rows[-1][1:]] == [timeline.get_column(name)[-1] for name, _ in TIMELINE_COLUMNS]
@@ -0,0 +1,53 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that the StreamingResultsWriter flushes its buffer, starts a new file every max_rows_per_file results, and reads
+back every result it wrote.
+
+"""
+import csv
+
+from libraries.StreamingResultsWriter import StreamingResultsWriter
+
+
+def get_results(number_of_results: int) -> list:
+    return [[None if j % 7 == 0 else 300 + j, f"SUPPLY 1, TEMPLE {j % 3 + 1}, "] for j in range(number_of_results)]
+
+
+def read_rows(output_path: str) -> list:
+    with open(output_path, newline='') as csvfile:
+        return list(csv.reader(csvfile))
+
+
+def test_files_rotate(tmp_path):
+    results = get_results(25)
+    with StreamingResultsWriter(str(tmp_path), max_rows_per_file=10, flush_rows=4, flush_seconds=1000) as writer:
+        for final_time, build_order_string in results:
+            writer.write(final_time, build_order_string)
+            # The buffer is flushed every flush_rows results
+            assert len(writer.buffer) < 4
+        assert writer.rows_written == 24
+
+    assert writer.rows_written == 25
+    assert len(writer.output_paths) == 3
+    assert [len(read_rows(output_path)) - 1 for output_path in writer.output_paths] == [10, 10, 5]
+    assert all(read_rows(output_path)[0] == ["Number", "Character"] for output_path in writer.output_paths)
+    assert list(writer.read_results()) == results
+
+
+def test_extra_columns(tmp_path):
+    with StreamingResultsWriter(str(tmp_path), extra_columns=["1500"]) as writer:
+        writer.write(400, "SUPPLY 1, ", extra_values=[250])
+        writer.write(None, "TEMPLE 1, ")
+    assert read_rows(writer.output_paths[0]) == [["Number", "Character", "1500"], ["400", "SUPPLY 1, ", "250"],
+                                                 ["", "TEMPLE 1, ", ""]]
+
+
+def test_new_run_does_not_overwrite(tmp_path):
+    with StreamingResultsWriter(str(tmp_path)) as first_writer:
+        first_writer.write(300, "SUPPLY 1, ")
+    with StreamingResultsWriter(str(tmp_path)) as second_writer:
+        second_writer.write(400, "TEMPLE 1, ")
+    assert first_writer.output_paths[0] != second_writer.output_paths[0]
+    assert list(first_writer.read_results()) == [[300, "SUPPLY 1, "]]
@@ -0,0 +1,74 @@
+"""
+Halo Wars Simulator
+October 18th, 2026
+
+Checks that tracing does not change the results, that the TraceRecorder keeps the last capacity events, and that the
+factories only pick the traced classes when there is a recorder.
+
+"""
+import pytest
+
+from libraries.BaseClass import Base, TracedBase, make_base
+from libraries.BuildOrderEncoding import decode_build_order
+from libraries.BuildSlotClasses import SupplyPad, Temple, TracedSupplyPad, TracedTemple
+from libraries.GenerateOrdersBuildingBlocks import GenerateOrdersBuildingBlocks
+from libraries.ResourceManager import ResourceManager
+from libraries.RuntimeBuildingBlocks import RuntimeBuildingBlocks, TracedRuntimeBuildingBlocks, \
+    make_runtime_building_blocks
+from libraries.SimulatorWrapper import SimulatorWrapper
+from libraries.TraceRecorder import TraceEvent, TraceRecorder
+from tests.simulation_helpers import RESOURCE_TRIGGER, SIMULATION_TIME_SECONDS, STARTING_MONEY
+
+
+def simulate_traced(packed_build_order: bytes, scenario: tuple, event_driven: bool, trace_capacity: int) -> list:
+    """
+    Simulate a packed build order with a SimulatorWrapper that records a trace.
+
+    :return: list: [final time, build order string, trace recorder]
+    """
+    sim_wrapper = SimulatorWrapper(starting_money=STARTING_MONEY, fine_debug=False, event_driven=event_driven,
+                                   trace_capacity=trace_capacity)
+    sim_wrapper.add_bases(*scenario)
+    build_order = decode_build_order(packed_build_order, sim_wrapper.base_list)
+    final_time = sim_wrapper.run_simulation(build_order=build_order, resource_trigger=RESOURCE_TRIGGER,
+                                            simulation_time_seconds=SIMULATION_TIME_SECONDS)
+    return [final_time, GenerateOrdersBuildingBlocks.build_order_print(build_order), sim_wrapper.trace_recorder]
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_tracing_does_not_change_results(scenario, build_orders, tick_results, event_driven):
+    for packed_build_order, tick_result in zip(build_orders[:20], tick_results):
+        final_time, build_order_string, trace_recorder = simulate_traced(packed_build_order, scenario, event_driven,
+                                                                         trace_capacity=100000)
+        assert [final_time, build_order_string] == tick_result
+        assert len(trace_recorder) == trace_recorder.number_recorded > 0
+        assert len(trace_recorder.get_messages()) == len(trace_recorder)
+        # Orders that were never tried are still in the build order string
+        assert len(trace_recorder.get_events(TraceEvent.ORDER_APPROVED)) <= build_order_string.count(", ")
+
+
+def test_capacity_keeps_last_events(scenario, build_orders):
+    full_trace = simulate_traced(build_orders[0], scenario, False, trace_capacity=100000)[2]
+    short_trace = simulate_traced(build_orders[0], scenario, False, trace_capacity=10)[2]
+    assert short_trace.number_recorded == full_trace.number_recorded
+    assert short_trace.get_events() == full_trace.get_events()[-10:]
+    short_trace.clear()
+    assert len(short_trace) == short_trace.number_recorded == 0
+
+
+def test_factories_pick_traced_classes():
+    resource_manager = ResourceManager()
+    base = make_base(resource_manager=resource_manager, base_number=1)
+    assert type(base) is Base
+    assert type(make_runtime_building_blocks(resource_manager=resource_manager)) is RuntimeBuildingBlocks
+
+    trace_recorder = TraceRecorder(resource_manager=resource_manager)
+    traced_base = make_base(resource_manager=resource_manager, base_number=1, trace_recorder=trace_recorder)
+    assert type(traced_base) is TracedBase
+    assert type(make_runtime_building_blocks(resource_manager=resource_manager, trace_recorder=trace_recorder)) is \
+        TracedRuntimeBuildingBlocks
+    assert (base._SUPPLY_PAD_CLASS, base._TEMPLE_CLASS) == (SupplyPad, Temple)
+    assert (traced_base._SUPPLY_PAD_CLASS, traced_base._TEMPLE_CLASS) == (TracedSupplyPad, TracedTemple)
+
+    with pytest.deprecated_call():
+        assert type(make_base(resource_manager=resource_manager, base_number=1, print_mode=True)) is TracedBase